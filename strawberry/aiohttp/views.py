@@ -1,43 +1,74 @@
 import asyncio
 import json
 from abc import ABC, abstractmethod
-from contextlib import suppress
-from io import BytesIO
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Optional, cast
-
-from graphql import ExecutionResult as GraphQLExecutionResult, GraphQLError
-from graphql.error import format_error as format_graphql_error
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
-from aiohttp import http, web
-from strawberry.exceptions import MissingQueryError
+from graphql import OperationType
+
+from aiohttp import hdrs, http, web
+from strawberry.cache import CachedResponse, ResponseCache, get_cache_policy_from_result
+from strawberry.codecs import DEFAULT_CHUNK_SIZE, JSONCodec, default_json_codec
+from strawberry.compression import ResponseCompression, StreamCompressor
+from strawberry.exceptions import (
+    InvalidPersistedQueryHashError,
+    MissingQueryError,
+    PersistedQueryNotFoundError,
+    UploadTooLargeError,
+)
+from strawberry.file_uploads import UploadLimits
+from strawberry.file_uploads.parser import parse_multipart_form
 from strawberry.file_uploads.utils import replace_placeholders_with_files
 from strawberry.http import (
+    MULTIPART_CONTENT_TYPE,
     GraphQLHTTPResponse,
+    GraphQLHTTPSubsequentResponse,
     GraphQLRequestData,
+    accepts_multipart,
+    encode_multipart_end,
+    encode_multipart_part,
+    encode_multipart_start,
+    etag_matches,
+    get_etag,
+    parse_batch_request_data,
+    parse_query_params,
     parse_request_data,
     process_result,
+    process_subsequent_result,
+    should_execute_query_params,
+)
+from strawberry.persisted_queries import (
+    PERSISTED_QUERY_NOT_FOUND_RESPONSE,
+    PersistedQueries,
 )
 from strawberry.schema import BaseSchema
 from strawberry.subscriptions.constants import (
-    GQL_COMPLETE,
-    GQL_CONNECTION_ACK,
-    GQL_CONNECTION_INIT,
-    GQL_CONNECTION_KEEP_ALIVE,
-    GQL_CONNECTION_TERMINATE,
-    GQL_DATA,
-    GQL_ERROR,
-    GQL_START,
-    GQL_STOP,
-    GRAPHQL_WS,
+    GRAPHQL_TRANSPORT_WS,
+    SUBSCRIPTION_PROTOCOLS,
+    WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE,
+)
+from strawberry.subscriptions.graphql_transport_ws import GraphQLTransportWSHandler
+from strawberry.subscriptions.graphql_ws import GraphQLWSHandler
+from strawberry.subscriptions.handlers import (
+    BaseSubscriptionsHandler,
+    select_subscription_protocol,
 )
-from strawberry.subscriptions.types import (
-    OperationMessage,
-    OperationMessagePayload,
-    StartPayload,
+from strawberry.types import (
+    ExecutionResult,
+    IncrementalExecutionResult,
+    SubsequentExecutionResult,
 )
-from strawberry.types import ExecutionResult
-from strawberry.utils.debug import pretty_print_graphql_operation
+from strawberry.utils.operation import get_operation_type
 
 
 class BaseGraphQLView(ABC):
@@ -47,13 +78,35 @@ class BaseGraphQLView(ABC):
         graphiql: bool = True,
         keep_alive: bool = True,
         keep_alive_interval: float = 1,
+        subscription_protocols: Sequence[str] = SUBSCRIPTION_PROTOCOLS,
+        connection_init_wait_timeout: float = 60,
         debug: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        json_codec: Optional[JSONCodec] = None,
+        stream_responses: bool = False,
+        stream_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        allow_batching: bool = False,
+        allow_queries_via_get: bool = True,
+        persisted_queries: Optional[PersistedQueries] = None,
+        compression: Optional[ResponseCompression] = None,
+        upload_limits: Optional[UploadLimits] = None,
     ):
         self.schema = schema
         self.graphiql = graphiql
         self.keep_alive = keep_alive
         self.keep_alive_interval = keep_alive_interval
+        self.subscription_protocols = subscription_protocols
+        self.connection_init_wait_timeout = connection_init_wait_timeout
         self.debug = debug
+        self.response_cache = response_cache
+        self.json_codec = json_codec or default_json_codec
+        self.stream_responses = stream_responses
+        self.stream_chunk_size = stream_chunk_size
+        self.allow_batching = allow_batching
+        self.allow_queries_via_get = allow_queries_via_get
+        self.persisted_queries = persisted_queries
+        self.compression = compression
+        self.upload_limits = upload_limits or UploadLimits()
 
     @abstractmethod
     async def __call__(self, request: web.Request) -> web.StreamResponse:
@@ -72,183 +125,208 @@ class BaseGraphQLView(ABC):
     ) -> GraphQLHTTPResponse:
         return process_result(result)
 
+    async def process_subsequent_result(
+        self, request: web.Request, result: SubsequentExecutionResult
+    ) -> GraphQLHTTPSubsequentResponse:
+        return process_subsequent_result(result)
+
+    def encode_json(self, data: Any) -> bytes:
+        return self.json_codec.encode(data)
+
+    def iter_encode_json(self, data: Any) -> Iterator[bytes]:
+        return self.json_codec.iter_encode(data, self.stream_chunk_size)
+
+    def decode_json(self, data: Union[str, bytes]) -> Any:
+        return self.json_codec.decode(data)
+
 
 class WebSocketHandler(BaseGraphQLView, ABC):
     async def handle_websocket(self, request: web.Request) -> web.StreamResponse:
-        ws = web.WebSocketResponse(protocols=[GRAPHQL_WS])
+        ws = web.WebSocketResponse(protocols=self.subscription_protocols)
         await ws.prepare(request)
 
-        request["subscriptions"] = {}
-        request["tasks"] = {}
-        request["keep_alive_task"] = None
+        protocol = select_subscription_protocol(
+            [ws.ws_protocol] if ws.ws_protocol else [], self.subscription_protocols
+        )
+
+        if protocol is None:
+            await ws.close(code=WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE)
+            return ws
+
+        handler = self.get_subscriptions_handler(request, ws, protocol)
+
+        request["tasks"] = handler.tasks
+        handler.start()
 
         try:
             async for ws_message in ws:  # type: http.WSMessage
                 if ws_message.type == http.WSMsgType.TEXT:
-                    message: OperationMessage = ws_message.json()
-                    await self.handle_ws_message(request, ws, message)
+                    await handler.handle_text(ws_message.data)
         finally:
-            if request["keep_alive_task"]:
-                request["keep_alive_task"].cancel()
-                with suppress(BaseException):
-                    await request["keep_alive_task"]
-
-            for operation_id in list(request["subscriptions"].keys()):
-                await self.cleanup_operation(request, operation_id)
+            await handler.handle_disconnect()
 
         return ws
 
-    async def handle_ws_message(
+    def get_subscriptions_handler(
+        self, request: web.Request, ws: web.WebSocketResponse, protocol: str
+    ) -> BaseSubscriptionsHandler:
+        async def close(code: int, reason: str) -> None:
+            await ws.close(code=code, message=reason.encode())
+
+        kwargs: Dict[str, Any] = dict(
+            send_text=ws.send_str,
+            close=close,
+            get_context=lambda: self.get_context(request, ws),
+            get_root_value=lambda: self.get_root_value(request),
+            json_codec=self.json_codec,
+            debug=self.debug,
+        )
+
+        if protocol == GRAPHQL_TRANSPORT_WS:
+            return GraphQLTransportWSHandler(
+                self.schema,
+                connection_init_wait_timeout=self.connection_init_wait_timeout,
+                **kwargs,
+            )
+
+        return GraphQLWSHandler(
+            self.schema,
+            keep_alive=self.keep_alive,
+            keep_alive_interval=self.keep_alive_interval,
+            **kwargs,
+        )
+
+    def is_websocket_request(self, request: web.Request) -> bool:
+        ws = web.WebSocketResponse(protocols=self.subscription_protocols)
+        return ws.can_prepare(request).ok
+
+
+class HTTPHandler(BaseGraphQLView, ABC):
+    async def handle_http(self, request: web.Request):
+        try:
+            if request.method == "GET":
+                response = await self.get(request)
+            elif request.method == "POST":
+                response = await self.post(request)
+            else:
+                raise web.HTTPMethodNotAllowed(request.method, ["GET", "POST"])
+        finally:
+            for file in request.get("uploaded_files", ()):
+                await file.close()
+
+        # streamed responses are compressed while they are being written
+        if self.compression is not None and not response.prepared:
+            response = await self.compress_response(request, response, self.compression)
+
+        return response
+
+    async def compress_response(
         self,
         request: web.Request,
-        ws: web.WebSocketResponse,
-        message: OperationMessage,
-    ) -> None:
-        message_type = message["type"]
-
-        if message_type == GQL_CONNECTION_INIT:
-            await self.handle_connection_init(request, ws)
-        elif message_type == GQL_CONNECTION_TERMINATE:
-            await self.handle_connection_terminate(ws)
-        elif message_type == GQL_START:
-            await self.handle_start(request, ws, message)
-        elif message_type == GQL_STOP:
-            await self.handle_stop(request, message)
-
-    async def handle_connection_init(
-        self, request: web.Request, ws: web.WebSocketResponse
-    ) -> None:
-        await ws.send_json({"type": GQL_CONNECTION_ACK})
+        response: web.StreamResponse,
+        compression: ResponseCompression,
+    ) -> web.StreamResponse:
+        add_vary_header(response)
+
+        if (
+            not isinstance(response, web.Response)
+            or not isinstance(response.body, bytes)
+            or hdrs.CONTENT_ENCODING in response.headers
+            or response.status in (204, 304)
+            or len(response.body) < compression.minimum_size
+        ):
+            return response
+
+        encoding = compression.negotiate(request.headers.get(hdrs.ACCEPT_ENCODING))
+
+        if encoding is not None:
+            response.body = await compression.compress(response.body, encoding)
+            response.headers[hdrs.CONTENT_ENCODING] = encoding
 
-        if self.keep_alive:
-            request["keep_alive_task"] = asyncio.create_task(self.handle_keep_alive(ws))
+        return response
 
-    async def handle_connection_terminate(self, ws: web.WebSocketResponse) -> None:
-        await ws.close()
+    def start_stream_compression(
+        self, request: web.Request, response: web.StreamResponse
+    ) -> Optional[StreamCompressor]:
+        """Sets the headers of a streamed response that is about to be
+        prepared, returning the compressor for its chunks"""
 
-    async def handle_start(
-        self, request: web.Request, ws: web.WebSocketResponse, message: OperationMessage
-    ) -> None:
-        operation_id = message["id"]
-        payload = cast(StartPayload, message["payload"])
-        query = payload["query"]
-        operation_name = payload.get("operationName")
-        variables = payload.get("variables")
-        context = await self.get_context(request, ws)
-        root_value = await self.get_root_value(request)
+        if self.compression is None:
+            return None
 
-        if self.debug:
-            pretty_print_graphql_operation(operation_name, query, variables)
+        add_vary_header(response)
 
-        try:
-            result_source = await self.schema.subscribe(
-                query=query,
-                variable_values=variables,
-                operation_name=operation_name,
-                context_value=context,
-                root_value=root_value,
-            )
-        except GraphQLError as error:
-            error_payload = format_graphql_error(error)
-            await self.send_message(ws, GQL_ERROR, operation_id, error_payload)
-            return
-
-        if isinstance(result_source, GraphQLExecutionResult):
-            assert result_source.errors
-            error_payload = format_graphql_error(result_source.errors[0])
-            await self.send_message(ws, GQL_ERROR, operation_id, error_payload)
-            return
-
-        request["subscriptions"][operation_id] = result_source
-        request["tasks"][operation_id] = asyncio.create_task(
-            self.handle_async_results(result_source, operation_id, ws)
-        )
+        encoding = self.compression.negotiate(request.headers.get(hdrs.ACCEPT_ENCODING))
 
-    async def handle_stop(
-        self, request: web.Request, message: OperationMessage
-    ) -> None:
-        operation_id = message["id"]
-        await self.cleanup_operation(request, operation_id)
+        if encoding is None:
+            return None
+
+        response.headers[hdrs.CONTENT_ENCODING] = encoding
 
-    async def handle_keep_alive(self, ws: web.WebSocketResponse) -> None:
-        while True:
-            await ws.send_json({"type": GQL_CONNECTION_KEEP_ALIVE})
-            await asyncio.sleep(self.keep_alive_interval)
+        return self.compression.get_compressor(encoding)
 
-    async def handle_async_results(
+    async def write_chunk(
         self,
-        result_source: AsyncGenerator,
-        operation_id: str,
-        ws: web.WebSocketResponse,
+        response: web.StreamResponse,
+        compressor: Optional[StreamCompressor],
+        chunk: bytes,
+        flush: bool = False,
     ) -> None:
-        try:
-            async for result in result_source:
-                payload = {"data": result.data}
-                if result.errors:
-                    payload["errors"] = [
-                        format_graphql_error(err) for err in result.errors
-                    ]
-                await self.send_message(ws, GQL_DATA, operation_id, payload)
-        except asyncio.CancelledError:
-            # CancelledErrors are expected during task cleanup.
-            pass
-        except Exception as error:
-            # GraphQLErrors are handled by graphql-core and included in the
-            # ExecutionResult
-            error = GraphQLError(str(error), original_error=error)
-            await self.send_message(
-                ws,
-                GQL_DATA,
-                operation_id,
-                {"data": None, "errors": [format_graphql_error(error)]},
-            )
+        if compressor is not None:
+            assert self.compression is not None
 
-        await self.send_message(ws, GQL_COMPLETE, operation_id, None)
-
-    @classmethod
-    async def cleanup_operation(cls, request: web.Request, operation_id: str) -> None:
-        await request["subscriptions"][operation_id].aclose()
-        del request["subscriptions"][operation_id]
-
-        request["tasks"][operation_id].cancel()
-        with suppress(BaseException):
-            await request["tasks"][operation_id]
-        del request["tasks"][operation_id]
-
-    @classmethod
-    async def send_message(
-        cls,
-        ws: web.WebSocketResponse,
-        type_: str,
-        operation_id: str,
-        payload: Optional[OperationMessagePayload] = None,
-    ) -> None:
-        data: OperationMessage = {"type": type_, "id": operation_id}
-        if payload is not None:
-            data["payload"] = payload
-        await ws.send_json(data)
-
-    @classmethod
-    def is_websocket_request(cls, request: web.Request) -> bool:
-        ws = web.WebSocketResponse(protocols=[GRAPHQL_WS])
-        return ws.can_prepare(request).ok
+            chunk = await self.compression.compress_chunk(compressor, chunk, flush)
 
+        await response.write(chunk)
 
-class HTTPHandler(BaseGraphQLView, ABC):
-    async def handle_http(self, request: web.Request):
-        if request.method == "GET":
-            return await self.get(request)
-        if request.method == "POST":
-            return await self.post(request)
-        raise web.HTTPMethodNotAllowed(request.method, ["GET", "POST"])
+    async def write_eof(
+        self, response: web.StreamResponse, compressor: Optional[StreamCompressor]
+    ) -> None:
+        if compressor is not None:
+            await response.write(compressor.finish())
+
+        await response.write_eof()
 
     async def get(self, request: web.Request) -> web.StreamResponse:
+        if self.allow_queries_via_get and should_execute_query_params(request.query):
+            return await self.execute_request(request)
         if self.should_render_graphiql(request):
             return self.render_graphiql()
         return web.HTTPNotFound()
 
     async def post(self, request: web.Request) -> web.StreamResponse:
-        request_data = await self.get_request_data(request)
+        return await self.execute_request(request)
+
+    async def execute_request(self, request: web.Request) -> web.StreamResponse:
+        try:
+            request_data = await self.get_request_data(request)
+        except PersistedQueryNotFoundError:
+            return web.Response(
+                body=self.encode_json(PERSISTED_QUERY_NOT_FOUND_RESPONSE),
+                content_type="application/json",
+            )
+
+        if isinstance(request_data, list):
+            return await self.post_batch(request, request_data)
+
+        if request.method == "GET" and (
+            get_operation_type(request_data.query, request_data.operation_name)
+            == OperationType.MUTATION
+        ):
+            raise web.HTTPMethodNotAllowed(
+                request.method,
+                ["POST"],
+                reason="Mutations are not allowed when using GET",
+            )
+
+        if self.response_cache is not None:
+            cached_response = await self.response_cache.get(request_data)
+
+            if cached_response is not None:
+                return self.with_etag(
+                    request, self.create_cached_response(cached_response)
+                )
+
         response = web.Response()
         context = await self.get_context(request, response)
         root_value = await self.get_root_value(request)
@@ -259,48 +337,238 @@ class HTTPHandler(BaseGraphQLView, ABC):
             variable_values=request_data.variables,
             context_value=context,
             operation_name=request_data.operation_name,
+            allow_incremental=accepts_multipart(request.headers.get("Accept", "")),
         )
 
         response_data = await self.process_result(request, result)
-        response.text = json.dumps(response_data)
+
+        if (
+            isinstance(result, IncrementalExecutionResult)
+            and result.subsequent_results is not None
+        ):
+            response_data["hasNext"] = True
+
+            return await self.create_incremental_response(
+                request, response, response_data, result.subsequent_results
+            )
+
+        response.content_type = "application/json"
+
+        cache_policy = get_cache_policy_from_result(result)
+
+        if cache_policy is not None:
+            response.headers["Cache-Control"] = cache_policy.to_header()
+
+        if self.stream_responses:
+            return await self.create_streaming_response(
+                request, response, response_data
+            )
+
+        response.body = self.encode_json(response_data)
+
+        if cache_policy is not None and self.response_cache is not None:
+            await self.response_cache.set(
+                request_data, result, cast(bytes, response.body)
+            )
+
+        return self.with_etag(request, response)
+
+    def with_etag(self, request: web.Request, response: web.Response) -> web.Response:
+        """Adds an ETag to the responses of GET requests, replying with a 304
+        when it matches the one sent by the client in `If-None-Match`"""
+
+        if request.method != "GET":
+            return response
+
+        etag = get_etag(cast(bytes, response.body))
+
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            not_modified = web.Response(
+                status=304,
+                headers={
+                    name: value
+                    for name, value in response.headers.items()
+                    if name in ("Cache-Control", "Age")
+                },
+            )
+            not_modified.cookies.update(response.cookies)
+            response = not_modified
+
+        response.headers["ETag"] = etag
+
+        return response
+
+    async def create_streaming_response(
+        self, request: web.Request, sub_response: web.Response, data: Any
+    ) -> web.StreamResponse:
+        response = self.create_response_from(sub_response)
+        compressor = self.start_stream_compression(request, response)
+
+        await response.prepare(request)
+
+        for chunk in self.iter_encode_json(data):
+            await self.write_chunk(response, compressor, chunk)
+
+        await self.write_eof(response, compressor)
+
+        return response
+
+    async def post_batch(
+        self, request: web.Request, batch_request_data: List[GraphQLRequestData]
+    ) -> web.StreamResponse:
+        response = web.Response()
+        context = await self.get_context(request, response)
+        root_value = await self.get_root_value(request)
+
+        # the operations run concurrently and share the context, so that the
+        # DataLoaders created for the request batch loads across operations
+        results = await asyncio.gather(
+            *(
+                self.schema.execute(
+                    query=request_data.query,
+                    root_value=root_value,
+                    variable_values=request_data.variables,
+                    context_value=context,
+                    operation_name=request_data.operation_name,
+                )
+                for request_data in batch_request_data
+            )
+        )
+
+        response_data = [
+            await self.process_result(request, result) for result in results
+        ]
+
+        response.body = self.encode_json(response_data)
         response.content_type = "application/json"
+
+        return response
+
+    async def create_incremental_response(
+        self,
+        request: web.Request,
+        sub_response: web.Response,
+        initial_data: GraphQLHTTPResponse,
+        subsequent_results: AsyncIterator[SubsequentExecutionResult],
+    ) -> web.StreamResponse:
+        response = self.create_response_from(sub_response)
+        response.headers["Content-Type"] = MULTIPART_CONTENT_TYPE
+        compressor = self.start_stream_compression(request, response)
+
+        await response.prepare(request)
+
+        # the compressor is flushed after each part, so that the client can
+        # process the results as soon as they are sent
+        await self.write_chunk(
+            response,
+            compressor,
+            encode_multipart_start()
+            + encode_multipart_part(self.encode_json(initial_data)),
+            flush=True,
+        )
+
+        async for result in subsequent_results:
+            data = await self.process_subsequent_result(request, result)
+
+            await self.write_chunk(
+                response,
+                compressor,
+                encode_multipart_part(self.encode_json(data)),
+                flush=True,
+            )
+
+        await self.write_chunk(response, compressor, encode_multipart_end())
+        await self.write_eof(response, compressor)
+
         return response
 
-    async def get_request_data(self, request: web.Request) -> GraphQLRequestData:
-        data = await self.parse_body(request)
+    def create_response_from(self, sub_response: web.Response) -> web.StreamResponse:
+        response = web.StreamResponse(
+            status=sub_response.status,
+            reason=sub_response.reason,
+            headers=sub_response.headers,
+        )
+        response.cookies.update(sub_response.cookies)
+
+        return response
+
+    def create_cached_response(self, cached_response: CachedResponse) -> web.Response:
+        return web.Response(
+            body=cached_response.body,
+            headers={
+                "Cache-Control": cached_response.to_header(),
+                "Age": str(cached_response.age),
+            },
+            content_type="application/json",
+        )
+
+    async def get_request_data(
+        self, request: web.Request
+    ) -> Union[GraphQLRequestData, List[GraphQLRequestData]]:
+        data: Union[dict, list]
+
+        if request.method == "GET":
+            data = self.parse_query_params(request)
+        else:
+            data = await self.parse_body(request)
+
+        if isinstance(data, list) and not self.allow_batching:
+            raise web.HTTPBadRequest(reason="Batched operations are not enabled")
 
         try:
+            if isinstance(data, list):
+                return parse_batch_request_data(data)
+
+            if self.persisted_queries is not None:
+                data = await self.persisted_queries.resolve(data)
+
             request_data = parse_request_data(data)
         except MissingQueryError:
             raise web.HTTPBadRequest(reason="No GraphQL query found in the request")
+        except InvalidPersistedQueryHashError as error:
+            raise web.HTTPBadRequest(reason=str(error))
 
         return request_data
 
-    async def parse_body(self, request: web.Request) -> dict:
+    def parse_query_params(self, request: web.Request) -> dict:
+        try:
+            return parse_query_params(request.query, self.decode_json)
+        except json.JSONDecodeError:
+            raise web.HTTPBadRequest(reason="Unable to parse the query parameters")
+
+    async def parse_body(self, request: web.Request) -> Union[dict, list]:
         if request.content_type.startswith("multipart/form-data"):
             return await self.parse_multipart_body(request)
         try:
-            return await request.json()
+            return self.decode_json(await request.read())
         except json.JSONDecodeError:
             raise web.HTTPBadRequest(reason="Unable to parse request body as JSON")
 
     async def parse_multipart_body(self, request: web.Request) -> dict:
-        reader = await request.multipart()
-        operations: Dict[str, Any] = {}
-        files_map: Dict[str, Any] = {}
-        files: Dict[str, Any] = {}
         try:
-            async for field in reader:
-                if field.name == "operations":
-                    operations = (await field.json()) or {}
-                elif field.name == "map":
-                    files_map = (await field.json()) or {}
-                elif field.filename:
-                    assert field.name
-
-                    files[field.name] = BytesIO(await field.read(decode=False))
+            fields, files = await parse_multipart_form(
+                request.content.iter_any(),
+                request.headers[hdrs.CONTENT_TYPE],
+                self.upload_limits,
+            )
+        except UploadTooLargeError as error:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=self.upload_limits.max_file_size or 0,
+                actual_size=request.content_length or 0,
+                reason=str(error),
+            )
         except ValueError:
             raise web.HTTPBadRequest(reason="Unable to parse the multipart body")
+
+        # closed once the response has been sent
+        request["uploaded_files"] = list(files.values())
+
+        try:
+            operations = self.decode_json(fields.get("operations") or "{}")
+            files_map = self.decode_json(fields.get("map") or "{}")
+        except json.JSONDecodeError:
+            raise web.HTTPBadRequest(reason="Unable to parse the multipart body")
+
         try:
             return replace_placeholders_with_files(operations, files_map, files)
         except KeyError:
@@ -327,3 +595,12 @@ class GraphQLView(HTTPHandler, WebSocketHandler, BaseGraphQLView):
             return await self.handle_websocket(request)
         else:
             return await self.handle_http(request)
+
+
+def add_vary_header(response: web.StreamResponse) -> None:
+    vary = response.headers.get(hdrs.VARY)
+
+    if vary is None:
+        response.headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+    elif hdrs.ACCEPT_ENCODING.lower() not in vary.lower():
+        response.headers[hdrs.VARY] = f"{vary}, {hdrs.ACCEPT_ENCODING}"
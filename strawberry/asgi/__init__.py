@@ -1,42 +1,85 @@
 import asyncio
 import json
 from abc import ABC, abstractmethod
-from contextlib import suppress
-from typing import Any, AsyncGenerator, Callable, Optional, Union, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from starlette import status
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
+from starlette.responses import (
+    HTMLResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.types import Receive, Scope, Send
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
-from graphql import ExecutionResult as GraphQLExecutionResult, GraphQLError
-from graphql.error import format_error as format_graphql_error
+from graphql import OperationType
 
 from strawberry.asgi.utils import get_graphiql_html
-from strawberry.exceptions import MissingQueryError
+from strawberry.cache import CachedResponse, ResponseCache, get_cache_policy_from_result
+from strawberry.codecs import DEFAULT_CHUNK_SIZE, JSONCodec, default_json_codec
+from strawberry.compression import ResponseCompression
+from strawberry.exceptions import (
+    InvalidPersistedQueryHashError,
+    MissingQueryError,
+    PersistedQueryNotFoundError,
+    UploadTooLargeError,
+)
+from strawberry.file_uploads import UploadLimits
+from strawberry.file_uploads.parser import parse_multipart_form
 from strawberry.file_uploads.utils import replace_placeholders_with_files
-from strawberry.http import GraphQLHTTPResponse, parse_request_data, process_result
+from strawberry.http import (
+    MULTIPART_CONTENT_TYPE,
+    GraphQLHTTPResponse,
+    GraphQLHTTPSubsequentResponse,
+    accepts_multipart,
+    encode_multipart_end,
+    encode_multipart_part,
+    encode_multipart_start,
+    etag_matches,
+    get_etag,
+    parse_batch_request_data,
+    parse_query_params,
+    parse_request_data,
+    process_result,
+    process_subsequent_result,
+    should_execute_query_params,
+)
+from strawberry.persisted_queries import (
+    PERSISTED_QUERY_NOT_FOUND_RESPONSE,
+    PersistedQueries,
+)
 from strawberry.schema import BaseSchema
 from strawberry.subscriptions.constants import (
-    GQL_COMPLETE,
-    GQL_CONNECTION_ACK,
-    GQL_CONNECTION_INIT,
-    GQL_CONNECTION_KEEP_ALIVE,
-    GQL_CONNECTION_TERMINATE,
-    GQL_DATA,
-    GQL_ERROR,
-    GQL_START,
-    GQL_STOP,
-    GRAPHQL_WS,
+    GRAPHQL_TRANSPORT_WS,
+    SUBSCRIPTION_PROTOCOLS,
+    WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE,
 )
-from strawberry.subscriptions.types import (
-    OperationMessage,
-    OperationMessagePayload,
-    StartPayload,
+from strawberry.subscriptions.graphql_transport_ws import GraphQLTransportWSHandler
+from strawberry.subscriptions.graphql_ws import GraphQLWSHandler
+from strawberry.subscriptions.handlers import (
+    BaseSubscriptionsHandler,
+    select_subscription_protocol,
+)
+from strawberry.types import (
+    ExecutionResult,
+    IncrementalExecutionResult,
+    SubsequentExecutionResult,
 )
-from strawberry.types import ExecutionResult
 from strawberry.utils.debug import pretty_print_graphql_operation
+from strawberry.utils.operation import get_operation_type
 
 
 class BaseGraphQLApp(ABC):
@@ -46,13 +89,35 @@ class BaseGraphQLApp(ABC):
         graphiql: bool = True,
         keep_alive: bool = False,
         keep_alive_interval: float = 1,
+        subscription_protocols: Sequence[str] = SUBSCRIPTION_PROTOCOLS,
+        connection_init_wait_timeout: float = 60,
         debug: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        json_codec: Optional[JSONCodec] = None,
+        stream_responses: bool = False,
+        stream_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        allow_batching: bool = False,
+        allow_queries_via_get: bool = True,
+        persisted_queries: Optional[PersistedQueries] = None,
+        compression: Optional[ResponseCompression] = None,
+        upload_limits: Optional[UploadLimits] = None,
     ) -> None:
         self.schema = schema
         self.graphiql = graphiql
         self.keep_alive = keep_alive
         self.keep_alive_interval = keep_alive_interval
+        self.subscription_protocols = subscription_protocols
+        self.connection_init_wait_timeout = connection_init_wait_timeout
         self.debug = debug
+        self.response_cache = response_cache
+        self.json_codec = json_codec or default_json_codec
+        self.stream_responses = stream_responses
+        self.stream_chunk_size = stream_chunk_size
+        self.allow_batching = allow_batching
+        self.allow_queries_via_get = allow_queries_via_get
+        self.persisted_queries = persisted_queries
+        self.compression = compression
+        self.upload_limits = upload_limits or UploadLimits()
 
     @abstractmethod
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
@@ -73,153 +138,86 @@ class BaseGraphQLApp(ABC):
     ) -> GraphQLHTTPResponse:
         return process_result(result)
 
+    async def process_subsequent_result(
+        self, request: Request, result: SubsequentExecutionResult
+    ) -> GraphQLHTTPSubsequentResponse:
+        return process_subsequent_result(result)
+
+    def encode_json(self, data: Any) -> bytes:
+        return self.json_codec.encode(data)
+
+    def iter_encode_json(self, data: Any) -> Iterator[bytes]:
+        return self.json_codec.iter_encode(data, self.stream_chunk_size)
+
+    def decode_json(self, data: Union[str, bytes]) -> Any:
+        return self.json_codec.decode(data)
+
 
 class WebSocketHandler(BaseGraphQLApp, ABC):
     async def handle_websocket(
         self, scope: Scope, receive: Receive, send: Send
     ) -> None:
         ws = WebSocket(scope=scope, receive=receive, send=send)
-        await ws.accept(subprotocol=GRAPHQL_WS)
-
-        ws.state.subscriptions = {}
-        ws.state.tasks = {}
-        ws.state.keep_alive_task = None
-
-        try:
-            while ws.application_state != WebSocketState.DISCONNECTED:
-                try:
-                    message: OperationMessage = await ws.receive_json()
-                except KeyError:
-                    # Ignore non-text/json for consistency with the aiohttp impl. and
-                    # to make this impl. more robust.
-                    continue
-                await self.handle_ws_message(ws, message)
-        except WebSocketDisconnect:  # pragma: no cover
-            pass
-        finally:
-            if ws.state.keep_alive_task:
-                ws.state.keep_alive_task.cancel()
-                with suppress(BaseException):
-                    await ws.state.keep_alive_task
-
-            for operation_id in list(ws.state.subscriptions.keys()):
-                await self.cleanup_operation(ws, operation_id)
-
-    async def handle_ws_message(self, ws: WebSocket, message: OperationMessage) -> None:
-        message_type = message.get("type")
-
-        if message_type == GQL_CONNECTION_INIT:
-            await self.handle_connection_init(ws)
-        elif message_type == GQL_CONNECTION_TERMINATE:
-            await self.handle_connection_terminate(ws)
-        elif message_type == GQL_START:
-            await self.handle_start(ws, message)
-        elif message_type == GQL_STOP:
-            await self.handle_stop(ws, message)
-
-    async def handle_connection_init(self, ws: WebSocket) -> None:
-        await ws.send_json({"type": GQL_CONNECTION_ACK})
-
-        if self.keep_alive:
-            ws.state.keep_alive_task = asyncio.create_task(self.handle_keep_alive(ws))
-
-    async def handle_connection_terminate(self, ws: WebSocket) -> None:
-        await ws.close()
-
-    async def handle_start(self, ws: WebSocket, message: OperationMessage) -> None:
-        operation_id = message["id"]
-        payload = cast(StartPayload, message["payload"])
-        query = payload["query"]
-        operation_name = payload.get("operationName")
-        variables = payload.get("variables")
-        context = await self.get_context(ws)
-        root_value = await self.get_root_value(ws)
+        protocol = select_subscription_protocol(
+            scope.get("subprotocols", []), self.subscription_protocols
+        )
 
-        if self.debug:
-            pretty_print_graphql_operation(operation_name, query, variables)
+        await ws.accept(subprotocol=protocol)
 
-        try:
-            result_source = await self.schema.subscribe(
-                query=query,
-                variable_values=variables,
-                operation_name=operation_name,
-                context_value=context,
-                root_value=root_value,
-            )
-        except GraphQLError as error:
-            error_payload = format_graphql_error(error)
-            await self.send_message(ws, GQL_ERROR, operation_id, error_payload)
+        if protocol is None:
+            await ws.close(WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE)
             return
 
-        if isinstance(result_source, GraphQLExecutionResult):
-            assert result_source.errors
-            error_payload = format_graphql_error(result_source.errors[0])
-            await self.send_message(ws, GQL_ERROR, operation_id, error_payload)
-            return
+        handler = self.get_subscriptions_handler(ws, protocol)
 
-        ws.state.subscriptions[operation_id] = result_source
-        ws.state.tasks[operation_id] = asyncio.create_task(
-            self.handle_async_results(result_source, operation_id, ws)
-        )
+        ws.state.tasks = handler.tasks
+        handler.start()
 
-    async def handle_stop(self, ws: WebSocket, message: OperationMessage) -> None:
-        operation_id = message["id"]
-        await self.cleanup_operation(ws, operation_id)
+        try:
+            while ws.application_state != WebSocketState.DISCONNECTED:
+                message = await ws.receive()
 
-    async def handle_keep_alive(self, ws: WebSocket) -> None:
-        while ws.application_state != WebSocketState.DISCONNECTED:  # pragma: no cover
-            await ws.send_json({"type": GQL_CONNECTION_KEEP_ALIVE})
-            await asyncio.sleep(self.keep_alive_interval)
+                if message["type"] == "websocket.disconnect":
+                    break
 
-    async def handle_async_results(
-        self, result_source: AsyncGenerator, operation_id: str, ws: WebSocket
-    ) -> None:
-        try:
-            async for result in result_source:
-                payload = {"data": result.data}
-                if result.errors:
-                    payload["errors"] = [
-                        format_graphql_error(err) for err in result.errors
-                    ]
-                await self.send_message(ws, GQL_DATA, operation_id, payload)
-        except asyncio.CancelledError:
-            # CancelledErrors are expected during task cleanup.
+                # Ignore the binary messages for consistency with the aiohttp
+                # implementation
+                if message.get("text") is not None:
+                    await handler.handle_text(message["text"])
+        except WebSocketDisconnect:  # pragma: no cover
             pass
-        except Exception as error:
-            # GraphQLErrors are handled by graphql-core and included in the
-            # ExecutionResult
-            error = GraphQLError(str(error), original_error=error)
-            await self.send_message(
-                ws,
-                GQL_DATA,
-                operation_id,
-                {"data": None, "errors": [format_graphql_error(error)]},
+        finally:
+            await handler.handle_disconnect()
+
+    def get_subscriptions_handler(
+        self, ws: WebSocket, protocol: str
+    ) -> BaseSubscriptionsHandler:
+        async def close(code: int, reason: str) -> None:
+            # the close reason isn't supported by this version of Starlette
+            await ws.close(code)
+
+        kwargs: Dict[str, Any] = dict(
+            send_text=ws.send_text,
+            close=close,
+            get_context=lambda: self.get_context(ws),
+            get_root_value=lambda: self.get_root_value(ws),
+            json_codec=self.json_codec,
+            debug=self.debug,
+        )
+
+        if protocol == GRAPHQL_TRANSPORT_WS:
+            return GraphQLTransportWSHandler(
+                self.schema,
+                connection_init_wait_timeout=self.connection_init_wait_timeout,
+                **kwargs,
             )
 
-        await self.send_message(ws, GQL_COMPLETE, operation_id, None)
-
-    @classmethod
-    async def cleanup_operation(cls, ws: WebSocket, operation_id: str) -> None:
-        await ws.state.subscriptions[operation_id].aclose()
-        del ws.state.subscriptions[operation_id]
-
-        ws.state.tasks[operation_id].cancel()
-        with suppress(BaseException):
-            await ws.state.tasks[operation_id]
-        del ws.state.tasks[operation_id]
-
-    @classmethod
-    async def send_message(
-        cls,
-        ws: WebSocket,
-        type_: str,
-        operation_id: str,
-        payload: Optional[OperationMessagePayload] = None,
-    ) -> None:
-        data: OperationMessage = {"type": type_, "id": operation_id}
-        if payload:
-            data["payload"] = payload
-        await ws.send_json(data)
+        return GraphQLWSHandler(
+            self.schema,
+            keep_alive=self.keep_alive,
+            keep_alive_interval=self.keep_alive_interval,
+            **kwargs,
+        )
 
 
 class HTTPHandler(BaseGraphQLApp, ABC):
@@ -254,7 +252,50 @@ class HTTPHandler(BaseGraphQLApp, ABC):
         if sub_response.status_code:
             response.status_code = sub_response.status_code
 
-        await response(scope, receive, send)
+        if self.compression is not None:
+            response = await self.compress_response(request, response, self.compression)
+
+        try:
+            await response(scope, receive, send)
+        finally:
+            for file in getattr(request.state, "uploaded_files", ()):
+                await file.close()
+
+    async def compress_response(
+        self, request: Request, response: Response, compression: ResponseCompression
+    ) -> Response:
+        response.headers.add_vary_header("Accept-Encoding")
+
+        if (
+            "content-encoding" in response.headers
+            or response.status_code in (204, 304)
+            or (
+                not isinstance(response, StreamingResponse)
+                and len(response.body) < compression.minimum_size
+            )
+        ):
+            return response
+
+        encoding = compression.negotiate(request.headers.get("Accept-Encoding"))
+
+        if encoding is None:
+            return response
+
+        if isinstance(response, StreamingResponse):
+            # multipart responses are flushed after each part, so that the
+            # client can process the results as soon as they are sent
+            response.body_iterator = compression.iter_compress(
+                response.body_iterator,
+                encoding,
+                flush=response.media_type == MULTIPART_CONTENT_TYPE,
+            )
+        else:
+            response.body = await compression.compress(response.body, encoding)
+            response.headers["Content-Length"] = str(len(response.body))
+
+        response.headers["Content-Encoding"] = encoding
+
+        return response
 
     async def get_http_response(
         self,
@@ -266,23 +307,67 @@ class HTTPHandler(BaseGraphQLApp, ABC):
         context: Optional[Any],
     ) -> Response:
         if request.method == "GET":
-            if not graphiql:
-                return HTMLResponse(status_code=status.HTTP_404_NOT_FOUND)
-
-            return self.get_graphiql_response()
-
-        if request.method == "POST":
+            if not (
+                self.allow_queries_via_get
+                and should_execute_query_params(request.query_params)
+            ):
+                if not graphiql:
+                    return HTMLResponse(status_code=status.HTTP_404_NOT_FOUND)
+
+                return self.get_graphiql_response()
+
+            try:
+                data = parse_query_params(request.query_params, self.decode_json)
+            except json.JSONDecodeError:
+                return PlainTextResponse(
+                    "Unable to parse the query parameters",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+        elif request.method == "POST":
             content_type = request.headers.get("Content-Type", "")
             if "application/json" in content_type:
-                data = await request.json()
+                try:
+                    data = self.decode_json(await request.body())
+                except json.JSONDecodeError:
+                    return PlainTextResponse(
+                        "Unable to parse request body as JSON",
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                    )
             elif content_type.startswith("multipart/form-data"):
-                multipart_data = await request.form()
-                operations = json.loads(multipart_data.get("operations", "{}"))
-                files_map = json.loads(multipart_data.get("map", "{}"))
+                try:
+                    fields, files = await parse_multipart_form(
+                        request.stream(), content_type, self.upload_limits
+                    )
+                except UploadTooLargeError as error:
+                    return PlainTextResponse(
+                        str(error),
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    )
+                except ValueError:
+                    return PlainTextResponse(
+                        "Unable to parse the multipart body",
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                # closed once the response has been sent
+                request.state.uploaded_files = list(files.values())
 
-                data = replace_placeholders_with_files(
-                    operations, files_map, multipart_data
-                )
+                try:
+                    operations = self.decode_json(fields.get("operations", "{}"))
+                    files_map = self.decode_json(fields.get("map", "{}"))
+                except json.JSONDecodeError:
+                    return PlainTextResponse(
+                        "Unable to parse the multipart body",
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                try:
+                    data = replace_placeholders_with_files(operations, files_map, files)
+                except KeyError:
+                    return PlainTextResponse(
+                        "File(s) missing in form data",
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                    )
 
             else:
                 return PlainTextResponse(
@@ -295,33 +380,223 @@ class HTTPHandler(BaseGraphQLApp, ABC):
                 status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
             )
 
+        if isinstance(data, list):
+            return await self.get_batch_http_response(
+                request=request,
+                data=data,
+                execute=execute,
+                process_result=process_result,
+                root_value=root_value,
+                context=context,
+            )
+
         try:
+            if self.persisted_queries is not None:
+                data = await self.persisted_queries.resolve(data)
+
             request_data = parse_request_data(data)
-        except MissingQueryError:
+        except PersistedQueryNotFoundError:
+            return Response(
+                self.encode_json(PERSISTED_QUERY_NOT_FOUND_RESPONSE),
+                status_code=status.HTTP_200_OK,
+                media_type="application/json",
+            )
+        except (MissingQueryError, InvalidPersistedQueryHashError) as error:
+            message = (
+                "No GraphQL query found in the request"
+                if isinstance(error, MissingQueryError)
+                else str(error)
+            )
+
+            return PlainTextResponse(message, status_code=status.HTTP_400_BAD_REQUEST)
+
+        if request.method == "GET" and (
+            get_operation_type(request_data.query, request_data.operation_name)
+            == OperationType.MUTATION
+        ):
             return PlainTextResponse(
-                "No GraphQL query found in the request",
-                status_code=status.HTTP_400_BAD_REQUEST,
+                "Mutations are not allowed when using GET",
+                status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
+                headers={"Allow": "POST"},
             )
 
+        if self.response_cache is not None:
+            cached_response = await self.response_cache.get(request_data)
+
+            if cached_response is not None:
+                return self.with_etag(
+                    request, self.get_cached_response(cached_response)
+                )
+
         result = await execute(
             request_data.query,
             variables=request_data.variables,
             context=context,
             operation_name=request_data.operation_name,
             root_value=root_value,
+            allow_incremental=accepts_multipart(request.headers.get("Accept", "")),
         )
 
         response_data = await process_result(request=request, result=result)
 
-        return JSONResponse(response_data, status_code=status.HTTP_200_OK)
+        if (
+            isinstance(result, IncrementalExecutionResult)
+            and result.subsequent_results is not None
+        ):
+            response_data["hasNext"] = True
+
+            return StreamingResponse(
+                self.encode_incremental_results(
+                    request, response_data, result.subsequent_results
+                ),
+                status_code=status.HTTP_200_OK,
+                media_type=MULTIPART_CONTENT_TYPE,
+            )
+
+        response: Response
+
+        if self.stream_responses:
+            # the chunks are encoded in a thread pool by starlette, so large
+            # responses don't block the event loop while being serialised
+            response = StreamingResponse(
+                self.iter_encode_json(response_data),
+                status_code=status.HTTP_200_OK,
+                media_type="application/json",
+            )
+        else:
+            response = Response(
+                self.encode_json(response_data),
+                status_code=status.HTTP_200_OK,
+                media_type="application/json",
+            )
+
+        cache_policy = get_cache_policy_from_result(result)
+
+        if cache_policy is not None:
+            response.headers["Cache-Control"] = cache_policy.to_header()
+
+            # streamed bodies are never fully materialised, so they can't be
+            # stored in the response cache
+            if self.response_cache is not None and not self.stream_responses:
+                await self.response_cache.set(request_data, result, response.body)
+
+        if self.stream_responses:
+            return response
+
+        return self.with_etag(request, response)
+
+    def with_etag(self, request: Request, response: Response) -> Response:
+        """Adds an ETag to the responses of GET requests, replying with a 304
+        when it matches the one sent by the client in `If-None-Match`"""
+
+        if request.method != "GET":
+            return response
+
+        etag = get_etag(response.body)
+
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            response = Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={
+                    name: value
+                    for name, value in response.headers.items()
+                    if name in ("cache-control", "age")
+                },
+            )
+
+        response.headers["ETag"] = etag
+
+        return response
+
+    async def get_batch_http_response(
+        self,
+        request: Request,
+        data: List[Dict[str, Any]],
+        execute: Callable,
+        process_result: Callable,
+        root_value: Optional[Any],
+        context: Optional[Any],
+    ) -> Response:
+        if not self.allow_batching:
+            return PlainTextResponse(
+                "Batched operations are not enabled",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            batch_request_data = parse_batch_request_data(data)
+        except MissingQueryError:
+            return PlainTextResponse(
+                "No GraphQL query found in the request",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # the operations run concurrently and share the context, so that the
+        # DataLoaders created for the request batch loads across operations
+        results = await asyncio.gather(
+            *(
+                execute(
+                    request_data.query,
+                    variables=request_data.variables,
+                    context=context,
+                    operation_name=request_data.operation_name,
+                    root_value=root_value,
+                )
+                for request_data in batch_request_data
+            )
+        )
+
+        response_data = [
+            await process_result(request=request, result=result) for result in results
+        ]
+
+        return Response(
+            self.encode_json(response_data),
+            status_code=status.HTTP_200_OK,
+            media_type="application/json",
+        )
 
     def get_graphiql_response(self) -> HTMLResponse:
         html = get_graphiql_html()
 
         return HTMLResponse(html)
 
+    def get_cached_response(self, cached_response: CachedResponse) -> Response:
+        return Response(
+            cached_response.body,
+            status_code=status.HTTP_200_OK,
+            headers={
+                "Cache-Control": cached_response.to_header(),
+                "Age": str(cached_response.age),
+            },
+            media_type="application/json",
+        )
+
+    async def encode_incremental_results(
+        self,
+        request: Request,
+        initial_data: GraphQLHTTPResponse,
+        subsequent_results: AsyncIterator[SubsequentExecutionResult],
+    ) -> AsyncGenerator[bytes, None]:
+        yield encode_multipart_start() + encode_multipart_part(
+            self.encode_json(initial_data)
+        )
+
+        async for result in subsequent_results:
+            data = await self.process_subsequent_result(request, result)
+
+            yield encode_multipart_part(self.encode_json(data))
+
+        yield encode_multipart_end()
+
     async def execute(
-        self, query, variables=None, context=None, operation_name=None, root_value=None
+        self,
+        query,
+        variables=None,
+        context=None,
+        operation_name=None,
+        root_value=None,
+        allow_incremental=False,
     ):
         if self.debug:
             pretty_print_graphql_operation(operation_name, query, variables)
@@ -332,6 +607,7 @@ class HTTPHandler(BaseGraphQLApp, ABC):
             variable_values=variables,
             operation_name=operation_name,
             context_value=context,
+            allow_incremental=allow_incremental,
         )
 
 
@@ -0,0 +1,21 @@
+from .control import CacheControl, CachePolicy, CacheScope, get_cache_policy
+from .fields import BaseFieldCache, FieldCache, ProcessFieldCache, RequestFieldCache
+from .response import CachedResponse, ResponseCache, get_cache_policy_from_result
+from .stores import BaseCacheStore, InMemoryCacheStore
+
+
+__all__ = [
+    "BaseCacheStore",
+    "BaseFieldCache",
+    "CacheControl",
+    "CachePolicy",
+    "CacheScope",
+    "CachedResponse",
+    "FieldCache",
+    "InMemoryCacheStore",
+    "ProcessFieldCache",
+    "RequestFieldCache",
+    "ResponseCache",
+    "get_cache_policy",
+    "get_cache_policy_from_result",
+]
@@ -0,0 +1,203 @@
+import dataclasses
+from enum import Enum
+from typing import Any, Dict, Optional, Set, Tuple
+
+from graphql import (
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLUnionType,
+    get_named_type,
+)
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationType,
+    SelectionSetNode,
+)
+from graphql.utilities import get_operation_ast
+
+from strawberry.extensions.utils import is_introspection_key
+
+
+class CacheScope(Enum):
+    PUBLIC = "PUBLIC"
+    PRIVATE = "PRIVATE"
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheControl:
+    """Cache hint for a type or a field
+
+    >>> @strawberry.type(cache_control=CacheControl(max_age=60))
+    >>> class Product:
+    >>>     name: str
+    >>>     price: float = strawberry.field(
+    >>>         cache_control=CacheControl(max_age=10, scope=CacheScope.PRIVATE)
+    >>>     )
+    """
+
+    max_age: Optional[int] = None
+    scope: Optional[CacheScope] = None
+
+
+@dataclasses.dataclass
+class CachePolicy:
+    """The cache policy of a whole operation.
+
+    The policy starts unrestricted and each hint found in the operation
+    restricts it, the resulting max age is the lowest of all the hints and
+    the scope is private as soon as one of the hints is private.
+    """
+
+    max_age: Optional[int] = None
+    scope: CacheScope = CacheScope.PUBLIC
+
+    def restrict(self, hint: CacheControl) -> None:
+        if hint.max_age is not None and (
+            self.max_age is None or hint.max_age < self.max_age
+        ):
+            self.max_age = hint.max_age
+
+        if hint.scope is CacheScope.PRIVATE:
+            self.scope = CacheScope.PRIVATE
+
+    @property
+    def is_cacheable(self) -> bool:
+        return bool(self.max_age)
+
+    @property
+    def is_public(self) -> bool:
+        return self.is_cacheable and self.scope is CacheScope.PUBLIC
+
+    def to_header(self) -> str:
+        if not self.is_cacheable:
+            return "no-store"
+
+        return f"max-age={self.max_age}, {self.scope.value.lower()}"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"maxAge": self.max_age or 0, "scope": self.scope.value}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CachePolicy":
+        return cls(max_age=data["maxAge"], scope=CacheScope(data["scope"]))
+
+
+def _get_strawberry_cache_control(extensions: Optional[Dict[str, Any]]):
+    definition = (extensions or {}).get("strawberry_definition")
+
+    return getattr(definition, "cache_control", None)
+
+
+def get_cache_policy(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: Optional[str] = None,
+    default_max_age: int = 0,
+) -> CachePolicy:
+    """Computes the cache policy of an operation from the hints declared on
+    types and fields, without executing it.
+
+    Like Apollo Server, root fields and fields returning object types that
+    don't have a hint get `default_max_age`, while scalar fields inherit the
+    policy of their parent.
+    """
+
+    policy = CachePolicy()
+    operation = get_operation_ast(document, operation_name)
+
+    if operation is None or operation.operation != OperationType.QUERY:
+        policy.max_age = 0
+        return policy
+
+    fragments: Dict[str, FragmentDefinitionNode] = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+    # fragments only need to be visited once, as their hints don't change
+    # depending on where they are spread, this also protects us from cycles
+    visited_fragments: Set[Tuple[str, bool]] = set()
+
+    def visit_field(
+        parent_type: Optional[GraphQLNamedType], node: FieldNode, is_root: bool
+    ) -> None:
+        field_name = node.name.value
+
+        if is_introspection_key(field_name):
+            return
+
+        fields: Dict[str, GraphQLField] = getattr(parent_type, "fields", {})
+        field = fields.get(field_name)
+
+        if field is None:
+            return
+
+        return_type = get_named_type(field.type)
+        is_composite = isinstance(
+            return_type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType)
+        )
+
+        hint = _get_strawberry_cache_control(field.extensions)
+
+        if hint is None or hint.max_age is None:
+            type_hint = _get_strawberry_cache_control(return_type.extensions)
+
+            if type_hint is not None:
+                hint = CacheControl(
+                    max_age=type_hint.max_age,
+                    scope=(hint and hint.scope) or type_hint.scope,
+                )
+
+        if hint is not None:
+            policy.restrict(hint)
+
+        if (hint is None or hint.max_age is None) and (is_composite or is_root):
+            policy.restrict(CacheControl(max_age=default_max_age))
+
+        if node.selection_set:
+            visit_selection_set(return_type, node.selection_set)
+
+    def visit_selection_set(
+        parent_type: Optional[GraphQLNamedType],
+        selection_set: SelectionSetNode,
+        is_root: bool = False,
+    ) -> None:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                visit_field(parent_type, selection, is_root)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type: Optional[GraphQLNamedType] = parent_type
+
+                if selection.type_condition:
+                    fragment_type = schema.get_type(selection.type_condition.name.value)
+
+                visit_selection_set(fragment_type, selection.selection_set, is_root)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+
+                if (name, is_root) in visited_fragments or name not in fragments:
+                    continue
+
+                visited_fragments.add((name, is_root))
+                fragment = fragments[name]
+
+                visit_selection_set(
+                    schema.get_type(fragment.type_condition.name.value),
+                    fragment.selection_set,
+                    is_root,
+                )
+
+    visit_selection_set(schema.query_type, operation.selection_set, is_root=True)
+
+    if policy.max_age is None:
+        policy.max_age = default_max_age
+
+    return policy
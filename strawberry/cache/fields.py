@@ -0,0 +1,261 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from graphql import GraphQLResolveInfo
+
+from strawberry.utils.await_maybe import AwaitableOrValue, await_maybe
+
+from .stores import BaseCacheStore, InMemoryCacheStore
+
+
+_Scope = Dict[int, Tuple[BaseCacheStore, Dict[str, "asyncio.Future"]]]
+
+_request_scope: ContextVar[Optional[_Scope]] = ContextVar(
+    "strawberry_field_cache_request_scope", default=None
+)
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """Delimits the lifetime of `RequestFieldCache`s, Strawberry uses it to
+    wrap the execution of each operation"""
+
+    token = _request_scope.set({})
+
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+
+
+def _get_request_scope(
+    cache: "BaseFieldCache", max_size: Optional[int]
+) -> Optional[Tuple[BaseCacheStore, Dict[str, "asyncio.Future"]]]:
+    request_scope = _request_scope.get()
+
+    if request_scope is None:
+        return None
+
+    if id(cache) not in request_scope:
+        request_scope[id(cache)] = (InMemoryCacheStore(max_size=max_size), {})
+
+    return request_scope[id(cache)]
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    # when the key of the parent is its identity we keep a reference to it, so
+    # that its id can't be reused by another object while the entry is alive
+    parent: Any
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+class BaseFieldCache(ABC):
+    """Base class of the caches that can be passed to `strawberry.field`
+
+    Results are keyed by field, parent and arguments. By default the parent is
+    identified by its id, `key` can be used to provide a function returning a
+    stable key for it (for example its primary key), which is needed to share
+    results between requests.
+
+    Concurrent calls of async resolvers with the same key share the same
+    in-flight call.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        self.ttl = ttl
+        self.key = key
+
+    @abstractmethod
+    def get_scope(self) -> Optional[Tuple[BaseCacheStore, Dict[str, asyncio.Future]]]:
+        """Returns the store and the in-flight calls to use for the current
+        execution, or None when results shouldn't be cached"""
+
+    def get_key(
+        self, source: Any, info: GraphQLResolveInfo, kwargs: Dict[str, Any]
+    ) -> str:
+        parent_key = self.key(source) if self.key else id(source)
+
+        return (
+            f"{info.parent_type.name}.{info.field_name}:"
+            f"{parent_key!r}:{_freeze(kwargs)!r}"
+        )
+
+    def resolve(
+        self,
+        get_result: Callable[[], AwaitableOrValue[Any]],
+        source: Any,
+        info: GraphQLResolveInfo,
+        kwargs: Dict[str, Any],
+    ) -> AwaitableOrValue[Any]:
+        scope = self.get_scope()
+
+        if scope is None:
+            return get_result()
+
+        store, in_flight = scope
+        key = self.get_key(source, info, kwargs)
+
+        if key in in_flight:
+            return self._wait(in_flight[key])
+
+        entry = store.get(key)
+
+        if isawaitable(entry):
+            return self._register_in_flight(
+                in_flight,
+                key,
+                self._resolve_with_async_store(
+                    store, key, cast(Awaitable, entry), get_result, source
+                ),
+            )
+
+        if entry is not None:
+            return cast(_CacheEntry, entry).value
+
+        result = get_result()
+
+        if isawaitable(result):
+            return self._register_in_flight(
+                in_flight, key, self._store_when_done(store, key, result, source)
+            )
+
+        stored = store.set(key, self._create_entry(result, source), ttl=self.ttl)
+
+        if isawaitable(stored):
+            # sync resolver with an async store
+            return self._return_when_stored(cast(Awaitable[None], stored), result)
+
+        return result
+
+    def _register_in_flight(
+        self, in_flight: Dict[str, asyncio.Future], key: str, call: Awaitable[Any]
+    ) -> Awaitable[Any]:
+        # concurrent calls with the same key wait for this one
+        future = asyncio.ensure_future(call)
+        in_flight[key] = future
+        future.add_done_callback(lambda _: in_flight.pop(key, None))
+
+        return self._wait(future)
+
+    async def _return_when_stored(self, stored: Awaitable[None], result: Any) -> Any:
+        await stored
+
+        return result
+
+    def _create_entry(self, value: Any, source: Any) -> _CacheEntry:
+        return _CacheEntry(value, None if self.key else source)
+
+    async def _wait(self, future: Awaitable[Any]) -> Any:
+        return await future
+
+    async def _store_when_done(
+        self, store: BaseCacheStore, key: str, future: Awaitable[Any], source: Any
+    ) -> Any:
+        result = await future
+
+        await await_maybe(store.set(key, self._create_entry(result, source), self.ttl))
+
+        return result
+
+    async def _resolve_with_async_store(
+        self,
+        store: BaseCacheStore,
+        key: str,
+        entry: Awaitable[Optional[_CacheEntry]],
+        get_result: Callable[[], AwaitableOrValue[Any]],
+        source: Any,
+    ) -> Any:
+        cached_entry = await entry
+
+        if cached_entry is not None:
+            return cached_entry.value
+
+        result = get_result()
+
+        if isawaitable(result):
+            result = await result
+
+        await await_maybe(store.set(key, self._create_entry(result, source), self.ttl))
+
+        return result
+
+
+class FieldCache(BaseFieldCache):
+    """Memoizes the results of a resolver in a custom `store`
+
+    The ids of the parents aren't stable between requests, nor between
+    processes, so without `key` the results are only kept for the duration of
+    a request, like with `RequestFieldCache`.
+    """
+
+    def __init__(
+        self,
+        store: BaseCacheStore,
+        ttl: Optional[float] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        super().__init__(ttl=ttl, key=key)
+        self.store = store
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def get_scope(self) -> Optional[Tuple[BaseCacheStore, Dict[str, asyncio.Future]]]:
+        if self.key is None:
+            return _get_request_scope(self, max_size=None)
+
+        return self.store, self._in_flight
+
+
+class ProcessFieldCache(FieldCache):
+    """Memoizes the results of a resolver in memory, for the whole process"""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = 1024,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        super().__init__(InMemoryCacheStore(max_size=max_size), ttl=ttl, key=key)
+
+
+class RequestFieldCache(BaseFieldCache):
+    """Memoizes the results of a resolver for the duration of a request"""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        super().__init__(key=key)
+        self.max_size = max_size
+
+    def get_scope(self) -> Optional[Tuple[BaseCacheStore, Dict[str, asyncio.Future]]]:
+        return _get_request_scope(self, self.max_size)
@@ -0,0 +1,95 @@
+import dataclasses
+import hashlib
+import json
+import time
+from typing import Optional
+
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+from strawberry.utils.await_maybe import await_maybe
+
+from .control import CachePolicy
+from .stores import BaseCacheStore, InMemoryCacheStore
+
+
+CACHE_CONTROL_EXTENSION_KEY = "cacheControl"
+
+
+@dataclasses.dataclass
+class CachedResponse:
+    body: bytes
+    policy: CachePolicy
+    created_at: float = dataclasses.field(default_factory=time.time)
+
+    @property
+    def age(self) -> int:
+        return int(time.time() - self.created_at)
+
+    def to_header(self) -> str:
+        max_age = max((self.policy.max_age or 0) - self.age, 0)
+
+        return CachePolicy(max_age=max_age, scope=self.policy.scope).to_header()
+
+
+class ResponseCache:
+    """Caches the full HTTP response of public queries
+
+    Responses are cached only when the operation has a public cache policy
+    (see `CacheControlExtension`) and when its execution didn't return any
+    error.
+    """
+
+    def __init__(self, store: Optional[BaseCacheStore] = None):
+        self.store = store if store is not None else InMemoryCacheStore()
+
+    def get_key(self, request_data: GraphQLRequestData) -> Optional[str]:
+        try:
+            serialized = json.dumps(
+                [
+                    request_data.query,
+                    request_data.operation_name,
+                    request_data.variables,
+                ],
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            # variables that can't be serialised (for example file uploads)
+            # make the request not cacheable
+            return None
+
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    async def get(self, request_data: GraphQLRequestData) -> Optional[CachedResponse]:
+        key = self.get_key(request_data)
+
+        if key is None:
+            return None
+
+        return await await_maybe(self.store.get(key))
+
+    async def set(
+        self,
+        request_data: GraphQLRequestData,
+        result: ExecutionResult,
+        body: bytes,
+    ) -> None:
+        policy = get_cache_policy_from_result(result)
+
+        if result.errors or policy is None or not policy.is_public:
+            return
+
+        key = self.get_key(request_data)
+
+        if key is None:
+            return
+
+        await await_maybe(
+            self.store.set(key, CachedResponse(body, policy), ttl=policy.max_age)
+        )
+
+
+def get_cache_policy_from_result(result: ExecutionResult) -> Optional[CachePolicy]:
+    if not result.extensions or CACHE_CONTROL_EXTENSION_KEY not in result.extensions:
+        return None
+
+    return CachePolicy.from_json(result.extensions[CACHE_CONTROL_EXTENSION_KEY])
@@ -0,0 +1,70 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from strawberry.utils.await_maybe import AwaitableOrValue
+
+
+class BaseCacheStore(ABC):
+    """Interface for the stores used by Strawberry's caches
+
+    Implementations can be either sync or async, which allows using shared
+    stores like Redis or Memcached.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> AwaitableOrValue[Optional[Any]]:
+        """Returns the value stored for `key` or None if there's none"""
+
+    @abstractmethod
+    def set(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> AwaitableOrValue[None]:
+        """Stores `value` for `key`, expiring it after `ttl` seconds"""
+
+
+class InMemoryCacheStore(BaseCacheStore):
+    """A LRU store that keeps up to `max_size` values in memory, it can be
+    shared by resolvers running in different threads"""
+
+    def __init__(self, max_size: Optional[int] = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
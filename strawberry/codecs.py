@@ -0,0 +1,169 @@
+import dataclasses
+import datetime
+import decimal
+import json
+import uuid
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Iterator, Union
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _default(obj: Any) -> Any:
+    """Serialises the values that the json encoders don't support out of the
+    box, for example the ones returned by a custom `process_result`"""
+
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+
+    if isinstance(obj, Enum):
+        return obj.value
+
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec(ABC):
+    @abstractmethod
+    def encode(self, data: Any) -> bytes:
+        """Serialises `data` to a JSON document"""
+
+    @abstractmethod
+    def decode(self, data: Union[str, bytes]) -> Any:
+        """Parses a JSON document, raising `json.JSONDecodeError` when invalid"""
+
+    def iter_encode(
+        self, data: Any, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Serialises `data` lazily, yielding chunks of roughly `chunk_size`
+        bytes so that the whole document never has to be held in memory.
+
+        Objects are walked until a list is found, each item of the list is
+        then encoded on its own using `encode`, this keeps most of the work
+        in the (possibly native) encoder while still bounding the size of
+        each chunk by the size of the largest list item."""
+
+        buffer = bytearray()
+
+        for part in self._iter_parts(data):
+            buffer += part
+
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+
+    def _iter_parts(self, data: Any) -> Iterator[bytes]:
+        if isinstance(data, dict):
+            yield b"{"
+
+            for index, (key, value) in enumerate(data.items()):
+                if index:
+                    yield b","
+
+                yield self.encode(str(key))
+                yield b":"
+                yield from self._iter_parts(value)
+
+            yield b"}"
+        elif isinstance(data, list):
+            yield b"["
+
+            for index, item in enumerate(data):
+                if index:
+                    yield b","
+
+                yield self.encode(item)
+
+            yield b"]"
+        else:
+            yield self.encode(data)
+
+
+class StdlibJSONCodec(JSONCodec):
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(
+            data, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+_stdlib_json_codec = StdlibJSONCodec()
+
+
+class OrjsonCodec(JSONCodec):
+    """Uses orjson, the documents orjson can't encode, like the ones with
+    integers larger than 64 bits, are encoded with the json module from the
+    standard library"""
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def encode(self, data: Any) -> bytes:
+        try:
+            return self._orjson.dumps(
+                data, default=_default, option=self._orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # orjson.JSONEncodeError is a subclass of TypeError
+            return _stdlib_json_codec.encode(data)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """Uses ujson, the documents ujson can't encode, like the ones with NaN,
+    are encoded with the json module from the standard library"""
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def encode(self, data: Any) -> bytes:
+        try:
+            return self._ujson.dumps(
+                data, default=_default, ensure_ascii=False, escape_forward_slashes=False
+            ).encode("utf-8")
+        except (TypeError, ValueError, OverflowError):
+            return _stdlib_json_codec.encode(data)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._ujson.loads(data)
+        except ValueError as error:
+            document = (
+                data.decode("utf-8", "replace") if isinstance(data, bytes) else data
+            )
+            raise json.JSONDecodeError(str(error), document, 0) from error
+
+
+def get_default_json_codec() -> JSONCodec:
+    """Returns the fastest codec available, in order orjson, ujson and the
+    json module from the standard library"""
+
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+
+    return StdlibJSONCodec()
+
+
+default_json_codec = get_default_json_codec()
@@ -0,0 +1,209 @@
+"""Compression of HTTP responses, negotiated with the `Accept-Encoding` header.
+
+gzip and deflate are always available, brotli is used when the `brotli`
+package is installed.
+"""
+
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from typing import AsyncIterable, AsyncIterator, Dict, Optional, Sequence
+
+
+DEFAULT_MINIMUM_SIZE = 500
+DEFAULT_EXECUTOR_SIZE = 64 * 1024
+
+
+def is_brotli_available() -> bool:
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+class StreamCompressor(ABC):
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresses a chunk of data, the result might be empty when the
+        compressor buffers it"""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Returns the buffered data, so that the client can decode all the
+        chunks sent so far"""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Returns the remaining data, closing the stream"""
+
+
+class ZlibStreamCompressor(StreamCompressor):
+    def __init__(self, level: int, wbits: int):
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressobj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressobj.flush(zlib.Z_FINISH)
+
+
+class BrotliStreamCompressor(StreamCompressor):
+    def __init__(self, quality: int):
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Returns the quality value of each coding in an `Accept-Encoding`
+    header"""
+
+    qualities: Dict[str, float] = {}
+
+    for item in accept_encoding.split(","):
+        coding, *params = item.strip().split(";")
+        coding = coding.strip().lower()
+
+        if not coding:
+            continue
+
+        quality = 1.0
+
+        for param in params:
+            name, _, value = param.strip().partition("=")
+
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding] = quality
+
+    return qualities
+
+
+class ResponseCompression:
+    """Compresses the responses of the views.
+
+    Args:
+        minimum_size: responses smaller than this number of bytes are sent
+            uncompressed
+        level: the compression level used by gzip and deflate, from 1 to 9
+        brotli_quality: the quality used by brotli, from 0 to 11
+        encodings: the supported encodings, in order of preference, brotli is
+            skipped when the `brotli` package is not installed
+        executor_size: bodies and chunks larger than this number of bytes are
+            compressed in the default executor, to avoid blocking the event
+            loop
+    """
+
+    def __init__(
+        self,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        level: int = 6,
+        brotli_quality: int = 4,
+        encodings: Sequence[str] = ("br", "gzip", "deflate"),
+        executor_size: int = DEFAULT_EXECUTOR_SIZE,
+    ):
+        self.minimum_size = minimum_size
+        self.level = level
+        self.brotli_quality = brotli_quality
+        self.executor_size = executor_size
+
+        brotli_available = is_brotli_available()
+
+        self.encodings = tuple(
+            encoding for encoding in encodings if encoding != "br" or brotli_available
+        )
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """Returns the encoding to use for a request, or None when the
+        response shouldn't be compressed"""
+
+        if not accept_encoding:
+            return None
+
+        qualities = parse_accept_encoding(accept_encoding)
+        default_quality = qualities.get("*", 0.0)
+
+        best_encoding = None
+        best_quality = 0.0
+
+        for encoding in self.encodings:
+            quality = qualities.get(encoding, default_quality)
+
+            if quality > best_quality:
+                best_encoding = encoding
+                best_quality = quality
+
+        return best_encoding
+
+    def get_compressor(self, encoding: str) -> StreamCompressor:
+        if encoding == "br":
+            return BrotliStreamCompressor(self.brotli_quality)
+        if encoding == "gzip":
+            return ZlibStreamCompressor(self.level, 16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            return ZlibStreamCompressor(self.level, zlib.MAX_WBITS)
+
+        raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress_sync(self, data: bytes, encoding: str) -> bytes:
+        compressor = self.get_compressor(encoding)
+
+        return compressor.compress(data) + compressor.finish()
+
+    async def compress(self, data: bytes, encoding: str) -> bytes:
+        if len(data) < self.executor_size:
+            return self.compress_sync(data, encoding)
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, self.compress_sync, data, encoding)
+
+    async def compress_chunk(
+        self, compressor: StreamCompressor, chunk: bytes, flush: bool = False
+    ) -> bytes:
+        """Compresses a chunk of a streamed response, when `flush` is True the
+        result contains all the data compressed so far"""
+
+        def compress() -> bytes:
+            data = compressor.compress(chunk)
+
+            return data + compressor.flush() if flush else data
+
+        if len(chunk) < self.executor_size:
+            return compress()
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, compress)
+
+    async def iter_compress(
+        self, chunks: AsyncIterable[bytes], encoding: str, flush: bool = False
+    ) -> AsyncIterator[bytes]:
+        compressor = self.get_compressor(encoding)
+
+        async for chunk in chunks:
+            data = await self.compress_chunk(compressor, chunk, flush=flush)
+
+            if data:
+                yield data
+
+        yield compressor.finish()
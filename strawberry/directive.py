@@ -1,5 +1,6 @@
 import dataclasses
 import inspect
+import keyword
 import sys
 from itertools import islice
 from typing import Callable, List, Optional
@@ -32,9 +33,15 @@ class DirectiveDefinition:
         for arg_name, annotation in annotations.items():
             parameter = parameters[arg_name]
 
+            # arguments named after python keywords, like `if`, can be
+            # declared with a trailing underscore
+            graphql_name = None
+            if arg_name.endswith("_") and keyword.iskeyword(arg_name[:-1]):
+                graphql_name = arg_name[:-1]
+
             argument = StrawberryArgument(
                 python_name=arg_name,
-                graphql_name=None,
+                graphql_name=graphql_name,
                 type_annotation=StrawberryAnnotation(
                     annotation=annotation, namespace=annotation_namespace
                 ),
@@ -1,10 +1,16 @@
 import asyncio
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from django.core.exceptions import SuspiciousOperation
-from django.http import Http404, HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponseNotAllowed,
+    HttpResponseNotModified,
+    JsonResponse,
+)
 from django.http.response import HttpResponse
 from django.template import RequestContext, Template
 from django.template.exceptions import TemplateDoesNotExist
@@ -14,16 +20,33 @@ from django.utils.decorators import classonlymethod, method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 
+from graphql import OperationType
+
 import strawberry
-from strawberry.exceptions import MissingQueryError
+from strawberry.codecs import JSONCodec, default_json_codec
+from strawberry.exceptions import (
+    InvalidPersistedQueryHashError,
+    MissingQueryError,
+    PersistedQueryNotFoundError,
+)
 from strawberry.file_uploads.utils import replace_placeholders_with_files
 from strawberry.http import (
     GraphQLHTTPResponse,
     GraphQLRequestData,
+    etag_matches,
+    get_etag,
+    parse_batch_request_data,
+    parse_query_params,
     parse_request_data,
     process_result,
+    should_execute_query_params,
+)
+from strawberry.persisted_queries import (
+    PERSISTED_QUERY_NOT_FOUND_RESPONSE,
+    PersistedQueries,
 )
 from strawberry.types import ExecutionResult
+from strawberry.utils.operation import get_operation_type
 
 from ..schema import BaseSchema
 from .context import StrawberryDjangoContext
@@ -40,42 +63,120 @@ class BaseView(View):
     subscriptions_enabled = False
     graphiql = True
     schema: Optional[BaseSchema] = None
-
-    def __init__(self, schema: BaseSchema, graphiql=True, subscriptions_enabled=False):
+    json_codec: JSONCodec = default_json_codec
+    allow_batching = False
+    allow_queries_via_get = True
+    persisted_queries: Optional[PersistedQueries] = None
+
+    def __init__(
+        self,
+        schema: BaseSchema,
+        graphiql=True,
+        subscriptions_enabled=False,
+        json_codec: Optional[JSONCodec] = None,
+        allow_batching=False,
+        allow_queries_via_get=True,
+        persisted_queries: Optional[PersistedQueries] = None,
+    ):
         self.schema = schema
         self.graphiql = graphiql
         self.subscriptions_enabled = subscriptions_enabled
+        self.json_codec = json_codec or default_json_codec
+        self.allow_batching = allow_batching
+        self.allow_queries_via_get = allow_queries_via_get
+        self.persisted_queries = persisted_queries
+
+    def encode_json(self, data: Any) -> bytes:
+        return self.json_codec.encode(data)
 
-    def parse_body(self, request) -> Dict[str, Any]:
+    def decode_json(self, data: Union[str, bytes]) -> Any:
+        return self.json_codec.decode(data)
+
+    def parse_body(self, request) -> Union[Dict[str, Any], List[Any]]:
         if request.content_type.startswith("multipart/form-data"):
-            data = json.loads(request.POST.get("operations", "{}"))
-            files_map = json.loads(request.POST.get("map", "{}"))
+            data = self.decode_json(request.POST.get("operations", "{}"))
+            files_map = self.decode_json(request.POST.get("map", "{}"))
 
             data = replace_placeholders_with_files(data, files_map, request.FILES)
 
             return data
 
-        return json.loads(request.body)
+        return self.decode_json(request.body)
 
     def is_request_allowed(self, request: HttpRequest) -> bool:
         return request.method.lower() in ("get", "post")
 
     def should_render_graphiql(self, request: HttpRequest) -> bool:
+        if self.is_get_query(request):
+            return False
+
         return "text/html" in request.META.get("HTTP_ACCEPT", "")
 
-    def get_request_data(self, request: HttpRequest) -> GraphQLRequestData:
+    def is_get_query(self, request: HttpRequest) -> bool:
+        return (
+            request.method == "GET"
+            and self.allow_queries_via_get
+            and should_execute_query_params(request.GET)
+        )
+
+    def load_request_data(self, request: HttpRequest) -> Union[Dict[str, Any], List]:
+        if self.is_get_query(request):
+            try:
+                return parse_query_params(request.GET, self.decode_json)
+            except json.decoder.JSONDecodeError:
+                raise SuspiciousOperation("Unable to parse the query parameters")
+
         try:
-            data = self.parse_body(request)
+            return self.parse_body(request)
         except json.decoder.JSONDecodeError:
             raise SuspiciousOperation("Unable to parse request body as JSON")
 
+    def get_request_data(
+        self, request: HttpRequest
+    ) -> Union[GraphQLRequestData, List[GraphQLRequestData]]:
+        return self.build_request_data(self.load_request_data(request))
+
+    def build_request_data(
+        self, data: Union[Dict[str, Any], List]
+    ) -> Union[GraphQLRequestData, List[GraphQLRequestData]]:
+        if isinstance(data, list) and not self.allow_batching:
+            raise SuspiciousOperation("Batched operations are not enabled")
+
         try:
+            if isinstance(data, list):
+                return parse_batch_request_data(data)
+
             request_data = parse_request_data(data)
         except MissingQueryError:
             raise SuspiciousOperation("No GraphQL query found in the request")
 
         return request_data
 
+    def check_get_operation(
+        self,
+        request: HttpRequest,
+        request_data: Union[GraphQLRequestData, List[GraphQLRequestData]],
+    ) -> Optional[HttpResponse]:
+        """Returns an error response when a mutation is sent over GET"""
+
+        if (
+            request.method == "GET"
+            and isinstance(request_data, GraphQLRequestData)
+            and get_operation_type(request_data.query, request_data.operation_name)
+            == OperationType.MUTATION
+        ):
+            return HttpResponseNotAllowed(
+                ["POST"], "Mutations are not allowed when using GET"
+            )
+
+        return None
+
+    def _create_persisted_query_not_found_response(self) -> HttpResponse:
+        return HttpResponse(
+            self.encode_json(PERSISTED_QUERY_NOT_FOUND_RESPONSE),
+            content_type="application/json",
+        )
+
     def _render_graphiql(self, request: HttpRequest, context=None):
         if not self.graphiql:
             raise Http404()
@@ -102,9 +203,13 @@ class BaseView(View):
         return response
 
     def _create_response(
-        self, response_data: GraphQLHTTPResponse, sub_response: HttpResponse
-    ) -> JsonResponse:
-        response = JsonResponse(response_data)
+        self,
+        response_data: Union[GraphQLHTTPResponse, List[GraphQLHTTPResponse]],
+        sub_response: HttpResponse,
+    ) -> HttpResponse:
+        response = HttpResponse(
+            self.encode_json(response_data), content_type="application/json"
+        )
 
         for name, value in sub_response.items():
             response[name] = value
@@ -117,6 +222,24 @@ class BaseView(View):
 
         return response
 
+    def _with_etag(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        if request.method != "GET":
+            return response
+
+        etag = get_etag(response.content)
+
+        if etag_matches(etag, request.META.get("HTTP_IF_NONE_MATCH")):
+            not_modified = HttpResponseNotModified()
+
+            for name, value in response.cookies.items():
+                not_modified.cookies[name] = value
+
+            response = not_modified
+
+        response["ETag"] = etag
+
+        return response
+
 
 class GraphQLView(BaseView):
     def get_root_value(self, request: HttpRequest) -> Any:
@@ -130,6 +253,19 @@ class GraphQLView(BaseView):
     ) -> GraphQLHTTPResponse:
         return process_result(result)
 
+    def execute(
+        self, request_data: GraphQLRequestData, context: Any, root_value: Any
+    ) -> ExecutionResult:
+        assert self.schema
+
+        return self.schema.execute_sync(
+            request_data.query,
+            root_value=root_value,
+            variable_values=request_data.variables,
+            context_value=context,
+            operation_name=request_data.operation_name,
+        )
+
     @method_decorator(csrf_exempt)
     def dispatch(self, request, *args, **kwargs):
         if not self.is_request_allowed(request):
@@ -140,25 +276,49 @@ class GraphQLView(BaseView):
         if self.should_render_graphiql(request):
             return self._render_graphiql(request)
 
-        request_data = self.get_request_data(request)
+        data = self.load_request_data(request)
 
-        sub_response = TemporalHttpResponse()
-        context = self.get_context(request, response=sub_response)
+        if self.persisted_queries is not None and isinstance(data, dict):
+            try:
+                data = self.persisted_queries.resolve_sync(data)
+            except PersistedQueryNotFoundError:
+                return self._create_persisted_query_not_found_response()
+            except InvalidPersistedQueryHashError as error:
+                raise SuspiciousOperation(str(error))
 
-        result = self.schema.execute_sync(
-            request_data.query,
-            root_value=self.get_root_value(request),
-            variable_values=request_data.variables,
-            context_value=context,
-            operation_name=request_data.operation_name,
-        )
+        request_data = self.build_request_data(data)
+
+        error_response = self.check_get_operation(request, request_data)
 
-        response_data = self.process_result(request=request, result=result)
+        if error_response is not None:
+            return error_response
 
-        return self._create_response(
+        sub_response = TemporalHttpResponse()
+        context = self.get_context(request, response=sub_response)
+        root_value = self.get_root_value(request)
+
+        response_data: Union[GraphQLHTTPResponse, List[GraphQLHTTPResponse]]
+
+        if isinstance(request_data, list):
+            # the operations are executed one after the other, sharing the
+            # context
+            response_data = [
+                self.process_result(
+                    request=request,
+                    result=self.execute(operation_data, context, root_value),
+                )
+                for operation_data in request_data
+            ]
+        else:
+            result = self.execute(request_data, context, root_value)
+            response_data = self.process_result(request=request, result=result)
+
+        response = self._create_response(
             response_data=response_data, sub_response=sub_response
         )
 
+        return self._with_etag(request, response)
+
 
 class AsyncGraphQLView(BaseView):
     @classonlymethod
@@ -180,13 +340,58 @@ class AsyncGraphQLView(BaseView):
         if self.should_render_graphiql(request):
             return self._render_graphiql(request)
 
-        request_data = self.get_request_data(request)
+        data = self.load_request_data(request)
+
+        if self.persisted_queries is not None and isinstance(data, dict):
+            try:
+                data = await self.persisted_queries.resolve(data)
+            except PersistedQueryNotFoundError:
+                return self._create_persisted_query_not_found_response()
+            except InvalidPersistedQueryHashError as error:
+                raise SuspiciousOperation(str(error))
+
+        request_data = self.build_request_data(data)
+
+        error_response = self.check_get_operation(request, request_data)
+
+        if error_response is not None:
+            return error_response
 
         sub_response = TemporalHttpResponse()
         context = await self.get_context(request, response=sub_response)
         root_value = await self.get_root_value(request)
 
-        result = await self.schema.execute(
+        response_data: Union[GraphQLHTTPResponse, List[GraphQLHTTPResponse]]
+
+        if isinstance(request_data, list):
+            # the operations run concurrently and share the context, so that
+            # the DataLoaders created for the request batch loads across them
+            results = await asyncio.gather(
+                *(
+                    self.execute(operation_data, context, root_value)
+                    for operation_data in request_data
+                )
+            )
+            response_data = [
+                await self.process_result(request=request, result=result)
+                for result in results
+            ]
+        else:
+            result = await self.execute(request_data, context, root_value)
+            response_data = await self.process_result(request=request, result=result)
+
+        response = self._create_response(
+            response_data=response_data, sub_response=sub_response
+        )
+
+        return self._with_etag(request, response)
+
+    async def execute(
+        self, request_data: GraphQLRequestData, context: Any, root_value: Any
+    ) -> ExecutionResult:
+        assert self.schema
+
+        return await self.schema.execute(
             request_data.query,
             root_value=root_value,
             variable_values=request_data.variables,
@@ -194,12 +399,6 @@ class AsyncGraphQLView(BaseView):
             operation_name=request_data.operation_name,
         )
 
-        response_data = await self.process_result(request=request, result=result)
-
-        return self._create_response(
-            response_data=response_data, sub_response=sub_response
-        )
-
     async def get_root_value(self, request: HttpRequest) -> Any:
         return None
 
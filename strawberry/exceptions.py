@@ -169,3 +169,27 @@ class MissingQueryError(Exception):
         message = 'Request data is missing a "query" value'
 
         super().__init__(message)
+
+
+class PersistedQueryNotFoundError(Exception):
+    def __init__(self):
+        message = "PersistedQueryNotFound"
+
+        super().__init__(message)
+
+
+class InvalidPersistedQueryHashError(Exception):
+    def __init__(self):
+        message = "Provided sha256 hash does not match the query"
+
+        super().__init__(message)
+
+
+class UploadTooLargeError(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class ExecutionTimeoutError(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
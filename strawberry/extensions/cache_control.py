@@ -0,0 +1,40 @@
+from typing import Any, Dict
+
+from strawberry.cache.control import CachePolicy, get_cache_policy
+from strawberry.cache.response import CACHE_CONTROL_EXTENSION_KEY
+from strawberry.extensions import Extension
+from strawberry.types.execution import ExecutionContext
+
+
+class CacheControlExtension(Extension):
+    """Computes the cache policy of the operation from the `cache_control`
+    hints declared on types and fields and adds it to the response extensions.
+
+    The HTTP integrations use this policy to send the `Cache-Control` header
+    and, when a `ResponseCache` is configured, to cache public responses.
+    """
+
+    def __init__(
+        self, *, execution_context: ExecutionContext, default_max_age: int = 0
+    ):
+        self.execution_context = execution_context
+        self.default_max_age = default_max_age
+
+    @property
+    def policy(self) -> CachePolicy:
+        execution_context = self.execution_context
+
+        if execution_context.graphql_document is None or execution_context.errors:
+            return CachePolicy(max_age=0)
+
+        assert execution_context.schema is not None
+
+        return get_cache_policy(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            operation_name=execution_context.operation_name,
+            default_max_age=self.default_max_age,
+        )
+
+    def get_results(self) -> Dict[str, Any]:
+        return {CACHE_CONTROL_EXTENSION_KEY: self.policy.to_json()}
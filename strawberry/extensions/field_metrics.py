@@ -0,0 +1,270 @@
+"""Latency statistics of the resolvers, aggregated across requests.
+
+The durations of the resolvers are counted in fixed, logarithmic buckets
+keyed by the schema coordinate of their field (`Query.user`), which keeps the
+memory used constant and recording a duration cheap. The percentiles are
+estimated from the buckets, so they are accurate to the width of a bucket.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from strawberry.extensions import Extension
+from strawberry.extensions.utils import should_skip_tracing
+from strawberry.types.execution import ExecutionContext
+
+
+# upper bounds of the buckets in seconds, from 10µs to about 84 seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = tuple(0.00001 * 2 ** i for i in range(24))
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass(frozen=True)
+class FieldStats:
+    count: int
+    errors: int
+    # durations in seconds
+    total: float
+    p50: float
+    p95: float
+    p99: float
+
+
+class LatencyHistogram:
+    """Counts durations in buckets, the last bucket counts the durations
+    longer than the last bound"""
+
+    __slots__ = ("bounds", "counts", "count", "errors", "total", "max")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float, error: bool = False) -> None:
+        self.counts[bisect_left(self.bounds, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+        if duration > self.max:
+            self.max = duration
+
+        if error:
+            self.errors += 1
+
+    def get_percentile(self, percentile: float) -> float:
+        """Returns the upper bound of the bucket containing the percentile,
+        capped to the longest duration recorded"""
+
+        if not self.count:
+            return 0.0
+
+        rank = percentile / 100 * self.count
+        cumulative = 0
+
+        for index, count in enumerate(self.counts):
+            cumulative += count
+
+            if cumulative >= rank and count:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+
+                break
+
+        return self.max
+
+    def get_stats(self) -> FieldStats:
+        return FieldStats(
+            count=self.count,
+            errors=self.errors,
+            total=self.total,
+            p50=self.get_percentile(50),
+            p95=self.get_percentile(95),
+            p99=self.get_percentile(99),
+        )
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+class FieldMetrics:
+    """Latency histograms of the fields, shared by the requests.
+
+    The statistics can be read with `get_stats`, or exported in the text
+    format of Prometheus with `to_prometheus`, or with an ASGI app returned by
+    `asgi_app`.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        prefix: str = "strawberry",
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, parent_type: str, field_name: str, duration: float, error: bool = False
+    ) -> None:
+        self.record_many([(parent_type, field_name, duration, error)])
+
+    def record_many(self, durations: Iterable[Tuple[str, str, float, bool]]) -> None:
+        with self._lock:
+            for parent_type, field_name, duration, error in durations:
+                key = (parent_type, field_name)
+                histogram = self._histograms.get(key)
+
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram(self.buckets)
+
+                histogram.record(duration, error)
+
+    def get_stats(self) -> Dict[str, FieldStats]:
+        """Returns the statistics of each field, keyed by `Type.field`"""
+
+        with self._lock:
+            return {
+                f"{parent_type}.{field_name}": histogram.get_stats()
+                for (parent_type, field_name), histogram in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        duration_name = f"{self.prefix}_field_duration_seconds"
+        errors_name = f"{self.prefix}_field_errors_total"
+
+        durations = [
+            f"# HELP {duration_name} Duration of the resolvers of the fields.",
+            f"# TYPE {duration_name} histogram",
+        ]
+        errors = [
+            f"# HELP {errors_name} Errors raised by the resolvers of the fields.",
+            f"# TYPE {errors_name} counter",
+        ]
+
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+
+            for (parent_type, field_name), histogram in histograms:
+                labels = f'type="{parent_type}",field="{field_name}"'
+                cumulative = 0
+
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    durations.append(
+                        f'{duration_name}_bucket{{{labels},le="{_format_float(bound)}"}}'
+                        f" {cumulative}"
+                    )
+
+                durations.append(
+                    f'{duration_name}_bucket{{{labels},le="+Inf"}} {histogram.count}'
+                )
+                durations.append(
+                    f"{duration_name}_sum{{{labels}}} {_format_float(histogram.total)}"
+                )
+                durations.append(f"{duration_name}_count{{{labels}}} {histogram.count}")
+                errors.append(f"{errors_name}{{{labels}}} {histogram.errors}")
+
+        return "\n".join(durations + errors) + "\n"
+
+    def asgi_app(self) -> "MetricsApp":
+        return MetricsApp(self)
+
+
+class MetricsApp:
+    """ASGI app returning the metrics in the text format of Prometheus, it can
+    be mounted next to the GraphQL app, for example with Starlette's
+    `app.mount("/metrics", metrics.asgi_app())`"""
+
+    def __init__(self, metrics: FieldMetrics):
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send) -> None:
+        assert scope["type"] == "http"
+
+        body = self.metrics.to_prometheus().encode()
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", PROMETHEUS_CONTENT_TYPE.encode()),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class FieldMetricsExtension(Extension):
+    """Records the duration of the resolvers in `metrics`.
+
+    The default resolvers and the introspection fields aren't measured. The
+    durations are collected during the request and added to the histograms
+    at its end, so that the lock is only taken once per request.
+    """
+
+    def __init__(self, *, execution_context: ExecutionContext, metrics: FieldMetrics):
+        self.execution_context = execution_context
+        self.metrics = metrics
+        self._durations: List[Tuple[str, str, float, bool]] = []
+
+    def on_request_end(self):
+        if self._durations:
+            self.metrics.record_many(self._durations)
+            self._durations = []
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        if should_skip_tracing(_next, info):
+            return _next(root, info, *args, **kwargs)
+
+        start = time.perf_counter()
+
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self._record(info, start, error=True)
+            raise
+
+        if isawaitable(result):
+            return self._resolve_async(result, info, start)
+
+        self._record(info, start, error=False)
+
+        return result
+
+    async def _resolve_async(self, result, info, start: float):
+        try:
+            result = await result
+        except Exception:
+            self._record(info, start, error=True)
+            raise
+
+        self._record(info, start, error=False)
+
+        return result
+
+    def _record(self, info, start: float, error: bool) -> None:
+        self._durations.append(
+            (
+                info.parent_type.name,
+                info.field_name,
+                time.perf_counter() - start,
+                error,
+            )
+        )
@@ -0,0 +1,286 @@
+"""Profiling of the requests matching a predicate, with cProfile or
+pyinstrument.
+
+Profilers observe the whole thread, so when requests are executed
+concurrently in an event loop the profile of a request also contains the
+work done for the other requests in the meantime. Only one request is
+profiled at a time in each process.
+"""
+
+import cProfile
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, List, Optional, Type
+
+from strawberry.extensions import Extension
+from strawberry.extensions.utils import get_request_header
+from strawberry.types.execution import ExecutionContext
+
+
+PROFILE_EXTENSION_KEY = "profile"
+
+_profiling_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ProfiledFunction:
+    function: str
+    # None when the profiler doesn't count the calls
+    calls: Optional[int]
+    # time spent in the function itself and with the functions it calls, in
+    # seconds
+    total_time: float
+    cumulative_time: float
+
+
+class BaseProfiler(ABC):
+    file_extension: str
+
+    @abstractmethod
+    def start(self) -> None:
+        ...
+
+    @abstractmethod
+    def stop(self) -> None:
+        ...
+
+    @abstractmethod
+    def write(self, path: str) -> None:
+        """Writes the profile to `path`"""
+
+    @abstractmethod
+    def get_top_functions(self, limit: int) -> List[ProfiledFunction]:
+        """Returns the `limit` functions with the longest cumulative time"""
+
+
+class CProfileProfiler(BaseProfiler):
+    """Deterministic profiler from the standard library, the profiles are
+    written in the format of `pstats`, which can be read by tools like
+    snakeviz"""
+
+    file_extension = ".prof"
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def write(self, path: str) -> None:
+        self._profile.dump_stats(path)
+
+    def get_top_functions(self, limit: int) -> List[ProfiledFunction]:
+        stats = pstats.Stats(self._profile).stats  # type: ignore
+
+        functions = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+
+        return [
+            ProfiledFunction(
+                function=pstats.func_std_string(function),  # type: ignore
+                calls=calls,
+                total_time=total_time,
+                cumulative_time=cumulative_time,
+            )
+            for function, (
+                _,
+                calls,
+                total_time,
+                cumulative_time,
+                _,
+            ) in functions[:limit]
+        ]
+
+
+class PyinstrumentProfiler(BaseProfiler):
+    """Statistical profiler with a lower overhead, which needs the
+    `pyinstrument` package. The profiles are written as HTML pages."""
+
+    file_extension = ".html"
+
+    def __init__(self):
+        from pyinstrument import Profiler
+
+        self._profiler = Profiler()
+
+    def start(self) -> None:
+        self._profiler.start()
+
+    def stop(self) -> None:
+        self._profiler.stop()
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as file:
+            file.write(self._profiler.output_html())
+
+    def get_top_functions(self, limit: int) -> List[ProfiledFunction]:
+        # function -> (self time, cumulative time)
+        times: Dict[str, List[float]] = {}
+        frames = [self._profiler.last_session.root_frame()]
+
+        while frames:
+            frame = frames.pop()
+
+            if frame is None:
+                continue
+
+            function = f"{frame.file_path_short}:{frame.line_no}({frame.function})"
+            function_times = times.setdefault(function, [0.0, 0.0])
+            function_times[0] += frame.total_self_time
+            function_times[1] += frame.time
+            frames.extend(frame.children)
+
+        functions = sorted(times.items(), key=lambda item: item[1][1], reverse=True)
+
+        return [
+            ProfiledFunction(
+                function=function,
+                calls=None,
+                total_time=total_time,
+                cumulative_time=cumulative_time,
+            )
+            for function, (total_time, cumulative_time) in functions[:limit]
+        ]
+
+
+def _get_file_name(operation_name: Optional[str], file_extension: str) -> str:
+    name = re.sub(r"[^\w-]", "_", operation_name or "anonymous")
+
+    return f"{time.time_ns()}-{name}{file_extension}"
+
+
+class ProfilerExtension(Extension):
+    """Profiles the requests for which `should_profile` returns true, the
+    ones sending `header`, a `sample_rate` fraction of them or the ones
+    executing one of `operation_names`.
+
+    The profiles are written to `output_dir` when it's set, and a summary of
+    the `summary_size` functions with the longest cumulative time is added to
+    the response extensions as `profile` when `include_summary` is true.
+    """
+
+    def __init__(
+        self,
+        *,
+        execution_context: ExecutionContext,
+        should_profile: Optional[Callable[[ExecutionContext], bool]] = None,
+        header: Optional[str] = None,
+        sample_rate: float = 0.0,
+        operation_names: Optional[Collection[str]] = None,
+        output_dir: Optional[str] = None,
+        include_summary: bool = False,
+        summary_size: int = 20,
+        profiler_class: Type[BaseProfiler] = CProfileProfiler,
+    ):
+        self.execution_context = execution_context
+        self.should_profile = should_profile
+        self.header = header
+        self.sample_rate = sample_rate
+        self.operation_names = operation_names
+        self.output_dir = output_dir
+        self.include_summary = include_summary
+        self.summary_size = summary_size
+        self.profiler_class = profiler_class
+
+        self.profiler: Optional[BaseProfiler] = None
+        self.path: Optional[str] = None
+        self._is_running = False
+
+    def is_requested(self) -> bool:
+        execution_context = self.execution_context
+
+        if self.header is not None and get_request_header(
+            execution_context.context, self.header
+        ):
+            return True
+
+        if (
+            self.operation_names is not None
+            and execution_context.operation_name in self.operation_names
+        ):
+            return True
+
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+
+        if self.should_profile is not None:
+            return self.should_profile(execution_context)
+
+        return False
+
+    def on_request_start(self):
+        if not self.is_requested():
+            return
+
+        # the profilers of the standard library can't be nested
+        if not _profiling_lock.acquire(blocking=False):
+            return
+
+        try:
+            self.profiler = self.profiler_class()
+            self.profiler.start()
+        except BaseException:
+            _profiling_lock.release()
+            raise
+
+        self._is_running = True
+
+    def stop_profiler(self) -> None:
+        if not self._is_running:
+            return
+
+        self._is_running = False
+
+        try:
+            self.profiler.stop()  # type: ignore
+        finally:
+            _profiling_lock.release()
+
+    def on_request_end(self):
+        if self.profiler is None:
+            return
+
+        self.stop_profiler()
+
+        if self.output_dir is not None:
+            self.path = os.path.join(
+                self.output_dir,
+                _get_file_name(
+                    self.execution_context.operation_name,
+                    self.profiler.file_extension,
+                ),
+            )
+            self.profiler.write(self.path)
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.profiler is None or not self.include_summary:
+            return {}
+
+        # the results are also requested when the operation is rejected,
+        # before the end of the request
+        self.stop_profiler()
+
+        functions = self.profiler.get_top_functions(self.summary_size)
+
+        return {
+            PROFILE_EXTENSION_KEY: {
+                "path": self.path,
+                "functions": [
+                    {
+                        "function": function.function,
+                        "calls": function.calls,
+                        "totalTime": round(function.total_time * 1000, 3),
+                        "cumulativeTime": round(function.cumulative_time * 1000, 3),
+                    }
+                    for function in functions
+                ],
+            }
+        }
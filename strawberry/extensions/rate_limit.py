@@ -0,0 +1,235 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, cast
+
+from graphql import GraphQLError
+
+from strawberry.extensions import Extension
+from strawberry.thread_pool import is_async_execution
+from strawberry.tools import get_query_cost
+from strawberry.types.execution import ExecutionContext
+from strawberry.utils.await_maybe import AwaitableOrValue
+
+
+RATE_LIMIT_EXTENSION_KEY = "rateLimit"
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    # tokens left in the bucket after the operation
+    remaining: float
+
+
+class BaseRateLimitStore(ABC):
+    """Interface for the stores of the token buckets used by `RateLimiter`
+
+    Implementations can be either sync or async, which allows sharing the
+    buckets between processes with stores like Redis. `consume` must update
+    the bucket atomically.
+    """
+
+    @abstractmethod
+    def consume(
+        self, key: str, amount: float, capacity: float, refill_rate: float
+    ) -> AwaitableOrValue[RateLimitResult]:
+        """Refills the bucket of `key` and takes `amount` tokens from it, when
+        it contains enough of them"""
+
+
+class InMemoryRateLimitStore(BaseRateLimitStore):
+    """Keeps the buckets of up to `max_size` keys in memory, the least
+    recently used buckets are dropped first"""
+
+    def __init__(self, max_size: Optional[int] = 10000):
+        self.max_size = max_size
+        # key -> (tokens, updated at)
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def consume(
+        self, key: str, amount: float, capacity: float, refill_rate: float
+    ) -> RateLimitResult:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+
+        allowed = amount <= tokens
+
+        if allowed:
+            tokens -= amount
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+
+        if self.max_size is not None:
+            while len(self._buckets) > self.max_size:
+                self._buckets.popitem(last=False)
+
+        return RateLimitResult(allowed=allowed, remaining=tokens)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RateLimiter:
+    """Token buckets holding up to `capacity` tokens, refilled with
+    `refill_rate` tokens per second.
+
+    `key` returns the bucket of a request from its execution context, for
+    example an API key, a user id or an IP address, requests for which it
+    returns None aren't limited.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        key: Callable[[ExecutionContext], Optional[str]],
+        store: Optional[BaseRateLimitStore] = None,
+    ):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.key = key
+        self.store = store if store is not None else InMemoryRateLimitStore()
+
+    def consume(self, key: str, amount: float) -> AwaitableOrValue[RateLimitResult]:
+        return self.store.consume(key, amount, self.capacity, self.refill_rate)
+
+    def get_retry_after(
+        self, result: RateLimitResult, amount: float
+    ) -> Optional[float]:
+        """Returns the number of seconds after which the bucket will contain
+        `amount` tokens, or None when it never will"""
+
+        if amount > self.capacity or self.refill_rate <= 0:
+            return None
+
+        return max(0.0, (amount - result.remaining) / self.refill_rate)
+
+
+class RateLimitExtension(Extension):
+    """Takes the estimated cost of each operation from a token bucket and
+    rejects the operation, before any resolver runs, when the bucket doesn't
+    contain enough tokens.
+
+    The cost is the one estimated by `strawberry.tools.query_cost_validator`
+    when the schema uses it, or is computed with `get_query_cost`, and the
+    remaining budget is added to the response extensions. The rate limiter
+    is shared between requests, so the extension is configured with
+    `functools.partial`:
+
+    >>> rate_limiter = RateLimiter(capacity=1000, refill_rate=10, key=get_api_key)
+    >>> schema = strawberry.Schema(
+    >>>     Query, extensions=[partial(RateLimitExtension, rate_limiter=rate_limiter)]
+    >>> )
+    """
+
+    def __init__(
+        self,
+        *,
+        execution_context: ExecutionContext,
+        rate_limiter: RateLimiter,
+        default_field_cost: int = 1,
+        default_scalar_cost: int = 0,
+        default_list_size: int = 1,
+    ):
+        self.execution_context = execution_context
+        self.rate_limiter = rate_limiter
+        self.default_field_cost = default_field_cost
+        self.default_scalar_cost = default_scalar_cost
+        self.default_list_size = default_list_size
+
+        self.cost: Optional[int] = None
+        self.result: Optional[RateLimitResult] = None
+
+    def on_validation_end(self) -> AwaitableOrValue[None]:
+        execution_context = self.execution_context
+
+        # invalid operations aren't executed, so they don't use the budget
+        if execution_context.graphql_document is None or execution_context.errors:
+            return None
+
+        key = self.rate_limiter.key(execution_context)
+
+        if key is None:
+            return None
+
+        assert execution_context.schema is not None
+
+        # the cost is already known when the schema validates the operations
+        # with `query_cost_validator`
+        self.cost = execution_context.query_cost
+
+        if self.cost is None:
+            self.cost = execution_context.query_cost = get_query_cost(
+                execution_context.schema._schema,
+                execution_context.graphql_document,
+                operation_name=execution_context.operation_name,
+                # the request sent all its variables, the missing ones use
+                # their default values
+                variables=execution_context.variables or {},
+                default_field_cost=self.default_field_cost,
+                default_scalar_cost=self.default_scalar_cost,
+                default_list_size=self.default_list_size,
+            )
+
+        result = self.rate_limiter.consume(key, self.cost)
+
+        if isawaitable(result):
+            if not is_async_execution():
+                # the sync executions can't wait for the store, and would let
+                # every operation through
+                getattr(result, "close", lambda: None)()
+
+                raise RuntimeError(
+                    "The rate limit store is async, use `Schema.execute` "
+                    "instead of `Schema.execute_sync`"
+                )
+
+            return self._handle_result_async(cast(Awaitable[RateLimitResult], result))
+
+        self._handle_result(cast(RateLimitResult, result))
+
+        return None
+
+    async def _handle_result_async(self, result: Awaitable[RateLimitResult]) -> None:
+        self._handle_result(await result)
+
+    def _handle_result(self, result: RateLimitResult) -> None:
+        self.result = result
+
+        if result.allowed:
+            return
+
+        assert self.cost is not None
+
+        retry_after = self.rate_limiter.get_retry_after(result, self.cost)
+        error = GraphQLError(
+            f"Rate limit exceeded, the operation costs {self.cost} and "
+            f"{int(result.remaining)} are left",
+            extensions={
+                "code": "RATE_LIMITED",
+                "cost": self.cost,
+                "retryAfter": retry_after,
+            },
+        )
+
+        self.execution_context.errors = [error]
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.result is None:
+            return {}
+
+        return {
+            RATE_LIMIT_EXTENSION_KEY: {
+                "cost": self.cost,
+                "limit": self.rate_limiter.capacity,
+                "remaining": int(self.result.remaining),
+            }
+        }
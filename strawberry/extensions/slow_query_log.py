@@ -0,0 +1,347 @@
+"""Logs the operations slower than a threshold.
+
+Each slow operation is logged with its signature, a normalized version of
+the operation that doesn't depend on the values passed in the query, so
+that the executions of the same operation can be grouped.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from copy import copy
+from inspect import isawaitable
+from typing import Any, Dict, List, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLResolveInfo,
+    InlineFragmentNode,
+    IntValueNode,
+    ListValueNode,
+    Node,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    StringValueNode,
+    Visitor,
+    get_operation_ast,
+    print_ast,
+    visit,
+)
+from graphql.pyutils import FrozenList
+
+from strawberry.extensions import Extension
+from strawberry.extensions.rate_limit import InMemoryRateLimitStore
+from strawberry.extensions.timings import format_timings
+from strawberry.extensions.utils import should_skip_tracing
+from strawberry.types.execution import ExecutionContext
+
+
+logger = logging.getLogger("strawberry.slow_queries")
+
+
+def _get_selection_sort_key(selection: Node) -> Tuple[int, str]:
+    if isinstance(selection, FieldNode):
+        return 0, selection.name.value
+
+    if isinstance(selection, FragmentSpreadNode):
+        return 1, selection.name.value
+
+    assert isinstance(selection, InlineFragmentNode)
+
+    type_condition = selection.type_condition
+
+    return 2, type_condition.name.value if type_condition else ""
+
+
+class _SignatureVisitor(Visitor):
+    """Hides the literals, removes the aliases and sorts the fields and the
+    arguments"""
+
+    def leave_int_value(self, node: IntValueNode, *_args: Any) -> IntValueNode:
+        return IntValueNode(value="0")
+
+    def leave_float_value(self, node: FloatValueNode, *_args: Any) -> FloatValueNode:
+        return FloatValueNode(value="0")
+
+    def leave_string_value(self, node: StringValueNode, *_args: Any) -> StringValueNode:
+        return StringValueNode(value="", block=False)
+
+    def leave_list_value(self, node: ListValueNode, *_args: Any) -> ListValueNode:
+        return ListValueNode(values=[])
+
+    def leave_object_value(self, node: ObjectValueNode, *_args: Any) -> ObjectValueNode:
+        return ObjectValueNode(fields=[])
+
+    def leave_field(self, node: FieldNode, *_args: Any) -> FieldNode:
+        node = copy(node)
+        node.alias = None
+        node.arguments = FrozenList(
+            sorted(node.arguments, key=lambda arg: arg.name.value)
+        )
+
+        return node
+
+    def leave_selection_set(
+        self, node: SelectionSetNode, *_args: Any
+    ) -> SelectionSetNode:
+        node = copy(node)
+        node.selections = FrozenList(
+            sorted(node.selections, key=_get_selection_sort_key)
+        )
+
+        return node
+
+
+def _get_fragment_spreads(selection_set: Optional[SelectionSetNode]) -> List[str]:
+    names: List[str] = []
+
+    for selection in selection_set.selections if selection_set else ():
+        if isinstance(selection, FragmentSpreadNode):
+            names.append(selection.name.value)
+        elif isinstance(selection, (FieldNode, InlineFragmentNode)):
+            names.extend(_get_fragment_spreads(selection.selection_set))
+
+    return names
+
+
+def _get_used_fragments(
+    operation: OperationDefinitionNode, fragments: Dict[str, FragmentDefinitionNode]
+) -> Dict[str, FragmentDefinitionNode]:
+    used: Dict[str, FragmentDefinitionNode] = {}
+    names = _get_fragment_spreads(operation.selection_set)
+
+    while names:
+        name = names.pop()
+
+        if name not in used and name in fragments:
+            used[name] = fragments[name]
+            names.extend(_get_fragment_spreads(fragments[name].selection_set))
+
+    return used
+
+
+def get_operation_signature(
+    document: DocumentNode, operation_name: Optional[str] = None
+) -> Optional[str]:
+    """Returns the operation executed in `document`, and the fragments it
+    uses, printed on a single line with the literals hidden, the aliases
+    removed and the fields sorted. None is returned when the operation can't
+    be found."""
+
+    operation = get_operation_ast(document, operation_name)
+
+    if operation is None:
+        return None
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    used_fragments = _get_used_fragments(operation, fragments)
+
+    definitions: List[Node] = [operation]
+    definitions.extend(used_fragments[name] for name in sorted(used_fragments))
+
+    signature_document = visit(
+        DocumentNode(definitions=definitions), _SignatureVisitor()
+    )
+
+    return " ".join(print_ast(signature_document).split())
+
+
+def get_variables_shape(value: Any) -> Any:
+    """Replaces the values of the variables with the name of their types, so
+    that they can be logged without leaking data"""
+
+    if isinstance(value, dict):
+        return {key: get_variables_shape(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [get_variables_shape(value[0])] if value else []
+
+    if value is None:
+        return "null"
+
+    return type(value).__name__
+
+
+class SlowQueryLog:
+    """Logs the operations taking longer than `threshold` seconds.
+
+    The records contain the signature of the operation, its name, the shape of
+    its variables, the durations of its phases and the `top_resolvers`
+    slowest resolvers. Each signature is logged at most `rate` times per
+    second, with bursts of `burst` records, and the signatures of the last
+    `cache_size` documents are cached.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        logger: logging.Logger = logger,
+        log_level: int = logging.WARNING,
+        top_resolvers: int = 5,
+        rate: float = 1.0,
+        burst: int = 5,
+        cache_size: int = 128,
+    ):
+        self.threshold = threshold
+        self.logger = logger
+        self.log_level = log_level
+        self.top_resolvers = top_resolvers
+        self.rate = rate
+        self.burst = burst
+        self.cache_size = cache_size
+
+        self._rate_limit_store = InMemoryRateLimitStore(max_size=cache_size)
+        self._signatures: "OrderedDict[Tuple[str, Optional[str]], Optional[str]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_signature(self, execution_context: ExecutionContext) -> Optional[str]:
+        document = execution_context.graphql_document
+
+        if document is None:
+            return None
+
+        key = (execution_context.query, execution_context.operation_name)
+
+        with self._lock:
+            if key in self._signatures:
+                self._signatures.move_to_end(key)
+                return self._signatures[key]
+
+        signature = get_operation_signature(document, execution_context.operation_name)
+
+        with self._lock:
+            self._signatures[key] = signature
+
+            while len(self._signatures) > self.cache_size:
+                self._signatures.popitem(last=False)
+
+        return signature
+
+    def should_log(self, signature: Optional[str]) -> bool:
+        with self._lock:
+            result = self._rate_limit_store.consume(
+                signature or "", 1, capacity=self.burst, refill_rate=self.rate
+            )
+
+        return result.allowed
+
+    def log(
+        self,
+        execution_context: ExecutionContext,
+        duration: float,
+        resolvers: List[Tuple[float, GraphQLResolveInfo]],
+    ) -> None:
+        if not self.logger.isEnabledFor(self.log_level):
+            return
+
+        signature = self.get_signature(execution_context)
+
+        if not self.should_log(signature):
+            return
+
+        slow_query = {
+            "signature": signature,
+            "operationName": execution_context.operation_name,
+            "variables": get_variables_shape(execution_context.variables or {}),
+            "duration": round(duration * 1000, 3),
+            "timings": format_timings(execution_context.timings),
+            "resolvers": [
+                {
+                    "path": ".".join(map(str, info.path.as_list())),
+                    "duration": round(resolver_duration * 1000, 3),
+                }
+                for resolver_duration, info in resolvers
+            ],
+        }
+
+        self.logger.log(
+            self.log_level,
+            "Slow operation (%sms): %s",
+            slow_query["duration"],
+            signature or execution_context.query,
+            extra={"slow_query": slow_query},
+        )
+
+
+class SlowQueryLogExtension(Extension):
+    """Reports the operations slower than the threshold of `slow_query_log`.
+
+    The durations of the resolvers are measured to find the slowest ones,
+    only the `top_resolvers` slowest are kept during the request.
+    """
+
+    def __init__(
+        self, *, execution_context: ExecutionContext, slow_query_log: SlowQueryLog
+    ):
+        self.execution_context = execution_context
+        self.slow_query_log = slow_query_log
+        self.top_resolvers = slow_query_log.top_resolvers
+
+        # min heap of the slowest resolvers, the counter avoids comparing the
+        # resolve infos of resolvers with the same duration
+        self._resolvers: List[Tuple[float, int, GraphQLResolveInfo]] = []
+        self._counter = itertools.count()
+
+    def on_request_start(self):
+        self.start_time = time.perf_counter()
+
+    def on_request_end(self):
+        duration = time.perf_counter() - self.start_time
+
+        if duration < self.slow_query_log.threshold:
+            return
+
+        resolvers = sorted(self._resolvers, reverse=True)
+
+        self.slow_query_log.log(
+            self.execution_context,
+            duration,
+            [(resolver_duration, info) for resolver_duration, _, info in resolvers],
+        )
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        if not self.top_resolvers or should_skip_tracing(_next, info):
+            return _next(root, info, *args, **kwargs)
+
+        start = time.perf_counter()
+        is_awaitable = False
+
+        try:
+            result = _next(root, info, *args, **kwargs)
+            is_awaitable = isawaitable(result)
+
+            if is_awaitable:
+                return self._resolve_async(result, info, start)
+
+            return result
+        finally:
+            if not is_awaitable:
+                self._record(info, start)
+
+    async def _resolve_async(self, result, info, start: float):
+        try:
+            return await result
+        finally:
+            self._record(info, start)
+
+    def _record(self, info: GraphQLResolveInfo, start: float) -> None:
+        item = (time.perf_counter() - start, next(self._counter), info)
+
+        if len(self._resolvers) < self.top_resolvers:
+            heapq.heappush(self._resolvers, item)
+        else:
+            heapq.heappushpop(self._resolvers, item)
@@ -0,0 +1,89 @@
+import logging
+from typing import Any, Dict, Optional
+
+from graphql import get_operation_ast
+
+from strawberry.extensions import Extension
+from strawberry.types.execution import ExecutionContext, ExecutionTimings
+
+
+TIMINGS_EXTENSION_KEY = "timings"
+
+logger = logging.getLogger("strawberry.timings")
+
+
+def _to_milliseconds(duration: Optional[float]) -> Optional[float]:
+    if duration is None:
+        return None
+
+    return round(duration * 1000, 3)
+
+
+def format_timings(timings: ExecutionTimings) -> Dict[str, Optional[float]]:
+    """Returns the durations of the phases in milliseconds"""
+
+    return {
+        "parsing": _to_milliseconds(timings.parsing),
+        "validation": _to_milliseconds(timings.validation),
+        "execution": _to_milliseconds(timings.execution),
+        "total": _to_milliseconds(timings.total),
+    }
+
+
+class TimingsExtension(Extension):
+    """Reports the durations of the parsing, the validation and the execution
+    of the operations, which are recorded in `execution_context.timings`.
+
+    They are added to the response extensions as `timings` when
+    `include_in_response` is true, and logged to the `strawberry.timings`
+    logger, or the one passed as `logger`, with `log_level`.
+    """
+
+    def __init__(
+        self,
+        *,
+        execution_context: ExecutionContext,
+        include_in_response: bool = True,
+        logger: Optional[logging.Logger] = logger,
+        log_level: int = logging.DEBUG,
+    ):
+        self.execution_context = execution_context
+        self.include_in_response = include_in_response
+        self.logger = logger
+        self.log_level = log_level
+
+    def get_operation_name(self) -> str:
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+
+        if execution_context.operation_name or document is None:
+            return execution_context.operation_name or "<anonymous>"
+
+        operation = get_operation_ast(document)
+
+        if operation is None or operation.name is None:
+            return "<anonymous>"
+
+        return operation.name.value
+
+    def on_request_end(self):
+        if self.logger is None or not self.logger.isEnabledFor(self.log_level):
+            return
+
+        timings = format_timings(self.execution_context.timings)
+
+        self.logger.log(
+            self.log_level,
+            "Operation %s: parsing %sms, validation %sms, execution %sms",
+            self.get_operation_name(),
+            timings["parsing"],
+            timings["validation"],
+            timings["execution"],
+            extra={"timings": timings},
+        )
+
+    def get_results(self) -> Dict[str, Any]:
+        if not self.include_in_response:
+            return {}
+
+        return {TIMINGS_EXTENSION_KEY: format_timings(self.execution_context.timings)}
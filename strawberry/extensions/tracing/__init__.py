@@ -1,2 +1,3 @@
 from .apollo import ApolloTracingExtension, ApolloTracingExtensionSync  # noqa
+from .apollo_federation import ApolloFederationTracingExtension  # noqa
 from .opentelemetry import OpenTelemetryExtension, OpenTelemetryExtensionSync  # noqa
@@ -1,11 +1,13 @@
 import dataclasses
+import random
 import time
 import typing
 from datetime import datetime
 from inspect import isawaitable
 
+from graphql import GraphQLResolveInfo
+
 from strawberry.extensions import Extension
-from strawberry.extensions.utils import get_path_from_info
 from strawberry.types.execution import ExecutionContext
 
 from .utils import should_skip_tracing
@@ -23,14 +25,40 @@ class ApolloStepStats:
         return {"startOffset": self.start_offset, "duration": self.duration}
 
 
-@dataclasses.dataclass
 class ApolloResolverStats:
-    path: typing.List[str]
-    parent_type: typing.Any
-    field_name: str
-    return_type: typing.Any
-    start_offset: int
-    duration: typing.Optional[int] = None
+    """The timing of a resolver.
+
+    The stats keep a reference to the resolve info, so that the path of the
+    field is only materialized when the stats are emitted.
+    """
+
+    __slots__ = ("info", "start_offset", "duration")
+
+    def __init__(
+        self,
+        info: GraphQLResolveInfo,
+        start_offset: int,
+        duration: typing.Optional[int] = None,
+    ):
+        self.info = info
+        self.start_offset = start_offset
+        self.duration = duration
+
+    @property
+    def path(self) -> typing.List[typing.Union[str, int]]:
+        return self.info.path.as_list()
+
+    @property
+    def field_name(self) -> str:
+        return self.info.field_name
+
+    @property
+    def parent_type(self) -> typing.Any:
+        return self.info.parent_type
+
+    @property
+    def return_type(self) -> typing.Any:
+        return self.info.return_type
 
     def to_json(self) -> typing.Dict[str, typing.Any]:
         return {
@@ -74,15 +102,52 @@ class ApolloTracingStats:
 
 
 class ApolloTracingExtension(Extension):
-    def __init__(self, execution_context: ExecutionContext):
+    """Adds the timing of the execution and of each resolver to the response
+    extensions, using the Apollo tracing format.
+
+    Tracing can be enabled for a fraction of the requests with `sample_rate`,
+    or by passing a `should_sample` function that receives the execution
+    context. The resolvers of the requests that aren't sampled are called
+    directly:
+
+    >>> schema = strawberry.Schema(
+    >>>     Query, extensions=[partial(ApolloTracingExtension, sample_rate=0.01)]
+    >>> )
+    """
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext,
+        *,
+        sample_rate: float = 1.0,
+        should_sample: typing.Optional[
+            typing.Callable[[ExecutionContext], bool]
+        ] = None,
+    ):
         self._resolver_stats: typing.List[ApolloResolverStats] = []
         self.execution_context = execution_context
 
+        if should_sample is not None:
+            self.sampled = should_sample(execution_context)
+        else:
+            self.sampled = sample_rate >= 1 or random.random() < sample_rate
+
+        self._start_parsing = self._end_parsing = 0
+        self._start_validation = self._end_validation = 0
+        self.end_timestamp: typing.Optional[int] = None
+        self.end_time: typing.Optional[datetime] = None
+
     def on_request_start(self):
+        if not self.sampled:
+            return
+
         self.start_timestamp = self.now()
         self.start_time = datetime.utcnow()
 
     def on_request_end(self):
+        if not self.sampled:
+            return
+
         self.end_timestamp = self.now()
         self.end_time = datetime.utcnow()
 
@@ -103,74 +168,75 @@ class ApolloTracingExtension(Extension):
 
     @property
     def stats(self) -> ApolloTracingStats:
+        # the results can be requested before the end of the request, when
+        # the operation is rejected
+        end_timestamp = self.end_timestamp
+        end_time = self.end_time
+
+        if end_timestamp is None or end_time is None:
+            end_timestamp = self.now()
+            end_time = datetime.utcnow()
+
+        start_parsing = self._start_parsing or self.start_timestamp
+        start_validation = self._start_validation or self.start_timestamp
+
         return ApolloTracingStats(
             start_time=self.start_time,
-            end_time=self.end_time,
-            duration=self.end_timestamp - self.start_timestamp,
+            end_time=end_time,
+            duration=end_timestamp - self.start_timestamp,
             execution=ApolloExecutionStats(self._resolver_stats),
             validation=ApolloStepStats(
-                start_offset=self._start_validation - self.start_timestamp,
-                duration=self._end_validation - self._start_validation,
+                start_offset=start_validation - self.start_timestamp,
+                duration=max(self._end_validation - start_validation, 0),
             ),
             parsing=ApolloStepStats(
-                start_offset=self._start_parsing - self.start_timestamp,
-                duration=self._end_parsing - self._start_parsing,
+                start_offset=start_parsing - self.start_timestamp,
+                duration=max(self._end_parsing - start_parsing, 0),
             ),
         )
 
     def get_results(self):
-        return {"tracing": self.stats.to_json()}
+        if not self.sampled:
+            return {}
 
-    async def resolve(self, _next, root, info, *args, **kwargs):
-        if should_skip_tracing(_next, info):
-            result = _next(root, info, *args, **kwargs)
-
-            if isawaitable(result):
-                result = await result  # pragma: no cover
+        return {"tracing": self.stats.to_json()}
 
-            return result
+    def resolve(self, _next, root, info, *args, **kwargs):
+        # sync results are timed without wrapping the resolver in a coroutine
+        if not self.sampled or should_skip_tracing(_next, info):
+            return _next(root, info, *args, **kwargs)
 
         start_timestamp = self.now()
-
-        resolver_stats = ApolloResolverStats(
-            path=get_path_from_info(info),
-            field_name=info.field_name,
-            parent_type=info.parent_type,
-            return_type=info.return_type,
-            start_offset=start_timestamp - self.start_timestamp,
-        )
+        is_awaitable = False
 
         try:
             result = _next(root, info, *args, **kwargs)
+            is_awaitable = isawaitable(result)
 
-            if isawaitable(result):
-                result = await result
+            if is_awaitable:
+                return self._resolve_async(result, info, start_timestamp)
 
             return result
         finally:
-            end_timestamp = self.now()
-            resolver_stats.duration = end_timestamp - start_timestamp
-            self._resolver_stats.append(resolver_stats)
-
-
-class ApolloTracingExtensionSync(ApolloTracingExtension):
-    def resolve(self, _next, root, info, *args, **kwargs):
-        if should_skip_tracing(_next, info):
-            return _next(root, info, *args, **kwargs)
-
-        start_timestamp = self.now()
-
-        resolver_stats = ApolloResolverStats(
-            path=get_path_from_info(info),
-            field_name=info.field_name,
-            parent_type=info.parent_type,
-            return_type=info.return_type,
-            start_offset=start_timestamp - self.start_timestamp,
-        )
+            if not is_awaitable:
+                self._add_resolver_stats(info, start_timestamp)
 
+    async def _resolve_async(self, result, info, start_timestamp: int):
         try:
-            return _next(root, info, *args, **kwargs)
+            return await result
         finally:
-            end_timestamp = self.now()
-            resolver_stats.duration = end_timestamp - start_timestamp
-            self._resolver_stats.append(resolver_stats)
+            self._add_resolver_stats(info, start_timestamp)
+
+    def _add_resolver_stats(self, info: GraphQLResolveInfo, start_timestamp: int):
+        self._resolver_stats.append(
+            ApolloResolverStats(
+                info,
+                start_offset=start_timestamp - self.start_timestamp,
+                duration=self.now() - start_timestamp,
+            )
+        )
+
+
+class ApolloTracingExtensionSync(ApolloTracingExtension):
+    """Apollo tracing for sync executions, kept for backwards compatibility as
+    `ApolloTracingExtension` now handles both sync and async resolvers"""
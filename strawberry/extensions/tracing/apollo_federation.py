@@ -0,0 +1,268 @@
+"""Federated tracing (ftv1) for Apollo Gateway.
+
+When the gateway sends the `apollo-federation-include-trace: ftv1` header,
+the timing of each field is collected in a tree and added to the response
+extensions as `ftv1`, a base64 encoded `Trace` message of Apollo's
+`reports.proto`. The message is encoded by hand, as it only uses a few
+fields, so that the `protobuf` package isn't needed.
+"""
+
+import base64
+import json
+import time
+import typing
+from inspect import isawaitable
+
+from graphql import GraphQLError, GraphQLResolveInfo
+
+from strawberry.extensions import Extension
+from strawberry.extensions.utils import get_request_header, is_introspection_key
+from strawberry.types.execution import ExecutionContext
+
+
+FTV1_HEADER = "apollo-federation-include-trace"
+FTV1_HEADER_VALUE = "ftv1"
+FTV1_EXTENSION_KEY = "ftv1"
+
+PathKey = typing.Union[str, int]
+
+
+def _encode_varint(value: int) -> bytes:
+    data = bytearray()
+
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+
+        if value:
+            data.append(byte | 0x80)
+        else:
+            data.append(byte)
+            return bytes(data)
+
+
+def _encode_varint_field(number: int, value: int) -> bytes:
+    return _encode_varint(number << 3) + _encode_varint(value)
+
+
+def _encode_bytes_field(number: int, value: bytes) -> bytes:
+    return _encode_varint(number << 3 | 2) + _encode_varint(len(value)) + value
+
+
+def _encode_string_field(number: int, value: str) -> bytes:
+    return _encode_bytes_field(number, value.encode())
+
+
+def _encode_timestamp(timestamp_ns: int) -> bytes:
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+
+    return _encode_varint_field(1, seconds) + _encode_varint_field(2, nanos)
+
+
+def _encode_error(error: GraphQLError) -> bytes:
+    data = _encode_string_field(1, error.message)
+
+    for location in error.locations or ():
+        data += _encode_bytes_field(
+            2,
+            _encode_varint_field(1, location.line)
+            + _encode_varint_field(2, location.column),
+        )
+
+    data += _encode_string_field(4, json.dumps(error.formatted))
+
+    return data
+
+
+class TraceNode:
+    """A node of the trace tree, either a field, identified by its response
+    name, or an item of a list, identified by its index"""
+
+    __slots__ = (
+        "key",
+        "type",
+        "parent_type",
+        "original_field_name",
+        "start_time",
+        "end_time",
+        "errors",
+        "children",
+    )
+
+    def __init__(self, key: typing.Optional[PathKey] = None):
+        self.key = key
+        self.type: typing.Optional[str] = None
+        self.parent_type: typing.Optional[str] = None
+        self.original_field_name: typing.Optional[str] = None
+        self.start_time = 0
+        self.end_time = 0
+        self.errors: typing.List[GraphQLError] = []
+        self.children: typing.Dict[PathKey, "TraceNode"] = {}
+
+    def get_child(self, key: PathKey) -> "TraceNode":
+        child = self.children.get(key)
+
+        if child is None:
+            child = self.children[key] = TraceNode(key)
+
+        return child
+
+    def encode(self) -> bytes:
+        parts: typing.List[bytes] = []
+
+        if isinstance(self.key, str):
+            parts.append(_encode_string_field(1, self.key))
+        elif isinstance(self.key, int):
+            parts.append(_encode_varint_field(2, self.key))
+
+        if self.type is not None:
+            parts.append(_encode_string_field(3, self.type))
+
+        if self.parent_type is not None:
+            parts.append(_encode_string_field(13, self.parent_type))
+
+        if self.original_field_name is not None:
+            parts.append(_encode_string_field(14, self.original_field_name))
+
+        if self.start_time:
+            parts.append(_encode_varint_field(8, self.start_time))
+
+        if self.end_time:
+            parts.append(_encode_varint_field(9, self.end_time))
+
+        for error in self.errors:
+            parts.append(_encode_bytes_field(11, _encode_error(error)))
+
+        for child in self.children.values():
+            parts.append(_encode_bytes_field(12, child.encode()))
+
+        return b"".join(parts)
+
+
+class ApolloFederationTracingExtension(Extension):
+    """Adds a federated trace (ftv1) of the execution to the response
+    extensions, when Apollo Gateway requests it with the
+    `apollo-federation-include-trace` header.
+
+    `should_trace` can be passed to decide differently, it receives the
+    execution context.
+    """
+
+    def __init__(
+        self,
+        execution_context: ExecutionContext,
+        *,
+        should_trace: typing.Optional[typing.Callable[[ExecutionContext], bool]] = None,
+    ):
+        self.execution_context = execution_context
+
+        if should_trace is not None:
+            self.enabled = should_trace(execution_context)
+        else:
+            header = get_request_header(execution_context.context, FTV1_HEADER)
+            self.enabled = header == FTV1_HEADER_VALUE
+
+        # resolve info, start and end of each resolver, the tree is only built
+        # when the results are emitted
+        self._resolvers: typing.List[typing.Tuple[GraphQLResolveInfo, int, int]] = []
+        self.end_time: typing.Optional[int] = None
+        self.end_timestamp: typing.Optional[int] = None
+
+    def now(self) -> int:
+        return time.perf_counter_ns()
+
+    def on_request_start(self):
+        if not self.enabled:
+            return
+
+        self.start_time = time.time_ns()
+        self.start_timestamp = self.now()
+
+    def on_request_end(self):
+        if not self.enabled:
+            return
+
+        self.end_time = time.time_ns()
+        self.end_timestamp = self.now()
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        if not self.enabled or (
+            is_introspection_key(info.field_name)
+            or is_introspection_key(info.parent_type.name)
+        ):
+            return _next(root, info, *args, **kwargs)
+
+        start_timestamp = self.now()
+        is_awaitable = False
+
+        try:
+            result = _next(root, info, *args, **kwargs)
+            is_awaitable = isawaitable(result)
+
+            if is_awaitable:
+                return self._resolve_async(result, info, start_timestamp)
+
+            return result
+        finally:
+            if not is_awaitable:
+                self._resolvers.append((info, start_timestamp, self.now()))
+
+    async def _resolve_async(self, result, info, start_timestamp: int):
+        try:
+            return await result
+        finally:
+            self._resolvers.append((info, start_timestamp, self.now()))
+
+    def build_tree(self) -> TraceNode:
+        root = TraceNode()
+
+        def get_node(path: typing.Iterable[PathKey]) -> TraceNode:
+            node = root
+
+            for key in path:
+                node = node.get_child(key)
+
+            return node
+
+        for info, start_timestamp, end_timestamp in self._resolvers:
+            node = get_node(info.path.as_list())
+            node.type = str(info.return_type)
+            node.parent_type = info.parent_type.name
+            node.start_time = start_timestamp - self.start_timestamp
+            node.end_time = end_timestamp - self.start_timestamp
+
+            field_name = info.field_nodes[0].name.value
+
+            if info.path.key != field_name:
+                node.original_field_name = field_name
+
+        errors = self.execution_context.errors
+        result = self.execution_context.result
+
+        if not errors and result is not None:
+            errors = result.errors
+
+        # errors without a path, like validation errors, are added to the root
+        for error in errors or ():
+            get_node(error.path or ()).errors.append(error)
+
+        return root
+
+    def encode_trace(self) -> bytes:
+        # the results can be requested before the end of the request, when
+        # the operation is rejected
+        end_time = self.end_time or time.time_ns()
+        end_timestamp = self.end_timestamp or self.now()
+
+        return (
+            _encode_bytes_field(3, _encode_timestamp(end_time))
+            + _encode_bytes_field(4, _encode_timestamp(self.start_time))
+            + _encode_varint_field(11, end_timestamp - self.start_timestamp)
+            + _encode_bytes_field(14, self.build_tree().encode())
+        )
+
+    def get_results(self) -> typing.Dict[str, typing.Any]:
+        if not self.enabled:
+            return {}
+
+        return {FTV1_EXTENSION_KEY: base64.b64encode(self.encode_trace()).decode()}
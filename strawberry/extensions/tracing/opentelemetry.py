@@ -1,6 +1,6 @@
 from copy import deepcopy
 from inspect import isawaitable
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Collection, Dict, Optional
 
 from opentelemetry import trace
 from opentelemetry.trace import Span, SpanKind, Tracer
@@ -8,7 +8,6 @@ from opentelemetry.trace import Span, SpanKind, Tracer
 from graphql import GraphQLResolveInfo
 
 from strawberry.extensions import Extension
-from strawberry.extensions.utils import get_path_from_info
 from strawberry.types.execution import ExecutionContext
 
 from .utils import should_skip_tracing
@@ -32,6 +31,14 @@ else:
 
 
 class OpenTelemetryExtension(Extension):
+    """Creates a span for the request and a child span for each resolver.
+
+    Nothing is done for the requests that aren't sampled, as their spans
+    aren't recording. The fields that get a child span can be restricted
+    with `max_depth`, the number of fields in their path, and with
+    `field_allowlist`, a collection of schema coordinates like `Query.user`.
+    """
+
     _arg_filter: Optional[ArgFilter]
     _root_span: Span
     _tracer: Tracer
@@ -41,9 +48,16 @@ class OpenTelemetryExtension(Extension):
         *,
         execution_context: ExecutionContext,
         arg_filter: Optional[ArgFilter] = None,
+        max_depth: Optional[int] = None,
+        field_allowlist: Optional[Collection[str]] = None,
     ):
         self._arg_filter = arg_filter
+        self._max_depth = max_depth
+        self._field_allowlist = (
+            frozenset(field_allowlist) if field_allowlist is not None else None
+        )
         self._tracer = trace.get_tracer("strawberry")
+        self._is_recording = False
         self.execution_context = execution_context
 
     def on_request_start(self):
@@ -54,8 +68,12 @@ class OpenTelemetryExtension(Extension):
         )
 
         self._root_span = self._tracer.start_span(span_name, kind=SpanKind.SERVER)
-        self._root_span.set_attribute("component", "graphql")
-        self._root_span.set_attribute("query", self.execution_context.query)
+        self._is_recording = self._root_span.is_recording()
+
+        # the attributes of the spans that aren't sampled are never exported
+        if self._is_recording:
+            self._root_span.set_attribute("component", "graphql")
+            self._root_span.set_attribute("query", self.execution_context.query)
 
     def on_request_end(self):
         self._root_span.end()
@@ -68,7 +86,7 @@ class OpenTelemetryExtension(Extension):
         return self._arg_filter(deepcopy(args), info)
 
     def add_tags(self, span: Span, info: GraphQLResolveInfo, kwargs: Dict[str, Any]):
-        graphql_path = ".".join(map(str, get_path_from_info(info)))
+        graphql_path = ".".join(map(str, info.path.as_list()))
 
         span.set_attribute("component", "graphql")
         span.set_attribute("graphql.parentType", info.parent_type.name)
@@ -80,15 +98,29 @@ class OpenTelemetryExtension(Extension):
             for kwarg, value in filtered_kwargs.items():
                 span.set_attribute(f"graphql.param.{kwarg}", value)
 
-    async def resolve(self, _next, root, info, *args, **kwargs):
-        if should_skip_tracing(_next, info):
-            result = _next(root, info, *args, **kwargs)
+    def should_trace(self, _next: Callable, info: GraphQLResolveInfo) -> bool:
+        if not self._is_recording:
+            return False
 
-            if isawaitable(result):  # pragma: no cover
-                result = await result
+        if self._field_allowlist is not None and (
+            f"{info.parent_type.name}.{info.field_name}" not in self._field_allowlist
+        ):
+            return False
+
+        if self._max_depth is not None and get_field_depth(info) > self._max_depth:
+            return False
+
+        return not should_skip_tracing(_next, info)
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        # the fields without a span are resolved without wrapping them in a
+        # coroutine
+        if not self.should_trace(_next, info):
+            return _next(root, info, *args, **kwargs)
 
-            return result
+        return self._resolve_in_span(_next, root, info, *args, **kwargs)
 
+    async def _resolve_in_span(self, _next, root, info, *args, **kwargs):
         with _use_span(self._root_span, self._tracer):
             with self._tracer.start_span(info.field_name, kind=SpanKind.SERVER) as span:
                 self.add_tags(span, info, kwargs)
@@ -102,10 +134,8 @@ class OpenTelemetryExtension(Extension):
 
 class OpenTelemetryExtensionSync(OpenTelemetryExtension):
     def resolve(self, _next, root, info, *args, **kwargs):
-        if should_skip_tracing(_next, info):
-            result = _next(root, info, *args, **kwargs)
-
-            return result
+        if not self.should_trace(_next, info):
+            return _next(root, info, *args, **kwargs)
 
         with _use_span(self._root_span, self._tracer):
             with self._tracer.start_span(info.field_name, kind=SpanKind.SERVER) as span:
@@ -113,3 +143,19 @@ class OpenTelemetryExtensionSync(OpenTelemetryExtension):
                 result = _next(root, info, *args, **kwargs)
 
                 return result
+
+
+def get_field_depth(info: GraphQLResolveInfo) -> int:
+    """Returns the number of fields in the path of a resolver, without the
+    indexes of the lists"""
+
+    path = info.path
+    depth = 0
+
+    while path:
+        if isinstance(path.key, str):
+            depth += 1
+
+        path = path.prev
+
+    return depth
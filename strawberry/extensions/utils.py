@@ -1,7 +1,9 @@
-from typing import List, Union
+from typing import Any, Callable, List, Optional, Union
 
 from graphql import GraphQLResolveInfo
 
+from strawberry.resolvers import is_default_resolver
+
 
 def is_introspection_key(key: Union[str, int]) -> bool:
     # from: https://spec.graphql.org/June2018/#sec-Schema
@@ -23,6 +25,18 @@ def is_introspection_field(info: GraphQLResolveInfo) -> bool:
     return False
 
 
+def should_skip_tracing(resolver: Callable, info: GraphQLResolveInfo) -> bool:
+    if info.field_name not in info.parent_type.fields:
+        return True
+    resolver = info.parent_type.fields[info.field_name].resolve
+    # walking the path to find introspection fields is the slowest check
+    return (
+        resolver is None
+        or is_default_resolver(resolver)
+        or is_introspection_field(info)
+    )
+
+
 def get_path_from_info(info: GraphQLResolveInfo) -> List[str]:
     path = info.path
     elements = []
@@ -32,3 +46,20 @@ def get_path_from_info(info: GraphQLResolveInfo) -> List[str]:
         path = path.prev
 
     return elements[::-1]
+
+
+def get_request_header(context: Any, name: str) -> Optional[str]:
+    """Reads a header of the request stored in the context by the HTTP
+    integrations, either as `context["request"]` or `context.request`"""
+
+    if isinstance(context, dict):
+        request = context.get("request")
+    else:
+        request = getattr(context, "request", None)
+
+    headers = getattr(request, "headers", None)
+
+    if headers is None:
+        return None
+
+    return headers.get(name)
@@ -1,4 +1,16 @@
-from typing import Callable, List, Optional, Type, Union, cast
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
 
 from graphql import (
     GraphQLField,
@@ -12,9 +24,11 @@ from graphql import (
 from graphql.type.definition import GraphQLArgument
 
 from strawberry.custom_scalar import ScalarDefinition
+from strawberry.dataloader import DataLoader
 from strawberry.enum import EnumDefinition
 from strawberry.permission import BasePermission
 from strawberry.schema.types.concrete_type import TypeMap
+from strawberry.types import ExecutionResult, Info
 from strawberry.types.types import TypeDefinition
 from strawberry.union import StrawberryUnion
 from strawberry.utils.inspect import get_func_args
@@ -100,6 +114,76 @@ def _get_entity_type(type_map: TypeMap):
     return entity_type
 
 
+def _get_representation_key(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _get_representation_key(item)) for key, item in value.items())
+        )
+
+    if isinstance(value, list):
+        return tuple(_get_representation_key(item) for item in value)
+
+    return value
+
+
+class EntityLoader:
+    """Loads the entities of a federated type in batches with its
+    `resolve_references` class method, which receives the list of the
+    representations to load and can take an `info` argument.
+
+    The loaders are created once per execution, so the references sent by the
+    gateway and the ones loaded by the other fields of the operation are
+    batched and cached together.
+    """
+
+    def __init__(self, cls: Type, info: Info):
+        self.cls = cls
+        self.info = info
+
+        self._representations: Dict[Hashable, Dict[str, Any]] = {}
+        self._loader: DataLoader[Hashable, Any] = DataLoader(
+            load_fn=self._load_references
+        )
+
+    async def _load_references(self, keys: List[Hashable]) -> List[Any]:
+        resolve_references = self.cls.resolve_references
+        representations = [self._representations[key] for key in keys]
+
+        if "info" in get_func_args(resolve_references):
+            return await resolve_references(representations, info=self.info)
+
+        return await resolve_references(representations)
+
+    def load(self, representation: Dict[str, Any]) -> Awaitable[Any]:
+        key = _get_representation_key(representation)
+        self._representations.setdefault(key, representation)
+
+        return self._loader.load(key)
+
+
+_entity_loaders: ContextVar[Optional[Dict[Type, EntityLoader]]] = ContextVar(
+    "strawberry_federation_entity_loaders", default=None
+)
+
+
+def get_entity_loader(info: Info, cls: Type) -> EntityLoader:
+    """Returns the loader of the entities of `cls` for the current execution,
+    `cls` must define a `resolve_references` class method"""
+
+    loaders = _entity_loaders.get()
+
+    if loaders is None:
+        raise RuntimeError(
+            "Entity loaders are only available while a federation schema is "
+            "executing an operation asynchronously"
+        )
+
+    if cls not in loaders:
+        loaders[cls] = EntityLoader(cls, info)
+
+    return loaders[cls]
+
+
 class Schema(BaseSchema):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -108,6 +192,14 @@ class Schema(BaseSchema):
         self._create_service_field()
         self._extend_query_type()
 
+    async def execute(self, *args, **kwargs) -> ExecutionResult:
+        token = _entity_loaders.set({})
+
+        try:
+            return await super().execute(*args, **kwargs)
+        finally:
+            _entity_loaders.reset(token)
+
     def entities_resolver(self, root, info, representations):
         results = []
 
@@ -116,6 +208,12 @@ class Schema(BaseSchema):
             type = self.schema_converter.type_map[type_name]
 
             definition = cast(TypeDefinition, type.definition)
+
+            if hasattr(definition.origin, "resolve_references"):
+                loader = get_entity_loader(info, definition.origin)
+                results.append(loader.load(representation))
+                continue
+
             resolve_reference = definition.origin.resolve_reference
 
             func_args = get_func_args(resolve_reference)
@@ -126,6 +224,7 @@ class Schema(BaseSchema):
 
             results.append(resolve_reference(**kwargs))
 
+        # the awaitable references are awaited concurrently by graphql-core
         return results
 
     def _add_scalars(self):
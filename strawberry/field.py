@@ -9,6 +9,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
@@ -18,6 +19,7 @@ from cached_property import cached_property  # type: ignore
 
 from strawberry.annotation import StrawberryAnnotation
 from strawberry.arguments import UNSET, StrawberryArgument
+from strawberry.cache import BaseFieldCache, CacheControl
 from strawberry.type import StrawberryType
 from strawberry.types.info import Info
 from strawberry.utils.mixins import GraphQLNameMixin
@@ -47,6 +49,12 @@ class StrawberryField(dataclasses.Field, GraphQLNameMixin):
         default: object = UNSET,
         default_factory: Union[Callable[[], Any], object] = UNSET,
         deprecation_reason: Optional[str] = None,
+        cache_control: Optional[CacheControl] = None,
+        cache: Optional[BaseFieldCache] = None,
+        run_in_thread: Optional[bool] = None,
+        cost: Optional[int] = None,
+        cost_multipliers: Optional[Sequence[str]] = None,
+        timeout: Optional[float] = None,
     ):
         federation = federation or FederationFieldParams()
 
@@ -94,6 +102,12 @@ class StrawberryField(dataclasses.Field, GraphQLNameMixin):
         self.permission_classes: List[Type[BasePermission]] = list(permission_classes)
 
         self.deprecation_reason = deprecation_reason
+        self.cache_control = cache_control
+        self.cache = cache
+        self.run_in_thread = run_in_thread
+        self.cost = cost
+        self.cost_multipliers: List[str] = list(cost_multipliers or ())
+        self.timeout = timeout
 
     def __call__(self, resolver: _RESOLVER_TYPE) -> "StrawberryField":
         """Add a resolver to the field"""
@@ -236,6 +250,12 @@ class StrawberryField(dataclasses.Field, GraphQLNameMixin):
             # ignored because of https://github.com/python/mypy/issues/6910
             default_factory=self.default_factory,  # type: ignore[misc]
             deprecation_reason=self.deprecation_reason,
+            cache_control=self.cache_control,
+            cache=self.cache,
+            run_in_thread=self.run_in_thread,
+            cost=self.cost,
+            cost_multipliers=self.cost_multipliers,
+            timeout=self.timeout,
         )
 
     def get_result(
@@ -278,6 +298,12 @@ def field(
     deprecation_reason: Optional[str] = None,
     default: Any = UNSET,
     default_factory: Union[Callable, object] = UNSET,
+    cache_control: Optional[CacheControl] = None,
+    cache: Optional[BaseFieldCache] = None,
+    run_in_thread: Optional[bool] = None,
+    cost: Optional[int] = None,
+    cost_multipliers: Optional[Sequence[str]] = None,
+    timeout: Optional[float] = None,
 ) -> StrawberryField:
     """Annotates a method or property as a GraphQL field.
 
@@ -305,6 +331,12 @@ def field(
         deprecation_reason=deprecation_reason,
         default=default,
         default_factory=default_factory,
+        cache_control=cache_control,
+        cache=cache,
+        run_in_thread=run_in_thread,
+        cost=cost,
+        cost_multipliers=cost_multipliers,
+        timeout=timeout,
     )
 
     if resolver:
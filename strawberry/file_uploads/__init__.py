@@ -1,4 +1,6 @@
+from .parser import UploadLimits
 from .scalars import Upload
+from .uploaded_file import UploadedFile
 
 
-__all__ = ["Upload"]
+__all__ = ["Upload", "UploadedFile", "UploadLimits"]
@@ -0,0 +1,181 @@
+"""A streaming parser for multipart requests.
+
+Files are written to `UploadedFile`s while the body is received, so that a
+request is never fully held in memory.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterable, Dict, List, Optional, Tuple
+
+from multipart.multipart import MultipartParser, parse_options_header
+
+from strawberry.exceptions import UploadTooLargeError
+
+from .uploaded_file import DEFAULT_MAX_MEMORY_SIZE, UploadedFile
+
+
+@dataclass
+class UploadLimits:
+    # the size after which a file is spooled to disk
+    max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE
+    max_file_size: Optional[int] = None
+    max_files: Optional[int] = None
+    # the size of the other fields, like `operations` and `map`
+    max_field_size: int = DEFAULT_MAX_MEMORY_SIZE
+
+
+class _Event(Enum):
+    PART_BEGIN = 1
+    PART_DATA = 2
+    PART_END = 3
+    HEADER_FIELD = 4
+    HEADER_VALUE = 5
+    HEADER_END = 6
+    HEADERS_FINISHED = 7
+    END = 8
+
+
+class MultipartFormParser:
+    def __init__(self, content_type: str, limits: UploadLimits):
+        _, params = parse_options_header(content_type)
+
+        boundary = params.get(b"boundary")
+
+        if not boundary:
+            raise ValueError("Missing multipart boundary")
+
+        self.limits = limits
+        self.events: List[Tuple[_Event, bytes]] = []
+        self.parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_event(_Event.PART_BEGIN),
+                "on_part_data": self._on_data(_Event.PART_DATA),
+                "on_part_end": self._on_event(_Event.PART_END),
+                "on_header_field": self._on_data(_Event.HEADER_FIELD),
+                "on_header_value": self._on_data(_Event.HEADER_VALUE),
+                "on_header_end": self._on_event(_Event.HEADER_END),
+                "on_headers_finished": self._on_event(_Event.HEADERS_FINISHED),
+                "on_end": self._on_event(_Event.END),
+            },
+        )
+
+        self.fields: Dict[str, str] = {}
+        self.files: Dict[str, UploadedFile] = {}
+
+    def _on_event(self, event: _Event):
+        return lambda: self.events.append((event, b""))
+
+    def _on_data(self, event: _Event):
+        return lambda data, start, end: self.events.append((event, data[start:end]))
+
+    async def parse(
+        self, stream: AsyncIterable[bytes]
+    ) -> Tuple[Dict[str, str], Dict[str, UploadedFile]]:
+        try:
+            await self._parse(stream)
+        except BaseException:
+            for file in self.files.values():
+                await file.close()
+
+            raise
+
+        return self.fields, self.files
+
+    async def _parse(self, stream: AsyncIterable[bytes]) -> None:
+        headers: Dict[bytes, bytes] = {}
+        header_field = b""
+        header_value = b""
+        name = ""
+        data = bytearray()
+        file: Optional[UploadedFile] = None
+        complete = False
+
+        async for chunk in stream:
+            self.parser.write(chunk)
+
+            events = self.events
+            self.events = []
+
+            for event, value in events:
+                if event == _Event.PART_BEGIN:
+                    headers = {}
+                    data = bytearray()
+                    file = None
+                elif event == _Event.HEADER_FIELD:
+                    header_field += value
+                elif event == _Event.HEADER_VALUE:
+                    header_value += value
+                elif event == _Event.HEADER_END:
+                    headers[header_field.lower()] = header_value
+                    header_field = b""
+                    header_value = b""
+                elif event == _Event.HEADERS_FINISHED:
+                    name, file = self._start_part(headers)
+                elif event == _Event.PART_DATA:
+                    if file is None:
+                        data += value
+                        self._check_size(len(data), self.limits.max_field_size)
+                    else:
+                        self._check_size(
+                            file.size + len(value), self.limits.max_file_size
+                        )
+                        await file.write(value)
+                elif event == _Event.PART_END:
+                    if file is None:
+                        self.fields[name] = data.decode("utf-8", errors="replace")
+                    else:
+                        await file.seek(0)
+                elif event == _Event.END:
+                    complete = True
+
+        self.parser.finalize()
+
+        if not complete:
+            raise ValueError("Incomplete multipart body")
+
+    def _start_part(
+        self, headers: Dict[bytes, bytes]
+    ) -> Tuple[str, Optional[UploadedFile]]:
+        _, options = parse_options_header(headers.get(b"content-disposition"))
+
+        if b"name" not in options:
+            raise ValueError("Missing name in Content-Disposition")
+
+        name = options[b"name"].decode("utf-8", errors="replace")
+
+        if b"filename" not in options:
+            return name, None
+
+        if (
+            self.limits.max_files is not None
+            and len(self.files) >= self.limits.max_files
+        ):
+            raise UploadTooLargeError(
+                f"Too many files, the limit is {self.limits.max_files}"
+            )
+
+        file = UploadedFile(
+            filename=options[b"filename"].decode("utf-8", errors="replace"),
+            content_type=headers.get(b"content-type", b"").decode("latin-1"),
+            max_memory_size=self.limits.max_memory_size,
+        )
+        self.files[name] = file
+
+        return name, file
+
+    def _check_size(self, size: int, limit: Optional[int]) -> None:
+        if limit is not None and size > limit:
+            raise UploadTooLargeError(f"Multipart part larger than {limit} bytes")
+
+
+async def parse_multipart_form(
+    stream: AsyncIterable[bytes], content_type: str, limits: UploadLimits
+) -> Tuple[Dict[str, str], Dict[str, UploadedFile]]:
+    """Parses a multipart/form-data body, returning its fields and files.
+
+    Raises `UploadTooLargeError` when a limit is exceeded and `ValueError`
+    when the body is invalid."""
+
+    return await MultipartFormParser(content_type, limits).parse(stream)
@@ -0,0 +1,67 @@
+import asyncio
+import tempfile
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+
+DEFAULT_MAX_MEMORY_SIZE = 1024 * 1024
+DEFAULT_READ_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+class UploadedFile:
+    """A file uploaded with a multipart request.
+
+    The content is kept in memory up to `max_memory_size` bytes and then
+    spooled to a temporary file on disk, once on disk the file operations run
+    in the default executor so that they don't block the event loop.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        content_type: str = "",
+        max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE,
+    ):
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+        self.file = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+
+    def __repr__(self) -> str:
+        return f"<UploadedFile filename={self.filename!r} size={self.size}>"
+
+    @property
+    def in_memory(self) -> bool:
+        return not getattr(self.file, "_rolled", True)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.in_memory:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, func, *args)
+
+    async def write(self, data: bytes) -> None:
+        self.size += len(data)
+
+        await self._run(self.file.write, data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return await self._run(self.file.read, size)
+
+    async def seek(self, offset: int) -> None:
+        await self._run(self.file.seek, offset)
+
+    async def close(self) -> None:
+        await self._run(self.file.close)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await self.read(DEFAULT_READ_SIZE)
+
+            if not chunk:
+                return
+
+            yield chunk
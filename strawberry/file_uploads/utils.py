@@ -1,4 +1,3 @@
-import copy
 from typing import Any, Dict, List, Mapping
 
 
@@ -7,7 +6,10 @@ def replace_placeholders_with_files(
     files_map: Mapping[str, List[str]],
     files: Mapping[str, Any],
 ) -> Dict[str, Any]:
-    operations = copy.deepcopy(operations_with_placeholders)
+    """Replaces the placeholders of the files in the operations, the
+    operations are updated in place and returned"""
+
+    operations = operations_with_placeholders
 
     for multipart_form_field_name, operations_paths in files_map.items():
         file_object = files[multipart_form_field_name]
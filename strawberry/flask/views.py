@@ -1,11 +1,34 @@
 import json
+from typing import Any, List, Optional, Union
+
+from graphql import OperationType
 
 from flask import Response, abort, render_template_string, request
 from flask.views import View
-from strawberry.exceptions import MissingQueryError
+from strawberry.codecs import JSONCodec, default_json_codec
+from strawberry.exceptions import (
+    InvalidPersistedQueryHashError,
+    MissingQueryError,
+    PersistedQueryNotFoundError,
+)
 from strawberry.file_uploads.utils import replace_placeholders_with_files
-from strawberry.http import GraphQLHTTPResponse, parse_request_data, process_result
+from strawberry.http import (
+    GraphQLHTTPResponse,
+    GraphQLRequestData,
+    etag_matches,
+    get_etag,
+    parse_batch_request_data,
+    parse_query_params,
+    parse_request_data,
+    process_result,
+    should_execute_query_params,
+)
+from strawberry.persisted_queries import (
+    PERSISTED_QUERY_NOT_FOUND_RESPONSE,
+    PersistedQueries,
+)
 from strawberry.types import ExecutionResult
+from strawberry.utils.operation import get_operation_type
 
 from ..schema import BaseSchema
 from .graphiql import render_graphiql_page
@@ -18,9 +41,17 @@ class GraphQLView(View):
         self,
         schema: BaseSchema,
         graphiql: bool = True,
+        json_codec: Optional[JSONCodec] = None,
+        allow_batching: bool = False,
+        allow_queries_via_get: bool = True,
+        persisted_queries: Optional[PersistedQueries] = None,
     ):
         self.graphiql = graphiql
         self.schema = schema
+        self.json_codec = json_codec or default_json_codec
+        self.allow_batching = allow_batching
+        self.allow_queries_via_get = allow_queries_via_get
+        self.persisted_queries = persisted_queries
 
     def get_root_value(self):
         return None
@@ -34,42 +65,131 @@ class GraphQLView(View):
     def process_result(self, result: ExecutionResult) -> GraphQLHTTPResponse:
         return process_result(result)
 
+    def encode_json(self, data: Any) -> bytes:
+        return self.json_codec.encode(data)
+
+    def decode_json(self, data: Union[str, bytes]) -> Any:
+        return self.json_codec.decode(data)
+
     def dispatch_request(self):
-        if "text/html" in request.environ.get("HTTP_ACCEPT", ""):
+        is_get_query = (
+            request.method == "GET"
+            and self.allow_queries_via_get
+            and should_execute_query_params(request.args)
+        )
+
+        if not is_get_query and "text/html" in request.environ.get("HTTP_ACCEPT", ""):
             if not self.graphiql:
                 abort(404)
 
             template = render_graphiql_page()
             return self.render_template(template=template)
 
-        if request.content_type.startswith("multipart/form-data"):
-            operations = json.loads(request.form.get("operations", "{}"))
-            files_map = json.loads(request.form.get("map", "{}"))
+        if is_get_query:
+            try:
+                data = parse_query_params(request.args, self.decode_json)
+            except json.JSONDecodeError:
+                return Response("Unable to parse the query parameters", 400)
+
+        elif request.content_type.startswith("multipart/form-data"):
+            try:
+                operations = self.decode_json(request.form.get("operations", "{}"))
+                files_map = self.decode_json(request.form.get("map", "{}"))
+            except json.JSONDecodeError:
+                return Response("Unable to parse the multipart body", 400)
 
             data = replace_placeholders_with_files(operations, files_map, request.files)
 
+        elif request.is_json:
+            try:
+                data = self.decode_json(request.get_data())
+            except json.JSONDecodeError:
+                return Response("Unable to parse request body as JSON", 400)
         else:
-            data = request.json
+            data = None
+
+        if isinstance(data, list):
+            return self.dispatch_batch_request(data)
 
         try:
+            if self.persisted_queries is not None and isinstance(data, dict):
+                data = self.persisted_queries.resolve_sync(data)
+
             request_data = parse_request_data(data)
         except MissingQueryError:
             return Response("No valid query was provided for the request", 400)
+        except PersistedQueryNotFoundError:
+            return Response(
+                self.encode_json(PERSISTED_QUERY_NOT_FOUND_RESPONSE),
+                status=200,
+                content_type="application/json",
+            )
+        except InvalidPersistedQueryHashError as error:
+            return Response(str(error), 400)
+
+        if request.method == "GET" and (
+            get_operation_type(request_data.query, request_data.operation_name)
+            == OperationType.MUTATION
+        ):
+            return Response(
+                "Mutations are not allowed when using GET",
+                405,
+                headers={"Allow": "POST"},
+            )
 
         context = self.get_context()
 
-        result = self.schema.execute_sync(
-            request_data.query,
-            variable_values=request_data.variables,
-            context_value=context,
-            operation_name=request_data.operation_name,
-            root_value=self.get_root_value(),
-        )
+        result = self.execute(request_data, context, self.get_root_value())
 
         response_data = self.process_result(result)
+        body = self.encode_json(response_data)
+
+        if request.method == "GET":
+            etag = get_etag(body)
+
+            if etag_matches(etag, request.headers.get("If-None-Match")):
+                return Response(status=304, headers={"ETag": etag})
+
+            return Response(
+                body,
+                status=200,
+                content_type="application/json",
+                headers={"ETag": etag},
+            )
+
+        return Response(body, status=200, content_type="application/json")
+
+    def dispatch_batch_request(self, data: List[Any]):
+        if not self.allow_batching:
+            return Response("Batched operations are not enabled", 400)
+
+        try:
+            batch_request_data = parse_batch_request_data(data)
+        except MissingQueryError:
+            return Response("No valid query was provided for the request", 400)
+
+        # the operations are executed one after the other, sharing the context
+        context = self.get_context()
+        root_value = self.get_root_value()
+
+        response_data = [
+            self.process_result(self.execute(request_data, context, root_value))
+            for request_data in batch_request_data
+        ]
 
         return Response(
-            json.dumps(response_data),
+            self.encode_json(response_data),
             status=200,
             content_type="application/json",
         )
+
+    def execute(
+        self, request_data: GraphQLRequestData, context: Any, root_value: Any
+    ) -> ExecutionResult:
+        return self.schema.execute_sync(
+            request_data.query,
+            variable_values=request_data.variables,
+            context_value=context,
+            operation_name=request_data.operation_name,
+            root_value=root_value,
+        )
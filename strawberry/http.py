@@ -1,18 +1,35 @@
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
 
 from typing_extensions import TypedDict
 
 from graphql.error import format_error as format_graphql_error
 
 from strawberry.exceptions import MissingQueryError
-from strawberry.types import ExecutionResult
+from strawberry.types import ExecutionResult, SubsequentExecutionResult
+
+
+MULTIPART_BOUNDARY = "-"
+MULTIPART_CONTENT_TYPE = f'multipart/mixed; boundary="{MULTIPART_BOUNDARY}"'
 
 
 class GraphQLHTTPResponse(TypedDict, total=False):
     data: Optional[Dict[str, Any]]
     errors: Optional[List[Any]]
     extensions: Optional[Dict[str, Any]]
+    hasNext: bool
+
+
+class GraphQLHTTPSubsequentResponse(TypedDict, total=False):
+    data: Optional[Dict[str, Any]]
+    items: Optional[List[Any]]
+    path: List[Union[str, int]]
+    label: str
+    errors: Optional[List[Any]]
+    extensions: Optional[Dict[str, Any]]
+    hasNext: bool
 
 
 def process_result(result: ExecutionResult) -> GraphQLHTTPResponse:
@@ -26,6 +43,54 @@ def process_result(result: ExecutionResult) -> GraphQLHTTPResponse:
     return data
 
 
+def process_subsequent_result(
+    result: SubsequentExecutionResult,
+) -> GraphQLHTTPSubsequentResponse:
+    data: GraphQLHTTPSubsequentResponse = {"hasNext": result.has_next}
+
+    if result.path is not None:
+        if result.items is not None:
+            data["items"] = result.items
+        else:
+            data["data"] = result.data
+
+        data["path"] = result.path
+
+    if result.label is not None:
+        data["label"] = result.label
+    if result.errors:
+        data["errors"] = [format_graphql_error(err) for err in result.errors]
+    if result.extensions:
+        data["extensions"] = result.extensions
+
+    return data
+
+
+def accepts_multipart(accept: str) -> bool:
+    """Returns whether an `Accept` header allows incremental delivery"""
+
+    return "multipart/mixed" in accept
+
+
+def encode_multipart_start() -> bytes:
+    return f"\r\n--{MULTIPART_BOUNDARY}".encode()
+
+
+def encode_multipart_part(body: bytes) -> bytes:
+    """Encodes a JSON payload as a part of a `multipart/mixed` response, it is
+    expected to follow either the start of the response or another part"""
+
+    return (
+        b"\r\nContent-Type: application/json; charset=utf-8\r\n\r\n"
+        + body
+        + f"\r\n--{MULTIPART_BOUNDARY}".encode()
+    )
+
+
+def encode_multipart_end() -> bytes:
+    return b"--\r\n"
+
+
 @dataclass
 class GraphQLRequestData:
     query: str
@@ -34,7 +99,7 @@ class GraphQLRequestData:
 
 
 def parse_request_data(data: Dict) -> GraphQLRequestData:
-    if "query" not in data:
+    if not isinstance(data, dict) or "query" not in data:
         raise MissingQueryError()
 
     result = GraphQLRequestData(
@@ -44,3 +109,64 @@ def parse_request_data(data: Dict) -> GraphQLRequestData:
     )
 
     return result
+
+
+def parse_batch_request_data(data: List[Dict]) -> List[GraphQLRequestData]:
+    """Parses a batch of operations, sent as a JSON array, raising
+    `MissingQueryError` when the batch is empty or any operation is invalid"""
+
+    if not data:
+        raise MissingQueryError()
+
+    return [parse_request_data(operation) for operation in data]
+
+
+def should_execute_query_params(params: Mapping[str, Any]) -> bool:
+    """Returns whether the query string of a GET request contains an operation"""
+
+    return "query" in params or "extensions" in params
+
+
+def parse_query_params(
+    params: Mapping[str, Any], decode_json: Callable[[str], Any] = json.loads
+) -> Dict[str, Any]:
+    """Converts the query string of a GET request to request data, variables
+    and extensions are JSON encoded, raising `json.JSONDecodeError` when
+    invalid"""
+
+    data: Dict[str, Any] = {}
+
+    if "query" in params:
+        data["query"] = params["query"]
+    if "operationName" in params:
+        data["operationName"] = params["operationName"]
+
+    for key in ("variables", "extensions"):
+        if params.get(key):
+            data[key] = decode_json(params[key])
+
+    return data
+
+
+def get_etag(body: bytes) -> str:
+    # the tag is weak, so it stays valid when the body gets compressed
+    return f'W/"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Compares an ETag with the value of an `If-None-Match` header, using the
+    weak comparison as required by RFC 7232"""
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    tags = {_strip_weak_prefix(tag.strip()) for tag in if_none_match.split(",")}
+
+    return _strip_weak_prefix(etag) in tags
+
+
+def _strip_weak_prefix(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
@@ -0,0 +1,565 @@
+"""Incremental delivery of results using the `@defer` and `@stream` directives.
+
+graphql-core doesn't support incremental delivery yet, so this module provides
+an execution context that collects deferred fragments and streamed list items
+while executing the initial result, and executes them afterwards, publishing
+each of them as a subsequent result.
+
+The directives are opt-in, they need to be passed to the schema:
+
+    schema = strawberry.Schema(query=Query, directives=[defer, stream])
+
+and results are only delivered incrementally when the caller allows it, for
+example when a client sends `Accept: multipart/mixed`, otherwise the deferred
+fragments and streamed fields are executed as if the directives were absent.
+"""
+
+import asyncio
+from copy import copy
+from inspect import isawaitable
+from itertools import islice
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from graphql import (
+    DirectiveLocation,
+    DocumentNode,
+    ExecutionContext as GraphQLExecutionContext,
+    ExecutionResult as GraphQLExecutionResult,
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationType,
+    SelectionSetNode,
+    located_error,
+)
+from graphql.execution.execute import get_field_entry_key
+from graphql.execution.values import get_directive_values
+from graphql.pyutils import AwaitableOrValue, Path
+
+from strawberry.directive import directive
+from strawberry.types.execution import SubsequentExecutionResult
+
+
+DEFER = "defer"
+STREAM = "stream"
+
+
+@directive(
+    locations=[DirectiveLocation.FRAGMENT_SPREAD, DirectiveLocation.INLINE_FRAGMENT],
+    description="Delays the execution of a fragment, delivering it in a "
+    "subsequent payload",
+)
+def defer(value: Any, if_: bool = True, label: Optional[str] = None):
+    return value
+
+
+@directive(
+    locations=[DirectiveLocation.FIELD],
+    description="Delivers the items of a list field after the first "
+    "`initialCount` ones in subsequent payloads",
+)
+def stream(
+    value: Any, if_: bool = True, label: Optional[str] = None, initial_count: int = 0
+):
+    return value
+
+
+# Each source of subsequent results sends its payloads together with a flag
+# that tells whether it was the last one, a `None` payload is sent when a
+# source completes without a final payload (for example an exhausted stream)
+_Payload = Tuple[Optional[SubsequentExecutionResult], bool]
+_Source = AsyncIterator[_Payload]
+
+
+class IncrementalPublisher:
+    def __init__(self) -> None:
+        self._queue: "asyncio.Queue[_Payload]" = asyncio.Queue()
+        self._pending = 0
+        self._tasks: Set["asyncio.Future[None]"] = set()
+
+    @property
+    def has_next(self) -> bool:
+        return self._pending > 0
+
+    def add(self, source: _Source) -> None:
+        self._pending += 1
+
+        task = asyncio.ensure_future(self._publish(source))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _publish(self, source: _Source) -> None:
+        is_last = False
+
+        try:
+            async for payload in source:
+                is_last = payload[1]
+                await self._queue.put(payload)
+        finally:
+            # a source that fails still completes, otherwise the subscribers
+            # would wait for it forever
+            if not is_last:
+                self._queue.put_nowait((None, True))
+
+    async def subscribe(self) -> AsyncGenerator[SubsequentExecutionResult, None]:
+        try:
+            while self._pending:
+                result, is_last = await self._queue.get()
+
+                if is_last:
+                    self._pending -= 1
+
+                if result is None:
+                    if not self._pending:
+                        yield SubsequentExecutionResult(has_next=False)
+
+                    continue
+
+                result.has_next = self._pending > 0
+
+                yield result
+        finally:
+            self.cancel()
+
+    def cancel(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+
+
+class IncrementalExecutionContext(GraphQLExecutionContext):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.publisher = IncrementalPublisher()
+
+        # Deferred fragments are stored by the id of the fields they have been
+        # collected with, the fields are kept here too so that their ids
+        # can't be reused while the execution is in progress
+        self._deferred_fragments: Dict[
+            int,
+            Tuple[
+                Dict[str, List[FieldNode]], List[Tuple[Optional[str], SelectionSetNode]]
+            ],
+        ] = {}
+
+        # results of mutations are never delivered incrementally, so that their
+        # side effects are always visible in the initial result
+        self._is_incremental = self.operation.operation == OperationType.QUERY
+
+    def _get_directive_values(
+        self,
+        name: str,
+        node: Union[FieldNode, FragmentSpreadNode, InlineFragmentNode],
+    ) -> Optional[Dict[str, Any]]:
+        if not self._is_incremental or not node.directives:
+            return None
+
+        graphql_directive = self.schema.get_directive(name)
+
+        if graphql_directive is None:
+            return None
+
+        values = get_directive_values(graphql_directive, node, self.variable_values)
+
+        if values is None or not values["if"]:
+            return None
+
+        return values
+
+    def _fork(self) -> "IncrementalExecutionContext":
+        context = copy(self)
+        context.errors = []
+
+        return context
+
+    def collect_fields(
+        self,
+        runtime_type: GraphQLObjectType,
+        selection_set: SelectionSetNode,
+        fields: Dict[str, List[FieldNode]],
+        visited_fragment_names: Set[str],
+    ) -> Dict[str, List[FieldNode]]:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                if not self.should_include_node(selection):
+                    continue
+
+                name = get_field_entry_key(selection)
+                fields.setdefault(name, []).append(selection)
+                continue
+
+            fragment_node = cast(
+                Union[InlineFragmentNode, FragmentSpreadNode], selection
+            )
+
+            if not self.should_include_node(fragment_node):
+                continue
+
+            if isinstance(fragment_node, InlineFragmentNode):
+                fragment_selection_set = fragment_node.selection_set
+
+                if not self.does_fragment_condition_match(fragment_node, runtime_type):
+                    continue
+            else:
+                fragment_name = fragment_node.name.value
+
+                if fragment_name in visited_fragment_names:
+                    continue
+
+                fragment = self.fragments.get(fragment_name)
+
+                if not fragment or not self.does_fragment_condition_match(
+                    fragment, runtime_type
+                ):
+                    continue
+
+                fragment_selection_set = fragment.selection_set
+
+            defer_values = self._get_directive_values(DEFER, fragment_node)
+
+            if defer_values is not None:
+                _, deferred = self._deferred_fragments.setdefault(
+                    id(fields), (fields, [])
+                )
+                deferred.append((defer_values.get("label"), fragment_selection_set))
+                continue
+
+            if isinstance(fragment_node, FragmentSpreadNode):
+                visited_fragment_names.add(fragment_node.name.value)
+
+            self.collect_fields(
+                runtime_type, fragment_selection_set, fields, visited_fragment_names
+            )
+
+        return fields
+
+    def execute_fields(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Optional[Path],
+        fields: Dict[str, List[FieldNode]],
+    ) -> AwaitableOrValue[Dict[str, Any]]:
+        if id(fields) in self._deferred_fragments:
+            _, deferred = self._deferred_fragments[id(fields)]
+
+            for label, selection_set in deferred:
+                self.publisher.add(
+                    self._execute_deferred_fragment(
+                        parent_type, source_value, path, label, selection_set
+                    )
+                )
+
+        return super().execute_fields(parent_type, source_value, path, fields)
+
+    async def _execute_deferred_fragment(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Optional[Path],
+        label: Optional[str],
+        selection_set: SelectionSetNode,
+    ) -> _Source:
+        context = self._fork()
+        fields = context.collect_fields(parent_type, selection_set, {}, set())
+
+        data: Optional[Dict[str, Any]]
+
+        try:
+            result = context.execute_fields(parent_type, source_value, path, fields)
+
+            if context.is_awaitable(result):
+                result = await result  # type: ignore
+
+            data = result  # type: ignore
+        except GraphQLError as error:
+            context.errors.append(error)
+            data = None
+
+        yield (
+            SubsequentExecutionResult(
+                data=data,
+                path=path.as_list() if path else [],
+                label=label,
+                errors=context.errors or None,
+            ),
+            True,
+        )
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Union[Iterable[Any], AsyncIterable[Any]],
+    ) -> AwaitableOrValue[List[Any]]:
+        stream_values = self._get_directive_values(STREAM, field_nodes[0])
+
+        if stream_values is None:
+            return super().complete_list_value(
+                return_type, field_nodes, info, path, result  # type: ignore
+            )
+
+        initial_count: int = stream_values["initialCount"]
+        label: Optional[str] = stream_values.get("label")
+
+        if isinstance(result, AsyncIterable):
+            return self._complete_async_iterable_value(
+                return_type, field_nodes, info, path, result, initial_count, label
+            )
+
+        if not isinstance(result, Iterable) or isinstance(result, str):
+            return super().complete_list_value(
+                return_type, field_nodes, info, path, result
+            )
+
+        iterator = iter(result)
+        initial_items = list(islice(iterator, initial_count))
+        remaining_items = list(iterator)
+
+        if remaining_items:
+            self.publisher.add(
+                self._stream_items(
+                    return_type.of_type,
+                    field_nodes,
+                    info,
+                    path,
+                    label,
+                    remaining_items,
+                    initial_count,
+                )
+            )
+
+        return super().complete_list_value(
+            return_type, field_nodes, info, path, initial_items
+        )
+
+    async def _complete_async_iterable_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: AsyncIterable[Any],
+        initial_count: int,
+        label: Optional[str],
+    ) -> List[Any]:
+        iterator = result.__aiter__()
+        initial_items: List[Any] = []
+
+        while len(initial_items) < initial_count:
+            try:
+                initial_items.append(await iterator.__anext__())
+            except StopAsyncIteration:
+                break
+        else:
+            self.publisher.add(
+                self._stream_async_items(
+                    return_type.of_type,
+                    field_nodes,
+                    info,
+                    path,
+                    label,
+                    iterator,
+                    initial_count,
+                )
+            )
+
+        completed = super().complete_list_value(
+            return_type, field_nodes, info, path, initial_items
+        )
+
+        if self.is_awaitable(completed):
+            completed = await completed  # type: ignore
+
+        return completed  # type: ignore
+
+    async def _stream_items(
+        self,
+        item_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        label: Optional[str],
+        items: List[Any],
+        start: int,
+    ) -> _Source:
+        last_index = start + len(items) - 1
+
+        for index, item in enumerate(items, start):
+            result = await self._complete_stream_item(
+                item_type, field_nodes, info, path.add_key(index), label, item
+            )
+
+            yield result, index == last_index
+
+    async def _stream_async_items(
+        self,
+        item_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        label: Optional[str],
+        iterator: AsyncIterator[Any],
+        start: int,
+    ) -> _Source:
+        index = start
+
+        try:
+            async for item in iterator:
+                result = await self._complete_stream_item(
+                    item_type, field_nodes, info, path.add_key(index), label, item
+                )
+
+                yield result, False
+
+                index += 1
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.add_key(index).as_list())
+
+            yield (
+                SubsequentExecutionResult(
+                    items=None,
+                    path=path.add_key(index).as_list(),
+                    label=label,
+                    errors=[error],
+                ),
+                True,
+            )
+        else:
+            yield None, True
+
+    async def _complete_stream_item(
+        self,
+        item_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        item_path: Path,
+        label: Optional[str],
+        item: Any,
+    ) -> SubsequentExecutionResult:
+        context = self._fork()
+
+        items: Optional[List[Any]]
+
+        try:
+            try:
+                if context.is_awaitable(item):
+                    item = await item
+
+                completed = context.complete_value(
+                    item_type, field_nodes, info, item_path, item
+                )
+
+                if context.is_awaitable(completed):
+                    completed = await completed
+            except Exception as raw_error:
+                error = located_error(raw_error, field_nodes, item_path.as_list())
+                context.handle_field_error(error, item_type)
+                completed = None
+
+            items = [completed]
+        except GraphQLError as error:
+            context.errors.append(error)
+            items = None
+
+        return SubsequentExecutionResult(
+            items=items,
+            path=item_path.as_list(),
+            label=label,
+            errors=context.errors or None,
+        )
+
+
+def get_incremental_execution_context_class(
+    execution_context_class: Optional[Type[GraphQLExecutionContext]] = None,
+) -> Type[IncrementalExecutionContext]:
+    if execution_context_class is None or issubclass(
+        execution_context_class, IncrementalExecutionContext
+    ):
+        return IncrementalExecutionContext
+
+    return type(
+        f"Incremental{execution_context_class.__name__}",
+        (IncrementalExecutionContext, execution_context_class),
+        {},
+    )
+
+
+async def execute_incremental(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    root_value: Any = None,
+    context_value: Any = None,
+    variable_values: Optional[Dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+    middleware: Any = None,
+    execution_context_class: Optional[Type[GraphQLExecutionContext]] = None,
+) -> Tuple[GraphQLExecutionResult, Optional[IncrementalPublisher]]:
+    """Executes the initial result of an operation, returning it together
+    with the publisher of the subsequent results when there are any"""
+
+    context_class = get_incremental_execution_context_class(execution_context_class)
+
+    context = cast(
+        Union[List[GraphQLError], IncrementalExecutionContext],
+        context_class.build(
+            schema,
+            document,
+            root_value=root_value,
+            context_value=context_value,
+            raw_variable_values=variable_values,
+            operation_name=operation_name,
+            middleware=middleware,
+        ),
+    )
+
+    if isinstance(context, list):
+        return GraphQLExecutionResult(data=None, errors=context), None
+
+    data = context.execute_operation(context.operation, root_value)
+    result = context.build_response(data)
+
+    if isawaitable(result):
+        result = await cast(Awaitable[GraphQLExecutionResult], result)
+
+    result = cast(GraphQLExecutionResult, result)
+
+    # when an error propagated up to the root there is no data to patch
+    if result.data is None or not context.publisher.has_next:
+        context.publisher.cancel()
+
+        return result, None
+
+    return result, context.publisher
+
+
+__all__ = [
+    "IncrementalExecutionContext",
+    "IncrementalPublisher",
+    "defer",
+    "execute_incremental",
+    "stream",
+]
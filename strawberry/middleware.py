@@ -9,7 +9,8 @@ from strawberry.utils.await_maybe import await_maybe
 from .directive import DirectiveDefinition
 
 
-SPECIFIED_DIRECTIVES = {"include", "skip"}
+# directives that are handled by the executor rather than by a resolver
+SPECIFIED_DIRECTIVES = {"include", "skip", "defer", "stream"}
 
 
 class Middleware(Protocol):
@@ -2,6 +2,7 @@ import dataclasses
 from functools import partial
 from typing import List, Optional, Type, cast
 
+from .cache import CacheControl
 from .exceptions import MissingFieldAnnotationError, MissingReturnAnnotationError
 from .field import StrawberryField
 from .types.type_resolver import _get_fields
@@ -93,6 +94,7 @@ def _process_type(
     is_interface: bool = False,
     description: Optional[str] = None,
     federation: Optional[FederationTypeParams] = None,
+    cache_control: Optional[CacheControl] = None,
 ):
     name = name or to_camel_case(cls.__name__)
 
@@ -108,6 +110,7 @@ def _process_type(
         federation=federation or FederationTypeParams(),
         origin=cls,
         _fields=fields,
+        cache_control=cache_control,
     )
 
     # dataclasses removes attributes from the class here:
@@ -130,6 +133,7 @@ def type(
     is_interface: bool = False,
     description: str = None,
     federation: Optional[FederationTypeParams] = None,
+    cache_control: Optional[CacheControl] = None,
 ):
     """Annotates a class as a GraphQL type.
 
@@ -150,6 +154,7 @@ def type(
             is_interface=is_interface,
             description=description,
             federation=federation,
+            cache_control=cache_control,
         )
 
     if cls is None:
@@ -0,0 +1,107 @@
+"""Support for automatic persisted queries, as implemented by Apollo.
+
+Clients send the sha256 hash of a query in the `persistedQuery` extension
+instead of the query itself, when the hash is unknown the server replies with a
+`PersistedQueryNotFound` error and the client sends the query together with its
+hash, which is then stored for the next requests.
+"""
+
+import hashlib
+from inspect import isawaitable
+from typing import Any, Dict, Optional
+
+from strawberry.cache import BaseCacheStore, InMemoryCacheStore
+from strawberry.exceptions import (
+    InvalidPersistedQueryHashError,
+    PersistedQueryNotFoundError,
+)
+from strawberry.utils.await_maybe import await_maybe
+
+
+PERSISTED_QUERY_NOT_FOUND_RESPONSE = {
+    "errors": [
+        {
+            "message": "PersistedQueryNotFound",
+            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+        }
+    ]
+}
+
+
+def get_persisted_query_hash(data: Dict[str, Any]) -> Optional[str]:
+    extensions = data.get("extensions")
+
+    if not isinstance(extensions, dict):
+        return None
+
+    persisted_query = extensions.get("persistedQuery")
+
+    if not isinstance(persisted_query, dict):
+        return None
+
+    return persisted_query.get("sha256Hash")
+
+
+class PersistedQueries:
+    def __init__(
+        self, store: Optional[BaseCacheStore] = None, ttl: Optional[float] = None
+    ):
+        self.store = store if store is not None else InMemoryCacheStore()
+        self.ttl = ttl
+
+    def get_key(self, query_hash: str) -> str:
+        return f"persisted_query:{query_hash}"
+
+    async def resolve(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the request data with the query of its persisted query hash,
+        storing the query when both are sent"""
+
+        query_hash = get_persisted_query_hash(data)
+
+        if query_hash is None:
+            return data
+
+        key = self.get_key(query_hash)
+        query = data.get("query")
+
+        if query is None:
+            query = await await_maybe(self.store.get(key))
+
+            if query is None:
+                raise PersistedQueryNotFoundError()
+
+            return {**data, "query": query}
+
+        self._check_hash(query, query_hash)
+        await await_maybe(self.store.set(key, query, self.ttl))
+
+        return data
+
+    def resolve_sync(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        query_hash = get_persisted_query_hash(data)
+
+        if query_hash is None:
+            return data
+
+        key = self.get_key(query_hash)
+        query = data.get("query")
+
+        if query is None:
+            query = self.store.get(key)
+
+            if isawaitable(query):
+                raise TypeError("Sync views require a sync persisted queries store")
+
+            if query is None:
+                raise PersistedQueryNotFoundError()
+
+            return {**data, "query": query}
+
+        self._check_hash(query, query_hash)
+        self.store.set(key, query, self.ttl)
+
+        return data
+
+    def _check_hash(self, query: str, query_hash: str) -> None:
+        if hashlib.sha256(query.encode("utf-8")).hexdigest() != query_hash:
+            raise InvalidPersistedQueryHashError()
@@ -1,19 +1,37 @@
+import asyncio
 import json
-from typing import Any
+from typing import Any, List, Optional, Union
+
+from graphql import OperationType
 
 from sanic.exceptions import ServerError, abort
 from sanic.request import Request
 from sanic.response import HTTPResponse, html
 from sanic.views import HTTPMethodView
-from strawberry.exceptions import MissingQueryError
+from strawberry.codecs import JSONCodec, default_json_codec
+from strawberry.exceptions import (
+    InvalidPersistedQueryHashError,
+    MissingQueryError,
+    PersistedQueryNotFoundError,
+)
 from strawberry.file_uploads.utils import replace_placeholders_with_files
 from strawberry.http import (
     GraphQLHTTPResponse,
     GraphQLRequestData,
+    etag_matches,
+    get_etag,
+    parse_batch_request_data,
+    parse_query_params,
     parse_request_data,
     process_result,
+    should_execute_query_params,
+)
+from strawberry.persisted_queries import (
+    PERSISTED_QUERY_NOT_FOUND_RESPONSE,
+    PersistedQueries,
 )
 from strawberry.types import ExecutionResult
+from strawberry.utils.operation import get_operation_type
 
 from ..schema import BaseSchema
 from .context import StrawberrySanicContext
@@ -28,6 +46,12 @@ class GraphQLView(HTTPMethodView):
     Args:
         schema: strawberry.Schema
         graphiql: bool, default is True
+        allow_batching: bool, whether to accept a JSON array of operations,
+            default is False
+        allow_queries_via_get: bool, whether to execute the queries sent in
+            the query string of GET requests, default is True
+        persisted_queries: PersistedQueries, enables automatic persisted
+            queries, default is None
 
     Returns:
         None
@@ -41,9 +65,21 @@ class GraphQLView(HTTPMethodView):
 
     methods = ["GET", "POST"]
 
-    def __init__(self, schema: BaseSchema, graphiql: bool = True):
+    def __init__(
+        self,
+        schema: BaseSchema,
+        graphiql: bool = True,
+        json_codec: Optional[JSONCodec] = None,
+        allow_batching: bool = False,
+        allow_queries_via_get: bool = True,
+        persisted_queries: Optional[PersistedQueries] = None,
+    ):
         self.graphiql = graphiql
         self.schema = schema
+        self.json_codec = json_codec or default_json_codec
+        self.allow_batching = allow_batching
+        self.allow_queries_via_get = allow_queries_via_get
+        self.persisted_queries = persisted_queries
 
     def get_root_value(self):
         return None
@@ -57,59 +93,147 @@ class GraphQLView(HTTPMethodView):
     def process_result(self, result: ExecutionResult) -> GraphQLHTTPResponse:
         return process_result(result)
 
+    def encode_json(self, data: Any) -> bytes:
+        return self.json_codec.encode(data)
+
+    def decode_json(self, data: Union[str, bytes]) -> Any:
+        return self.json_codec.decode(data)
+
     async def dispatch_request(self, request: Request):  # type: ignore
         request_method = request.method.lower()
-        if not self.graphiql and request_method == "get":
-            abort(404)
-
-        show_graphiql = request_method == "get" and self.should_display_graphiql(
-            request
+        is_get_query = (
+            request_method == "get"
+            and self.allow_queries_via_get
+            and should_execute_query_params(request.args)
         )
 
-        if show_graphiql:
-            template = render_graphiql_page()
-            return self.render_template(template=template)
+        if request_method == "get" and not is_get_query:
+            if not self.graphiql:
+                abort(404)
+
+            if self.should_display_graphiql(request):
+                template = render_graphiql_page()
+                return self.render_template(template=template)
+
+        try:
+            request_data = await self.get_request_data(request)
+        except PersistedQueryNotFoundError:
+            return HTTPResponse(
+                self.encode_json(PERSISTED_QUERY_NOT_FOUND_RESPONSE),
+                status=200,
+                content_type="application/json",
+            )
+
+        if (
+            is_get_query
+            and isinstance(request_data, GraphQLRequestData)
+            and get_operation_type(request_data.query, request_data.operation_name)
+            == OperationType.MUTATION
+        ):
+            return HTTPResponse(
+                "Mutations are not allowed when using GET",
+                status=405,
+                headers={"Allow": "POST"},
+            )
 
-        request_data = self.get_request_data(request)
         context = await self.get_context(request)
         root_value = self.get_root_value()
 
-        result = await self.schema.execute(
+        response_data: Union[GraphQLHTTPResponse, List[GraphQLHTTPResponse]]
+
+        if isinstance(request_data, list):
+            # the operations run concurrently and share the context, so that
+            # the DataLoaders created for the request batch loads across them
+            results = await asyncio.gather(
+                *(
+                    self.execute(operation_data, context, root_value)
+                    for operation_data in request_data
+                )
+            )
+            response_data = [self.process_result(result) for result in results]
+        else:
+            result = await self.execute(request_data, context, root_value)
+            response_data = self.process_result(result)
+
+        body = self.encode_json(response_data)
+
+        if is_get_query:
+            etag = get_etag(body)
+
+            if etag_matches(etag, request.headers.get("if-none-match")):
+                return HTTPResponse(status=304, headers={"ETag": etag})
+
+            return HTTPResponse(
+                body,
+                status=200,
+                content_type="application/json",
+                headers={"ETag": etag},
+            )
+
+        return HTTPResponse(body, status=200, content_type="application/json")
+
+    async def execute(
+        self, request_data: GraphQLRequestData, context: Any, root_value: Any
+    ) -> ExecutionResult:
+        return await self.schema.execute(
             query=request_data.query,
             variable_values=request_data.variables,
             context_value=context,
             root_value=root_value,
             operation_name=request_data.operation_name,
         )
-        response_data = self.process_result(result)
 
-        return HTTPResponse(
-            json.dumps(response_data), status=200, content_type="application/json"
-        )
+    async def get_request_data(
+        self, request: Request
+    ) -> Union[GraphQLRequestData, List[GraphQLRequestData]]:
+        data: Union[dict, list]
 
-    def get_request_data(self, request: Request) -> GraphQLRequestData:
-        try:
-            data = self.parse_body(request)
-        except json.JSONDecodeError:
-            raise ServerError("Unable to parse request body as JSON", status_code=400)
+        if request.method == "GET":
+            try:
+                data = parse_query_params(
+                    {key: request.args.get(key) for key in request.args},
+                    self.decode_json,
+                )
+            except json.JSONDecodeError:
+                raise ServerError(
+                    "Unable to parse the query parameters", status_code=400
+                )
+        else:
+            try:
+                data = self.parse_body(request)
+            except json.JSONDecodeError:
+                raise ServerError(
+                    "Unable to parse request body as JSON", status_code=400
+                )
+
+        if isinstance(data, list) and not self.allow_batching:
+            raise ServerError("Batched operations are not enabled", status_code=400)
 
         try:
+            if isinstance(data, list):
+                return parse_batch_request_data(data)
+
+            if self.persisted_queries is not None:
+                data = await self.persisted_queries.resolve(data)
+
             request_data = parse_request_data(data)
         except MissingQueryError:
             raise ServerError("No GraphQL query found in the request", status_code=400)
+        except InvalidPersistedQueryHashError as error:
+            raise ServerError(str(error), status_code=400)
 
         return request_data
 
-    def parse_body(self, request: Request) -> dict:
+    def parse_body(self, request: Request) -> Union[dict, list]:
         if request.content_type.startswith("multipart/form-data"):
             files = convert_request_to_files_dict(request)
-            operations = json.loads(request.form.get("operations", "{}"))
-            files_map = json.loads(request.form.get("map", "{}"))
+            operations = self.decode_json(request.form.get("operations", "{}"))
+            files_map = self.decode_json(request.form.get("map", "{}"))
             try:
                 return replace_placeholders_with_files(operations, files_map, files)
             except KeyError:
                 abort(400, "File(s) missing in form data")
-        return request.json
+        return self.decode_json(request.body)
 
     def should_display_graphiql(self, request):
         if not self.graphiql:
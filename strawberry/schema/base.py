@@ -19,6 +19,8 @@ class BaseSchema(Protocol):
         context_value: Optional[Any] = None,
         root_value: Optional[Any] = None,
         operation_name: Optional[str] = None,
+        *,
+        allow_incremental: bool = False,
     ) -> ExecutionResult:
         raise NotImplementedError
 
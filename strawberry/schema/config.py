@@ -1,6 +1,31 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, Type
+
+from strawberry.thread_pool import ResolverThreadPool
+
+
+@dataclass
+class ErrorLoggingConfig:
+    # errors raised by these exceptions, for example the permission denials,
+    # are logged at the debug level without their traceback
+    expected_errors: Tuple[Type[BaseException], ...] = (PermissionError,)
+    # number of different errors logged for each request, the errors with the
+    # same type and field are only logged once
+    max_errors_per_request: Optional[int] = 10
+    # maximum number of times each error is logged per second, with bursts of
+    # `burst` errors
+    rate: Optional[float] = None
+    burst: int = 10
 
 
 @dataclass
 class StrawberryConfig:
     auto_camel_case: bool = True
+    # runs the sync resolvers of async executions in a pool of threads, the
+    # default pool is used when `resolver_thread_pool` is not set
+    run_sync_resolvers_in_thread: bool = False
+    resolver_thread_pool: Optional[ResolverThreadPool] = None
+    # seconds after which the resolvers still running are stopped, can be
+    # overridden for each execution
+    execution_timeout: Optional[float] = None
+    error_logging: ErrorLoggingConfig = field(default_factory=ErrorLoggingConfig)
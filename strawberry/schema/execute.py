@@ -1,6 +1,7 @@
 from asyncio import ensure_future
 from inspect import isawaitable
-from typing import Any, Awaitable, Collection, Optional, Sequence, Type, cast
+from time import perf_counter
+from typing import Any, Awaitable, Collection, Optional, Sequence, Type, Union, cast
 
 from graphql import (
     ExecutionContext as GraphQLExecutionContext,
@@ -14,8 +15,14 @@ from graphql.validation import ValidationRule, validate
 
 from strawberry.extensions import Extension
 from strawberry.extensions.runner import ExtensionsRunner
+from strawberry.incremental import IncrementalPublisher, execute_incremental
 from strawberry.middleware import DirectivesMiddleware, DirectivesMiddlewareSync
-from strawberry.types import ExecutionContext, ExecutionResult
+from strawberry.types import (
+    ExecutionContext,
+    ExecutionResult,
+    IncrementalExecutionResult,
+)
+from strawberry.types.execution import execution_context_scope
 
 
 async def execute(
@@ -27,6 +34,7 @@ async def execute(
     execution_context_class: Optional[Type[GraphQLExecutionContext]] = None,
     validate_queries: bool = True,
     validation_rules: Optional[Collection[Type[ValidationRule]]] = None,
+    allow_incremental: bool = False,
 ) -> ExecutionResult:
     extensions_runner = ExtensionsRunner(
         execution_context=execution_context,
@@ -36,6 +44,8 @@ async def execute(
     )
 
     additional_middlewares = [DirectivesMiddleware(directives)]
+    timings = execution_context.timings
+    publisher: Optional[IncrementalPublisher] = None
 
     async with extensions_runner.request():
         # Note: In graphql-core the schema would be validated here but in
@@ -43,7 +53,9 @@ async def execute(
 
         try:
             async with extensions_runner.parsing():
+                start = perf_counter()
                 document = parse(query)
+                timings.parsing = perf_counter() - start
                 execution_context.graphql_document = document
         except GraphQLError as error:
             execution_context.errors = [error]
@@ -65,30 +77,75 @@ async def execute(
 
         if validate_queries:
             async with extensions_runner.validation():
-                validation_errors = validate(schema, document, rules=validation_rules)
-
-            if validation_errors:
-                execution_context.errors = validation_errors
-                return ExecutionResult(data=None, errors=validation_errors)
-
-        result = original_execute(
-            schema,
-            document,
-            root_value=execution_context.root_value,
-            middleware=extensions_runner.as_middleware_manager(*additional_middlewares),
-            variable_values=execution_context.variables,
-            operation_name=execution_context.operation_name,
-            context_value=execution_context.context,
-            execution_context_class=execution_context_class,
-        )
+                start = perf_counter()
+                with execution_context_scope(execution_context):
+                    validation_errors = validate(
+                        schema, document, rules=validation_rules
+                    )
+                timings.validation = perf_counter() - start
+
+                if validation_errors:
+                    execution_context.errors = validation_errors
+
+            # extensions can also reject the operation by adding errors in
+            # `on_validation_end`
+            if execution_context.errors:
+                return ExecutionResult(
+                    data=None,
+                    errors=execution_context.errors,
+                    extensions=await extensions_runner.get_extensions_results(),
+                )
+
+        result: Union[GraphQLExecutionResult, Awaitable[GraphQLExecutionResult]]
+
+        start = perf_counter()
+
+        if allow_incremental:
+            result, publisher = await execute_incremental(
+                schema,
+                document,
+                root_value=execution_context.root_value,
+                middleware=extensions_runner.as_middleware_manager(
+                    *additional_middlewares
+                ),
+                variable_values=execution_context.variables,
+                operation_name=execution_context.operation_name,
+                context_value=execution_context.context,
+                execution_context_class=execution_context_class,
+            )
+        else:
+            result = original_execute(
+                schema,
+                document,
+                root_value=execution_context.root_value,
+                middleware=extensions_runner.as_middleware_manager(
+                    *additional_middlewares
+                ),
+                variable_values=execution_context.variables,
+                operation_name=execution_context.operation_name,
+                context_value=execution_context.context,
+                execution_context_class=execution_context_class,
+            )
 
         if isawaitable(result):
             result = await cast(Awaitable[GraphQLExecutionResult], result)
 
+        timings.execution = perf_counter() - start
         execution_context.result = cast(GraphQLExecutionResult, result)
 
+        if execution_context.result.errors:
+            execution_context.errors = execution_context.result.errors
+
     result = cast(GraphQLExecutionResult, result)
 
+    if publisher is not None:
+        return IncrementalExecutionResult(
+            data=result.data,
+            errors=result.errors,
+            extensions=await extensions_runner.get_extensions_results(),
+            subsequent_results=publisher.subscribe(),
+        )
+
     return ExecutionResult(
         data=result.data,
         errors=result.errors,
@@ -114,6 +171,7 @@ def execute_sync(
     )
 
     additional_middlewares = [DirectivesMiddlewareSync(directives)]
+    timings = execution_context.timings
 
     with extensions_runner.request():
         # Note: In graphql-core the schema would be validated here but in
@@ -121,7 +179,9 @@ def execute_sync(
 
         try:
             with extensions_runner.parsing():
+                start = perf_counter()
                 document = parse(query)
+                timings.parsing = perf_counter() - start
                 execution_context.graphql_document = document
         except GraphQLError as error:
             execution_context.errors = [error]
@@ -143,12 +203,26 @@ def execute_sync(
 
         if validate_queries:
             with extensions_runner.validation():
-                validation_errors = validate(schema, document, rules=validation_rules)
-
-            if validation_errors:
-                execution_context.errors = validation_errors
-                return ExecutionResult(data=None, errors=validation_errors)
-
+                start = perf_counter()
+                with execution_context_scope(execution_context):
+                    validation_errors = validate(
+                        schema, document, rules=validation_rules
+                    )
+                timings.validation = perf_counter() - start
+
+                if validation_errors:
+                    execution_context.errors = validation_errors
+
+            # extensions can also reject the operation by adding errors in
+            # `on_validation_end`
+            if execution_context.errors:
+                return ExecutionResult(
+                    data=None,
+                    errors=execution_context.errors,
+                    extensions=extensions_runner.get_extensions_results_sync(),
+                )
+
+        start = perf_counter()
         result = original_execute(
             schema,
             document,
@@ -165,6 +239,7 @@ def execute_sync(
             raise RuntimeError("GraphQL execution failed to complete synchronously.")
 
         result = cast(GraphQLExecutionResult, result)
+        timings.execution = perf_counter() - start
         execution_context.result = result
         if result.errors:
             execution_context.errors = result.errors
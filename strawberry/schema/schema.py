@@ -1,6 +1,19 @@
 import logging
 import sys
-from typing import Any, Collection, Dict, List, Optional, Sequence, Type, Union
+import threading
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from graphql import (
     ExecutionContext as GraphQLExecutionContext,
@@ -14,12 +27,21 @@ from graphql.subscription import subscribe
 from graphql.type.directives import specified_directives
 from graphql.validation import ValidationRule
 
+from strawberry.cache.fields import request_scope
 from strawberry.custom_scalar import ScalarDefinition, ScalarWrapper
 from strawberry.enum import EnumDefinition
 from strawberry.extensions import Extension
+from strawberry.extensions.rate_limit import InMemoryRateLimitStore
 from strawberry.schema.schema_converter import GraphQLCoreConverter
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
-from strawberry.types import ExecutionContext, ExecutionResult
+from strawberry.thread_pool import async_execution
+from strawberry.timeouts import execution_deadline
+from strawberry.types import (
+    ExecutionContext,
+    ExecutionResult,
+    IncrementalExecutionResult,
+    SubsequentExecutionResult,
+)
 from strawberry.types.types import TypeDefinition
 from strawberry.union import StrawberryUnion
 
@@ -31,6 +53,18 @@ from .execute import execute, execute_sync
 logger = logging.getLogger("strawberry.execution")
 
 
+def _get_error_key(error: GraphQLError) -> Tuple[Any, ...]:
+    """Returns the type and the field of an error, without the indexes of the
+    lists in its path, or its message when it doesn't have a path"""
+
+    error_type = type(error.original_error or error)
+
+    if not error.path:
+        return (error_type, error.message)
+
+    return (error_type, *(key for key in error.path if isinstance(key, str)))
+
+
 class Schema:
     def __init__(
         self,
@@ -99,6 +133,9 @@ class Schema:
 
         self.query = self.schema_converter.type_map[query_type.name]
 
+        self._error_log_store = InMemoryRateLimitStore()
+        self._error_log_lock = threading.Lock()
+
     def get_type_by_name(
         self, name: str
     ) -> Optional[
@@ -109,21 +146,90 @@ class Schema:
 
         return None
 
+    def is_expected_error(self, error: GraphQLError) -> bool:
+        """Expected errors, like permission denials, are part of the normal
+        operation of the API and are only logged at the debug level"""
+
+        return isinstance(
+            error.original_error, self.config.error_logging.expected_errors
+        )
+
     def process_errors(
         self, errors: List[GraphQLError], execution_context: ExecutionContext
     ) -> None:
-        kwargs: Dict[str, Any] = {
-            "stack_info": True,
-        }
-
-        # stacklevel was added in version 3.8
-        # https://docs.python.org/3/library/logging.html#logging.Logger.debug
+        config = self.config.error_logging
 
-        if sys.version_info >= (3, 8):
-            kwargs["stacklevel"] = 3
+        # the errors with the same type and field, for example the errors of
+        # the items of a list, are only logged once
+        groups: Dict[Tuple[Any, ...], List[Any]] = {}
 
         for error in errors:
-            logger.error(error, exc_info=error.original_error, **kwargs)
+            key = _get_error_key(error)
+            group = groups.get(key)
+
+            if group is None:
+                groups[key] = [error, 1]
+            else:
+                group[1] += 1
+
+        logged = 0
+        not_logged = 0
+
+        for key, (error, count) in groups.items():
+            if self.is_expected_error(error):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(error)
+
+                continue
+
+            if (
+                config.max_errors_per_request is not None
+                and logged >= config.max_errors_per_request
+            ) or not self._should_log_error(key):
+                not_logged += count
+                continue
+
+            kwargs: Dict[str, Any] = {}
+
+            # stacklevel was added in version 3.8
+            # https://docs.python.org/3/library/logging.html#logging.Logger.debug
+
+            if sys.version_info >= (3, 8):
+                kwargs["stacklevel"] = 3
+
+            # the stack is the same for all the errors of the request, so it's
+            # only logged with the first one
+            if not logged:
+                kwargs["stack_info"] = True
+
+            if count > 1:
+                logger.error(
+                    "%s\n\n%s similar errors were not logged",
+                    error,
+                    count - 1,
+                    exc_info=error.original_error,
+                    **kwargs,
+                )
+            else:
+                logger.error(error, exc_info=error.original_error, **kwargs)
+
+            logged += 1
+
+        if not_logged:
+            logger.error("%s other errors were not logged", not_logged)
+
+    def _should_log_error(self, key: Tuple[Any, ...]) -> bool:
+        config = self.config.error_logging
+
+        if config.rate is None:
+            return True
+
+        with self._error_log_lock:
+            result = self._error_log_store.consume(
+                repr(key), 1, capacity=config.burst, refill_rate=config.rate
+            )
+
+        return result.allowed
 
     async def execute(
         self,
@@ -134,7 +240,17 @@ class Schema:
         operation_name: Optional[str] = None,
         validate_queries: bool = True,
         validation_rules: Optional[Collection[Type[ValidationRule]]] = None,
+        allow_incremental: bool = False,
+        timeout: Optional[float] = None,
     ) -> ExecutionResult:
+        """Executes an operation, when `allow_incremental` is True and the
+        operation uses `@defer` or `@stream` an `IncrementalExecutionResult` is
+        returned, with the deferred results in `subsequent_results`.
+
+        The resolvers still running after `timeout` seconds, or after the
+        `execution_timeout` of the config when it's not passed, are cancelled
+        and return a timeout error."""
+
         # Create execution context
         execution_context = ExecutionContext(
             query=query,
@@ -142,24 +258,45 @@ class Schema:
             root_value=root_value,
             variables=variable_values,
             operation_name=operation_name,
+            schema=self,
         )
 
-        result = await execute(
-            self._schema,
-            query,
-            extensions=self.extensions,
-            directives=self.directives,
-            execution_context_class=self.execution_context_class,
-            validate_queries=validate_queries,
-            execution_context=execution_context,
-            validation_rules=validation_rules,
-        )
+        with request_scope(), async_execution(), execution_deadline(
+            self._get_timeout(timeout)
+        ):
+            result = await execute(
+                self._schema,
+                query,
+                extensions=self.extensions,
+                directives=self.directives,
+                execution_context_class=self.execution_context_class,
+                validate_queries=validate_queries,
+                execution_context=execution_context,
+                validation_rules=validation_rules,
+                allow_incremental=allow_incremental,
+            )
 
         if result.errors:
             self.process_errors(result.errors, execution_context=execution_context)
 
+        if isinstance(result, IncrementalExecutionResult) and result.subsequent_results:
+            result.subsequent_results = self._process_subsequent_results(
+                result.subsequent_results, execution_context
+            )
+
         return result
 
+    async def _process_subsequent_results(
+        self,
+        subsequent_results: AsyncIterator[SubsequentExecutionResult],
+        execution_context: ExecutionContext,
+    ) -> AsyncGenerator[SubsequentExecutionResult, None]:
+        async for result in subsequent_results:
+            if result.errors:
+                self.process_errors(result.errors, execution_context=execution_context)
+
+            yield result
+
     def execute_sync(
         self,
         query: str,
@@ -169,6 +306,7 @@ class Schema:
         operation_name: Optional[str] = None,
         validate_queries: bool = True,
         validation_rules: Optional[Collection[Type[ValidationRule]]] = None,
+        timeout: Optional[float] = None,
     ) -> ExecutionResult:
         execution_context = ExecutionContext(
             query=query,
@@ -176,24 +314,32 @@ class Schema:
             root_value=root_value,
             variables=variable_values,
             operation_name=operation_name,
+            schema=self,
         )
 
-        result = execute_sync(
-            self._schema,
-            query,
-            extensions=self.extensions,
-            directives=self.directives,
-            execution_context_class=self.execution_context_class,
-            validate_queries=validate_queries,
-            execution_context=execution_context,
-            validation_rules=validation_rules,
-        )
+        with request_scope(), execution_deadline(self._get_timeout(timeout)):
+            result = execute_sync(
+                self._schema,
+                query,
+                extensions=self.extensions,
+                directives=self.directives,
+                execution_context_class=self.execution_context_class,
+                validate_queries=validate_queries,
+                execution_context=execution_context,
+                validation_rules=validation_rules,
+            )
 
         if result.errors:
             self.process_errors(result.errors, execution_context=execution_context)
 
         return result
 
+    def _get_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        if timeout is not None:
+            return timeout
+
+        return self.config.execution_timeout
+
     async def subscribe(
         self,
         query: str,
@@ -44,6 +44,8 @@ from strawberry.lazy_type import LazyType
 from strawberry.scalars import is_scalar
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import _make_scalar_type
+from strawberry.thread_pool import get_default_thread_pool, is_async_execution
+from strawberry.timeouts import with_timeout
 from strawberry.type import StrawberryList, StrawberryOptional, StrawberryType
 from strawberry.types.info import Info
 from strawberry.types.types import TypeDefinition
@@ -158,7 +160,10 @@ class GraphQLCoreConverter:
             subscribe=subscribe,
             description=field.description,
             deprecation_reason=field.deprecation_reason,
-            extensions={"python_name": field.python_name},
+            extensions={
+                "python_name": field.python_name,
+                "strawberry_definition": field,
+            },
         )
 
     def from_input_field(self, field: StrawberryField) -> GraphQLInputField:
@@ -251,6 +256,7 @@ class GraphQLCoreConverter:
             interfaces=list(map(self.from_interface, interface.interfaces)),
             description=interface.description,
             resolve_type=resolve_type,
+            extensions={"strawberry_definition": interface},
         )
 
         self.type_map[interface.name] = ConcreteType(
@@ -300,6 +306,7 @@ class GraphQLCoreConverter:
             fields=get_graphql_fields,
             interfaces=list(map(self.from_interface, object_type.interfaces)),
             description=object_type.description,
+            extensions={"strawberry_definition": object_type},
         )
 
         self.type_map[object_type.name] = ConcreteType(
@@ -382,24 +389,69 @@ class GraphQLCoreConverter:
                 _source, info=info, args=field_args, kwargs=field_kwargs
             )
 
+        def _get_cached_result(_source: Any, info: Info, **kwargs):
+            assert field.cache is not None
+
+            return field.cache.resolve(
+                lambda: _get_result(_source, info, **kwargs),
+                _source,
+                info._raw_info,
+                kwargs,
+            )
+
+        get_result = (
+            _get_cached_result
+            if field.cache is not None and field.base_resolver is not None
+            else _get_result
+        )
+
         def _resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
             strawberry_info = _strawberry_info_from_graphql(info)
             _check_permissions(_source, strawberry_info, kwargs)
 
-            return _get_result(_source, strawberry_info, **kwargs)
+            return get_result(_source, strawberry_info, **kwargs)
 
         async def _async_resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
             strawberry_info = _strawberry_info_from_graphql(info)
             await _check_permissions_async(_source, strawberry_info, kwargs)
 
-            return await await_maybe(_get_result(_source, strawberry_info, **kwargs))
+            return await await_maybe(get_result(_source, strawberry_info, **kwargs))
+
+        def _threaded_resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
+            # sync executions can't await the result, so the resolver is
+            # called directly
+            if not is_async_execution():
+                return _resolver(_source, info, **kwargs)
+
+            thread_pool = self.config.resolver_thread_pool or get_default_thread_pool()
+
+            return thread_pool.run(_resolver, _source, info, **kwargs)
+
+        resolver: Callable[..., Any]
 
         if field.is_async:
-            _async_resolver._is_default = not field.base_resolver  # type: ignore
-            return _async_resolver
+            resolver = _async_resolver
+        elif self._should_run_in_thread(field):
+            resolver = _threaded_resolver
         else:
-            _resolver._is_default = not field.base_resolver  # type: ignore
-            return _resolver
+            resolver = _resolver
+
+        # fields without a resolver only read an attribute of their parent
+        if field.base_resolver is not None:
+            resolver = with_timeout(resolver, field.timeout)
+
+        resolver._is_default = not field.base_resolver  # type: ignore
+        return resolver
+
+    def _should_run_in_thread(self, field: StrawberryField) -> bool:
+        # fields without a resolver only read an attribute of their parent
+        if field.base_resolver is None:
+            return False
+
+        if field.run_in_thread is not None:
+            return field.run_in_thread
+
+        return self.config.run_sync_resolvers_in_thread
 
     def from_scalar(self, scalar: Type) -> GraphQLScalarType:
         scalar_definition: ScalarDefinition
@@ -0,0 +1,250 @@
+"""Fans out the messages of a topic to all the subscriptions listening to it.
+
+Each topic is read once per process, whatever the number of its
+subscribers: the first subscriber starts reading the topic, from the source
+registered for it or from the backend, and every message is copied to the
+bounded queue of each subscriber. The topic stops being read once its last
+subscriber leaves.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+)
+
+
+class BaseBroadcastBackend(ABC):
+    """Interface for the message brokers the topics are read from.
+
+    `listen` is called once per topic in each process, while the topic has
+    subscribers, so a single subscription to the broker is shared by all of
+    them.
+    """
+
+    @abstractmethod
+    async def publish(self, topic: str, message: Any) -> None:
+        ...
+
+    @abstractmethod
+    def listen(self, topic: str) -> AsyncIterator[Any]:
+        """Returns the messages published to `topic` from now on, the
+        iterator is closed when the topic has no more subscribers"""
+
+
+class InMemoryBroadcastBackend(BaseBroadcastBackend):
+    """Delivers the messages to the listeners of the same process"""
+
+    def __init__(self):
+        self._queues: Dict[str, Set["asyncio.Queue[Any]"]] = {}
+
+    async def publish(self, topic: str, message: Any) -> None:
+        for queue in self._queues.get(topic, ()):
+            queue.put_nowait(message)
+
+    def listen(self, topic: str) -> AsyncIterator[Any]:
+        # the listener is registered right away, so that the messages
+        # published before the iteration starts aren't lost
+        queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._queues.setdefault(topic, set()).add(queue)
+
+        return self._iterate(topic, queue)
+
+    async def _iterate(
+        self, topic: str, queue: "asyncio.Queue[Any]"
+    ) -> AsyncGenerator[Any, None]:
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            queues = self._queues[topic]
+            queues.discard(queue)
+
+            if not queues:
+                del self._queues[topic]
+
+
+# marks the end of the topic in the queues of the subscribers
+_END = object()
+
+
+class _UpstreamError:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class _Topic:
+    def __init__(self, name: str):
+        self.name = name
+        self.subscribers: Set["Subscriber"] = set()
+        self.task: Optional["asyncio.Task[None]"] = None
+
+
+class Subscriber:
+    """Async iterator over the messages of a topic.
+
+    The messages are buffered in a queue of `max_queue_size` messages, the
+    oldest messages are dropped when a subscriber is too slow to keep up, and
+    counted in `dropped`. The subscriber must be closed with `aclose`, or
+    used as an async context manager, to leave the topic.
+    """
+
+    def __init__(self, broadcast: "Broadcast", topic: _Topic, max_queue_size: int):
+        self.broadcast = broadcast
+        self.topic = topic.name
+        self.dropped = 0
+        self.closed = False
+
+        self._topic = topic
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue(max_queue_size)
+
+    def put(self, message: Any) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+
+        self._queue.put_nowait(message)
+
+    def __aiter__(self) -> "Subscriber":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.closed:
+            raise StopAsyncIteration
+
+        message = await self._queue.get()
+
+        if message is _END:
+            await self.aclose()
+            raise StopAsyncIteration
+
+        if isinstance(message, _UpstreamError):
+            await self.aclose()
+            raise message.error
+
+        return message
+
+    async def aclose(self) -> None:
+        if not self.closed:
+            self.closed = True
+            await self.broadcast._unsubscribe(self._topic, self)
+
+    async def __aenter__(self) -> "Subscriber":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
+class Broadcast:
+    """Publishes messages to topics and subscribes to them.
+
+    The topics are read from `backend`, in memory by default, unless a source
+    was registered for them with `register`. Each subscriber buffers up to
+    `max_queue_size` messages.
+
+    Example:
+
+    >>> broadcast = Broadcast()
+    >>>
+    >>> @strawberry.type
+    ... class Subscription:
+    ...     @strawberry.subscription
+    ...     async def scores(self, match_id: str) -> AsyncGenerator[Score, None]:
+    ...         async with broadcast.subscribe(f"scores:{match_id}") as scores:
+    ...             async for score in scores:
+    ...                 yield score
+    """
+
+    def __init__(
+        self,
+        backend: Optional[BaseBroadcastBackend] = None,
+        max_queue_size: int = 100,
+    ):
+        self.backend = backend or InMemoryBroadcastBackend()
+        self.max_queue_size = max_queue_size
+
+        self._sources: Dict[str, Callable[[], AsyncIterable[Any]]] = {}
+        self._topics: Dict[str, _Topic] = {}
+
+    def register(self, topic: str, source: Callable[[], AsyncIterable[Any]]) -> None:
+        """Reads `topic` from the iterables returned by `source`, which is
+        called when the topic gets its first subscriber. The subscribers are
+        closed when the iterable ends."""
+
+        self._sources[topic] = source
+
+    async def publish(self, topic: str, message: Any) -> None:
+        await self.backend.publish(topic, message)
+
+    def subscribe(self, topic: str, max_queue_size: Optional[int] = None) -> Subscriber:
+        """Returns a subscriber receiving the messages of `topic` from now on"""
+
+        current_topic = self._topics.get(topic)
+
+        if current_topic is None:
+            current_topic = self._topics[topic] = _Topic(topic)
+
+            if topic in self._sources:
+                upstream = self._sources[topic]()
+            else:
+                upstream = self.backend.listen(topic)
+
+            current_topic.task = asyncio.create_task(
+                self._fan_out(current_topic, upstream)
+            )
+
+        subscriber = Subscriber(
+            self,
+            current_topic,
+            self.max_queue_size if max_queue_size is None else max_queue_size,
+        )
+        current_topic.subscribers.add(subscriber)
+
+        return subscriber
+
+    def get_subscriber_count(self, topic: str) -> int:
+        current_topic = self._topics.get(topic)
+
+        return len(current_topic.subscribers) if current_topic else 0
+
+    async def _fan_out(self, topic: _Topic, upstream: AsyncIterable[Any]) -> None:
+        end: Any = _END
+
+        try:
+            async for message in upstream:
+                for subscriber in topic.subscribers:
+                    subscriber.put(message)
+        except Exception as error:
+            end = _UpstreamError(error)
+        finally:
+            if self._topics.get(topic.name) is topic:
+                del self._topics[topic.name]
+
+            aclose = getattr(upstream, "aclose", None)
+
+            if aclose is not None:
+                await aclose()
+
+        for subscriber in topic.subscribers:
+            subscriber.put(end)
+
+    async def _unsubscribe(self, topic: _Topic, subscriber: Subscriber) -> None:
+        topic.subscribers.discard(subscriber)
+
+        if topic.subscribers or topic.task is None:
+            return
+
+        if self._topics.get(topic.name) is topic:
+            del self._topics[topic.name]
+
+        topic.task.cancel()
+        # doesn't raise the CancelledError of the task
+        await asyncio.wait([topic.task])
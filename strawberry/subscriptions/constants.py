@@ -1,6 +1,11 @@
 GRAPHQL_WS = "graphql-ws"
+GRAPHQL_TRANSPORT_WS = "graphql-transport-ws"
 WS_PROTOCOL = GRAPHQL_WS
 
+# the protocols supported by the integrations, in order of preference
+SUBSCRIPTION_PROTOCOLS = (GRAPHQL_TRANSPORT_WS, GRAPHQL_WS)
+
+# messages of the legacy graphql-ws protocol
 GQL_CONNECTION_INIT = "connection_init"
 GQL_CONNECTION_ACK = "connection_ack"
 GQL_CONNECTION_ERROR = "connection_error"
@@ -11,3 +16,21 @@ GQL_DATA = "data"
 GQL_ERROR = "error"
 GQL_COMPLETE = "complete"
 GQL_STOP = "stop"
+
+# messages of the graphql-transport-ws protocol
+GQL_TRANSPORT_CONNECTION_INIT = "connection_init"
+GQL_TRANSPORT_CONNECTION_ACK = "connection_ack"
+GQL_TRANSPORT_PING = "ping"
+GQL_TRANSPORT_PONG = "pong"
+GQL_TRANSPORT_SUBSCRIBE = "subscribe"
+GQL_TRANSPORT_NEXT = "next"
+GQL_TRANSPORT_ERROR = "error"
+GQL_TRANSPORT_COMPLETE = "complete"
+
+# close codes of the graphql-transport-ws protocol
+WS_CLOSE_INVALID_MESSAGE = 4400
+WS_CLOSE_UNAUTHORIZED = 4401
+WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE = 4406
+WS_CLOSE_CONNECTION_INIT_TIMEOUT = 4408
+WS_CLOSE_SUBSCRIBER_ALREADY_EXISTS = 4409
+WS_CLOSE_TOO_MANY_INIT_REQUESTS = 4429
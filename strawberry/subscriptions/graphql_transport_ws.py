@@ -0,0 +1,163 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from graphql import GraphQLError
+from graphql.error import format_error as format_graphql_error
+
+from strawberry.subscriptions.constants import (
+    GQL_TRANSPORT_COMPLETE,
+    GQL_TRANSPORT_CONNECTION_ACK,
+    GQL_TRANSPORT_CONNECTION_INIT,
+    GQL_TRANSPORT_ERROR,
+    GQL_TRANSPORT_NEXT,
+    GQL_TRANSPORT_PING,
+    GQL_TRANSPORT_PONG,
+    GQL_TRANSPORT_SUBSCRIBE,
+    WS_CLOSE_CONNECTION_INIT_TIMEOUT,
+    WS_CLOSE_INVALID_MESSAGE,
+    WS_CLOSE_SUBSCRIBER_ALREADY_EXISTS,
+    WS_CLOSE_TOO_MANY_INIT_REQUESTS,
+    WS_CLOSE_UNAUTHORIZED,
+)
+from strawberry.subscriptions.handlers import BaseSubscriptionsHandler
+
+
+class GraphQLTransportWSHandler(BaseSubscriptionsHandler):
+    """Implements the `graphql-transport-ws` protocol of graphql-ws.
+
+    The connection is closed when the client doesn't send `connection_init`
+    within `connection_init_wait_timeout` seconds, which only schedules a
+    callback on the event loop. The server doesn't send keep alive messages,
+    the clients check the connection by sending pings.
+    """
+
+    complete_stopped_operations = False
+
+    def __init__(
+        self, *args: Any, connection_init_wait_timeout: float = 60, **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.connection_init_wait_timeout = connection_init_wait_timeout
+        self.connection_init_received = False
+        self.connection_acknowledged = False
+        # payload of the connection_init message
+        self.connection_params: Optional[Dict[str, Any]] = None
+
+        self._connection_init_timeout: Optional[asyncio.TimerHandle] = None
+        self._close_task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        self._connection_init_timeout = asyncio.get_running_loop().call_later(
+            self.connection_init_wait_timeout, self._on_connection_init_timeout
+        )
+
+    def _on_connection_init_timeout(self) -> None:
+        if not self.connection_init_received:
+            self._close_task = asyncio.create_task(
+                self.close(
+                    WS_CLOSE_CONNECTION_INIT_TIMEOUT,
+                    "Connection initialisation timeout",
+                )
+            )
+
+    async def handle_invalid_message(self, reason: str) -> None:
+        await self.close(WS_CLOSE_INVALID_MESSAGE, reason)
+
+    async def handle_message(self, message: Dict[str, Any]) -> None:
+        message_type = message.get("type")
+
+        if message_type == GQL_TRANSPORT_CONNECTION_INIT:
+            await self.handle_connection_init(message)
+        elif message_type == GQL_TRANSPORT_PING:
+            await self.send_json({"type": GQL_TRANSPORT_PONG})
+        elif message_type == GQL_TRANSPORT_PONG:
+            pass
+        elif message_type == GQL_TRANSPORT_SUBSCRIBE:
+            await self.handle_subscribe(message)
+        elif message_type == GQL_TRANSPORT_COMPLETE:
+            operation_id = message.get("id")
+
+            if not isinstance(operation_id, str):
+                await self.handle_invalid_message("Invalid message")
+                return
+
+            await self.stop_operation(operation_id)
+        else:
+            await self.handle_invalid_message(f"Unknown message type: {message_type}")
+
+    async def handle_connection_init(self, message: Dict[str, Any]) -> None:
+        if self.connection_init_received:
+            await self.close(
+                WS_CLOSE_TOO_MANY_INIT_REQUESTS, "Too many initialisation requests"
+            )
+            return
+
+        payload = message.get("payload")
+
+        if payload is not None and not isinstance(payload, dict):
+            await self.handle_invalid_message("Invalid connection init payload")
+            return
+
+        self.connection_init_received = True
+        self.connection_params = payload
+
+        if self._connection_init_timeout is not None:
+            self._connection_init_timeout.cancel()
+
+        await self.send_json({"type": GQL_TRANSPORT_CONNECTION_ACK})
+        self.connection_acknowledged = True
+
+    async def handle_subscribe(self, message: Dict[str, Any]) -> None:
+        if not self.connection_acknowledged:
+            await self.close(WS_CLOSE_UNAUTHORIZED, "Unauthorized")
+            return
+
+        operation_id = message.get("id")
+        payload = message.get("payload")
+
+        if (
+            not isinstance(operation_id, str)
+            or not isinstance(payload, dict)
+            or not isinstance(payload.get("query"), str)
+        ):
+            await self.handle_invalid_message("Invalid subscribe message")
+            return
+
+        if operation_id in self.operations:
+            await self.close(
+                WS_CLOSE_SUBSCRIBER_ALREADY_EXISTS,
+                f"Subscriber for {operation_id} already exists",
+            )
+            return
+
+        await self.start_operation(operation_id, payload)  # type: ignore
+
+    async def handle_disconnect(self) -> None:
+        if self._connection_init_timeout is not None:
+            self._connection_init_timeout.cancel()
+
+        # the connection might be closed by the timeout while the integration
+        # is waiting for a message, it has to send the close frame before the
+        # integration closes the connection itself
+        if self._close_task is not None:
+            await self._close_task
+
+        await super().handle_disconnect()
+
+    async def send_next(self, operation_id: str, payload: Dict[str, Any]) -> None:
+        await self.send_json(
+            {"id": operation_id, "type": GQL_TRANSPORT_NEXT, "payload": payload}
+        )
+
+    async def send_errors(self, operation_id: str, errors: List[GraphQLError]) -> None:
+        await self.send_json(
+            {
+                "id": operation_id,
+                "type": GQL_TRANSPORT_ERROR,
+                "payload": [format_graphql_error(error) for error in errors],
+            }
+        )
+
+    async def send_complete(self, operation_id: str) -> None:
+        await self.send_json({"id": operation_id, "type": GQL_TRANSPORT_COMPLETE})
@@ -0,0 +1,104 @@
+import asyncio
+from contextlib import suppress
+from typing import Any, Dict, List, Optional
+
+from graphql import GraphQLError
+from graphql.error import format_error as format_graphql_error
+
+from strawberry.subscriptions.constants import (
+    GQL_COMPLETE,
+    GQL_CONNECTION_ACK,
+    GQL_CONNECTION_INIT,
+    GQL_CONNECTION_KEEP_ALIVE,
+    GQL_CONNECTION_TERMINATE,
+    GQL_DATA,
+    GQL_ERROR,
+    GQL_START,
+    GQL_STOP,
+)
+from strawberry.subscriptions.handlers import BaseSubscriptionsHandler
+from strawberry.subscriptions.types import OperationMessage, OperationMessagePayload
+
+
+class GraphQLWSHandler(BaseSubscriptionsHandler):
+    """Implements the legacy `graphql-ws` protocol of subscriptions-transport-ws,
+    the messages that aren't valid are ignored"""
+
+    def __init__(
+        self,
+        *args: Any,
+        keep_alive: bool = False,
+        keep_alive_interval: float = 1,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.keep_alive = keep_alive
+        self.keep_alive_interval = keep_alive_interval
+        self.keep_alive_task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        pass
+
+    async def handle_invalid_message(self, reason: str) -> None:
+        pass
+
+    async def handle_message(self, message: Dict[str, Any]) -> None:
+        message_type = message.get("type")
+
+        if message_type == GQL_CONNECTION_INIT:
+            await self.handle_connection_init()
+        elif message_type == GQL_CONNECTION_TERMINATE:
+            await self.close(1000)
+        elif message_type == GQL_START:
+            operation_id = message.get("id")
+            payload = message.get("payload")
+
+            if isinstance(operation_id, str) and isinstance(payload, dict):
+                await self.start_operation(operation_id, payload)  # type: ignore
+        elif message_type == GQL_STOP:
+            await self.stop_operation(message.get("id"))  # type: ignore
+
+    async def handle_connection_init(self) -> None:
+        await self.send_json({"type": GQL_CONNECTION_ACK})
+
+        if self.keep_alive and self.keep_alive_task is None:
+            self.keep_alive_task = asyncio.create_task(self.send_keep_alive())
+
+    async def send_keep_alive(self) -> None:
+        while not self.closed:
+            await self.send_json({"type": GQL_CONNECTION_KEEP_ALIVE})
+            await asyncio.sleep(self.keep_alive_interval)
+
+    async def handle_disconnect(self) -> None:
+        if self.keep_alive_task is not None:
+            self.keep_alive_task.cancel()
+
+            with suppress(BaseException):
+                await self.keep_alive_task
+
+        await super().handle_disconnect()
+
+    async def send_message(
+        self,
+        type_: str,
+        operation_id: str,
+        payload: Optional[OperationMessagePayload] = None,
+    ) -> None:
+        data: OperationMessage = {"type": type_, "id": operation_id}
+
+        if payload:
+            data["payload"] = payload
+
+        await self.send_json(data)  # type: ignore
+
+    async def send_next(self, operation_id: str, payload: Dict[str, Any]) -> None:
+        await self.send_message(GQL_DATA, operation_id, payload)
+
+    async def send_errors(self, operation_id: str, errors: List[GraphQLError]) -> None:
+        await self.send_message(
+            GQL_ERROR, operation_id, format_graphql_error(errors[0])
+        )
+
+    async def send_complete(self, operation_id: str) -> None:
+        await self.send_message(GQL_COMPLETE, operation_id)
@@ -0,0 +1,281 @@
+"""The subscription protocols, independent of the web frameworks.
+
+The integrations accept the websocket, pass the text messages they receive
+to `handle_text` and call `handle_disconnect` once the connection is closed.
+The handlers send their messages and close the connection with the
+callables they receive, so that the same code runs for every framework.
+"""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+from graphql import (
+    ExecutionResult as GraphQLExecutionResult,
+    GraphQLError,
+    OperationType,
+)
+from graphql.error import format_error as format_graphql_error
+
+from strawberry.codecs import JSONCodec, default_json_codec
+from strawberry.http import process_result, process_subsequent_result
+from strawberry.schema import BaseSchema
+from strawberry.subscriptions.constants import GRAPHQL_WS
+from strawberry.subscriptions.types import StartPayload
+from strawberry.types import IncrementalExecutionResult
+from strawberry.utils.debug import pretty_print_graphql_operation
+from strawberry.utils.operation import get_operation_type
+
+
+SendText = Callable[[str], Awaitable[Any]]
+Close = Callable[[int, str], Awaitable[Any]]
+GetValue = Callable[[], Awaitable[Any]]
+
+
+def select_subscription_protocol(
+    requested: Sequence[str], supported: Sequence[str]
+) -> Optional[str]:
+    """Returns the first supported protocol requested by the client.
+
+    The clients that don't request any supported protocol are served with
+    graphql-ws, the only protocol before they were negotiated, unless it isn't
+    supported either."""
+
+    for protocol in supported:
+        if protocol in requested:
+            return protocol
+
+    if GRAPHQL_WS in supported:
+        return GRAPHQL_WS
+
+    return None
+
+
+class BaseSubscriptionsHandler(ABC):
+    """Runs the operations started on a websocket connection, each of them in
+    its own task, and sends their results"""
+
+    # whether a complete message is sent for the operations stopped by the
+    # client
+    complete_stopped_operations = True
+
+    def __init__(
+        self,
+        schema: BaseSchema,
+        *,
+        send_text: SendText,
+        close: Close,
+        get_context: GetValue,
+        get_root_value: GetValue,
+        json_codec: Optional[JSONCodec] = None,
+        debug: bool = False,
+    ):
+        self.schema = schema
+        self._send_text = send_text
+        self._close = close
+        self.get_context = get_context
+        self.get_root_value = get_root_value
+        self.json_codec = json_codec or default_json_codec
+        self.debug = debug
+
+        self.closed = False
+        self.operations: Dict[str, AsyncGenerator[Dict[str, Any], None]] = {}
+        self.tasks: Dict[str, "asyncio.Task[None]"] = {}
+
+    @abstractmethod
+    def start(self) -> None:
+        """Called once the connection is accepted"""
+
+    async def handle_text(self, text: str) -> None:
+        try:
+            message = self.json_codec.decode(text)
+        except json.JSONDecodeError:
+            await self.handle_invalid_message("Invalid JSON")
+            return
+
+        if not isinstance(message, dict):
+            await self.handle_invalid_message("Invalid message")
+            return
+
+        await self.handle_message(message)
+
+    @abstractmethod
+    async def handle_message(self, message: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    async def handle_invalid_message(self, reason: str) -> None:
+        """Called for the messages that aren't JSON objects"""
+
+    async def handle_disconnect(self) -> None:
+        self.closed = True
+
+        for operation_id in list(self.operations):
+            await self.stop_operation(operation_id)
+
+    async def send_json(self, data: Dict[str, Any]) -> None:
+        if not self.closed:
+            await self._send_text(self.json_codec.encode(data).decode())
+
+    async def close(self, code: int, reason: str = "") -> None:
+        if not self.closed:
+            self.closed = True
+            await self._close(code, reason)
+
+    @abstractmethod
+    async def send_next(self, operation_id: str, payload: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    async def send_errors(self, operation_id: str, errors: List[GraphQLError]) -> None:
+        """Sends the errors preventing an operation from starting"""
+
+    @abstractmethod
+    async def send_complete(self, operation_id: str) -> None:
+        ...
+
+    async def start_operation(self, operation_id: str, payload: StartPayload) -> None:
+        query = payload["query"]
+        operation_name = payload.get("operationName")
+        variables = payload.get("variables")
+        context = await self.get_context()
+        root_value = await self.get_root_value()
+
+        if self.debug:
+            pretty_print_graphql_operation(operation_name, query, variables)
+
+        results: AsyncGenerator[Dict[str, Any], None]
+
+        if get_operation_type(query, operation_name) in (
+            OperationType.QUERY,
+            OperationType.MUTATION,
+        ):
+            results = self.execute_operation(
+                query, variables, operation_name, context, root_value
+            )
+        else:
+            try:
+                result_source = await self.schema.subscribe(
+                    query=query,
+                    variable_values=variables,
+                    operation_name=operation_name,
+                    context_value=context,
+                    root_value=root_value,
+                )
+            except GraphQLError as error:
+                await self.send_errors(operation_id, [error])
+                return
+
+            if isinstance(result_source, GraphQLExecutionResult):
+                assert result_source.errors
+                await self.send_errors(operation_id, result_source.errors)
+                return
+
+            results = self.iterate_subscription(result_source)
+
+        self.operations[operation_id] = results
+        self.tasks[operation_id] = asyncio.create_task(
+            self.send_results(operation_id, results)
+        )
+
+    async def stop_operation(self, operation_id: str) -> None:
+        results = self.operations.pop(operation_id, None)
+        task = self.tasks.pop(operation_id, None)
+
+        if task is not None:
+            task.cancel()
+
+            # the task might send a complete message, which can fail when the
+            # connection is closed
+            try:
+                await task
+            except BaseException:
+                pass
+
+        if results is not None:
+            await results.aclose()
+
+    async def execute_operation(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        context: Any,
+        root_value: Any,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Executes a query or a mutation, yielding the initial result and then
+        the subsequent results of the deferred fragments and streamed fields"""
+
+        result = await self.schema.execute(
+            query,
+            variable_values=variables,
+            operation_name=operation_name,
+            context_value=context,
+            root_value=root_value,
+            allow_incremental=True,
+        )
+
+        payload: Dict[str, Any] = {**process_result(result)}
+
+        if not isinstance(result, IncrementalExecutionResult):
+            yield payload
+            return
+
+        assert result.subsequent_results is not None
+
+        yield {**payload, "hasNext": True}
+
+        async for subsequent_result in result.subsequent_results:
+            yield {**process_subsequent_result(subsequent_result)}
+
+    async def iterate_subscription(
+        self, result_source: AsyncGenerator
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        try:
+            async for result in result_source:
+                payload = {"data": result.data}
+
+                if result.errors:
+                    payload["errors"] = [
+                        format_graphql_error(error) for error in result.errors
+                    ]
+
+                yield payload
+        except Exception as error:
+            # GraphQLErrors are handled by graphql-core and included in the
+            # ExecutionResult
+            error = GraphQLError(str(error), original_error=error)
+
+            yield {"data": None, "errors": [format_graphql_error(error)]}
+        finally:
+            await result_source.aclose()
+
+    async def send_results(
+        self, operation_id: str, results: AsyncGenerator[Dict[str, Any], None]
+    ) -> None:
+        try:
+            async for payload in results:
+                await self.send_next(operation_id, payload)
+        except asyncio.CancelledError:
+            # the operation was stopped by the client or the connection was
+            # closed, the operation was already removed
+            if self.complete_stopped_operations:
+                await self.send_complete(operation_id)
+
+            return
+
+        if self.tasks.get(operation_id) is asyncio.current_task():
+            del self.operations[operation_id]
+            del self.tasks[operation_id]
+
+        await self.send_complete(operation_id)
@@ -0,0 +1,173 @@
+"""Execution of sync resolvers in a pool of threads.
+
+When enabled, the sync resolvers of an operation executed with
+`Schema.execute` run in a bounded `ThreadPoolExecutor` instead of the event
+loop, so that a blocking call doesn't stall the other requests. The context
+variables of the execution are copied to the thread running each resolver.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+_async_execution: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "strawberry_async_execution", default=False
+)
+
+
+@contextmanager
+def async_execution() -> Iterator[None]:
+    """Marks the resolvers called in this block as part of an async execution,
+    where they can be run in threads"""
+
+    token = _async_execution.set(True)
+
+    try:
+        yield
+    finally:
+        _async_execution.reset(token)
+
+
+def is_async_execution() -> bool:
+    return _async_execution.get()
+
+
+@dataclass(frozen=True)
+class ThreadPoolMetrics:
+    max_workers: int
+    # resolvers currently running in a thread
+    active: int
+    # resolvers waiting for a free thread
+    pending: int
+    submitted: int
+    completed: int
+    failed: int
+    # seconds spent by the resolvers waiting for a thread and running, summed
+    total_wait_time: float
+    total_run_time: float
+
+
+class ResolverThreadPool:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        thread_name_prefix: str = "strawberry-resolver",
+    ):
+        # same default as `ThreadPoolExecutor`
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.thread_name_prefix = thread_name_prefix
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait_time = 0.0
+        self._total_run_time = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # created lazily, so that pools defined at import time don't start
+        # threads until they are used
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Calls `func` in a thread of the pool, with a copy of the current
+        context variables"""
+
+        context = contextvars.copy_context()
+        submitted_at = time.perf_counter()
+
+        def call() -> T:
+            started_at = time.perf_counter()
+
+            with self._lock:
+                self._active += 1
+                self._total_wait_time += started_at - submitted_at
+
+            failed = True
+
+            try:
+                result = context.run(func, *args, **kwargs)
+                failed = False
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._total_run_time += time.perf_counter() - started_at
+
+                    if failed:
+                        self._failed += 1
+                    else:
+                        self._completed += 1
+
+            return result
+
+        with self._lock:
+            self._submitted += 1
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, call)
+
+    @property
+    def metrics(self) -> ThreadPoolMetrics:
+        with self._lock:
+            finished = self._completed + self._failed
+
+            return ThreadPoolMetrics(
+                max_workers=self.max_workers,
+                active=self._active,
+                pending=self._submitted - finished - self._active,
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                total_wait_time=self._total_wait_time,
+                total_run_time=self._total_run_time,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_default_thread_pool: Optional[ResolverThreadPool] = None
+
+
+def get_default_thread_pool() -> ResolverThreadPool:
+    global _default_thread_pool
+
+    if _default_thread_pool is None:
+        _default_thread_pool = ResolverThreadPool()
+
+    return _default_thread_pool
+
+
+__all__ = [
+    "ResolverThreadPool",
+    "ThreadPoolMetrics",
+    "async_execution",
+    "get_default_thread_pool",
+    "is_async_execution",
+]
@@ -0,0 +1,132 @@
+"""Deadlines of the executions and timeouts of the resolvers.
+
+The deadline of an execution is stored in a context variable. Each resolver
+checks it before running, and async resolvers are cancelled when they are
+still running once it is reached. The resolvers that are stopped return a
+timeout error, so the response contains the fields resolved in time.
+"""
+
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Iterator, Optional, Tuple
+
+from strawberry.exceptions import ExecutionTimeoutError
+
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "strawberry_execution_deadline", default=None
+)
+
+
+@contextmanager
+def execution_deadline(timeout: Optional[float]) -> Iterator[None]:
+    """Stops the resolvers called in this block after `timeout` seconds, a
+    nested deadline can't extend the current one"""
+
+    if timeout is None:
+        yield
+        return
+
+    deadline = time.monotonic() + timeout
+    current_deadline = _deadline.get()
+
+    if current_deadline is not None:
+        deadline = min(deadline, current_deadline)
+
+    token = _deadline.set(deadline)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+def get_remaining_time() -> Optional[float]:
+    """Returns the seconds left before the deadline of the current execution,
+    or None when it doesn't have one"""
+
+    deadline = _deadline.get()
+
+    if deadline is None:
+        return None
+
+    return deadline - time.monotonic()
+
+
+def _get_timeout(field_timeout: Optional[float]) -> Tuple[Optional[float], bool]:
+    """Returns how long a resolver can run for and whether the limit comes
+    from the deadline of the execution"""
+
+    remaining_time = get_remaining_time()
+
+    if remaining_time is None:
+        return field_timeout, False
+
+    if field_timeout is None or remaining_time <= field_timeout:
+        return remaining_time, True
+
+    return field_timeout, False
+
+
+def _timeout_error(
+    field_name: str, timeout: float, is_deadline: bool
+) -> ExecutionTimeoutError:
+    if is_deadline:
+        return ExecutionTimeoutError("Execution timed out")
+
+    return ExecutionTimeoutError(
+        f"Resolver for '{field_name}' timed out after {timeout} seconds"
+    )
+
+
+async def _wait_for(
+    result: Awaitable[Any], field_name: str, timeout: float, is_deadline: bool
+) -> Any:
+    try:
+        return await asyncio.wait_for(result, timeout)
+    except asyncio.TimeoutError:
+        raise _timeout_error(field_name, timeout, is_deadline)
+
+
+def with_timeout(
+    resolver: Callable[..., Any], field_timeout: Optional[float] = None
+) -> Callable[..., Any]:
+    """Wraps a resolver so that it stops after `field_timeout` seconds or at
+    the deadline of the execution, whichever comes first.
+
+    Sync resolvers can't be interrupted, so they only check that there's time
+    left before running, while awaitable results are cancelled.
+    """
+
+    def _resolver(_source: Any, info: Any, **kwargs: Any) -> Any:
+        timeout, is_deadline = _get_timeout(field_timeout)
+
+        if timeout is None:
+            return resolver(_source, info, **kwargs)
+
+        if timeout <= 0:
+            raise _timeout_error(info.field_name, timeout, is_deadline)
+
+        result = resolver(_source, info, **kwargs)
+
+        if isawaitable(result):
+            return _wait_for(result, info.field_name, timeout, is_deadline)
+
+        return result
+
+    return _resolver
+
+
+__all__ = [
+    "execution_deadline",
+    "get_deadline",
+    "get_remaining_time",
+    "with_timeout",
+]
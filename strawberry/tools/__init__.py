@@ -1,8 +1,11 @@
 from .create_type import create_type
 from .depth_limit_validator import depth_limit_validator
+from .query_cost_validator import get_query_cost, query_cost_validator
 
 
 __all__ = [
     "create_type",
     "depth_limit_validator",
+    "get_query_cost",
+    "query_cost_validator",
 ]
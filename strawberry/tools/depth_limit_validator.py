@@ -26,11 +26,14 @@
 # SOFTWARE.
 
 import re
-from typing import Callable, Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Union
 
 from graphql import GraphQLError
 from graphql.language import (
     DefinitionNode,
+    DocumentNode,
     FieldNode,
     FragmentDefinitionNode,
     FragmentSpreadNode,
@@ -50,6 +53,7 @@ def depth_limit_validator(
     max_depth: int,
     ignore: Optional[List[IgnoreType]] = None,
     callback: Callable[[Dict[str, int]], None] = None,
+    cache_size: int = 128,
 ):
     """
     Creates a validator for the GraphQL query depth
@@ -60,35 +64,84 @@ def depth_limit_validator(
         a boolean.
     - callback - Called each time validation runs. Receives an Object which is a
         map of the depths for each operation.
+    - cache_size - The number of valid documents whose depths are cached, so
+        that the same query isn't walked again on each request.
     """
 
+    # depths of the operations of the documents validated recently, keyed by
+    # the source of the documents
+    cache: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+    cache_lock = threading.Lock()
+
     class DepthLimitValidator(ValidationRule):
         def __init__(self, validation_context: ValidationContext):
             document = validation_context.document
-            definitions = document.definitions
-
-            fragments = get_fragments(definitions)
-            queries = get_queries_and_mutations(definitions)
-            query_depths = {}
-
-            for name in queries:
-                query_depths[name] = determine_depth(
-                    node=queries[name],
-                    fragments=fragments,
-                    depth_so_far=0,
-                    max_depth=max_depth,
-                    context=validation_context,
-                    operation_name=name,
-                    ignore=ignore,
+            source = document.loc.source.body if document.loc else None
+
+            query_depths = None
+
+            if source is not None and cache_size > 0:
+                with cache_lock:
+                    query_depths = cache.get(source)
+
+                    if query_depths is not None:
+                        cache.move_to_end(source)
+
+            if query_depths is None:
+                query_depths = determine_depths(
+                    document, max_depth, validation_context, ignore
                 )
 
+                # documents that are too deep are rejected, and the errors
+                # need to be reported again for each request
+                is_valid = all(depth <= max_depth for depth in query_depths.values())
+
+                if source is not None and cache_size > 0 and is_valid:
+                    with cache_lock:
+                        cache[source] = query_depths
+
+                        while len(cache) > cache_size:
+                            cache.popitem(last=False)
+
             if callable(callback):
-                callback(query_depths)
+                callback(dict(query_depths))
             super().__init__(validation_context)
 
     return DepthLimitValidator
 
 
+def determine_depths(
+    document: DocumentNode,
+    max_depth: int,
+    context: ValidationContext,
+    ignore: Optional[List[IgnoreType]] = None,
+) -> Dict[str, int]:
+    """Returns the depth of each operation of the document, reporting an error
+    for the operations that are deeper than `max_depth`"""
+
+    definitions = document.definitions
+
+    fragments = get_fragments(definitions)
+    queries = get_queries_and_mutations(definitions)
+
+    # the depth of the fragments is shared by all the operations
+    fragment_depths: Dict[str, int] = {}
+
+    return {
+        name: determine_depth(
+            node=queries[name],
+            fragments=fragments,
+            depth_so_far=0,
+            max_depth=max_depth,
+            context=context,
+            operation_name=name,
+            ignore=ignore,
+            fragment_depths=fragment_depths,
+        )
+        for name in queries
+    }
+
+
 def get_fragments(
     definitions: List[DefinitionNode],
 ) -> Dict[str, FragmentDefinitionNode]:
@@ -115,6 +168,93 @@ def get_queries_and_mutations(
     return operations
 
 
+class MaxDepthExceeded(Exception):
+    def __init__(self, node: Node, depth: int):
+        self.node = node
+        self.depth = depth
+
+
+class DepthCalculator:
+    """Computes the depth of a node, raising `MaxDepthExceeded` as soon as a
+    node deeper than `max_depth` is found.
+
+    The depth of each fragment is computed once and then added to the depth
+    at which it is spread, so that documents reusing fragments don't take
+    exponential time.
+    """
+
+    def __init__(
+        self,
+        fragments: Dict[str, FragmentDefinitionNode],
+        max_depth: int,
+        ignore: Optional[List[IgnoreType]] = None,
+        fragment_depths: Optional[Dict[str, int]] = None,
+    ):
+        self.fragments = fragments
+        self.max_depth = max_depth
+        self.ignore = ignore
+        self.fragment_depths = {} if fragment_depths is None else fragment_depths
+        self._visiting_fragments: Set[str] = set()
+
+    def get_depth(self, node: Node, depth_so_far: int) -> int:
+        if depth_so_far > self.max_depth:
+            raise MaxDepthExceeded(node, depth_so_far)
+
+        if isinstance(node, FieldNode):
+            # by default, ignore the introspection fields which begin with double
+            # underscores
+            should_ignore = is_introspection_key(node.name.value) or is_ignored(
+                node, self.ignore
+            )
+
+            if should_ignore or not node.selection_set:
+                return 0
+
+            return 1 + self.get_selections_depth(node, depth_so_far + 1)
+
+        if isinstance(node, FragmentSpreadNode):
+            return self.get_fragment_depth(node, depth_so_far)
+
+        if isinstance(
+            node, (InlineFragmentNode, FragmentDefinitionNode, OperationDefinitionNode)
+        ):
+            return self.get_selections_depth(node, depth_so_far)
+
+        raise Exception(f"Depth crawler cannot handle: {node.kind}")  # pragma: no cover
+
+    def get_selections_depth(self, node: Node, depth_so_far: int) -> int:
+        return max(
+            self.get_depth(selection, depth_so_far)
+            for selection in node.selection_set.selections  # type: ignore
+        )
+
+    def get_fragment_depth(self, node: FragmentSpreadNode, depth_so_far: int) -> int:
+        name = node.name.value
+        depth = self.fragment_depths.get(name)
+
+        if depth is None:
+            # cycles are reported by the `NoFragmentCycles` rule, here we only
+            # need to avoid recursing forever
+            if name in self._visiting_fragments or name not in self.fragments:
+                return 0
+
+            self._visiting_fragments.add(name)
+
+            try:
+                # the depth of the fragment doesn't depend on where it is
+                # spread, only the check of the max depth does
+                depth = self.get_depth(self.fragments[name], depth_so_far)
+            finally:
+                self._visiting_fragments.discard(name)
+
+            self.fragment_depths[name] = depth
+
+        if depth_so_far + depth > self.max_depth:
+            raise MaxDepthExceeded(node, depth_so_far + depth)
+
+        return depth
+
+
 def determine_depth(
     node: Node,
     fragments: Dict[str, FragmentDefinitionNode],
@@ -123,68 +263,20 @@ def determine_depth(
     context: ValidationContext,
     operation_name: str,
     ignore: Optional[List[IgnoreType]] = None,
+    fragment_depths: Optional[Dict[str, int]] = None,
 ) -> int:
-    if depth_so_far > max_depth:
+    calculator = DepthCalculator(fragments, max_depth, ignore, fragment_depths)
+
+    try:
+        return calculator.get_depth(node, depth_so_far)
+    except MaxDepthExceeded as error:
         context.report_error(
             GraphQLError(
                 f"'{operation_name}' exceeds maximum operation depth of {max_depth}",
-                [node],
-            )
-        )
-        return depth_so_far
-
-    if isinstance(node, FieldNode):
-        # by default, ignore the introspection fields which begin with double underscores
-        should_ignore = is_introspection_key(node.name.value) or is_ignored(
-            node, ignore
-        )
-
-        if should_ignore or not node.selection_set:
-            return 0
-
-        return 1 + max(
-            map(
-                lambda selection: determine_depth(
-                    node=selection,
-                    fragments=fragments,
-                    depth_so_far=depth_so_far + 1,
-                    max_depth=max_depth,
-                    context=context,
-                    operation_name=operation_name,
-                    ignore=ignore,
-                ),
-                node.selection_set.selections,
-            )
-        )
-    elif isinstance(node, FragmentSpreadNode):
-        return determine_depth(
-            node=fragments[node.name.value],
-            fragments=fragments,
-            depth_so_far=depth_so_far,
-            max_depth=max_depth,
-            context=context,
-            operation_name=operation_name,
-            ignore=ignore,
-        )
-    elif isinstance(
-        node, (InlineFragmentNode, FragmentDefinitionNode, OperationDefinitionNode)
-    ):
-        return max(
-            map(
-                lambda selection: determine_depth(
-                    node=selection,
-                    fragments=fragments,
-                    depth_so_far=depth_so_far,
-                    max_depth=max_depth,
-                    context=context,
-                    operation_name=operation_name,
-                    ignore=ignore,
-                ),
-                node.selection_set.selections,
+                [error.node],
             )
         )
-    else:
-        raise Exception(f"Depth crawler cannot handle: {node.kind}")  # pragma: no cover
+        return error.depth
 
 
 def is_ignored(node: FieldNode, ignore: Optional[List[IgnoreType]] = None) -> bool:
@@ -0,0 +1,386 @@
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from graphql import (
+    GraphQLError,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLUnionType,
+    Undefined,
+    get_named_type,
+)
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+)
+from graphql.utilities import (
+    get_operation_ast,
+    get_operation_root_type,
+    value_from_ast_untyped,
+)
+from graphql.validation import ValidationContext, ValidationRule
+
+from strawberry.extensions.utils import is_introspection_key
+from strawberry.types.execution import get_current_execution_context
+from strawberry.utils.str_converters import to_camel_case
+
+
+DEFAULT_FIELD_COST = 1
+DEFAULT_SCALAR_COST = 0
+DEFAULT_LIST_SIZE = 1
+
+
+class QueryCostCalculator:
+    """Estimates the cost of the operations of a document, without executing
+    them.
+
+    Each field costs its `cost` hint, or `default_field_cost` when it returns
+    an object type and `default_scalar_cost` otherwise. The cost of the
+    selections of a field is multiplied by the size of the list it returns,
+    which is the largest value passed to the arguments listed in its
+    `cost_multipliers` hint, or `default_list_size` when none is passed.
+
+    When `variables` is None the values of the variables aren't known, so the
+    multiplier arguments passed as variables count as `max_list_size`, or are
+    listed in `unknown_multipliers` when it isn't set.
+
+    Fragments spread on types that exclude each other are all counted, so
+    the cost is an upper bound.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Optional[Dict[str, Any]] = None,
+        default_field_cost: int = DEFAULT_FIELD_COST,
+        default_scalar_cost: int = DEFAULT_SCALAR_COST,
+        default_list_size: int = DEFAULT_LIST_SIZE,
+        max_list_size: Optional[int] = None,
+    ):
+        self.schema = schema
+        self.variables = variables
+        self.default_field_cost = default_field_cost
+        self.default_scalar_cost = default_scalar_cost
+        self.default_list_size = default_list_size
+        self.max_list_size = max_list_size
+
+        # the fields of the current operation whose multiplier is passed as a
+        # variable that isn't known
+        self.unknown_multipliers: List[FieldNode] = []
+        self._operation_variables: Optional[Dict[str, Any]] = None
+
+        self.fragments: Dict[str, FragmentDefinitionNode] = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+        # the cost of a fragment doesn't depend on where it is spread, so it
+        # is only computed once per document
+        self._fragment_costs: Dict[str, int] = {}
+        self._visiting_fragments: Set[str] = set()
+
+    def get_operation_cost(self, operation: OperationDefinitionNode) -> int:
+        try:
+            root_type = get_operation_root_type(self.schema, operation)
+        except GraphQLError:
+            # the schema doesn't support this operation type, which is
+            # reported by the other validation rules
+            return 0
+
+        self.unknown_multipliers = []
+        # the fragments can use the variables, whose default values depend on
+        # the operation
+        self._fragment_costs = {}
+
+        if self.variables is None:
+            self._operation_variables = None
+        else:
+            self._operation_variables = {
+                definition.variable.name.value: value_from_ast_untyped(
+                    definition.default_value
+                )
+                for definition in operation.variable_definitions or ()
+                if definition.default_value is not None
+            }
+            self._operation_variables.update(self.variables)
+
+        return self.get_selection_set_cost(root_type, operation.selection_set)
+
+    def get_selection_set_cost(
+        self, parent_type: Optional[GraphQLNamedType], selection_set: SelectionSetNode
+    ) -> int:
+        cost = 0
+
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self.get_field_cost(parent_type, selection)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+
+                if selection.type_condition:
+                    fragment_type = self.schema.get_type(
+                        selection.type_condition.name.value
+                    )
+
+                cost += self.get_selection_set_cost(
+                    fragment_type, selection.selection_set
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                cost += self.get_fragment_cost(selection.name.value)
+
+        return cost
+
+    def get_fragment_cost(self, name: str) -> int:
+        if name in self._fragment_costs:
+            return self._fragment_costs[name]
+
+        # cycles are reported by the `NoFragmentCycles` rule, here we only
+        # need to avoid recursing forever
+        if name in self._visiting_fragments or name not in self.fragments:
+            return 0
+
+        fragment = self.fragments[name]
+        self._visiting_fragments.add(name)
+
+        try:
+            cost = self.get_selection_set_cost(
+                self.schema.get_type(fragment.type_condition.name.value),
+                fragment.selection_set,
+            )
+        finally:
+            self._visiting_fragments.discard(name)
+
+        self._fragment_costs[name] = cost
+
+        return cost
+
+    def get_field_cost(
+        self, parent_type: Optional[GraphQLNamedType], node: FieldNode
+    ) -> int:
+        if is_introspection_key(node.name.value):
+            return 0
+
+        fields: Dict[str, GraphQLField] = getattr(parent_type, "fields", {})
+        field = fields.get(node.name.value)
+
+        if field is None:
+            return 0
+
+        definition = (field.extensions or {}).get("strawberry_definition")
+        return_type = get_named_type(field.type)
+
+        cost: Optional[int] = getattr(definition, "cost", None)
+
+        if cost is None:
+            is_composite = isinstance(
+                return_type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType)
+            )
+            cost = self.default_field_cost if is_composite else self.default_scalar_cost
+
+        if not node.selection_set:
+            return cost
+
+        multiplier = self.get_multiplier(field, node, definition)
+
+        return cost + multiplier * self.get_selection_set_cost(
+            return_type, node.selection_set
+        )
+
+    def get_multiplier(self, field: GraphQLField, node: FieldNode, definition) -> int:
+        argument_names: List[str] = getattr(definition, "cost_multipliers", [])
+
+        if not argument_names:
+            field_type = field.type
+
+            if isinstance(field_type, GraphQLNonNull):
+                field_type = field_type.of_type
+
+            if isinstance(field_type, GraphQLList):
+                return self.default_list_size
+
+            return 1
+
+        values: Dict[str, Any] = {}
+
+        for name, argument in field.args.items():
+            if argument.default_value is not Undefined:
+                values[name] = argument.default_value
+
+        unknown_arguments: Set[str] = set()
+
+        for argument_node in node.arguments or ():
+            if (
+                isinstance(argument_node.value, VariableNode)
+                and self._operation_variables is None
+            ):
+                unknown_arguments.add(argument_node.name.value)
+                continue
+
+            value = value_from_ast_untyped(
+                argument_node.value, self._operation_variables
+            )
+
+            if value is not Undefined:
+                values[argument_node.name.value] = value
+
+        sizes = []
+
+        for name in argument_names:
+            # the hints use the python names of the arguments
+            if unknown_arguments.intersection((name, to_camel_case(name))):
+                if self.max_list_size is None:
+                    self.unknown_multipliers.append(node)
+                else:
+                    sizes.append(self.max_list_size)
+
+                continue
+
+            value = values.get(name, values.get(to_camel_case(name)))
+
+            if isinstance(value, int) and not isinstance(value, bool):
+                sizes.append(max(value, 0))
+
+        return max(sizes) if sizes else self.default_list_size
+
+
+def get_query_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+    default_field_cost: int = DEFAULT_FIELD_COST,
+    default_scalar_cost: int = DEFAULT_SCALAR_COST,
+    default_list_size: int = DEFAULT_LIST_SIZE,
+    max_list_size: Optional[int] = None,
+) -> int:
+    """Returns the estimated cost of an operation, or 0 when the document
+    doesn't contain it.
+
+    `variables` are the variables of the request, when they aren't known the
+    multiplier arguments passed as variables count as `max_list_size`, or
+    `default_list_size` when it isn't set."""
+
+    operation = get_operation_ast(document, operation_name)
+
+    if operation is None:
+        return 0
+
+    calculator = QueryCostCalculator(
+        schema,
+        document,
+        variables=variables,
+        default_field_cost=default_field_cost,
+        default_scalar_cost=default_scalar_cost,
+        default_list_size=default_list_size,
+        max_list_size=max_list_size,
+    )
+
+    return calculator.get_operation_cost(operation)
+
+
+def query_cost_validator(
+    max_cost: int,
+    variables: Optional[Dict[str, Any]] = None,
+    default_field_cost: int = DEFAULT_FIELD_COST,
+    default_scalar_cost: int = DEFAULT_SCALAR_COST,
+    default_list_size: int = DEFAULT_LIST_SIZE,
+    max_list_size: Optional[int] = None,
+    callback: Callable[[Dict[str, int]], None] = None,
+):
+    """
+    Creates a validator for the estimated cost of GraphQL queries
+
+    - max_cost - The maximum allowed cost for any operation in a GraphQL document.
+    - variables - The variables of the request, used to read the multiplier
+        arguments that are passed as variables. Defaults to the variables of
+        the execution when the schema executes the operation.
+    - default_field_cost - The cost of the fields returning object types that
+        don't have a cost hint.
+    - default_scalar_cost - The cost of the other fields that don't have a
+        cost hint.
+    - default_list_size - The multiplier used for list fields when none of
+        their multiplier arguments are passed.
+    - max_list_size - The multiplier used for the arguments passed as variables
+        when their values aren't known. Without it, the operations passing
+        multiplier arguments as variables are rejected.
+    - callback - Called each time validation runs. Receives an Object which is a
+        map of the costs for each operation.
+
+    When the schema executes the operation, its cost is also stored in
+    `execution_context.query_cost`, so that extensions can use it.
+    """
+
+    class QueryCostValidator(ValidationRule):
+        def __init__(self, validation_context: ValidationContext):
+            document = validation_context.document
+            # set when the operation is executed by the schema
+            execution_context = get_current_execution_context()
+            executed_operation = None
+            operation_variables = variables
+
+            if execution_context is not None:
+                executed_operation = get_operation_ast(
+                    document, execution_context.operation_name
+                )
+
+                if operation_variables is None:
+                    operation_variables = execution_context.variables or {}
+
+            calculator = QueryCostCalculator(
+                validation_context.schema,
+                document,
+                variables=operation_variables,
+                default_field_cost=default_field_cost,
+                default_scalar_cost=default_scalar_cost,
+                default_list_size=default_list_size,
+                max_list_size=max_list_size,
+            )
+            query_costs = {}
+
+            for definition in document.definitions:
+                if not isinstance(definition, OperationDefinitionNode):
+                    continue
+
+                name = definition.name.value if definition.name else "anonymous"
+                cost = calculator.get_operation_cost(definition)
+                query_costs[name] = cost
+
+                if definition is executed_operation:
+                    # shared with the extensions, like the rate limiter
+                    assert execution_context is not None
+                    execution_context.query_cost = cost
+
+                if calculator.unknown_multipliers:
+                    validation_context.report_error(
+                        GraphQLError(
+                            f"The cost of '{name}' can't be estimated because "
+                            "it passes list sizes as variables",
+                            calculator.unknown_multipliers,
+                        )
+                    )
+                elif cost > max_cost:
+                    validation_context.report_error(
+                        GraphQLError(
+                            f"'{name}' exceeds maximum operation cost of "
+                            f"{max_cost} with a cost of {cost}",
+                            [definition],
+                        )
+                    )
+
+            if callable(callback):
+                callback(query_costs)
+            super().__init__(validation_context)
+
+    return QueryCostValidator
@@ -1,5 +1,18 @@
-from .execution import ExecutionContext, ExecutionResult
+from .execution import (
+    ExecutionContext,
+    ExecutionResult,
+    ExecutionTimings,
+    IncrementalExecutionResult,
+    SubsequentExecutionResult,
+)
 from .info import Info
 
 
-__all__ = ["ExecutionContext", "ExecutionResult", "Info"]
+__all__ = [
+    "ExecutionContext",
+    "ExecutionResult",
+    "ExecutionTimings",
+    "IncrementalExecutionResult",
+    "Info",
+    "SubsequentExecutionResult",
+]
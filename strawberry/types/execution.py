@@ -1,11 +1,41 @@
 import dataclasses
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 from graphql import ExecutionResult as GraphQLExecutionResult
 from graphql.error.graphql_error import GraphQLError
 from graphql.language import DocumentNode
 
 
+if TYPE_CHECKING:
+    from strawberry.schema import Schema
+
+
+@dataclasses.dataclass
+class ExecutionTimings:
+    """Durations in seconds of the phases of an execution, a phase that
+    didn't run is None. The execution includes the resolvers and the
+    completion of their results."""
+
+    parsing: Optional[float] = None
+    validation: Optional[float] = None
+    execution: Optional[float] = None
+
+    @property
+    def total(self) -> float:
+        return (self.parsing or 0) + (self.validation or 0) + (self.execution or 0)
+
+
 @dataclasses.dataclass
 class ExecutionContext:
     query: str
@@ -13,12 +43,38 @@ class ExecutionContext:
     variables: Optional[Dict[str, Any]] = None
     operation_name: Optional[str] = None
     root_value: Optional[Any] = None
+    schema: Optional["Schema"] = None
 
     # Values that get populated during the GraphQL execution so that they can be
     # accessed by extensions
     graphql_document: Optional[DocumentNode] = None
     errors: Optional[List[GraphQLError]] = None
     result: Optional[GraphQLExecutionResult] = None
+    timings: ExecutionTimings = dataclasses.field(default_factory=ExecutionTimings)
+    # estimated by `strawberry.tools.query_cost_validator`
+    query_cost: Optional[int] = None
+
+
+_current_execution_context: ContextVar[Optional[ExecutionContext]] = ContextVar(
+    "strawberry_execution_context", default=None
+)
+
+
+@contextmanager
+def execution_context_scope(execution_context: ExecutionContext) -> Iterator[None]:
+    """Makes the execution context available to the validation rules, which
+    don't receive it, while the operation is validated"""
+
+    token = _current_execution_context.set(execution_context)
+
+    try:
+        yield
+    finally:
+        _current_execution_context.reset(token)
+
+
+def get_current_execution_context() -> Optional[ExecutionContext]:
+    return _current_execution_context.get()
 
 
 @dataclasses.dataclass
@@ -26,3 +82,22 @@ class ExecutionResult:
     data: Optional[Dict[str, Any]]
     errors: Optional[List[GraphQLError]]
     extensions: Optional[Dict[str, Any]] = None
+
+
+@dataclasses.dataclass
+class SubsequentExecutionResult:
+    """A result delivered after the initial one, either the data of a deferred
+    fragment or the items of a streamed list field"""
+
+    has_next: bool = True
+    data: Optional[Dict[str, Any]] = None
+    items: Optional[List[Any]] = None
+    path: Optional[List[Union[str, int]]] = None
+    label: Optional[str] = None
+    errors: Optional[List[GraphQLError]] = None
+    extensions: Optional[Dict[str, Any]] = None
+
+
+@dataclasses.dataclass
+class IncrementalExecutionResult(ExecutionResult):
+    subsequent_results: Optional[AsyncIterator[SubsequentExecutionResult]] = None
@@ -18,6 +18,7 @@ from strawberry.utils.typing import is_generic as is_type_generic
 
 
 if TYPE_CHECKING:
+    from strawberry.cache import CacheControl
     from strawberry.field import StrawberryField
 
 
@@ -44,6 +45,7 @@ class TypeDefinition(StrawberryType):
     type_var_map: Mapping[TypeVar, Union[StrawberryType, type]] = dataclasses.field(
         default_factory=dict
     )
+    cache_control: Optional["CacheControl"] = None
 
     # TODO: remove wrapped cls when we "merge" this with `StrawberryObject`
     def resolve_generic(self, wrapped_cls: type) -> type:
@@ -94,6 +96,7 @@ class TypeDefinition(StrawberryType):
             _fields=fields,
             concrete_of=self,
             type_var_map=type_var_map,
+            cache_control=self.cache_control,
         )
 
         new_type = type(
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from graphql import GraphQLError, OperationType, get_operation_ast, parse
+
+
+def get_operation_type(
+    query: str, operation_name: Optional[str] = None
+) -> Optional[OperationType]:
+    """Returns the type of the operation that would be executed, or None when
+    the query can't be parsed or the operation doesn't exist"""
+
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return None
+
+    operation = get_operation_ast(document, operation_name)
+
+    return operation.operation if operation else None
@@ -33,21 +33,21 @@ class Query:
 @strawberry.type
 class Mutation:
     @strawberry.mutation
-    def read_text(self, text_file: Upload) -> str:
-        return text_file.read().decode()
+    async def read_text(self, text_file: Upload) -> str:
+        return (await text_file.read()).decode()
 
     @strawberry.mutation
-    def read_files(self, files: typing.List[Upload]) -> typing.List[str]:
+    async def read_files(self, files: typing.List[Upload]) -> typing.List[str]:
         contents = []
         for file in files:
-            contents.append(file.read().decode())
+            contents.append((await file.read()).decode())
         return contents
 
     @strawberry.mutation
-    def read_folder(self, folder: FolderInput) -> typing.List[str]:
+    async def read_folder(self, folder: FolderInput) -> typing.List[str]:
         contents = []
         for file in folder.files:
-            contents.append(file.read().decode())
+            contents.append((await file.read()).decode())
         return contents
 
 
@@ -0,0 +1,76 @@
+import typing
+
+import strawberry
+from aiohttp import web
+from strawberry.aiohttp.views import GraphQLView
+from strawberry.compression import ResponseCompression
+
+
+@strawberry.type
+class Product:
+    id: int
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def products(self, count: int) -> typing.List[Product]:
+        return [Product(id=index, name=f"Product {index}") for index in range(count)]
+
+
+QUERY = "{ products(count: 100) { id name } }"
+
+
+async def create_client(aiohttp_client, **kwargs):
+    view = GraphQLView(schema=strawberry.Schema(query=Query), **kwargs)
+
+    app = web.Application()
+    app.router.add_route("*", "/graphql", view)
+
+    return await aiohttp_client(app)
+
+
+async def test_compresses_the_response(aiohttp_client):
+    client = await create_client(
+        aiohttp_client, compression=ResponseCompression(encodings=("gzip",))
+    )
+
+    response = await client.post(
+        "/graphql", json={"query": QUERY}, headers={"Accept-Encoding": "gzip"}
+    )
+    data = await response.json()
+
+    assert response.status == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert len(data["data"]["products"]) == 100
+
+
+async def test_does_not_compress_small_responses(aiohttp_client):
+    client = await create_client(
+        aiohttp_client, compression=ResponseCompression(minimum_size=10_000)
+    )
+
+    response = await client.post(
+        "/graphql", json={"query": QUERY}, headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert "Content-Encoding" not in response.headers
+
+
+async def test_compresses_streamed_responses(aiohttp_client):
+    client = await create_client(
+        aiohttp_client,
+        compression=ResponseCompression(encodings=("deflate",)),
+        stream_responses=True,
+        stream_chunk_size=128,
+    )
+
+    response = await client.post(
+        "/graphql", json={"query": QUERY}, headers={"Accept-Encoding": "deflate"}
+    )
+    data = await response.json()
+
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert len(data["data"]["products"]) == 100
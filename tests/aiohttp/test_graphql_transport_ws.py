@@ -0,0 +1,106 @@
+from strawberry.subscriptions.constants import (
+    GQL_CONNECTION_ACK,
+    GQL_CONNECTION_INIT,
+    GQL_TRANSPORT_COMPLETE,
+    GQL_TRANSPORT_CONNECTION_ACK,
+    GQL_TRANSPORT_CONNECTION_INIT,
+    GQL_TRANSPORT_NEXT,
+    GQL_TRANSPORT_PING,
+    GQL_TRANSPORT_PONG,
+    GQL_TRANSPORT_SUBSCRIBE,
+    GRAPHQL_TRANSPORT_WS,
+    WS_CLOSE_CONNECTION_INIT_TIMEOUT,
+    WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE,
+    WS_CLOSE_UNAUTHORIZED,
+)
+from tests.aiohttp.app import create_app
+
+
+async def test_simple_subscription(aiohttp_client):
+    aiohttp_app_client = await aiohttp_client(create_app(keep_alive=False))
+
+    async with aiohttp_app_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_TRANSPORT_WS]
+    ) as ws:
+        assert ws.protocol == GRAPHQL_TRANSPORT_WS
+
+        await ws.send_json({"type": GQL_TRANSPORT_CONNECTION_INIT})
+        assert await ws.receive_json() == {"type": GQL_TRANSPORT_CONNECTION_ACK}
+
+        await ws.send_json({"type": GQL_TRANSPORT_PING})
+        assert await ws.receive_json() == {"type": GQL_TRANSPORT_PONG}
+
+        await ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": 'subscription { echo(message: "Hi") }'},
+            }
+        )
+
+        assert await ws.receive_json() == {
+            "id": "sub1",
+            "type": GQL_TRANSPORT_NEXT,
+            "payload": {"data": {"echo": "Hi"}},
+        }
+        assert await ws.receive_json() == {
+            "id": "sub1",
+            "type": GQL_TRANSPORT_COMPLETE,
+        }
+
+
+async def test_subscribe_before_ack_is_unauthorized(aiohttp_client):
+    aiohttp_app_client = await aiohttp_client(create_app(keep_alive=False))
+
+    async with aiohttp_app_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_TRANSPORT_WS]
+    ) as ws:
+        await ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": "subscription { flavors }"},
+            }
+        )
+
+        message = await ws.receive(timeout=2)
+
+        assert ws.closed
+        assert ws.close_code == WS_CLOSE_UNAUTHORIZED
+        assert message.extra == "Unauthorized"
+
+
+async def test_connection_init_timeout(aiohttp_client):
+    aiohttp_app_client = await aiohttp_client(
+        create_app(keep_alive=False, connection_init_wait_timeout=0.1)
+    )
+
+    async with aiohttp_app_client.ws_connect(
+        "/graphql", protocols=[GRAPHQL_TRANSPORT_WS]
+    ) as ws:
+        await ws.receive(timeout=2)
+
+        assert ws.closed
+        assert ws.close_code == WS_CLOSE_CONNECTION_INIT_TIMEOUT
+
+
+async def test_falls_back_to_graphql_ws(aiohttp_client):
+    aiohttp_app_client = await aiohttp_client(create_app(keep_alive=False))
+
+    for protocols in [(), ("mqtt",)]:
+        async with aiohttp_app_client.ws_connect("/graphql", protocols=protocols) as ws:
+            await ws.send_json({"type": GQL_CONNECTION_INIT})
+
+            assert await ws.receive_json() == {"type": GQL_CONNECTION_ACK}
+
+
+async def test_unsupported_subprotocol(aiohttp_client):
+    aiohttp_app_client = await aiohttp_client(
+        create_app(keep_alive=False, subscription_protocols=[GRAPHQL_TRANSPORT_WS])
+    )
+
+    async with aiohttp_app_client.ws_connect("/graphql") as ws:
+        await ws.receive(timeout=2)
+
+        assert ws.closed
+        assert ws.close_code == WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE
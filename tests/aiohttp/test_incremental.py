@@ -0,0 +1,41 @@
+import json
+import typing
+
+import strawberry
+from aiohttp import web
+from strawberry.aiohttp.views import GraphQLView
+from strawberry.incremental import defer, stream
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def numbers(self) -> typing.List[int]:
+        return [1, 2, 3]
+
+
+schema = strawberry.Schema(query=Query, directives=[defer, stream])
+
+
+async def test_multipart_response(aiohttp_client):
+    app = web.Application()
+    app.router.add_route("*", "/graphql", GraphQLView(schema=schema))
+    client = await aiohttp_client(app)
+
+    response = await client.post(
+        "/graphql",
+        json={"query": "{ numbers @stream(initialCount: 2) }"},
+        headers={"Accept": "multipart/mixed"},
+    )
+    body = await response.text()
+
+    assert response.status == 200
+    assert response.headers["Content-Type"] == 'multipart/mixed; boundary="-"'
+
+    parts = body.strip("\r\n-").split("\r\n---\r\n")
+    payloads = [json.loads(part.split("\r\n\r\n")[1]) for part in parts]
+
+    assert payloads == [
+        {"data": {"numbers": [1, 2]}, "hasNext": True},
+        {"items": [3], "path": ["numbers", 2], "hasNext": False},
+    ]
@@ -0,0 +1,33 @@
+import strawberry
+from aiohttp import web
+from strawberry.aiohttp.views import GraphQLView
+from strawberry.cache import CacheControl, ResponseCache
+from strawberry.extensions.cache_control import CacheControlExtension
+
+
+async def test_caches_public_responses(aiohttp_client):
+    calls = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(cache_control=CacheControl(max_age=60))
+        def catalog(self) -> str:
+            calls.append("catalog")
+            return "catalog"
+
+    schema = strawberry.Schema(query=Query, extensions=[CacheControlExtension])
+    view = GraphQLView(schema=schema, response_cache=ResponseCache())
+
+    app = web.Application()
+    app.router.add_route("*", "/graphql", view)
+    client = await aiohttp_client(app)
+
+    for _ in range(2):
+        response = await client.post("/graphql", json={"query": "{ catalog }"})
+        data = await response.json()
+
+        assert response.status == 200
+        assert response.headers["Cache-Control"] == "max-age=60, public"
+        assert data["data"] == {"catalog": "catalog"}
+
+    assert calls == ["catalog"]
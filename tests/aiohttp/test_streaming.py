@@ -0,0 +1,44 @@
+import typing
+
+import strawberry
+from aiohttp import web
+from strawberry.aiohttp.views import GraphQLView
+
+
+@strawberry.type
+class Product:
+    id: int
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def products(self, info, count: int) -> typing.List[Product]:
+        info.context["response"].set_cookie("TEST_COOKIE", "TEST_VALUE")
+        info.context["response"].headers["X-Products"] = str(count)
+
+        return [Product(id=index, name=f"Product {index}") for index in range(count)]
+
+
+async def test_streams_the_response(aiohttp_client):
+    schema = strawberry.Schema(query=Query)
+    view = GraphQLView(schema=schema, stream_responses=True, stream_chunk_size=128)
+
+    app = web.Application()
+    app.router.add_route("*", "/graphql", view)
+    client = await aiohttp_client(app)
+
+    response = await client.post(
+        "/graphql", json={"query": "{ products(count: 100) { id name } }"}
+    )
+    data = await response.json()
+
+    assert response.status == 200
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers["X-Products"] == "100"
+    assert response.cookies.get("TEST_COOKIE").value == "TEST_VALUE"
+    assert "Content-Length" not in response.headers
+
+    assert len(data["data"]["products"]) == 100
+    assert data["data"]["products"][99] == {"id": 99, "name": "Product 99"}
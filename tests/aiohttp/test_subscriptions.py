@@ -524,7 +524,7 @@ async def test_task_cancellation_separation(aiohttp_client):
         return [
             task
             for task in asyncio.all_tasks()
-            if "WebSocketHandler.handle_async_results" in repr(task)
+            if "BaseSubscriptionsHandler.send_results" in repr(task)
         ]
 
     connection1 = aiohttp_app_client.ws_connect("/graphql", protocols=[GRAPHQL_WS])
@@ -144,3 +144,50 @@ async def test_not_allowed_methods(aiohttp_app_client):
     for method in not_allowed_methods:
         response = await aiohttp_app_client.request(method, "/graphql")
         assert response.status == 405, method
+
+
+async def test_batched_operations(aiohttp_client):
+    app = create_app(allow_batching=True)
+    client = await aiohttp_client(app)
+
+    response = await client.post(
+        "/graphql", json=[{"query": "{ hello }"}, {"query": "{ __typename }"}]
+    )
+
+    assert response.status == 200
+    assert await response.json() == [
+        {"data": {"hello": "strawberry"}},
+        {"data": {"__typename": "Query"}},
+    ]
+
+
+async def test_batched_operations_disabled(aiohttp_app_client):
+    response = await aiohttp_app_client.post("/graphql", json=[{"query": "{ hello }"}])
+
+    assert response.status == 400
+    assert response.reason == "Batched operations are not enabled"
+
+
+async def test_query_via_get(aiohttp_app_client):
+    response = await aiohttp_app_client.get(
+        "/graphql", params={"query": "{ hello }"}, headers={"Accept": "text/html"}
+    )
+
+    assert response.status == 200
+    assert await response.json() == {"data": {"hello": "strawberry"}}
+
+    etag = response.headers["ETag"]
+    response = await aiohttp_app_client.get(
+        "/graphql", params={"query": "{ hello }"}, headers={"If-None-Match": etag}
+    )
+
+    assert response.status == 304
+    assert response.headers["ETag"] == etag
+
+
+async def test_mutations_are_not_allowed_via_get(aiohttp_app_client):
+    response = await aiohttp_app_client.get(
+        "/graphql", params={"query": "mutation { __typename }"}
+    )
+
+    assert response.status == 405
@@ -0,0 +1,72 @@
+import typing
+
+from starlette.testclient import TestClient
+
+import strawberry
+from strawberry.asgi import GraphQL
+from strawberry.dataloader import DataLoader
+
+
+def create_app(batches, **kwargs):
+    async def load_products(keys: typing.List[int]) -> typing.List[str]:
+        batches.append(keys)
+        return [f"Product {key}" for key in keys]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def product(self, info, id: int) -> str:
+            return await info.context["product_loader"].load(id)
+
+    class BatchingGraphQL(GraphQL):
+        async def get_context(self, request, response=None):
+            return {"product_loader": DataLoader(load_fn=load_products)}
+
+    return BatchingGraphQL(strawberry.Schema(query=Query), **kwargs)
+
+
+def test_batched_operations_share_dataloaders():
+    batches: typing.List[typing.List[int]] = []
+    test_client = TestClient(create_app(batches, allow_batching=True))
+
+    response = test_client.post(
+        "/",
+        json=[
+            {"query": "{ product(id: 1) }"},
+            {
+                "query": "query Product($id: Int!) { product(id: $id) }",
+                "variables": {"id": 2},
+                "operationName": "Product",
+            },
+            {"query": "{ product }"},
+        ],
+    )
+
+    assert response.status_code == 200
+
+    data = response.json()
+
+    assert data[0] == {"data": {"product": "Product 1"}}
+    assert data[1] == {"data": {"product": "Product 2"}}
+    assert data[2]["data"] is None
+    assert len(data[2]["errors"]) == 1
+
+    assert batches == [[1, 2]]
+
+
+def test_batching_is_disabled_by_default():
+    test_client = TestClient(create_app([]))
+
+    response = test_client.post("/", json=[{"query": "{ product(id: 1) }"}])
+
+    assert response.status_code == 400
+    assert response.text == "Batched operations are not enabled"
+
+
+def test_batch_without_query():
+    test_client = TestClient(create_app([], allow_batching=True))
+
+    response = test_client.post("/", json=[{"query": "{ product(id: 1) }"}, {}])
+
+    assert response.status_code == 400
+    assert response.text == "No GraphQL query found in the request"
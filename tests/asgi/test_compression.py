@@ -0,0 +1,95 @@
+import typing
+
+from starlette.testclient import TestClient
+
+import strawberry
+from strawberry.asgi import GraphQL
+from strawberry.compression import ResponseCompression
+from strawberry.incremental import defer, stream
+
+
+@strawberry.type
+class Product:
+    id: int
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def products(self, count: int) -> typing.List[Product]:
+        return [Product(id=index, name=f"Product {index}") for index in range(count)]
+
+
+schema = strawberry.Schema(query=Query, directives=[defer, stream])
+
+QUERY = "{ products(count: 100) { id name } }"
+
+
+def test_compresses_the_response():
+    app = GraphQL(schema, compression=ResponseCompression(encodings=("gzip",)))
+    test_client = TestClient(app)
+
+    response = test_client.post(
+        "/", json={"query": QUERY}, headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert len(response.json()["data"]["products"]) == 100
+
+
+def test_does_not_compress_small_responses():
+    app = GraphQL(schema, compression=ResponseCompression(minimum_size=10_000))
+    test_client = TestClient(app)
+
+    response = test_client.post(
+        "/", json={"query": QUERY}, headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_does_not_compress_without_accept_encoding():
+    test_client = TestClient(GraphQL(schema, compression=ResponseCompression()))
+
+    response = test_client.post(
+        "/", json={"query": QUERY}, headers={"Accept-Encoding": "identity"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert len(response.json()["data"]["products"]) == 100
+
+
+def test_compresses_streamed_responses():
+    app = GraphQL(
+        schema,
+        compression=ResponseCompression(encodings=("deflate",)),
+        stream_responses=True,
+        stream_chunk_size=128,
+    )
+    test_client = TestClient(app)
+
+    response = test_client.post(
+        "/", json={"query": QUERY}, headers={"Accept-Encoding": "deflate"}
+    )
+
+    assert response.headers["content-encoding"] == "deflate"
+    assert "content-length" not in response.headers
+    assert len(response.json()["data"]["products"]) == 100
+
+
+def test_compresses_multipart_responses():
+    test_client = TestClient(GraphQL(schema, compression=ResponseCompression()))
+
+    response = test_client.post(
+        "/",
+        json={"query": "{ products(count: 100) @stream(initialCount: 1) { id } }"},
+        headers={"Accept": "multipart/mixed", "Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.endswith("-----\r\n")
@@ -0,0 +1,269 @@
+import pytest
+
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from strawberry.subscriptions.constants import (
+    GQL_CONNECTION_ACK,
+    GQL_CONNECTION_INIT,
+    GQL_TRANSPORT_COMPLETE,
+    GQL_TRANSPORT_CONNECTION_ACK,
+    GQL_TRANSPORT_CONNECTION_INIT,
+    GQL_TRANSPORT_ERROR,
+    GQL_TRANSPORT_NEXT,
+    GQL_TRANSPORT_PING,
+    GQL_TRANSPORT_PONG,
+    GQL_TRANSPORT_SUBSCRIBE,
+    GRAPHQL_TRANSPORT_WS,
+    GRAPHQL_WS,
+    WS_CLOSE_CONNECTION_INIT_TIMEOUT,
+    WS_CLOSE_INVALID_MESSAGE,
+    WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE,
+    WS_CLOSE_SUBSCRIBER_ALREADY_EXISTS,
+    WS_CLOSE_TOO_MANY_INIT_REQUESTS,
+    WS_CLOSE_UNAUTHORIZED,
+)
+from strawberry.subscriptions.handlers import select_subscription_protocol
+
+from .conftest import GraphQL
+
+
+def connect(test_client):
+    return test_client.websocket_connect("/", [GRAPHQL_TRANSPORT_WS])
+
+
+def init(ws):
+    ws.send_json({"type": GQL_TRANSPORT_CONNECTION_INIT})
+    assert ws.receive_json() == {"type": GQL_TRANSPORT_CONNECTION_ACK}
+
+
+def assert_closed(ws, code):
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        ws.receive_json()
+
+    assert exc_info.value.code == code
+
+
+def test_select_subscription_protocol():
+    supported = ("graphql-transport-ws", "graphql-ws")
+
+    assert select_subscription_protocol(["graphql-ws"], supported) == "graphql-ws"
+    assert (
+        select_subscription_protocol(["graphql-ws", "graphql-transport-ws"], supported)
+        == "graphql-transport-ws"
+    )
+    # the clients that don't negotiate get the legacy protocol
+    assert select_subscription_protocol([], supported) == "graphql-ws"
+    assert select_subscription_protocol(["mqtt"], supported) == "graphql-ws"
+    assert select_subscription_protocol(["mqtt"], ["graphql-transport-ws"]) is None
+
+
+def test_simple_subscription(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": "subscription { flavors }"},
+            }
+        )
+
+        for flavor in ("VANILLA", "STRAWBERRY", "CHOCOLATE"):
+            assert ws.receive_json() == {
+                "id": "sub1",
+                "type": GQL_TRANSPORT_NEXT,
+                "payload": {"data": {"flavors": flavor}},
+            }
+
+        assert ws.receive_json() == {"id": "sub1", "type": GQL_TRANSPORT_COMPLETE}
+
+
+def test_query(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "query1",
+                "payload": {"query": "{ hello }"},
+            }
+        )
+
+        assert ws.receive_json() == {
+            "id": "query1",
+            "type": GQL_TRANSPORT_NEXT,
+            "payload": {"data": {"hello": "Hello world"}},
+        }
+        assert ws.receive_json() == {"id": "query1", "type": GQL_TRANSPORT_COMPLETE}
+
+
+def test_ping_pong(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_json({"type": GQL_TRANSPORT_PONG})
+        ws.send_json({"type": GQL_TRANSPORT_PING})
+
+        assert ws.receive_json() == {"type": GQL_TRANSPORT_PONG}
+
+
+def test_complete_stops_the_subscription_without_reply(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": 'subscription { infinity(message: "Hi") }'},
+            }
+        )
+
+        assert ws.receive_json()["type"] == GQL_TRANSPORT_NEXT
+
+        ws.send_json({"type": GQL_TRANSPORT_COMPLETE, "id": "sub1"})
+        ws.send_json({"type": GQL_TRANSPORT_PING})
+
+        assert ws.receive_json() == {"type": GQL_TRANSPORT_PONG}
+
+        # the id can be used again once the subscription is completed
+        ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": 'subscription { echo(message: "Hi") }'},
+            }
+        )
+
+        assert ws.receive_json()["payload"] == {"data": {"echo": "Hi"}}
+        assert ws.receive_json() == {"id": "sub1", "type": GQL_TRANSPORT_COMPLETE}
+
+
+def test_validation_errors(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": "subscription { doesNotExist }"},
+            }
+        )
+
+        response = ws.receive_json()
+
+        assert response["type"] == GQL_TRANSPORT_ERROR
+        assert response["id"] == "sub1"
+        assert [error["message"] for error in response["payload"]] == [
+            "The subscription field 'doesNotExist' is not defined."
+        ]
+
+
+def test_subscription_exceptions(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": 'subscription { exception(message: "TEST") }'},
+            }
+        )
+
+        response = ws.receive_json()
+
+        assert response["type"] == GQL_TRANSPORT_NEXT
+        assert response["payload"]["data"] is None
+        assert response["payload"]["errors"][0]["message"] == "TEST"
+        assert ws.receive_json() == {"id": "sub1", "type": GQL_TRANSPORT_COMPLETE}
+
+
+def test_subscribe_before_ack_is_unauthorized(test_client):
+    with connect(test_client) as ws:
+        ws.send_json(
+            {
+                "type": GQL_TRANSPORT_SUBSCRIBE,
+                "id": "sub1",
+                "payload": {"query": "subscription { flavors }"},
+            }
+        )
+
+        assert_closed(ws, WS_CLOSE_UNAUTHORIZED)
+
+
+def test_duplicate_subscriber(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        message = {
+            "type": GQL_TRANSPORT_SUBSCRIBE,
+            "id": "sub1",
+            "payload": {"query": 'subscription { infinity(message: "Hi") }'},
+        }
+
+        ws.send_json(message)
+        assert ws.receive_json()["type"] == GQL_TRANSPORT_NEXT
+
+        ws.send_json(message)
+
+        assert_closed(ws, WS_CLOSE_SUBSCRIBER_ALREADY_EXISTS)
+
+
+def test_too_many_initialisation_requests(test_client):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_json({"type": GQL_TRANSPORT_CONNECTION_INIT})
+
+        assert_closed(ws, WS_CLOSE_TOO_MANY_INIT_REQUESTS)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "not json",
+        "[]",
+        '{"type": "unknown"}',
+        '{"type": "subscribe", "id": "sub1"}',
+    ],
+)
+def test_invalid_messages(test_client, message):
+    with connect(test_client) as ws:
+        init(ws)
+
+        ws.send_text(message)
+
+        assert_closed(ws, WS_CLOSE_INVALID_MESSAGE)
+
+
+def test_connection_init_timeout(schema):
+    test_client = TestClient(GraphQL(schema, connection_init_wait_timeout=0.1))
+
+    with connect(test_client) as ws:
+        assert_closed(ws, WS_CLOSE_CONNECTION_INIT_TIMEOUT)
+
+
+@pytest.mark.parametrize("subprotocols", [None, ["mqtt"]])
+def test_falls_back_to_graphql_ws(test_client, subprotocols):
+    with test_client.websocket_connect("/", subprotocols) as ws:
+        assert ws.accepted_subprotocol == GRAPHQL_WS
+
+        ws.send_json({"type": GQL_CONNECTION_INIT})
+        assert ws.receive_json() == {"type": GQL_CONNECTION_ACK}
+
+
+def test_subscription_protocols_can_be_restricted(schema):
+    test_client = TestClient(
+        GraphQL(schema, subscription_protocols=[GRAPHQL_TRANSPORT_WS])
+    )
+
+    with test_client.websocket_connect("/", [GRAPHQL_WS]) as ws:
+        assert_closed(ws, WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE)
+
+    with test_client.websocket_connect("/") as ws:
+        assert_closed(ws, WS_CLOSE_SUBPROTOCOL_NOT_ACCEPTABLE)
@@ -0,0 +1,111 @@
+import json
+import typing
+
+from starlette.testclient import TestClient
+
+import strawberry
+from strawberry.asgi import GraphQL
+from strawberry.incremental import defer, stream
+from strawberry.subscriptions.constants import (
+    GQL_COMPLETE,
+    GQL_CONNECTION_ACK,
+    GQL_CONNECTION_INIT,
+    GQL_DATA,
+    GQL_START,
+    GRAPHQL_WS,
+)
+
+
+@strawberry.type
+class Product:
+    id: int
+
+    @strawberry.field
+    async def recommendations(self) -> typing.List[str]:
+        return [f"Recommendation {self.id}"]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def product(self) -> Product:
+        return Product(id=1)
+
+
+schema = strawberry.Schema(query=Query, directives=[defer, stream])
+
+QUERY = "{ product { id ... @defer { recommendations } } }"
+
+
+def parse_multipart(body: str) -> typing.List[typing.Any]:
+    assert body.startswith("\r\n---")
+    assert body.endswith("-----\r\n")
+
+    payloads = []
+
+    for part in body.strip("\r\n-").split("\r\n---\r\n"):
+        headers, payload = part.split("\r\n\r\n")
+
+        assert headers == "Content-Type: application/json; charset=utf-8"
+
+        payloads.append(json.loads(payload))
+
+    return payloads
+
+
+def test_multipart_response():
+    test_client = TestClient(GraphQL(schema))
+
+    response = test_client.post(
+        "/", json={"query": QUERY}, headers={"Accept": "multipart/mixed"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == 'multipart/mixed; boundary="-"'
+    assert parse_multipart(response.text) == [
+        {"data": {"product": {"id": 1}}, "hasNext": True},
+        {
+            "data": {"recommendations": ["Recommendation 1"]},
+            "path": ["product"],
+            "hasNext": False,
+        },
+    ]
+
+
+def test_json_response_without_multipart_accept_header():
+    test_client = TestClient(GraphQL(schema))
+
+    response = test_client.post("/", json={"query": QUERY})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "data": {"product": {"id": 1, "recommendations": ["Recommendation 1"]}}
+    }
+
+
+def test_websocket_query():
+    test_client = TestClient(GraphQL(schema))
+
+    with test_client.websocket_connect("/", GRAPHQL_WS) as ws:
+        ws.send_json({"type": GQL_CONNECTION_INIT})
+        ws.send_json({"type": GQL_START, "id": "demo", "payload": {"query": QUERY}})
+
+        assert ws.receive_json()["type"] == GQL_CONNECTION_ACK
+
+        assert ws.receive_json() == {
+            "type": GQL_DATA,
+            "id": "demo",
+            "payload": {"data": {"product": {"id": 1}}, "hasNext": True},
+        }
+        assert ws.receive_json() == {
+            "type": GQL_DATA,
+            "id": "demo",
+            "payload": {
+                "data": {"recommendations": ["Recommendation 1"]},
+                "path": ["product"],
+                "hasNext": False,
+            },
+        }
+        assert ws.receive_json() == {"type": GQL_COMPLETE, "id": "demo"}
+
+        ws.close()
@@ -0,0 +1,51 @@
+import datetime
+
+from starlette.testclient import TestClient
+
+from strawberry.asgi import GraphQL
+from strawberry.codecs import StdlibJSONCodec
+
+
+class RecordingCodec(StdlibJSONCodec):
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, data):
+        self.calls.append("encode")
+        return super().encode(data)
+
+    def decode(self, data):
+        self.calls.append("decode")
+        return super().decode(data)
+
+
+def test_custom_json_codec(schema):
+    codec = RecordingCodec()
+
+    class CustomGraphQL(GraphQL):
+        async def process_result(self, request, result):
+            return {
+                "data": result.data,
+                "extensions": {"servedAt": datetime.date(2021, 9, 6)},
+            }
+
+    test_client = TestClient(CustomGraphQL(schema, json_codec=codec))
+
+    response = test_client.post("/", json={"query": "{ hello }"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "data": {"hello": "Hello world"},
+        "extensions": {"servedAt": "2021-09-06"},
+    }
+    assert codec.calls == ["decode", "encode"]
+
+
+def test_invalid_json_body(test_client):
+    response = test_client.post(
+        "/", data='{"query": ', headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 400
+    assert response.text == "Unable to parse request body as JSON"
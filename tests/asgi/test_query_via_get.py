@@ -0,0 +1,142 @@
+import hashlib
+import json
+
+from starlette.testclient import TestClient
+
+import strawberry
+from strawberry.asgi import GraphQL
+from strawberry.persisted_queries import PersistedQueries
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self, name: str = "world") -> str:
+        return f"Hello {name}"
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def hello(self) -> str:
+        return "Hello"
+
+
+schema = strawberry.Schema(query=Query, mutation=Mutation)
+
+
+def test_query_via_get():
+    test_client = TestClient(GraphQL(schema))
+
+    response = test_client.get(
+        "/",
+        params={
+            "query": "query Hello($name: String!) { hello(name: $name) }",
+            "variables": json.dumps({"name": "strawberry"}),
+            "operationName": "Hello",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"data": {"hello": "Hello strawberry"}}
+    assert response.headers["etag"].startswith('W/"')
+
+
+def test_queries_via_get_can_be_disabled():
+    test_client = TestClient(GraphQL(schema, allow_queries_via_get=False))
+
+    response = test_client.get(
+        "/", params={"query": "{ hello }"}, headers={"Accept": "text/html"}
+    )
+
+    assert response.status_code == 200
+    assert "GraphiQL" in response.text
+
+
+def test_mutations_are_not_allowed_via_get():
+    test_client = TestClient(GraphQL(schema))
+
+    response = test_client.get("/", params={"query": "mutation { hello }"})
+
+    assert response.status_code == 405
+    assert response.headers["allow"] == "POST"
+
+
+def test_invalid_variables_via_get():
+    test_client = TestClient(GraphQL(schema))
+
+    response = test_client.get("/", params={"query": "{ hello }", "variables": "{"})
+
+    assert response.status_code == 400
+    assert response.text == "Unable to parse the query parameters"
+
+
+def test_returns_not_modified_when_the_etag_matches():
+    test_client = TestClient(GraphQL(schema))
+
+    response = test_client.get("/", params={"query": "{ hello }"})
+    etag = response.headers["etag"]
+
+    response = test_client.get(
+        "/", params={"query": "{ hello }"}, headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = test_client.get(
+        "/", params={"query": "{ hello }"}, headers={"If-None-Match": 'W/"other"'}
+    )
+
+    assert response.status_code == 200
+
+
+def test_post_responses_have_no_etag():
+    test_client = TestClient(GraphQL(schema))
+
+    response = test_client.post("/", json={"query": "{ hello }"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_automatic_persisted_queries():
+    test_client = TestClient(GraphQL(schema, persisted_queries=PersistedQueries()))
+
+    query = "{ hello }"
+    extensions = {
+        "persistedQuery": {
+            "version": 1,
+            "sha256Hash": hashlib.sha256(query.encode()).hexdigest(),
+        }
+    }
+
+    response = test_client.get("/", params={"extensions": json.dumps(extensions)})
+
+    assert response.status_code == 200
+    assert response.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    response = test_client.post("/", json={"query": query, "extensions": extensions})
+
+    assert response.json() == {"data": {"hello": "Hello world"}}
+
+    response = test_client.get("/", params={"extensions": json.dumps(extensions)})
+
+    assert response.status_code == 200
+    assert response.json() == {"data": {"hello": "Hello world"}}
+
+
+def test_persisted_query_with_invalid_hash():
+    test_client = TestClient(GraphQL(schema, persisted_queries=PersistedQueries()))
+
+    response = test_client.post(
+        "/",
+        json={
+            "query": "{ hello }",
+            "extensions": {"persistedQuery": {"version": 1, "sha256Hash": "abc"}},
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.text == "Provided sha256 hash does not match the query"
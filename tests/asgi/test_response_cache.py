@@ -0,0 +1,121 @@
+from starlette.testclient import TestClient
+
+import strawberry
+from strawberry.asgi import GraphQL
+from strawberry.cache import CacheControl, CacheScope, InMemoryCacheStore, ResponseCache
+from strawberry.extensions.cache_control import CacheControlExtension
+
+
+def create_schema(calls):
+    @strawberry.type
+    class Query:
+        @strawberry.field(cache_control=CacheControl(max_age=60))
+        def catalog(self) -> str:
+            calls.append("catalog")
+            return "catalog"
+
+        @strawberry.field(
+            cache_control=CacheControl(max_age=60, scope=CacheScope.PRIVATE)
+        )
+        def me(self) -> str:
+            calls.append("me")
+            return "me"
+
+        @strawberry.field(cache_control=CacheControl(max_age=60))
+        async def broken(self) -> str:
+            calls.append("broken")
+            raise ValueError("Broken")
+
+    return strawberry.Schema(query=Query, extensions=[CacheControlExtension])
+
+
+def test_sends_cache_control_header():
+    app = GraphQL(create_schema([]))
+    test_client = TestClient(app)
+
+    response = test_client.post("/", json={"query": "{ catalog }"})
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "max-age=60, public"
+
+    response = test_client.post("/", json={"query": "{ catalog me }"})
+
+    assert response.headers["cache-control"] == "max-age=60, private"
+
+
+def test_responses_with_errors_are_not_cached():
+    calls = []
+    store = InMemoryCacheStore()
+    app = GraphQL(create_schema(calls), response_cache=ResponseCache(store))
+    test_client = TestClient(app)
+
+    for _ in range(2):
+        response = test_client.post("/", json={"query": "{ catalog broken }"})
+
+        assert response.json()["errors"][0]["message"] == "Broken"
+        assert response.headers["cache-control"] == "no-store"
+
+    assert calls == ["catalog", "broken", "catalog", "broken"]
+
+
+def test_no_cache_control_header_without_extension():
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    app = GraphQL(strawberry.Schema(query=Query))
+    test_client = TestClient(app)
+
+    response = test_client.post("/", json={"query": "{ hello }"})
+
+    assert "cache-control" not in response.headers
+
+
+def test_caches_public_responses():
+    calls = []
+    store = InMemoryCacheStore()
+    app = GraphQL(create_schema(calls), response_cache=ResponseCache(store))
+    test_client = TestClient(app)
+
+    for _ in range(3):
+        response = test_client.post("/", json={"query": "{ catalog }"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "data": {"catalog": "catalog"},
+            "extensions": {"cacheControl": {"maxAge": 60, "scope": "PUBLIC"}},
+        }
+        assert response.headers["cache-control"] == "max-age=60, public"
+
+    assert calls == ["catalog"]
+    assert len(store) == 1
+    assert response.headers["age"] == "0"
+
+
+def test_does_not_cache_private_responses():
+    calls = []
+    app = GraphQL(create_schema(calls), response_cache=ResponseCache())
+    test_client = TestClient(app)
+
+    for _ in range(2):
+        test_client.post("/", json={"query": "{ me }"})
+
+    assert calls == ["me", "me"]
+
+
+def test_cache_key_includes_variables():
+    calls = []
+    app = GraphQL(create_schema(calls), response_cache=ResponseCache())
+    test_client = TestClient(app)
+
+    query = "query ($skip: Boolean!) { catalog @skip(if: $skip) }"
+
+    test_client.post("/", json={"query": query, "variables": {"skip": False}})
+    test_client.post("/", json={"query": query, "variables": {"skip": True}})
+    test_client.post("/", json={"query": query, "variables": {"skip": False}})
+
+    assert calls == ["catalog"]
+
+    response = test_client.post("/", json={"query": query, "variables": {"skip": True}})
+
+    assert response.json()["data"] == {}
@@ -0,0 +1,49 @@
+import typing
+
+from starlette.testclient import TestClient
+
+import strawberry
+from strawberry.asgi import GraphQL
+
+
+@strawberry.type
+class Product:
+    id: int
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def products(self, count: int) -> typing.List[Product]:
+        return [Product(id=index, name=f"Product {index}") for index in range(count)]
+
+
+def test_streams_the_response():
+    schema = strawberry.Schema(query=Query)
+    app = GraphQL(schema, stream_responses=True, stream_chunk_size=128)
+    test_client = TestClient(app)
+
+    response = test_client.post(
+        "/", json={"query": "{ products(count: 100) { id name } }"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "content-length" not in response.headers
+
+    products = response.json()["data"]["products"]
+
+    assert len(products) == 100
+    assert products[99] == {"id": 99, "name": "Product 99"}
+
+
+def test_streams_errors():
+    schema = strawberry.Schema(query=Query)
+    test_client = TestClient(GraphQL(schema, stream_responses=True))
+
+    response = test_client.post("/", json={"query": "{ products { id } }"})
+
+    assert response.status_code == 200
+    assert response.json()["data"] is None
+    assert len(response.json()["errors"]) == 1
@@ -5,9 +5,11 @@ from io import BytesIO
 import pytest
 
 from starlette import status
+from starlette.testclient import TestClient
 
 import strawberry
-from strawberry.file_uploads import Upload
+from strawberry.asgi import GraphQL
+from strawberry.file_uploads import Upload, UploadLimits
 
 
 @strawberry.input
@@ -127,3 +129,22 @@ def test_nested_file_list(schema, test_client):
     assert len(data["data"]["readFolder"]) == 2
     assert data["data"]["readFolder"][0] == "strawberry1"
     assert data["data"]["readFolder"][1] == "strawberry2"
+
+
+def test_upload_larger_than_the_limit(schema):
+    app = GraphQL(schema, upload_limits=UploadLimits(max_file_size=5))
+    test_client = TestClient(app)
+
+    query = "mutation($textFile: Upload!) { readText(textFile: $textFile) }"
+
+    response = test_client.post(
+        "/graphql/",
+        data={
+            "operations": json.dumps({"query": query, "variables": {"textFile": None}}),
+            "map": json.dumps({"textFile": ["variables.textFile"]}),
+        },
+        files={"textFile": BytesIO(b"strawberry")},
+    )
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert response.text == "Multipart part larger than 5 bytes"
@@ -0,0 +1,68 @@
+from typing import List
+
+import pytest
+
+from graphql import parse, validate
+
+import strawberry
+from strawberry.tools import depth_limit_validator
+
+
+@strawberry.type
+class User:
+    name: str
+
+    @strawberry.field
+    def friends(self) -> List["User"]:
+        return []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def user(self) -> User:
+        return User(name="Patrick")
+
+
+schema = strawberry.Schema(query=Query)
+
+
+def build_query(size: int) -> str:
+    # each fragment spreads the next one twice, walking the spreads without
+    # memoization takes 2 ** size steps
+    fragments = [
+        f"fragment F{i} on User {{ name ...F{i + 1} friends {{ ...F{i + 1} }} }}"
+        for i in range(size)
+    ]
+    fragments.append(f"fragment F{size} on User {{ name }}")
+
+    return "query read { user { ...F0 } }\n" + "\n".join(fragments)
+
+
+@pytest.mark.parametrize("size", [10, 50, 100])
+def test_depth_limit_validator_with_fragments(benchmark, size):
+    document = parse(build_query(size))
+
+    def run():
+        # a new rule for each run, so that the depths aren't cached
+        rule = depth_limit_validator(max_depth=size + 1, cache_size=0)
+
+        return validate(schema._schema, document, [rule])
+
+    errors = benchmark(run)
+
+    assert not errors
+
+
+@pytest.mark.parametrize("size", [50, 100])
+def test_depth_limit_validator_stops_at_max_depth(benchmark, size):
+    document = parse(build_query(size))
+
+    def run():
+        rule = depth_limit_validator(max_depth=10, cache_size=0)
+
+        return validate(schema._schema, document, [rule])
+
+    errors = benchmark(run)
+
+    assert len(errors) == 1
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from strawberry.cache import InMemoryCacheStore
+
+
+def test_in_memory_store():
+    store = InMemoryCacheStore()
+
+    assert store.get("a") is None
+
+    store.set("a", 1)
+
+    assert store.get("a") == 1
+
+
+def test_in_memory_store_evicts_least_recently_used_values():
+    store = InMemoryCacheStore(max_size=2)
+
+    store.set("a", 1)
+    store.set("b", 2)
+    store.get("a")
+    store.set("c", 3)
+
+    assert len(store) == 2
+    assert store.get("a") == 1
+    assert store.get("b") is None
+    assert store.get("c") == 3
+
+
+def test_in_memory_store_expires_values(mocker):
+    monotonic = mocker.patch(
+        "strawberry.cache.stores.time.monotonic", return_value=100.0
+    )
+
+    store = InMemoryCacheStore()
+    store.set("a", 1, ttl=10)
+
+    assert store.get("a") == 1
+
+    monotonic.return_value = 110.0
+
+    assert store.get("a") is None
+    assert len(store) == 0
+
+
+def test_in_memory_store_can_be_shared_between_threads():
+    store = InMemoryCacheStore(max_size=10)
+
+    def use_store(offset):
+        for index in range(1000):
+            store.set(str(offset + index), index)
+            store.get(str(offset + index - 5))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(use_store, range(0, 4000, 1000)))
+
+    assert len(store) == 10
@@ -1,3 +1,4 @@
+import hashlib
 import json
 
 import pytest
@@ -10,6 +11,7 @@ from django.test.client import RequestFactory
 
 import strawberry
 from strawberry.django.views import AsyncGraphQLView as AsyncBaseGraphQLView
+from strawberry.persisted_queries import PersistedQueries
 
 from .app.models import Example
 
@@ -131,3 +133,65 @@ async def test_async_graphql_query_model():
 
     reset_db = sync_to_async(lambda: Example.objects.all().delete())
     await reset_db()
+
+
+async def test_async_batched_operations():
+    factory = RequestFactory()
+    request = factory.post(
+        "/graphql/",
+        [{"query": "{ helloAsync }"}, {"query": "{ __typename }"}],
+        content_type="application/json",
+    )
+
+    response = await AsyncGraphQLView.as_view(schema=schema, allow_batching=True)(
+        request
+    )
+
+    assert json.loads(response.content.decode()) == [
+        {"data": {"helloAsync": "async strawberry"}},
+        {"data": {"__typename": "Query"}},
+    ]
+
+
+async def test_async_query_via_get():
+    factory = RequestFactory()
+    request = factory.get("/graphql/", {"query": "{ helloAsync }"})
+
+    response = await AsyncGraphQLView.as_view(schema=schema)(request)
+
+    assert response.status_code == 200
+    assert response["ETag"].startswith('W/"')
+    assert json.loads(response.content.decode()) == {
+        "data": {"helloAsync": "async strawberry"}
+    }
+
+
+async def test_async_persisted_queries():
+    query = "{ helloAsync }"
+    extensions = json.dumps(
+        {
+            "persistedQuery": {
+                "version": 1,
+                "sha256Hash": hashlib.sha256(query.encode()).hexdigest(),
+            }
+        }
+    )
+    view = AsyncGraphQLView.as_view(schema=schema, persisted_queries=PersistedQueries())
+
+    factory = RequestFactory()
+    request = factory.get("/graphql/", {"extensions": extensions})
+    response = await view(request)
+
+    assert json.loads(response.content.decode())["errors"][0]["message"] == (
+        "PersistedQueryNotFound"
+    )
+
+    request = factory.get("/graphql/", {"query": query, "extensions": extensions})
+    response = await view(request)
+
+    request = factory.get("/graphql/", {"extensions": extensions})
+    response = await view(request)
+
+    assert json.loads(response.content.decode()) == {
+        "data": {"helloAsync": "async strawberry"}
+    }
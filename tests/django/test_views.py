@@ -329,3 +329,60 @@ def test_can_change_status_code():
 
     assert response.status_code == 418
     assert data == {"data": {"abc": "ABC"}}
+
+
+def test_batched_operations():
+    factory = RequestFactory()
+
+    request = factory.post(
+        "/graphql/",
+        [{"query": "{ hello }"}, {"query": "{ __typename }"}],
+        content_type="application/json",
+    )
+
+    response = GraphQLView.as_view(schema=schema, allow_batching=True)(request)
+
+    assert response.status_code == 200
+    assert json.loads(response.content.decode()) == [
+        {"data": {"hello": "strawberry"}},
+        {"data": {"__typename": "Query"}},
+    ]
+
+
+def test_fails_when_batching_is_disabled():
+    factory = RequestFactory()
+
+    request = factory.post(
+        "/graphql/", [{"query": "{ hello }"}], content_type="application/json"
+    )
+
+    with pytest.raises(SuspiciousOperation) as e:
+        GraphQLView.as_view(schema=schema)(request)
+
+    assert e.value.args == ("Batched operations are not enabled",)
+
+
+def test_query_via_get():
+    factory = RequestFactory()
+
+    request = factory.get("/graphql/", {"query": "{ hello }"}, HTTP_ACCEPT="text/html")
+    response = GraphQLView.as_view(schema=schema)(request)
+
+    assert response.status_code == 200
+    assert json.loads(response.content.decode()) == {"data": {"hello": "strawberry"}}
+
+    etag = response["ETag"]
+    request = factory.get("/graphql/", {"query": "{ hello }"}, HTTP_IF_NONE_MATCH=etag)
+    response = GraphQLView.as_view(schema=schema)(request)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+def test_mutations_are_not_allowed_via_get():
+    factory = RequestFactory()
+
+    request = factory.get("/graphql/", {"query": "mutation { __typename }"})
+    response = GraphQLView.as_view(schema=schema)(request)
+
+    assert response.status_code == 405
@@ -1,6 +1,9 @@
 import typing
 
+import pytest
+
 import strawberry
+from strawberry.dataloader import DataLoader
 
 
 def test_fetch_entities():
@@ -84,3 +87,206 @@ def test_info_param_in_resolve_reference():
         "GraphQLResolveInfo(field_name='_entities', field_nodes=[FieldNode"
         in result.data["_entities"][0]["info"]
     )
+
+
+@pytest.mark.asyncio
+async def test_fetch_entities_with_async_resolve_reference():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        async def resolve_reference(cls, upc):
+            return Product(upc)
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:
+            return []
+
+    schema = strawberry.federation.Schema(query=Query)
+
+    query = """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product {
+                    upc
+                }
+            }
+        }
+    """
+
+    result = await schema.execute(
+        query,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Product", "upc": "2"},
+            ]
+        },
+    )
+
+    assert not result.errors
+
+    assert result.data == {"_entities": [{"upc": "1"}, {"upc": "2"}]}
+
+
+@pytest.mark.asyncio
+async def test_fetch_entities_are_batched_with_dataloaders():
+    batches = []
+
+    async def load_products(keys):
+        batches.append(keys)
+        return [Product(upc=key, name=f"Product {key}") for key in keys]
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+        name: str
+
+        @classmethod
+        def resolve_reference(cls, info, upc):
+            return info.context["product_loader"].load(upc)
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:
+            return []
+
+    schema = strawberry.federation.Schema(query=Query)
+
+    query = """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product {
+                    upc
+                    name
+                }
+            }
+        }
+    """
+
+    result = await schema.execute(
+        query,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Product", "upc": "2"},
+                {"__typename": "Product", "upc": "1"},
+            ]
+        },
+        context_value={"product_loader": DataLoader(load_fn=load_products)},
+    )
+
+    assert not result.errors
+
+    assert result.data == {
+        "_entities": [
+            {"upc": "1", "name": "Product 1"},
+            {"upc": "2", "name": "Product 2"},
+            {"upc": "1", "name": "Product 1"},
+        ]
+    }
+    assert batches == [["1", "2"]]
+
+
+@pytest.mark.asyncio
+async def test_entity_loaders_are_shared_with_the_other_fields():
+    batches = []
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+        name: str
+
+        @classmethod
+        async def resolve_references(cls, representations, info):
+            batches.append(
+                [representation["upc"] for representation in representations]
+            )
+
+            return [
+                Product(
+                    upc=representation["upc"], name=f"Product {representation['upc']}"
+                )
+                for representation in representations
+            ]
+
+    @strawberry.type
+    class Review:
+        upc: str
+
+        @strawberry.field
+        async def product(self, info) -> Product:
+            loader = strawberry.federation.get_entity_loader(info, Product)
+            return await loader.load({"upc": self.upc})
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def reviews(self) -> typing.List[Review]:
+            return [Review(upc="1"), Review(upc="3")]
+
+    schema = strawberry.federation.Schema(query=Query)
+
+    query = """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product {
+                    upc
+                    name
+                }
+            }
+            reviews {
+                product {
+                    name
+                }
+            }
+        }
+    """
+
+    result = await schema.execute(
+        query,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Product", "upc": "2"},
+                {"__typename": "Product", "upc": "1"},
+            ]
+        },
+    )
+
+    assert not result.errors
+
+    assert result.data == {
+        "_entities": [
+            {"upc": "1", "name": "Product 1"},
+            {"upc": "2", "name": "Product 2"},
+            {"upc": "1", "name": "Product 1"},
+        ],
+        "reviews": [
+            {"product": {"name": "Product 1"}},
+            {"product": {"name": "Product 3"}},
+        ],
+    }
+    # the references are loaded in a single batch, and the product already
+    # loaded for them isn't loaded again for the reviews
+    assert batches[0] == ["1", "2"]
+    assert sorted(sum(batches, [])) == ["1", "2", "3"]
+
+
+def test_entity_loaders_need_an_execution():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        async def resolve_references(cls, representations):
+            return [
+                Product(upc=representation["upc"]) for representation in representations
+            ]
+
+    with pytest.raises(RuntimeError):
+        strawberry.federation.get_entity_loader(None, Product)
@@ -0,0 +1,81 @@
+import pytest
+
+from strawberry.exceptions import UploadTooLargeError
+from strawberry.file_uploads import UploadLimits
+from strawberry.file_uploads.parser import parse_multipart_form
+
+
+pytestmark = pytest.mark.asyncio
+
+CONTENT_TYPE = "multipart/form-data; boundary=boundary"
+
+
+def create_body(*parts):
+    body = b""
+
+    for headers, content in parts:
+        body += b"--boundary\r\n" + headers + b"\r\n\r\n" + content + b"\r\n"
+
+    return body + b"--boundary--\r\n"
+
+
+async def stream(body, chunk_size=7):
+    for index in range(0, len(body), chunk_size):
+        yield body[index : index + chunk_size]  # noqa: E203
+
+
+BODY = create_body(
+    (b'Content-Disposition: form-data; name="operations"', b'{"query": "{ a }"}'),
+    (
+        b'Content-Disposition: form-data; name="0"; filename="a.txt"\r\n'
+        b"Content-Type: text/plain",
+        b"strawberry" * 10,
+    ),
+)
+
+
+async def test_parses_fields_and_files():
+    fields, files = await parse_multipart_form(
+        stream(BODY), CONTENT_TYPE, UploadLimits()
+    )
+
+    assert fields == {"operations": '{"query": "{ a }"}'}
+    assert files["0"].filename == "a.txt"
+    assert files["0"].content_type == "text/plain"
+    assert files["0"].size == 100
+    assert files["0"].in_memory
+    assert await files["0"].read() == b"strawberry" * 10
+
+
+async def test_spools_large_files_to_disk():
+    fields, files = await parse_multipart_form(
+        stream(BODY), CONTENT_TYPE, UploadLimits(max_memory_size=50)
+    )
+
+    assert not files["0"].in_memory
+    assert b"".join([chunk async for chunk in files["0"]]) == b"strawberry" * 10
+
+    await files["0"].close()
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [
+        UploadLimits(max_file_size=99),
+        UploadLimits(max_files=0),
+        UploadLimits(max_field_size=10),
+    ],
+)
+async def test_limits(limits):
+    with pytest.raises(UploadTooLargeError):
+        await parse_multipart_form(stream(BODY), CONTENT_TYPE, limits)
+
+
+async def test_incomplete_body():
+    with pytest.raises(ValueError):
+        await parse_multipart_form(stream(BODY[:-20]), CONTENT_TYPE, UploadLimits())
+
+
+async def test_missing_boundary():
+    with pytest.raises(ValueError):
+        await parse_multipart_form(stream(BODY), "multipart/form-data", UploadLimits())
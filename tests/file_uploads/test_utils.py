@@ -3,17 +3,18 @@ from io import BytesIO
 from strawberry.file_uploads.utils import replace_placeholders_with_files
 
 
-def test_does_deep_copy():
+def test_replaces_in_place():
     operations = {
         "query": "mutation($file: Upload!) { upload_file(file: $file) { id } }",
         "variables": {"file": None},
     }
-    files_map = {}
-    files = {}
+    files_map = {"0": ["variables.file"]}
+    file0 = BytesIO()
+    files = {"0": file0}
 
     result = replace_placeholders_with_files(operations, files_map, files)
-    assert result == operations
-    assert result is not operations
+    assert result is operations
+    assert operations["variables"]["file"] is file0
 
 
 def test_empty_files_map():
@@ -105,3 +105,59 @@ def test_custom_process_result():
 
         assert response.status_code == 200
         assert data == {}
+
+
+def test_batched_operations():
+    app = create_app(allow_batching=True)
+
+    with app.test_client() as client:
+        response = client.post(
+            "/graphql", json=[{"query": "{ hello }"}, {"query": "{ __typename }"}]
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.data.decode()) == [
+        {"data": {"hello": "strawberry"}},
+        {"data": {"__typename": "Query"}},
+    ]
+
+
+def test_batched_operations_disabled(flask_client):
+    response = flask_client.post("/graphql", json=[{"query": "{ hello }"}])
+
+    assert response.status_code == 400
+    assert response.data.decode() == "Batched operations are not enabled"
+
+
+def test_query_via_get(flask_client):
+    response = flask_client.get(
+        "/graphql", query_string={"query": "{ hello }"}, headers={"Accept": "text/html"}
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.data.decode()) == {"data": {"hello": "strawberry"}}
+
+    etag = response.headers["ETag"]
+    response = flask_client.get(
+        "/graphql", query_string={"query": "{ hello }"}, headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_mutations_are_not_allowed_via_get(flask_client):
+    response = flask_client.get(
+        "/graphql", query_string={"query": "mutation { __typename }"}
+    )
+
+    assert response.status_code == 405
+
+
+def test_invalid_json_body(flask_client):
+    response = flask_client.post(
+        "/graphql", data='{"query": ', content_type="application/json"
+    )
+
+    assert response.status_code == 400
+    assert response.data.decode() == "Unable to parse request body as JSON"
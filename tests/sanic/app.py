@@ -45,7 +45,11 @@ def create_app(**kwargs):
     app = Sanic(f"test-app-{random()}")
 
     app.add_route(
-        GraphQLView.as_view(schema=schema, graphiql=kwargs.get("graphiql", True)),
+        GraphQLView.as_view(
+            schema=schema,
+            graphiql=kwargs.get("graphiql", True),
+            allow_batching=kwargs.get("allow_batching", False),
+        ),
         "/graphql",
     )
     return app
@@ -100,3 +100,50 @@ def test_malformed_query(sanic_client):
 
     request, response = sanic_client.test_client.post("/graphql", json=query)
     assert response.status == 400
+
+
+def test_batched_operations():
+    app = create_app(allow_batching=True)
+
+    request, response = app.test_client.post(
+        "/graphql", json=[{"query": "{ hello }"}, {"query": "{ __typename }"}]
+    )
+
+    assert response.status == 200
+    assert response.json == [
+        {"data": {"hello": "strawberry"}},
+        {"data": {"__typename": "Query"}},
+    ]
+
+
+def test_batched_operations_disabled(sanic_client):
+    request, response = sanic_client.test_client.post(
+        "/graphql", json=[{"query": "{ hello }"}]
+    )
+
+    assert response.status == 400
+
+
+def test_query_via_get(sanic_client):
+    request, response = sanic_client.test_client.get(
+        "/graphql", params={"query": "{ hello }"}
+    )
+
+    assert response.status == 200
+    assert response.json == {"data": {"hello": "strawberry"}}
+
+    etag = response.headers["ETag"]
+    request, response = sanic_client.test_client.get(
+        "/graphql", params={"query": "{ hello }"}, headers={"If-None-Match": etag}
+    )
+
+    assert response.status == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_mutations_are_not_allowed_via_get(sanic_client):
+    request, response = sanic_client.test_client.get(
+        "/graphql", params={"query": "mutation { __typename }"}
+    )
+
+    assert response.status == 405
@@ -1,3 +1,6 @@
+import typing
+from functools import partial
+
 import pytest
 
 from freezegun import freeze_time
@@ -200,3 +203,80 @@ async def test_should_not_trace_introspection_async_queries(mocker):
             "parsing": {"startOffset": 0, "duration": 0},
         }
     }
+
+
+@strawberry.type
+class SampledQuery:
+    @strawberry.field
+    def numbers(self) -> typing.List[int]:
+        return [1, 2]
+
+    @strawberry.field
+    async def example(self) -> str:
+        return "Hi"
+
+
+@pytest.mark.asyncio
+async def test_requests_that_are_not_sampled_are_not_traced(mocker):
+    mocker.patch("strawberry.extensions.tracing.apollo.random.random", return_value=0.5)
+
+    schema = strawberry.Schema(
+        query=SampledQuery,
+        extensions=[partial(ApolloTracingExtension, sample_rate=0.1)],
+    )
+
+    result = await schema.execute("{ example numbers }")
+
+    assert not result.errors
+    assert result.data == {"example": "Hi", "numbers": [1, 2]}
+    assert not result.extensions
+
+
+@pytest.mark.asyncio
+async def test_sample_rate(mocker):
+    mocker.patch(
+        "strawberry.extensions.tracing.apollo.random.random", return_value=0.05
+    )
+
+    schema = strawberry.Schema(
+        query=SampledQuery,
+        extensions=[partial(ApolloTracingExtension, sample_rate=0.1)],
+    )
+
+    result = await schema.execute("{ example numbers }")
+
+    resolvers = result.extensions["tracing"]["execution"]["resolvers"]
+
+    assert [resolver["path"] for resolver in resolvers] == [["example"], ["numbers"]]
+
+
+def test_should_sample():
+    schema = strawberry.Schema(
+        query=SampledQuery,
+        extensions=[
+            partial(
+                ApolloTracingExtension,
+                should_sample=lambda execution_context: execution_context.context[
+                    "trace"
+                ],
+            )
+        ],
+    )
+
+    result = schema.execute_sync("{ numbers }", context_value={"trace": True})
+    assert result.extensions["tracing"]["execution"]["resolvers"][0]["path"] == [
+        "numbers"
+    ]
+
+    result = schema.execute_sync("{ numbers }", context_value={"trace": False})
+    assert not result.extensions
+
+
+def test_tracing_of_rejected_operations():
+    schema = strawberry.Schema(query=SampledQuery, extensions=[ApolloTracingExtension])
+
+    result = schema.execute_sync("{ missing }")
+
+    assert result.errors
+    assert result.extensions["tracing"]["execution"] == {"resolvers": []}
+    assert result.extensions["tracing"]["duration"] >= 0
@@ -0,0 +1,268 @@
+import base64
+import json
+import typing
+from functools import partial
+
+import pytest
+
+import strawberry
+from strawberry.extensions.tracing import ApolloFederationTracingExtension
+
+
+def decode_varint(data: bytes, position: int) -> typing.Tuple[int, int]:
+    value = shift = 0
+
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+        if not byte & 0x80:
+            return value, position
+
+
+def decode_message(data: bytes) -> typing.Dict[int, typing.List[typing.Any]]:
+    """Decodes the fields of a protobuf message, the nested messages are left
+    as bytes"""
+
+    fields: typing.Dict[int, typing.List[typing.Any]] = {}
+    position = 0
+
+    while position < len(data):
+        key, position = decode_varint(data, position)
+        number, wire_type = key >> 3, key & 7
+
+        if wire_type == 0:
+            value, position = decode_varint(data, position)
+        else:
+            assert wire_type == 2
+            length, position = decode_varint(data, position)
+            end = position + length
+            value = data[position:end]
+            position = end
+
+        fields.setdefault(number, []).append(value)
+
+    return fields
+
+
+def decode_node(data: bytes) -> typing.Dict[str, typing.Any]:
+    fields = decode_message(data)
+    node: typing.Dict[str, typing.Any] = {}
+
+    if 1 in fields:
+        node["response_name"] = fields[1][0].decode()
+    if 2 in fields:
+        node["index"] = fields[2][0]
+    if 3 in fields:
+        node["type"] = fields[3][0].decode()
+    if 13 in fields:
+        node["parent_type"] = fields[13][0].decode()
+    if 14 in fields:
+        node["original_field_name"] = fields[14][0].decode()
+    if 8 in fields:
+        node["start_time"] = fields[8][0]
+        node["end_time"] = fields[9][0]
+    if 11 in fields:
+        node["errors"] = [
+            {
+                "message": decode_message(error)[1][0].decode(),
+                "json": json.loads(decode_message(error)[4][0]),
+            }
+            for error in fields[11]
+        ]
+    if 12 in fields:
+        node["children"] = [decode_node(child) for child in fields[12]]
+
+    return node
+
+
+def decode_trace(ftv1: str) -> typing.Dict[int, typing.List[typing.Any]]:
+    return decode_message(base64.b64decode(ftv1))
+
+
+def strip_timings(node: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    node = {
+        key: value
+        for key, value in node.items()
+        if key not in ("start_time", "end_time")
+    }
+
+    if "children" in node:
+        node["children"] = [strip_timings(child) for child in node["children"]]
+
+    return node
+
+
+@strawberry.type
+class Review:
+    body: str
+
+
+@strawberry.type
+class Product:
+    upc: str
+
+    @strawberry.field
+    async def reviews(self) -> typing.List[Review]:
+        return [Review(body="Great"), Review(body="Bad")]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def top_products(self) -> typing.List[Product]:
+        return [Product(upc="1")]
+
+    @strawberry.field
+    def fail(self) -> typing.Optional[str]:
+        raise ValueError("Failed")
+
+
+class Request:
+    def __init__(self, headers: typing.Dict[str, str]):
+        self.headers = headers
+
+
+schema = strawberry.Schema(query=Query, extensions=[ApolloFederationTracingExtension])
+
+
+@pytest.mark.asyncio
+async def test_trace_tree():
+    result = await schema.execute(
+        "{ products: topProducts { upc reviews { body } } }",
+        context_value={"request": Request({"apollo-federation-include-trace": "ftv1"})},
+    )
+
+    assert not result.errors
+
+    trace = decode_trace(result.extensions["ftv1"])
+    root = decode_node(trace[14][0])
+
+    assert trace[11][0] > 0
+    assert strip_timings(root) == {
+        "children": [
+            {
+                "response_name": "products",
+                "type": "[Product!]!",
+                "parent_type": "Query",
+                "original_field_name": "topProducts",
+                "children": [
+                    {
+                        "index": 0,
+                        "children": [
+                            {
+                                "response_name": "upc",
+                                "type": "String!",
+                                "parent_type": "Product",
+                            },
+                            {
+                                "response_name": "reviews",
+                                "type": "[Review!]!",
+                                "parent_type": "Product",
+                                "children": [
+                                    {
+                                        "index": 0,
+                                        "children": [
+                                            {
+                                                "response_name": "body",
+                                                "type": "String!",
+                                                "parent_type": "Review",
+                                            }
+                                        ],
+                                    },
+                                    {
+                                        "index": 1,
+                                        "children": [
+                                            {
+                                                "response_name": "body",
+                                                "type": "String!",
+                                                "parent_type": "Review",
+                                            }
+                                        ],
+                                    },
+                                ],
+                            },
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+    products = root["children"][0]
+    assert products["end_time"] >= products["start_time"] > 0
+
+
+def test_errors_are_added_to_their_node():
+    result = schema.execute_sync(
+        "{ fail }",
+        context_value={"request": Request({"apollo-federation-include-trace": "ftv1"})},
+    )
+
+    root = decode_node(decode_trace(result.extensions["ftv1"])[14][0])
+
+    assert root["children"][0]["errors"] == [
+        {
+            "message": "Failed",
+            "json": {
+                "message": "Failed",
+                "locations": [{"line": 1, "column": 3}],
+                "path": ["fail"],
+            },
+        }
+    ]
+
+
+def test_validation_errors_are_added_to_the_root():
+    result = schema.execute_sync(
+        "{ missing }",
+        context_value={"request": Request({"apollo-federation-include-trace": "ftv1"})},
+    )
+
+    root = decode_node(decode_trace(result.extensions["ftv1"])[14][0])
+
+    assert root["errors"][0]["message"] == (
+        "Cannot query field 'missing' on type 'Query'."
+    )
+
+
+def test_no_trace_without_the_header():
+    result = schema.execute_sync(
+        "{ topProducts { upc } }", context_value={"request": Request({})}
+    )
+
+    assert not result.errors
+    assert not result.extensions
+
+    result = schema.execute_sync("{ topProducts { upc } }")
+
+    assert not result.extensions
+
+
+def test_should_trace():
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            partial(
+                ApolloFederationTracingExtension,
+                should_trace=lambda execution_context: True,
+            )
+        ],
+    )
+
+    result = schema.execute_sync("{ topProducts { upc } }")
+
+    assert "ftv1" in result.extensions
+
+
+def test_introspection_is_not_traced():
+    result = schema.execute_sync(
+        "{ __typename }",
+        context_value={"request": Request({"apollo-federation-include-trace": "ftv1"})},
+    )
+
+    root = decode_node(decode_trace(result.extensions["ftv1"])[14][0])
+
+    assert root == {}
@@ -0,0 +1,145 @@
+import typing
+
+import pytest
+
+import strawberry
+from strawberry.cache import CacheControl, CacheScope
+from strawberry.extensions.cache_control import CacheControlExtension
+
+
+@strawberry.type(cache_control=CacheControl(max_age=60))
+class Product:
+    name: str
+    price: float = strawberry.field(cache_control=CacheControl(max_age=30))
+    stock: int = strawberry.field(
+        cache_control=CacheControl(max_age=120, scope=CacheScope.PRIVATE)
+    )
+
+
+@strawberry.type
+class User:
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field(cache_control=CacheControl(max_age=300))
+    def products(self) -> typing.List[Product]:
+        return [Product(name="Strawberry", price=1.5, stock=10)]
+
+    @strawberry.field
+    def product(self) -> Product:
+        return Product(name="Strawberry", price=1.5, stock=10)
+
+    @strawberry.field
+    def me(self) -> User:
+        return User(name="Patrick")
+
+    @strawberry.field(cache_control=CacheControl(max_age=10))
+    def hello(self) -> str:
+        return "world"
+
+    @strawberry.field(cache_control=CacheControl(max_age=10))
+    def broken(self) -> str:
+        raise ValueError("Broken")
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation(cache_control=CacheControl(max_age=10))
+    def buy(self) -> Product:
+        return Product(name="Strawberry", price=1.5, stock=9)
+
+
+schema = strawberry.Schema(
+    query=Query, mutation=Mutation, extensions=[CacheControlExtension]
+)
+
+
+def test_uses_lowest_max_age():
+    result = schema.execute_sync("{ products { name price } }")
+
+    assert not result.errors
+    assert result.extensions == {"cacheControl": {"maxAge": 30, "scope": "PUBLIC"}}
+
+
+def test_field_hints_take_precedence_over_type_hints():
+    result = schema.execute_sync("{ products { name } }")
+
+    assert result.extensions == {"cacheControl": {"maxAge": 300, "scope": "PUBLIC"}}
+
+
+def test_object_types_use_their_hint_and_scalars_inherit_it():
+    result = schema.execute_sync("{ product { name } }")
+
+    assert result.extensions == {"cacheControl": {"maxAge": 60, "scope": "PUBLIC"}}
+
+
+def test_private_scope():
+    result = schema.execute_sync("{ products { name stock } }")
+
+    assert result.extensions == {"cacheControl": {"maxAge": 120, "scope": "PRIVATE"}}
+
+
+def test_fields_without_hints_use_the_default_max_age():
+    result = schema.execute_sync("{ hello me { name } }")
+
+    assert result.extensions == {"cacheControl": {"maxAge": 0, "scope": "PUBLIC"}}
+
+
+def test_custom_default_max_age():
+    def extension(**kwargs):
+        return CacheControlExtension(default_max_age=5, **kwargs)
+
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    result = schema.execute_sync("{ hello me { name } }")
+
+    assert result.extensions == {"cacheControl": {"maxAge": 5, "scope": "PUBLIC"}}
+
+
+@pytest.mark.asyncio
+async def test_responses_with_errors_are_not_cacheable():
+    result = await schema.execute("{ hello broken }")
+
+    assert result.errors
+    assert result.extensions == {"cacheControl": {"maxAge": 0, "scope": "PUBLIC"}}
+
+    result = schema.execute_sync("{ hello broken }")
+
+    assert result.errors
+    assert result.extensions == {"cacheControl": {"maxAge": 0, "scope": "PUBLIC"}}
+
+
+def test_fragments():
+    query = """
+        query {
+            products { ...ProductFragment }
+            otherProducts: products { ...ProductFragment }
+        }
+
+        fragment ProductFragment on Product {
+            ... on Product {
+                price
+            }
+        }
+    """
+
+    result = schema.execute_sync(query)
+
+    assert not result.errors
+    assert result.extensions == {"cacheControl": {"maxAge": 30, "scope": "PUBLIC"}}
+
+
+def test_mutations_are_not_cacheable():
+    result = schema.execute_sync("mutation { buy { name } }")
+
+    assert not result.errors
+    assert result.extensions == {"cacheControl": {"maxAge": 0, "scope": "PUBLIC"}}
+
+
+def test_invalid_queries_are_not_cacheable():
+    result = schema.execute_sync("{ hello ")
+
+    assert result.errors
+    assert result.extensions == {"cacheControl": {"maxAge": 0, "scope": "PUBLIC"}}
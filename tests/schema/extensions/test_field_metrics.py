@@ -0,0 +1,153 @@
+import asyncio
+import typing
+from functools import partial
+
+import pytest
+
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+import strawberry
+from strawberry.extensions.field_metrics import (
+    FieldMetrics,
+    FieldMetricsExtension,
+    FieldStats,
+    LatencyHistogram,
+)
+
+
+@strawberry.type
+class User:
+    name: str
+
+    @strawberry.field
+    async def friends(self) -> typing.List[str]:
+        await asyncio.sleep(0)
+        return ["Marco"]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def user(self) -> User:
+        return User(name="Patrick")
+
+    @strawberry.field
+    def fail(self) -> typing.Optional[str]:
+        raise ValueError("Failed")
+
+    @strawberry.field
+    async def async_fail(self) -> typing.Optional[str]:
+        raise ValueError("Failed")
+
+
+def create_schema(metrics: FieldMetrics) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query, extensions=[partial(FieldMetricsExtension, metrics=metrics)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_records_the_resolvers():
+    metrics = FieldMetrics()
+    schema = create_schema(metrics)
+
+    for _ in range(3):
+        result = await schema.execute(
+            "{ user { name friends } fail asyncFail __typename }"
+        )
+        assert result.data["user"] == {"name": "Patrick", "friends": ["Marco"]}
+
+    stats = metrics.get_stats()
+
+    # default resolvers and introspection fields aren't measured
+    assert sorted(stats) == [
+        "Query.asyncFail",
+        "Query.fail",
+        "Query.user",
+        "User.friends",
+    ]
+    assert stats["Query.user"].count == 3
+    assert stats["Query.user"].errors == 0
+    assert stats["Query.fail"].errors == 3
+    assert stats["Query.asyncFail"].errors == 3
+    assert stats["User.friends"].count == 3
+    assert 0 < stats["User.friends"].p50 <= stats["User.friends"].p99
+
+
+def test_records_sync_executions():
+    metrics = FieldMetrics()
+    schema = create_schema(metrics)
+
+    schema.execute_sync("{ user { name } }")
+
+    assert metrics.get_stats()["Query.user"].count == 1
+
+    metrics.reset()
+
+    assert metrics.get_stats() == {}
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram(bounds=(0.001, 0.01, 0.1))
+
+    for _ in range(90):
+        histogram.record(0.0005)
+
+    for _ in range(9):
+        histogram.record(0.005)
+
+    histogram.record(0.5, error=True)
+
+    assert histogram.get_stats() == FieldStats(
+        count=100,
+        errors=1,
+        total=pytest.approx(90 * 0.0005 + 9 * 0.005 + 0.5),
+        p50=0.001,
+        p95=0.01,
+        p99=0.01,
+    )
+    assert histogram.get_percentile(100) == 0.5
+
+
+def test_histogram_percentiles_are_capped_to_the_maximum():
+    histogram = LatencyHistogram(bounds=(0.001, 0.01, 0.1))
+    histogram.record(0.002)
+
+    assert histogram.get_percentile(50) == 0.002
+    assert LatencyHistogram().get_percentile(50) == 0
+
+
+def test_prometheus_format():
+    metrics = FieldMetrics(buckets=(0.01, 0.1), prefix="gql")
+    metrics.record("Query", "user", 0.05)
+    metrics.record("Query", "user", 0.2, error=True)
+
+    assert metrics.to_prometheus() == (
+        "# HELP gql_field_duration_seconds "
+        "Duration of the resolvers of the fields.\n"
+        "# TYPE gql_field_duration_seconds histogram\n"
+        'gql_field_duration_seconds_bucket{type="Query",field="user",le="0.01"} 0\n'
+        'gql_field_duration_seconds_bucket{type="Query",field="user",le="0.1"} 1\n'
+        'gql_field_duration_seconds_bucket{type="Query",field="user",le="+Inf"} 2\n'
+        'gql_field_duration_seconds_sum{type="Query",field="user"} 0.25\n'
+        'gql_field_duration_seconds_count{type="Query",field="user"} 2\n'
+        "# HELP gql_field_errors_total "
+        "Errors raised by the resolvers of the fields.\n"
+        "# TYPE gql_field_errors_total counter\n"
+        'gql_field_errors_total{type="Query",field="user"} 1\n'
+    )
+
+
+def test_asgi_app():
+    metrics = FieldMetrics()
+    metrics.record("Query", "user", 0.05)
+
+    app = Starlette()
+    app.mount("/metrics", metrics.asgi_app())
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert response.text == metrics.to_prometheus()
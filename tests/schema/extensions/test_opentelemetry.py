@@ -1,3 +1,7 @@
+import typing
+from functools import partial
+from unittest import mock
+
 import pytest
 
 from opentelemetry.trace import SpanKind
@@ -11,7 +15,12 @@ from strawberry.extensions.tracing.opentelemetry import (
 
 @pytest.fixture
 def global_tracer_mock(mocker):
-    return mocker.patch("strawberry.extensions.tracing.opentelemetry.trace.get_tracer")
+    tracer_mock = mocker.patch(
+        "strawberry.extensions.tracing.opentelemetry.trace.get_tracer"
+    )
+    tracer_mock.return_value.start_span.return_value.is_recording.return_value = True
+
+    return tracer_mock
 
 
 @strawberry.type
@@ -96,6 +105,7 @@ async def test_open_tracing(global_tracer_mock, mocker):
     global_tracer_mock.return_value.start_span.assert_has_calls(
         [
             mocker.call("GraphQL Query", kind=SpanKind.SERVER),
+            mocker.call().is_recording(),
             mocker.call().set_attribute("component", "graphql"),
             mocker.call().set_attribute("query", query),
             mocker.call("person", kind=SpanKind.SERVER),
@@ -125,6 +135,7 @@ async def test_open_tracing_uses_operation_name(global_tracer_mock, mocker):
     global_tracer_mock.return_value.start_span.assert_has_calls(
         [
             mocker.call("GraphQL Query: Example", kind=SpanKind.SERVER),
+            mocker.call().is_recording(),
             mocker.call().set_attribute("component", "graphql"),
             mocker.call().set_attribute("query", query),
             mocker.call("person", kind=SpanKind.SERVER),
@@ -196,3 +207,102 @@ async def test_tracing_filter_kwargs(global_tracer_mock, mocker):
             mocker.call().__enter__().set_attribute("graphql.param.name", "[...]"),
         ]
     )
+
+
+@strawberry.type
+class Author:
+    @strawberry.field
+    def books(self, first: int) -> typing.List[str]:
+        return ["Dune"] * first
+
+
+@strawberry.type
+class NestedQuery:
+    @strawberry.field
+    def authors(self) -> typing.List[Author]:
+        return [Author(), Author()]
+
+    @strawberry.field
+    def hi(self, name: str) -> str:
+        return f"Hi {name}"
+
+
+def get_span_names(global_tracer_mock) -> typing.List[str]:
+    return [
+        call.args[0]
+        for call in global_tracer_mock.return_value.start_span.call_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_does_nothing_when_the_span_is_not_recording(global_tracer_mock):
+    root_span = global_tracer_mock.return_value.start_span.return_value
+    root_span.is_recording.return_value = False
+
+    arg_filter = mock.Mock()
+
+    schema = strawberry.Schema(
+        query=NestedQuery,
+        extensions=[partial(OpenTelemetryExtension, arg_filter=arg_filter)],
+    )
+
+    result = await schema.execute('{ hi(name: "Patrick") authors { books(first: 1) } }')
+
+    assert not result.errors
+    assert get_span_names(global_tracer_mock) == ["GraphQL Query"]
+    root_span.set_attribute.assert_not_called()
+    root_span.end.assert_called_once_with()
+    arg_filter.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_max_depth(global_tracer_mock):
+    schema = strawberry.Schema(
+        query=NestedQuery,
+        extensions=[partial(OpenTelemetryExtension, max_depth=1)],
+    )
+
+    result = await schema.execute("{ authors { books(first: 1) } }")
+
+    assert not result.errors
+    assert get_span_names(global_tracer_mock) == ["GraphQL Query", "authors"]
+
+
+def test_field_allowlist(global_tracer_mock):
+    schema = strawberry.Schema(
+        query=NestedQuery,
+        extensions=[
+            partial(OpenTelemetryExtensionSync, field_allowlist=["Author.books"])
+        ],
+    )
+
+    result = schema.execute_sync('{ hi(name: "Patrick") authors { books(first: 1) } }')
+
+    assert not result.errors
+    assert get_span_names(global_tracer_mock) == ["GraphQL Query", "books", "books"]
+
+
+@pytest.mark.asyncio
+async def test_arg_filter_gets_a_copy_of_the_arguments(global_tracer_mock):
+    received = []
+
+    def arg_filter(kwargs, info):
+        received.append(kwargs)
+        kwargs.pop("name")
+        kwargs["friends"][0] = "***"
+        return kwargs
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hi(self, name: str, friends: typing.List[str]) -> str:
+            return f"Hi {name} and {', '.join(friends)}"
+
+    schema = strawberry.Schema(
+        query=Query, extensions=[partial(OpenTelemetryExtension, arg_filter=arg_filter)]
+    )
+
+    result = await schema.execute('{ hi(name: "Patrick", friends: ["Marco"]) }')
+
+    assert result.data == {"hi": "Hi Patrick and Marco"}
+    assert received == [{"friends": ["***"]}]
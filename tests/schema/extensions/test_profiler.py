@@ -0,0 +1,211 @@
+import os
+import pstats
+import typing
+from functools import partial
+
+import pytest
+
+import strawberry
+from strawberry.extensions.profiler import (
+    BaseProfiler,
+    ProfiledFunction,
+    ProfilerExtension,
+)
+
+
+def slow_function() -> str:
+    return "".join(str(number) for number in range(1000))
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        slow_function()
+        return "world"
+
+    @strawberry.field
+    async def async_hello(self) -> str:
+        slow_function()
+        return "world"
+
+
+class Request:
+    def __init__(self, headers: typing.Dict[str, str]):
+        self.headers = headers
+
+
+def create_schema(**options) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query, extensions=[partial(ProfilerExtension, **options)]
+    )
+
+
+def test_profiles_the_requests_sending_the_header():
+    schema = create_schema(header="x-profile", include_summary=True)
+
+    result = schema.execute_sync(
+        "{ hello }", context_value={"request": Request({"x-profile": "1"})}
+    )
+
+    assert not result.errors
+
+    profile = result.extensions["profile"]
+
+    assert profile["path"] is None
+    assert len(profile["functions"]) == 20
+    assert set(profile["functions"][0]) == {
+        "function",
+        "calls",
+        "totalTime",
+        "cumulativeTime",
+    }
+
+    result = schema.execute_sync("{ hello }", context_value={"request": Request({})})
+
+    assert not result.extensions
+
+
+@pytest.mark.asyncio
+async def test_profiles_the_operations_by_name():
+    schema = create_schema(operation_names=["Profiled"], include_summary=True)
+
+    result = await schema.execute(
+        "query Profiled { asyncHello }", operation_name="Profiled"
+    )
+
+    assert "profile" in result.extensions
+
+    result = await schema.execute("query Other { asyncHello }", operation_name="Other")
+
+    assert not result.extensions
+
+
+def test_summary_size():
+    schema = create_schema(
+        should_profile=lambda execution_context: True,
+        include_summary=True,
+        summary_size=1000,
+    )
+
+    functions = schema.execute_sync("{ hello }").extensions["profile"]["functions"]
+
+    assert 20 < len(functions) <= 1000
+    assert any("slow_function" in item["function"] for item in functions)
+    assert functions == sorted(
+        functions, key=lambda item: item["cumulativeTime"], reverse=True
+    )
+
+
+def test_sample_rate(mocker):
+    mocker.patch("strawberry.extensions.profiler.random.random", return_value=0.3)
+
+    schema = create_schema(sample_rate=0.5, include_summary=True)
+    assert "profile" in schema.execute_sync("{ hello }").extensions
+
+    schema = create_schema(sample_rate=0.2, include_summary=True)
+    assert not schema.execute_sync("{ hello }").extensions
+
+
+def test_should_profile():
+    schema = create_schema(
+        should_profile=lambda execution_context: execution_context.context["profile"],
+        include_summary=True,
+    )
+
+    assert schema.execute_sync("{ hello }", context_value={"profile": True}).extensions
+    assert not schema.execute_sync(
+        "{ hello }", context_value={"profile": False}
+    ).extensions
+
+
+def test_writes_the_profiles(tmp_path):
+    schema = create_schema(
+        should_profile=lambda execution_context: True, output_dir=str(tmp_path)
+    )
+
+    result = schema.execute_sync("query Hello { hello }", operation_name="Hello")
+
+    assert not result.extensions
+
+    files = os.listdir(tmp_path)
+
+    assert len(files) == 1
+    assert files[0].endswith("-Hello.prof")
+
+    stats = pstats.Stats(str(tmp_path / files[0])).stats  # type: ignore
+
+    assert any(function[2] == "slow_function" for function in stats)
+
+
+def test_rejected_operations_are_profiled():
+    schema = create_schema(
+        should_profile=lambda execution_context: True, include_summary=True
+    )
+
+    result = schema.execute_sync("{ missing }")
+
+    assert result.errors
+    assert result.extensions["profile"]["functions"]
+
+
+def test_one_request_is_profiled_at_a_time():
+    profilers = []
+
+    class FakeProfiler(BaseProfiler):
+        file_extension = ".txt"
+
+        def __init__(self):
+            profilers.append(self)
+
+        def start(self):
+            pass
+
+        def stop(self):
+            pass
+
+        def write(self, path):
+            pass
+
+        def get_top_functions(self, limit):
+            return [ProfiledFunction("function", None, 0.001, 0.002)]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def nested(self) -> typing.Optional[str]:
+            # a request executed while the first one is profiled
+            result = schema.execute_sync("{ hello }")
+            assert not result.extensions
+            return "nested"
+
+        @strawberry.field
+        def hello(self) -> str:
+            return "world"
+
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            partial(
+                ProfilerExtension,
+                should_profile=lambda execution_context: True,
+                include_summary=True,
+                profiler_class=FakeProfiler,
+            )
+        ],
+    )
+
+    result = schema.execute_sync("{ nested }")
+
+    assert result.data == {"nested": "nested"}
+    assert len(profilers) == 1
+    assert result.extensions["profile"]["functions"] == [
+        {
+            "function": "function",
+            "calls": None,
+            "totalTime": 1.0,
+            "cumulativeTime": 2.0,
+        }
+    ]
+
+    assert schema.execute_sync("{ hello }").extensions
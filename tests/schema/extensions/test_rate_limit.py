@@ -0,0 +1,223 @@
+import typing
+from functools import partial
+
+import pytest
+
+import strawberry
+from strawberry.extensions.rate_limit import (
+    BaseRateLimitStore,
+    InMemoryRateLimitStore,
+    RateLimiter,
+    RateLimitExtension,
+    RateLimitResult,
+)
+from strawberry.schema import default_validation_rules
+from strawberry.tools import query_cost_validator
+
+
+@strawberry.type
+class User:
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field(cost_multipliers=["first"])
+    def users(self, info, first: int = 10) -> typing.List[User]:
+        info.context["calls"] += 1
+        return [User(name="Patrick")] * first
+
+    @strawberry.field
+    def me(self, info) -> User:
+        info.context["calls"] += 1
+        return User(name="Patrick")
+
+
+def get_key(execution_context) -> typing.Optional[str]:
+    return execution_context.context.get("api_key")
+
+
+def create_schema(rate_limiter: RateLimiter) -> strawberry.Schema:
+    return strawberry.Schema(
+        Query, extensions=[partial(RateLimitExtension, rate_limiter=rate_limiter)]
+    )
+
+
+def test_deducts_the_cost_of_the_operations():
+    schema = create_schema(RateLimiter(capacity=30, refill_rate=0, key=get_key))
+    context = {"api_key": "abc", "calls": 0}
+
+    result = schema.execute_sync("{ users(first: 5) { name } }", context_value=context)
+
+    assert not result.errors
+    assert result.extensions == {"rateLimit": {"cost": 1, "limit": 30, "remaining": 29}}
+
+    result = schema.execute_sync("{ me { name } }", context_value=context)
+
+    assert result.extensions == {"rateLimit": {"cost": 1, "limit": 30, "remaining": 28}}
+
+
+def test_rejects_operations_before_running_the_resolvers():
+    schema = create_schema(RateLimiter(capacity=3, refill_rate=1, key=get_key))
+    context = {"api_key": "abc", "calls": 0}
+
+    result = schema.execute_sync(
+        "{ users(first: 3) { name } me { name } }", context_value=context
+    )
+
+    assert not result.errors
+    assert context["calls"] == 2
+
+    result = schema.execute_sync(
+        "query Users($first: Int!) { users(first: $first) { name } me { name } }",
+        variable_values={"first": 4},
+        context_value=context,
+    )
+
+    assert result.data is None
+    assert context["calls"] == 2
+    assert len(result.errors) == 1
+    assert result.errors[0].message == (
+        "Rate limit exceeded, the operation costs 2 and 1 are left"
+    )
+    assert result.errors[0].extensions["code"] == "RATE_LIMITED"
+    assert result.errors[0].extensions["retryAfter"] == pytest.approx(1, abs=0.1)
+    assert result.extensions["rateLimit"]["remaining"] == 1
+
+
+def test_uses_the_cost_of_the_validator(mocker):
+    schema = create_schema(RateLimiter(capacity=30, refill_rate=0, key=get_key))
+    get_query_cost = mocker.patch("strawberry.extensions.rate_limit.get_query_cost")
+
+    result = schema.execute_sync(
+        "{ users(first: 5) { name } }",
+        context_value={"api_key": "abc", "calls": 0},
+        validation_rules=(
+            default_validation_rules + [query_cost_validator(100, default_field_cost=2)]
+        ),
+    )
+
+    assert not result.errors
+    assert result.extensions == {"rateLimit": {"cost": 2, "limit": 30, "remaining": 28}}
+    # the operation is only costed once
+    get_query_cost.assert_not_called()
+
+
+def test_buckets_are_keyed_by_the_key_function():
+    schema = create_schema(RateLimiter(capacity=1, refill_rate=0, key=get_key))
+
+    query = "{ me { name } }"
+
+    assert not schema.execute_sync(
+        query, context_value={"api_key": "a", "calls": 0}
+    ).errors
+    assert schema.execute_sync(query, context_value={"api_key": "a", "calls": 0}).errors
+    assert not schema.execute_sync(
+        query, context_value={"api_key": "b", "calls": 0}
+    ).errors
+
+
+def test_requests_without_key_are_not_limited():
+    schema = create_schema(RateLimiter(capacity=0, refill_rate=0, key=get_key))
+
+    result = schema.execute_sync("{ me { name } }", context_value={"calls": 0})
+
+    assert not result.errors
+    assert not result.extensions
+
+
+def test_invalid_operations_dont_use_the_budget():
+    schema = create_schema(RateLimiter(capacity=1, refill_rate=0, key=get_key))
+    context = {"api_key": "abc", "calls": 0}
+
+    result = schema.execute_sync("{ me { missing } }", context_value=context)
+
+    assert result.errors
+    assert not result.extensions
+
+    result = schema.execute_sync("{ me { name } }", context_value=context)
+
+    assert not result.errors
+
+
+def test_in_memory_store_refills_the_buckets(mocker):
+    monotonic = mocker.patch("strawberry.extensions.rate_limit.time.monotonic")
+    monotonic.return_value = 100.0
+
+    store = InMemoryRateLimitStore()
+
+    assert store.consume("a", 8, capacity=10, refill_rate=2) == RateLimitResult(
+        allowed=True, remaining=2
+    )
+    assert store.consume("a", 3, capacity=10, refill_rate=2) == RateLimitResult(
+        allowed=False, remaining=2
+    )
+
+    monotonic.return_value = 101.0
+
+    assert store.consume("a", 3, capacity=10, refill_rate=2) == RateLimitResult(
+        allowed=True, remaining=1
+    )
+
+    monotonic.return_value = 200.0
+
+    assert store.consume("a", 0, capacity=10, refill_rate=2) == RateLimitResult(
+        allowed=True, remaining=10
+    )
+
+
+def test_in_memory_store_max_size():
+    store = InMemoryRateLimitStore(max_size=2)
+
+    store.consume("a", 1, capacity=10, refill_rate=0)
+    store.consume("b", 1, capacity=10, refill_rate=0)
+    store.consume("c", 1, capacity=10, refill_rate=0)
+
+    assert len(store) == 2
+
+
+def test_empty_stores_are_used():
+    store = InMemoryRateLimitStore(max_size=5)
+
+    assert (
+        RateLimiter(capacity=1, refill_rate=0, key=get_key, store=store).store is store
+    )
+
+
+class AsyncStore(BaseRateLimitStore):
+    def __init__(self):
+        self.store = InMemoryRateLimitStore()
+
+    async def consume(self, key, amount, capacity, refill_rate):
+        return self.store.consume(key, amount, capacity, refill_rate)
+
+
+@pytest.mark.asyncio
+async def test_async_store():
+    schema = create_schema(
+        RateLimiter(capacity=1, refill_rate=0, key=get_key, store=AsyncStore())
+    )
+    context = {"api_key": "abc", "calls": 0}
+
+    result = await schema.execute("{ me { name } }", context_value=context)
+
+    assert not result.errors
+    assert result.extensions == {"rateLimit": {"cost": 1, "limit": 1, "remaining": 0}}
+
+    result = await schema.execute("{ me { name } }", context_value=context)
+
+    assert result.errors[0].extensions["code"] == "RATE_LIMITED"
+    assert result.errors[0].extensions["retryAfter"] is None
+    assert context["calls"] == 1
+
+
+def test_async_store_with_sync_execution():
+    schema = create_schema(
+        RateLimiter(capacity=1, refill_rate=0, key=get_key, store=AsyncStore())
+    )
+    context = {"api_key": "abc", "calls": 0}
+
+    with pytest.raises(RuntimeError, match="rate limit store is async"):
+        schema.execute_sync("{ me { name } }", context_value=context)
+
+    assert context["calls"] == 0
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import time
+import typing
+from functools import partial
+
+import pytest
+
+from graphql import parse
+
+import strawberry
+from strawberry.extensions.slow_query_log import (
+    SlowQueryLog,
+    SlowQueryLogExtension,
+    get_operation_signature,
+    get_variables_shape,
+)
+
+
+@strawberry.type
+class User:
+    name: str
+
+    @strawberry.field
+    def slow_friends(
+        self, filter: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[str]:
+        time.sleep(0.02)
+        return ["Marco"]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def user(self, id: strawberry.ID) -> User:
+        return User(name="Patrick")
+
+    @strawberry.field
+    async def slow(self) -> str:
+        await asyncio.sleep(0.02)
+        return "slow"
+
+    @strawberry.field
+    def fast(self) -> str:
+        return "fast"
+
+
+def create_schema(slow_query_log: SlowQueryLog) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        extensions=[partial(SlowQueryLogExtension, slow_query_log=slow_query_log)],
+    )
+
+
+def test_logs_the_slow_operations(caplog):
+    schema = create_schema(SlowQueryLog(threshold=0.01, top_resolvers=2))
+
+    with caplog.at_level(logging.WARNING, logger="strawberry.slow_queries"):
+        result = schema.execute_sync(
+            """
+            query GetUser($id: ID!, $filter: [String!]) {
+                u: user(id: $id) { slowFriends(filter: $filter) name }
+                fast
+            }
+            """,
+            variable_values={"id": "1", "filter": ["a", "b"]},
+            operation_name="GetUser",
+        )
+
+    assert not result.errors
+    assert len(caplog.records) == 1
+
+    slow_query = caplog.records[0].slow_query  # type: ignore
+
+    assert slow_query["signature"] == (
+        "query GetUser($id: ID!, $filter: [String!]) "
+        "{ fast user(id: $id) { name slowFriends(filter: $filter) } }"
+    )
+    assert slow_query["operationName"] == "GetUser"
+    assert slow_query["variables"] == {"id": "str", "filter": ["str"]}
+    assert slow_query["duration"] >= 20
+    assert slow_query["timings"]["execution"] >= 20
+    # the order of the fast resolvers depends on the timing
+    assert slow_query["resolvers"][0]["path"] == "u.slowFriends"
+    assert slow_query["resolvers"][1]["path"] in ("u", "fast")
+    assert slow_query["resolvers"][0]["duration"] >= 20
+    assert caplog.records[0].getMessage().startswith("Slow operation (")
+
+
+@pytest.mark.asyncio
+async def test_logs_the_slow_async_operations(caplog):
+    schema = create_schema(SlowQueryLog(threshold=0.01))
+
+    with caplog.at_level(logging.WARNING, logger="strawberry.slow_queries"):
+        await schema.execute("{ slow fast }")
+
+    slow_query = caplog.records[0].slow_query  # type: ignore
+
+    assert slow_query["signature"] == "{ fast slow }"
+    assert slow_query["resolvers"][0]["path"] == "slow"
+
+
+def test_fast_operations_are_not_logged(caplog):
+    schema = create_schema(SlowQueryLog(threshold=10))
+
+    with caplog.at_level(logging.WARNING, logger="strawberry.slow_queries"):
+        schema.execute_sync("{ fast }")
+
+    assert not caplog.records
+
+
+def test_logs_are_rate_limited_by_signature(caplog, mocker):
+    slow_query_log = SlowQueryLog(threshold=0, rate=0, burst=2)
+    schema = create_schema(slow_query_log)
+
+    get_signature = mocker.spy(slow_query_log, "get_signature")
+
+    with caplog.at_level(logging.WARNING, logger="strawberry.slow_queries"):
+        for _ in range(3):
+            schema.execute_sync("{ fast }")
+
+        schema.execute_sync("{ user(id: 1) { name } }")
+        schema.execute_sync('{ user(id: "2") { name } }')
+
+    assert get_signature.call_count == 5
+    assert [record.slow_query["signature"] for record in caplog.records] == [
+        "{ fast }",
+        "{ fast }",
+        "{ user(id: 0) { name } }",
+        '{ user(id: "") { name } }',
+    ]
+
+
+def test_signatures_are_cached(mocker):
+    spy = mocker.patch(
+        "strawberry.extensions.slow_query_log.get_operation_signature",
+        return_value="{ fast }",
+    )
+    schema = create_schema(SlowQueryLog(threshold=0, burst=10))
+
+    schema.execute_sync("{ fast }")
+    schema.execute_sync("{ fast }")
+
+    assert spy.call_count == 1
+
+
+def test_operation_signature():
+    document = parse(
+        """
+        query Users {
+            b: users(first: 10, names: ["a"], filter: {name: "b"}, ratio: 1.5) {
+                ...UserFields
+                name
+            }
+            a
+        }
+
+        fragment UserFields on User {
+            id
+            ... on Admin { role }
+        }
+
+        fragment Unused on User { id }
+
+        query Other { other }
+        """
+    )
+
+    assert get_operation_signature(document, "Users") == (
+        "query Users { a users(filter: {}, first: 0, names: [], ratio: 0) "
+        "{ name ...UserFields } } "
+        "fragment UserFields on User { id ... on Admin { role } }"
+    )
+    assert get_operation_signature(document, "Other") == "query Other { other }"
+    assert get_operation_signature(document, "Missing") is None
+
+
+def test_variables_shape():
+    assert get_variables_shape(
+        {"id": 1, "names": ["a"], "empty": [], "input": {"ok": True, "value": None}}
+    ) == {
+        "id": "int",
+        "names": ["str"],
+        "empty": [],
+        "input": {"ok": "bool", "value": "null"},
+    }
@@ -0,0 +1,101 @@
+import logging
+import typing
+from functools import partial
+
+import pytest
+
+import strawberry
+from strawberry.extensions import Extension
+from strawberry.extensions.timings import TimingsExtension
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+    @strawberry.field
+    async def async_hello(self) -> str:
+        return "world"
+
+
+@pytest.mark.asyncio
+async def test_timings_are_recorded_on_the_execution_context():
+    execution_contexts = []
+
+    class CaptureExtension(Extension):
+        def on_request_end(self):
+            execution_contexts.append(self.execution_context)
+
+    schema = strawberry.Schema(query=Query, extensions=[CaptureExtension])
+
+    await schema.execute("{ asyncHello }")
+    schema.execute_sync("{ hello }")
+
+    for execution_context in execution_contexts:
+        timings = execution_context.timings
+
+        assert timings.parsing > 0
+        assert timings.validation > 0
+        assert timings.execution > 0
+        assert timings.total == pytest.approx(
+            timings.parsing + timings.validation + timings.execution
+        )
+
+
+def test_timings_in_the_response():
+    schema = strawberry.Schema(query=Query, extensions=[TimingsExtension])
+
+    result = schema.execute_sync("{ hello }")
+
+    assert not result.errors
+
+    timings = result.extensions["timings"]
+
+    assert set(timings) == {"parsing", "validation", "execution", "total"}
+    assert all(isinstance(duration, float) for duration in timings.values())
+
+
+def test_phases_that_dont_run_are_none():
+    schema = strawberry.Schema(query=Query, extensions=[TimingsExtension])
+
+    result = schema.execute_sync("{ missing }")
+
+    assert result.errors
+
+    timings = result.extensions["timings"]
+
+    assert timings["validation"] is not None
+    assert timings["execution"] is None
+
+    result = schema.execute_sync("{ hello")
+
+    assert result.extensions["timings"]["validation"] is None
+
+
+def test_timings_are_logged(caplog):
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[partial(TimingsExtension, include_in_response=False)],
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="strawberry.timings"):
+        result = schema.execute_sync("query Hello { hello }")
+
+    assert not result.extensions
+
+    records: typing.List[logging.LogRecord] = caplog.records
+
+    assert len(records) == 1
+    assert records[0].getMessage().startswith("Operation Hello: parsing ")
+    assert records[0].timings["execution"] is not None  # type: ignore
+
+
+def test_timings_are_not_logged_below_the_log_level(caplog):
+    schema = strawberry.Schema(query=Query, extensions=[TimingsExtension])
+
+    with caplog.at_level(logging.INFO, logger="strawberry.timings"):
+        schema.execute_sync("{ hello }")
+
+    assert not caplog.records
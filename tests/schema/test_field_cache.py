@@ -0,0 +1,253 @@
+import asyncio
+import typing
+
+import pytest
+
+import strawberry
+from strawberry.cache import (
+    FieldCache,
+    InMemoryCacheStore,
+    ProcessFieldCache,
+    RequestFieldCache,
+)
+
+
+def test_request_cache():
+    calls = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(cache=RequestFieldCache())
+        def price_with_tax(self, currency: str) -> str:
+            calls.append(currency)
+            return f"1 {currency}"
+
+    schema = strawberry.Schema(query=Query)
+    query = """{
+        a: priceWithTax(currency: "EUR")
+        b: priceWithTax(currency: "EUR")
+        c: priceWithTax(currency: "USD")
+    }"""
+
+    root = Query()
+    result = schema.execute_sync(query, root_value=root)
+
+    assert not result.errors
+    assert result.data == {"a": "1 EUR", "b": "1 EUR", "c": "1 USD"}
+    assert calls == ["EUR", "USD"]
+
+    schema.execute_sync(query, root_value=root)
+
+    assert calls == ["EUR", "USD", "EUR", "USD"]
+
+
+def test_request_cache_uses_parent_identity():
+    calls = []
+
+    @strawberry.type
+    class Product:
+        id: int
+
+        @strawberry.field(cache=RequestFieldCache())
+        def price(self) -> int:
+            calls.append(self.id)
+            return self.id * 10
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def products(self) -> typing.List[Product]:
+            product = Product(id=1)
+
+            return [product, product, Product(id=2)]
+
+    schema = strawberry.Schema(query=Query)
+    result = schema.execute_sync("{ products { price } }")
+
+    assert not result.errors
+    assert result.data == {"products": [{"price": 10}, {"price": 10}, {"price": 20}]}
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_request_cache_deduplicates_in_flight_calls():
+    calls = []
+
+    @strawberry.type
+    class Product:
+        id: int
+
+        @strawberry.field(cache=RequestFieldCache(key=lambda product: product.id))
+        async def price(self) -> int:
+            calls.append(self.id)
+            await asyncio.sleep(0)
+            return self.id * 10
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def products(self) -> typing.List[Product]:
+            return [Product(id=1), Product(id=1), Product(id=2)]
+
+    schema = strawberry.Schema(query=Query)
+    result = await schema.execute("{ products { price } }")
+
+    assert not result.errors
+    assert result.data == {"products": [{"price": 10}, {"price": 10}, {"price": 20}]}
+    assert calls == [1, 2]
+
+
+def test_process_cache(mocker):
+    monotonic = mocker.patch(
+        "strawberry.cache.stores.time.monotonic", return_value=100.0
+    )
+    calls = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(cache=ProcessFieldCache(ttl=10, key=lambda root: None))
+        def rate(self, currency: str) -> float:
+            calls.append(currency)
+            return 1.5
+
+    schema = strawberry.Schema(query=Query)
+    query = '{ rate(currency: "EUR") }'
+
+    assert schema.execute_sync(query).data == {"rate": 1.5}
+    assert schema.execute_sync(query).data == {"rate": 1.5}
+    assert calls == ["EUR"]
+
+    monotonic.return_value = 111.0
+
+    assert schema.execute_sync(query).data == {"rate": 1.5}
+    assert calls == ["EUR", "EUR"]
+
+
+def test_process_cache_without_key_is_request_scoped():
+    calls = []
+    cache = ProcessFieldCache()
+
+    @strawberry.type
+    class Product:
+        name: str
+
+        @strawberry.field(cache=cache)
+        def price(self) -> float:
+            calls.append(self.name)
+            return 1.5
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def products(self) -> typing.List[Product]:
+            product = Product(name="Strawberry")
+            return [product, product]
+
+    schema = strawberry.Schema(query=Query)
+    query = "{ products { price } }"
+
+    assert not schema.execute_sync(query).errors
+    assert calls == ["Strawberry"]
+
+    # the parents are identified by their id, which can be reused by other
+    # objects in the next requests
+    assert not schema.execute_sync(query).errors
+    assert calls == ["Strawberry", "Strawberry"]
+    assert len(cache.store) == 0
+
+
+@pytest.mark.asyncio
+async def test_custom_store():
+    class AsyncStore(InMemoryCacheStore):
+        async def get(self, key):
+            return super().get(key)
+
+        async def set(self, key, value, ttl=None):
+            super().set(key, value, ttl)
+
+    calls = []
+    store = AsyncStore()
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(cache=FieldCache(store, key=lambda root: None))
+        def hello(self) -> str:
+            calls.append("hello")
+            return "world"
+
+    schema = strawberry.Schema(query=Query)
+
+    for _ in range(2):
+        result = await schema.execute("{ hello }")
+
+        assert not result.errors
+        assert result.data == {"hello": "world"}
+
+    assert calls == ["hello"]
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_store_deduplicates_in_flight_calls():
+    class AsyncStore(InMemoryCacheStore):
+        async def get(self, key):
+            await asyncio.sleep(0)
+            return super().get(key)
+
+        async def set(self, key, value, ttl=None):
+            super().set(key, value, ttl)
+
+    calls = []
+
+    @strawberry.type
+    class Product:
+        id: int
+
+        @strawberry.field(
+            cache=FieldCache(AsyncStore(), key=lambda product: product.id)
+        )
+        async def price(self) -> int:
+            calls.append(self.id)
+            await asyncio.sleep(0)
+            return self.id * 10
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def products(self) -> typing.List[Product]:
+            return [Product(id=1), Product(id=1), Product(id=2)]
+
+    schema = strawberry.Schema(query=Query)
+    result = await schema.execute("{ products { price } }")
+
+    assert not result.errors
+    assert result.data == {"products": [{"price": 10}, {"price": 10}, {"price": 20}]}
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_store_with_async_set():
+    class Store(InMemoryCacheStore):
+        async def set(self, key, value, ttl=None):
+            super().set(key, value, ttl)
+
+    calls = []
+    store = Store()
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(cache=FieldCache(store, key=lambda root: None))
+        def hello(self) -> str:
+            calls.append("hello")
+            return "world"
+
+    schema = strawberry.Schema(query=Query)
+
+    for _ in range(2):
+        result = await schema.execute("{ hello }")
+
+        assert not result.errors
+        assert result.data == {"hello": "world"}
+
+    assert calls == ["hello"]
+    assert len(store) == 1
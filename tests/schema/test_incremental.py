@@ -0,0 +1,250 @@
+import asyncio
+import typing
+
+import pytest
+
+import strawberry
+from strawberry.incremental import IncrementalPublisher, defer, stream
+from strawberry.types import IncrementalExecutionResult, SubsequentExecutionResult
+
+
+@strawberry.type
+class Product:
+    id: int
+
+    @strawberry.field
+    async def recommendations(self) -> typing.List[str]:
+        await asyncio.sleep(0)
+        return [f"Recommendation {self.id}"]
+
+    @strawberry.field
+    def price(self) -> int:
+        if self.id == 1:
+            raise ValueError("Price not available")
+
+        return self.id * 10
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def products(self) -> typing.List[Product]:
+        return [Product(id=index) for index in range(3)]
+
+    @strawberry.field
+    def product(self) -> Product:
+        return Product(id=0)
+
+    @strawberry.field
+    async def live_products(self) -> typing.List[Product]:
+        async def generate():
+            for index in range(3):
+                await asyncio.sleep(0)
+                yield Product(id=index)
+
+        return generate()  # type: ignore
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def create_product(self) -> Product:
+        return Product(id=0)
+
+
+schema = strawberry.Schema(query=Query, mutation=Mutation, directives=[defer, stream])
+
+
+async def collect(result):
+    assert isinstance(result, IncrementalExecutionResult)
+
+    return [subsequent_result async for subsequent_result in result.subsequent_results]
+
+
+def test_directives_are_in_the_schema():
+    assert "directive @defer(if: Boolean! = true" in str(schema)
+    assert "initialCount: Int! = 0) on FIELD" in str(schema)
+
+
+@pytest.mark.asyncio
+async def test_defer_fragment():
+    query = """
+        {
+            product {
+                id
+                ... @defer(label: "recommendations") {
+                    recommendations
+                }
+            }
+        }
+    """
+
+    result = await schema.execute(query, allow_incremental=True)
+
+    assert not result.errors
+    assert result.data == {"product": {"id": 0}}
+
+    subsequent_results = await collect(result)
+
+    assert len(subsequent_results) == 1
+    assert subsequent_results[0].data == {"recommendations": ["Recommendation 0"]}
+    assert subsequent_results[0].path == ["product"]
+    assert subsequent_results[0].label == "recommendations"
+    assert subsequent_results[0].has_next is False
+
+
+@pytest.mark.asyncio
+async def test_defer_fragment_spread_in_list():
+    query = """
+        {
+            products {
+                id
+                ...ProductPrice @defer
+            }
+        }
+
+        fragment ProductPrice on Product {
+            price
+        }
+    """
+
+    result = await schema.execute(query, allow_incremental=True)
+
+    assert result.data == {"products": [{"id": 0}, {"id": 1}, {"id": 2}]}
+
+    subsequent_results = await collect(result)
+    by_path = {tuple(result.path): result for result in subsequent_results}
+
+    assert by_path[("products", 0)].data == {"price": 0}
+    assert by_path[("products", 2)].data == {"price": 20}
+
+    # errors are part of the subsequent result that caused them
+    assert by_path[("products", 1)].data is None
+    assert by_path[("products", 1)].errors[0].message == "Price not available"
+    assert [result.has_next for result in subsequent_results] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_stream_list():
+    query = "{ products @stream(initialCount: 1) { id } }"
+
+    result = await schema.execute(query, allow_incremental=True)
+
+    assert result.data == {"products": [{"id": 0}]}
+
+    subsequent_results = await collect(result)
+
+    assert [result.items for result in subsequent_results] == [
+        [{"id": 1}],
+        [{"id": 2}],
+    ]
+    assert [result.path for result in subsequent_results] == [
+        ["products", 1],
+        ["products", 2],
+    ]
+    assert subsequent_results[-1].has_next is False
+
+
+@pytest.mark.asyncio
+async def test_stream_async_iterable():
+    query = "{ liveProducts @stream(initialCount: 2) { id } }"
+
+    result = await schema.execute(query, allow_incremental=True)
+
+    assert result.data == {"liveProducts": [{"id": 0}, {"id": 1}]}
+
+    subsequent_results = await collect(result)
+
+    assert subsequent_results[0].items == [{"id": 2}]
+    assert subsequent_results[0].has_next is True
+
+    # the end of the stream is only known once the iterator is exhausted
+    assert subsequent_results[-1].items is None
+    assert subsequent_results[-1].has_next is False
+
+
+@pytest.mark.asyncio
+async def test_directives_are_ignored_when_incremental_delivery_is_not_allowed():
+    query = """
+        {
+            products @stream {
+                id
+                ... @defer {
+                    recommendations
+                }
+            }
+        }
+    """
+
+    result = await schema.execute(query)
+
+    assert not isinstance(result, IncrementalExecutionResult)
+    assert not result.errors
+    assert result.data["products"][2] == {
+        "id": 2,
+        "recommendations": ["Recommendation 2"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_directives_are_ignored_when_disabled():
+    query = """
+        query ($shouldDefer: Boolean!) {
+            product {
+                id
+                ... @defer(if: $shouldDefer) {
+                    recommendations
+                }
+            }
+        }
+    """
+
+    result = await schema.execute(
+        query, variable_values={"shouldDefer": False}, allow_incremental=True
+    )
+
+    assert not isinstance(result, IncrementalExecutionResult)
+    assert result.data == {
+        "product": {"id": 0, "recommendations": ["Recommendation 0"]}
+    }
+
+
+@pytest.mark.asyncio
+async def test_mutations_are_not_delivered_incrementally():
+    query = """
+        mutation {
+            createProduct {
+                id
+                ... @defer {
+                    recommendations
+                }
+            }
+        }
+    """
+
+    result = await schema.execute(query, allow_incremental=True)
+
+    assert not isinstance(result, IncrementalExecutionResult)
+    assert result.data == {
+        "createProduct": {"id": 0, "recommendations": ["Recommendation 0"]}
+    }
+
+
+@pytest.mark.asyncio
+async def test_failing_sources_complete():
+    async def failing_source():
+        yield SubsequentExecutionResult(data={"id": 1}, path=["product"]), False
+        raise ValueError("Source failed")
+
+    publisher = IncrementalPublisher()
+    publisher.add(failing_source())
+
+    results = await asyncio.wait_for(
+        collect(IncrementalExecutionResult(None, None, None, publisher.subscribe())),
+        timeout=1,
+    )
+
+    assert results == [
+        SubsequentExecutionResult(data={"id": 1}, path=["product"], has_next=True),
+        SubsequentExecutionResult(has_next=False),
+    ]
@@ -0,0 +1,121 @@
+import logging
+import typing
+
+import pytest
+
+import strawberry
+from strawberry.permission import BasePermission
+from strawberry.schema.config import ErrorLoggingConfig, StrawberryConfig
+
+
+class IsAdmin(BasePermission):
+    message = "Not an admin"
+
+    def has_permission(self, source, info, **kwargs) -> bool:
+        return False
+
+
+@strawberry.type
+class Item:
+    id: int
+
+    @strawberry.field
+    def fail(self) -> typing.Optional[str]:
+        raise ValueError(f"Item {self.id} failed")
+
+    @strawberry.field
+    def fail_differently(self) -> typing.Optional[str]:
+        raise KeyError(self.id)
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self, count: int) -> typing.List[Item]:
+        return [Item(id=id) for id in range(count)]
+
+    @strawberry.field(permission_classes=[IsAdmin])
+    def secret(self) -> typing.Optional[str]:
+        return "secret"
+
+
+def create_schema(**options) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(error_logging=ErrorLoggingConfig(**options)),
+    )
+
+
+def test_errors_with_the_same_type_and_field_are_logged_once(caplog):
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync("{ items(count: 100) { fail failDifferently } }")
+
+    assert len(result.errors) == 200
+    assert len(caplog.records) == 2
+
+    first, second = caplog.records
+
+    assert first.getMessage().startswith("Item 0 failed")
+    assert first.getMessage().endswith("99 similar errors were not logged")
+    assert first.exc_info[0] is ValueError
+    assert first.stack_info is not None
+
+    assert second.exc_info[0] is KeyError
+    assert second.stack_info is None
+
+
+def test_expected_errors_are_logged_at_the_debug_level(caplog):
+    schema = strawberry.Schema(query=Query)
+
+    with caplog.at_level(logging.DEBUG, logger="strawberry.execution"):
+        result = schema.execute_sync("{ secret }")
+
+    assert result.errors[0].message == "Not an admin"
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelname == "DEBUG"
+    assert caplog.records[0].exc_info is None
+
+
+def test_expected_errors_can_be_configured(caplog):
+    schema = create_schema(expected_errors=(ValueError,))
+
+    schema.execute_sync("{ items(count: 1) { fail } secret }")
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].exc_info[0] is PermissionError
+
+
+def test_max_errors_per_request(caplog):
+    schema = create_schema(max_errors_per_request=1)
+
+    schema.execute_sync("{ items(count: 3) { fail failDifferently } }")
+
+    assert len(caplog.records) == 2
+    assert caplog.records[0].exc_info[0] is ValueError
+    assert caplog.records[1].getMessage() == "3 other errors were not logged"
+
+
+@pytest.mark.asyncio
+async def test_errors_are_rate_limited(caplog):
+    schema = create_schema(rate=0, burst=2)
+
+    for _ in range(3):
+        await schema.execute("{ items(count: 1) { fail } }")
+
+    messages = [record.getMessage().split("\n")[0] for record in caplog.records]
+
+    assert messages == [
+        "Item 0 failed",
+        "Item 0 failed",
+        "1 other errors were not logged",
+    ]
+
+
+def test_errors_without_path_are_grouped_by_message(caplog):
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync("{ missing other }")
+
+    assert len(result.errors) == 2
+    assert len(caplog.records) == 2
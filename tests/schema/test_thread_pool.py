@@ -0,0 +1,130 @@
+import contextvars
+import threading
+
+import pytest
+
+import strawberry
+from strawberry.schema.config import StrawberryConfig
+from strawberry.thread_pool import ResolverThreadPool
+
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+main_thread = threading.get_ident()
+
+
+def in_thread() -> bool:
+    return threading.get_ident() != main_thread
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def threaded(self) -> bool:
+        return in_thread()
+
+    @strawberry.field(run_in_thread=True)
+    def always_threaded(self) -> bool:
+        return in_thread()
+
+    @strawberry.field(run_in_thread=False)
+    def never_threaded(self) -> bool:
+        return in_thread()
+
+    @strawberry.field
+    def request_id(self) -> str:
+        return request_id.get()
+
+    @strawberry.field
+    def fail(self) -> str:
+        raise ValueError("Failed")
+
+
+@pytest.mark.asyncio
+async def test_runs_sync_resolvers_in_threads():
+    thread_pool = ResolverThreadPool(max_workers=2)
+    schema = strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(
+            run_sync_resolvers_in_thread=True, resolver_thread_pool=thread_pool
+        ),
+    )
+
+    request_id.set("abc")
+    result = await schema.execute("{ threaded neverThreaded requestId }")
+
+    assert not result.errors
+    assert result.data == {
+        "threaded": True,
+        "neverThreaded": False,
+        "requestId": "abc",
+    }
+
+    metrics = thread_pool.metrics
+
+    assert metrics.max_workers == 2
+    assert metrics.submitted == 2
+    assert metrics.completed == 2
+    assert metrics.active == metrics.pending == metrics.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread_per_field():
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ threaded alwaysThreaded }")
+
+    assert not result.errors
+    assert result.data == {"threaded": False, "alwaysThreaded": True}
+
+
+@pytest.mark.asyncio
+async def test_resolvers_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def a(self) -> bool:
+            barrier.wait()
+            return True
+
+        @strawberry.field
+        def b(self) -> bool:
+            barrier.wait()
+            return True
+
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(run_sync_resolvers_in_thread=True)
+    )
+
+    result = await schema.execute("{ a b }")
+
+    assert not result.errors
+    assert result.data == {"a": True, "b": True}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted():
+    thread_pool = ResolverThreadPool()
+    schema = strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(
+            run_sync_resolvers_in_thread=True, resolver_thread_pool=thread_pool
+        ),
+    )
+
+    result = await schema.execute("{ fail }")
+
+    assert result.errors[0].message == "Failed"
+    assert thread_pool.metrics.failed == 1
+
+
+def test_sync_execution_runs_resolvers_directly():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(run_sync_resolvers_in_thread=True)
+    )
+
+    result = schema.execute_sync("{ threaded alwaysThreaded }")
+
+    assert not result.errors
+    assert result.data == {"threaded": False, "alwaysThreaded": False}
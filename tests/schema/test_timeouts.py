@@ -0,0 +1,147 @@
+import asyncio
+import time
+from typing import Optional
+
+import pytest
+
+import strawberry
+from strawberry.schema.config import StrawberryConfig
+from strawberry.timeouts import execution_deadline, get_remaining_time
+
+
+cancelled = []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    async def fast(self) -> str:
+        return "fast"
+
+    @strawberry.field
+    async def slow(self) -> Optional[str]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+        return "slow"
+
+    @strawberry.field(timeout=0.05)
+    async def slow_with_timeout(self) -> Optional[str]:
+        await asyncio.sleep(10)
+        return "slow"
+
+    @strawberry.field(timeout=10)
+    async def fast_with_timeout(self) -> str:
+        return "fast"
+
+    @strawberry.field
+    def blocking(self) -> str:
+        time.sleep(0.1)
+        return "blocking"
+
+    @strawberry.field
+    def sync(self) -> Optional[str]:
+        return "sync"
+
+
+schema = strawberry.Schema(query=Query)
+
+
+@pytest.fixture(autouse=True)
+def clear_cancelled():
+    cancelled.clear()
+
+
+@pytest.mark.asyncio
+async def test_execution_timeout_from_config():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(execution_timeout=0.05)
+    )
+
+    started_at = time.monotonic()
+    result = await schema.execute("{ fast slow }")
+
+    assert time.monotonic() - started_at < 1
+    assert result.data == {"fast": "fast", "slow": None}
+    assert len(result.errors) == 1
+    assert result.errors[0].message == "Execution timed out"
+    assert result.errors[0].path == ["slow"]
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_execution_timeout_per_request():
+    result = await schema.execute("{ fast slow }", timeout=0.05)
+
+    assert result.data == {"fast": "fast", "slow": None}
+    assert result.errors[0].message == "Execution timed out"
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_overrides_the_config():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(execution_timeout=10)
+    )
+
+    result = await schema.execute("{ slow }", timeout=0.05)
+
+    assert result.data == {"slow": None}
+    assert result.errors[0].message == "Execution timed out"
+
+
+@pytest.mark.asyncio
+async def test_field_timeout():
+    result = await schema.execute("{ fastWithTimeout slowWithTimeout }")
+
+    assert result.data == {"fastWithTimeout": "fast", "slowWithTimeout": None}
+    assert len(result.errors) == 1
+    assert result.errors[0].message == (
+        "Resolver for 'slowWithTimeout' timed out after 0.05 seconds"
+    )
+
+
+@pytest.mark.asyncio
+async def test_deadline_shorter_than_the_field_timeout():
+    result = await schema.execute("{ slowWithTimeout }", timeout=0.01)
+
+    assert result.errors[0].message == "Execution timed out"
+
+
+@pytest.mark.asyncio
+async def test_resolvers_dont_run_after_the_deadline():
+    result = await schema.execute("{ blocking sync }", timeout=0.05)
+
+    assert result.data == {"blocking": "blocking", "sync": None}
+    assert result.errors[0].message == "Execution timed out"
+    assert result.errors[0].path == ["sync"]
+
+
+def test_execute_sync_timeout():
+    result = schema.execute_sync("{ blocking sync }", timeout=0.05)
+
+    assert result.data == {"blocking": "blocking", "sync": None}
+    assert result.errors[0].message == "Execution timed out"
+
+
+@pytest.mark.asyncio
+async def test_no_timeout():
+    result = await schema.execute("{ fast fastWithTimeout sync }")
+
+    assert not result.errors
+    assert result.data == {"fast": "fast", "fastWithTimeout": "fast", "sync": "sync"}
+
+
+def test_nested_deadlines_cant_extend_the_deadline():
+    assert get_remaining_time() is None
+
+    with execution_deadline(1):
+        with execution_deadline(10):
+            assert get_remaining_time() <= 1
+
+        with execution_deadline(None):
+            assert get_remaining_time() <= 1
+
+    assert get_remaining_time() is None
@@ -0,0 +1,166 @@
+import asyncio
+import typing
+
+import pytest
+
+import strawberry
+from strawberry.subscriptions.broadcast import Broadcast, InMemoryBroadcastBackend
+
+
+async def collect(subscriber, count):
+    return [await subscriber.__anext__() for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_publish_to_subscribers():
+    broadcast = Broadcast()
+
+    async with broadcast.subscribe("scores") as first, broadcast.subscribe(
+        "scores"
+    ) as second, broadcast.subscribe("news") as other:
+        await broadcast.publish("scores", 1)
+        await broadcast.publish("scores", 2)
+        await broadcast.publish("news", "goal")
+
+        assert await collect(first, 2) == [1, 2]
+        assert await collect(second, 2) == [1, 2]
+        assert await collect(other, 1) == ["goal"]
+        assert broadcast.get_subscriber_count("scores") == 2
+
+    assert broadcast.get_subscriber_count("scores") == 0
+
+
+@pytest.mark.asyncio
+async def test_the_backend_is_listened_once_per_topic():
+    listened = []
+
+    class Backend(InMemoryBroadcastBackend):
+        def listen(self, topic):
+            listened.append(topic)
+            return super().listen(topic)
+
+    backend = Backend()
+    broadcast = Broadcast(backend=backend)
+
+    subscribers = [broadcast.subscribe("scores") for _ in range(100)]
+
+    await broadcast.publish("scores", 1)
+
+    for subscriber in subscribers:
+        assert await subscriber.__anext__() == 1
+
+    assert listened == ["scores"]
+
+    for subscriber in subscribers:
+        await subscriber.aclose()
+
+    # the backend stops listening with the last subscriber
+    assert backend._queues == {}
+
+    async with broadcast.subscribe("scores"):
+        assert listened == ["scores", "scores"]
+
+
+@pytest.mark.asyncio
+async def test_slow_subscribers_drop_the_oldest_messages():
+    broadcast = Broadcast(max_queue_size=2)
+
+    async with broadcast.subscribe("scores") as slow, broadcast.subscribe(
+        "scores", max_queue_size=10
+    ) as fast:
+        for score in range(5):
+            await broadcast.publish("scores", score)
+
+        assert await collect(fast, 5) == [0, 1, 2, 3, 4]
+        assert await collect(slow, 2) == [3, 4]
+        assert slow.dropped == 3
+        assert fast.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_registered_source():
+    calls = []
+    stop = asyncio.Event()
+
+    async def scores():
+        calls.append(None)
+
+        for score in range(3):
+            yield score
+
+        await stop.wait()
+
+    broadcast = Broadcast()
+    broadcast.register("scores", scores)
+
+    async with broadcast.subscribe("scores") as first, broadcast.subscribe(
+        "scores"
+    ) as second:
+        assert await collect(first, 3) == [0, 1, 2]
+        assert await collect(second, 3) == [0, 1, 2]
+
+        stop.set()
+
+        assert [score async for score in first] == []
+        assert [score async for score in second] == []
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_source_errors_are_raised_to_the_subscribers():
+    async def scores():
+        yield 1
+        raise ValueError("Feed unavailable")
+
+    broadcast = Broadcast()
+    broadcast.register("scores", scores)
+
+    subscriber = broadcast.subscribe("scores")
+
+    assert await subscriber.__anext__() == 1
+
+    with pytest.raises(ValueError, match="Feed unavailable"):
+        await subscriber.__anext__()
+
+    assert subscriber.closed
+    assert broadcast.get_subscriber_count("scores") == 0
+
+
+@pytest.mark.asyncio
+async def test_subscriptions():
+    broadcast = Broadcast()
+
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    @strawberry.type
+    class Subscription:
+        @strawberry.subscription
+        async def scores(self, match: str) -> typing.AsyncGenerator[int, None]:
+            async with broadcast.subscribe(f"scores:{match}") as scores:
+                async for score in scores:
+                    yield score
+
+    schema = strawberry.Schema(query=Query, subscription=Subscription)
+
+    results = [
+        await schema.subscribe('subscription { scores(match: "final") }')
+        for _ in range(2)
+    ]
+    # the resolvers subscribe when the results are first awaited
+    pending = [asyncio.ensure_future(result.__anext__()) for result in results]
+
+    while broadcast.get_subscriber_count("scores:final") < 2:
+        await asyncio.sleep(0)
+
+    await broadcast.publish("scores:final", 3)
+
+    for future in pending:
+        assert (await future).data == {"scores": 3}
+
+    for result in results:
+        await result.aclose()
+
+    assert broadcast.get_subscriber_count("scores:final") == 0
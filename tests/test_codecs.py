@@ -0,0 +1,127 @@
+import datetime
+import decimal
+import json
+import uuid
+from enum import Enum
+
+import pytest
+
+from strawberry.codecs import (
+    OrjsonCodec,
+    StdlibJSONCodec,
+    UjsonCodec,
+    get_default_json_codec,
+)
+
+
+class Flavor(Enum):
+    VANILLA = "vanilla"
+
+
+def get_codecs():
+    codecs = [StdlibJSONCodec]
+
+    for module, codec in (("orjson", OrjsonCodec), ("ujson", UjsonCodec)):
+        try:
+            __import__(module)
+        except ImportError:  # pragma: no cover
+            continue
+
+        codecs.append(codec)
+
+    return codecs
+
+
+@pytest.fixture(params=get_codecs())
+def codec(request):
+    return request.param()
+
+
+def test_encode(codec):
+    data = {
+        "data": {"name": "Strawberry 🍓", "url": "https://strawberry.rocks/"},
+        "extensions": {
+            "date": datetime.date(2021, 9, 6),
+            "datetime": datetime.datetime(2021, 9, 6, 12, 30),
+            "flavor": Flavor.VANILLA,
+            "id": uuid.UUID("a4b0d5b2-3f1a-4a3e-9c1a-3a8f8c1d2e4f"),
+        },
+    }
+
+    assert json.loads(codec.encode(data)) == {
+        "data": {"name": "Strawberry 🍓", "url": "https://strawberry.rocks/"},
+        "extensions": {
+            "date": "2021-09-06",
+            "datetime": "2021-09-06T12:30:00",
+            "flavor": "vanilla",
+            "id": "a4b0d5b2-3f1a-4a3e-9c1a-3a8f8c1d2e4f",
+        },
+    }
+
+
+@pytest.mark.parametrize("codec_class", (StdlibJSONCodec, OrjsonCodec))
+def test_encode_decimals_as_strings(codec_class):
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+
+    codec = codec_class()
+
+    assert codec.encode({"price": decimal.Decimal("1.50")}) == b'{"price":"1.50"}'
+
+
+def test_encode_unsupported_type(codec):
+    with pytest.raises(TypeError):
+        codec.encode({"data": object()})
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({1: "a"}, {"1": "a"}),
+        ({"count": 2 ** 70}, {"count": 2 ** 70}),
+        ({"items": [{"count": 2 ** 70}]}, {"items": [{"count": 2 ** 70}]}),
+    ],
+)
+def test_encode_like_the_standard_library(codec, data, expected):
+    assert json.loads(codec.encode(data)) == expected
+    assert json.loads(b"".join(codec.iter_encode(data))) == expected
+
+
+def test_decode(codec):
+    assert codec.decode(b'{"query": "{ hello }"}') == {"query": "{ hello }"}
+    assert codec.decode('{"query": "{ hello }"}') == {"query": "{ hello }"}
+
+
+def test_decode_invalid_json(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.decode(b'{"query": ')
+
+
+def test_default_codec_prefers_orjson():
+    pytest.importorskip("orjson")
+
+    assert isinstance(get_default_json_codec(), OrjsonCodec)
+
+
+def test_iter_encode(codec):
+    data = {
+        "data": {
+            "products": [
+                {"id": index, "name": f"Product {index}"} for index in range(50)
+            ],
+            "total": 50,
+        },
+        "extensions": {"flavor": Flavor.VANILLA},
+    }
+
+    chunks = list(codec.iter_encode(data, chunk_size=64))
+
+    assert len(chunks) > 1
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == json.loads(codec.encode(data))
+
+
+def test_iter_encode_scalars(codec):
+    assert b"".join(codec.iter_encode(None)) == b"null"
+    assert b"".join(codec.iter_encode([])) == b"[]"
+    assert b"".join(codec.iter_encode({})) == b"{}"
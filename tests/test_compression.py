@@ -0,0 +1,67 @@
+import gzip
+import zlib
+
+import pytest
+
+from strawberry.compression import ResponseCompression, parse_accept_encoding
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip, deflate;q=0.5, br;q=0") == {
+        "gzip": 1.0,
+        "deflate": 0.5,
+        "br": 0.0,
+    }
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "deflate"),
+        ("gzip;q=0, deflate;q=0", None),
+        ("*", "gzip"),
+        ("*, gzip;q=0", "deflate"),
+    ],
+)
+def test_negotiate(accept_encoding, expected):
+    compression = ResponseCompression(encodings=("gzip", "deflate"))
+
+    assert compression.negotiate(accept_encoding) == expected
+
+
+def test_skips_brotli_when_not_installed(mocker):
+    mocker.patch("strawberry.compression.is_brotli_available", return_value=False)
+
+    assert ResponseCompression().encodings == ("gzip", "deflate")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_size", [0, 1024 * 1024])
+async def test_compress(executor_size):
+    compression = ResponseCompression(executor_size=executor_size)
+    data = b'{"data": "strawberry"}' * 100
+
+    assert gzip.decompress(await compression.compress(data, "gzip")) == data
+    assert zlib.decompress(await compression.compress(data, "deflate")) == data
+
+
+@pytest.mark.asyncio
+async def test_iter_compress_flushes_each_chunk():
+    compression = ResponseCompression()
+
+    async def chunks():
+        yield b"first"
+        yield b"second"
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    decompressed = []
+
+    async for chunk in compression.iter_compress(chunks(), "gzip", flush=True):
+        decompressed.append(decompressor.decompress(chunk))
+
+    assert decompressed == [b"first", b"second", b""]
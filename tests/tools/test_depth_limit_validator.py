@@ -1,3 +1,4 @@
+import importlib
 import re
 from typing import List, Optional
 
@@ -254,3 +255,121 @@ def test_should_raise_invalid_ignore():
             10,
             ignore=[True],
         )
+
+
+def build_fragment_chain(size: int) -> str:
+    # each fragment spreads the next one twice, so walking the spreads
+    # without memoization takes 2 ** size steps
+    fragments = [
+        f"fragment F{i} on Human {{ name ...F{i + 1} pets {{ ...P{i} }} }}\n"
+        f"fragment P{i} on Pet {{ owner {{ ...F{i + 1} }} }}"
+        for i in range(size)
+    ]
+    fragments.append(f"fragment F{size} on Human {{ name }}")
+
+    return "query read { user { ...F0 } }\n" + "\n".join(fragments)
+
+
+def test_fragments_spread_many_times():
+    errors, result = run_query(build_fragment_chain(30), 100)
+
+    assert not errors
+    assert result == {"read": 61}
+
+
+def test_fragments_spread_too_deep():
+    query = """
+    query read {
+      user {
+        ...Owner
+        pets {
+          owner {
+            ...Owner
+          }
+        }
+      }
+    }
+
+    fragment Owner on Human {
+      pets {
+        owner {
+          name
+        }
+      }
+    }
+    """
+
+    errors, result = run_query(query, 4)
+
+    assert len(errors) == 1
+    assert errors[0].message == "'read' exceeds maximum operation depth of 4"
+    assert errors[0].locations[0].line == 7
+
+
+def test_reports_one_error_per_operation():
+    query = """
+    query read {
+      user { pets { owner { pets { name } } } }
+      user1 { address { city } }
+      user2 { pets { owner { pets { name } } } }
+    }
+    """
+
+    errors, result = run_query(query, 2)
+
+    assert len(errors) == 1
+    assert result == {"read": 3}
+
+
+def test_fragment_cycles():
+    query = """
+    query read {
+      user {
+        ...A
+      }
+    }
+
+    fragment A on Human {
+      pets {
+        owner {
+          ...A
+        }
+      }
+    }
+    """
+
+    result = None
+
+    def callback(query_depths):
+        nonlocal result
+        result = query_depths
+
+    # the default rules of graphql-core don't handle cycles in all the cases,
+    # so we only run the depth rule
+    errors = validate(
+        schema._schema,
+        parse(query),
+        rules=[depth_limit_validator(10, callback=callback)],
+    )
+
+    assert not errors
+    assert result == {"read": 3}
+
+
+def test_caches_the_depths_of_valid_documents(mocker):
+    # the module is shadowed by the function in `strawberry.tools`
+    module = importlib.import_module("strawberry.tools.depth_limit_validator")
+    spy = mocker.spy(module, "determine_depths")
+    rule = depth_limit_validator(2)
+
+    for _ in range(2):
+        assert not validate(schema._schema, parse("{ user { name } }"), [rule])
+
+    assert spy.call_count == 1
+
+    for _ in range(2):
+        assert validate(
+            schema._schema, parse("{ user { pets { owner { name } } } }"), [rule]
+        )
+
+    assert spy.call_count == 3
@@ -0,0 +1,317 @@
+from typing import List
+
+from graphql import parse, validate
+
+import strawberry
+from strawberry.extensions import Extension
+from strawberry.schema import default_validation_rules
+from strawberry.tools import get_query_cost, query_cost_validator
+
+
+@strawberry.type
+class User:
+    name: str
+    avatar: str = strawberry.field(cost=5)
+
+    @strawberry.field(cost=2, cost_multipliers=["first"])
+    def friends(self, first: int = 10) -> List["User"]:
+        return []
+
+
+@strawberry.type
+class Query:
+    version: str
+
+    @strawberry.field(cost_multipliers=["first", "last"])
+    def users(self, first: int = 0, last: int = 0) -> List[User]:
+        return []
+
+    @strawberry.field
+    def user(self) -> User:
+        return User(name="Patrick")
+
+    @strawberry.field
+    def tags(self) -> List[User]:
+        return []
+
+
+schema = strawberry.Schema(Query)
+
+
+def run_query(query: str, max_cost: int, variables=None, **kwargs):
+    document = parse(query)
+
+    result = None
+
+    def callback(query_costs):
+        nonlocal result
+        result = query_costs
+
+    errors = validate(
+        schema._schema,
+        document,
+        rules=(
+            default_validation_rules
+            + [query_cost_validator(max_cost, variables, callback=callback, **kwargs)]
+        ),
+    )
+
+    return errors, result
+
+
+def test_scalar_fields_are_free_by_default():
+    errors, result = run_query("{ version user { name } }", 100)
+
+    assert not errors
+    assert result == {"anonymous": 1}
+
+
+def test_field_cost_hints():
+    errors, result = run_query("{ user { name avatar } }", 100)
+
+    assert not errors
+    assert result == {"anonymous": 6}
+
+
+def test_multiplies_the_selections_of_list_fields():
+    query = """
+    query read {
+      users(first: 100) {
+        avatar
+        friends(first: 10) {
+          name
+        }
+      }
+    }
+    """
+
+    errors, result = run_query(query, 10000)
+
+    assert not errors
+    # users costs 1 and each of the 100 users costs 5 for the avatar and 2 for
+    # the friends, whose names are free
+    assert result == {"read": 701}
+
+
+def test_uses_the_largest_multiplier_and_defaults():
+    errors, result = run_query(
+        "{ users(first: 2, last: 3) { friends { avatar } } }", 10000
+    )
+
+    assert not errors
+    # the 3 users cost 2 each for the friends, plus 5 for each of the 10
+    # avatars of the friends
+    assert result == {"anonymous": 157}
+
+
+def test_reads_multipliers_from_variables():
+    query = """
+    query read($first: Int!) {
+      users(first: $first) {
+        avatar
+      }
+    }
+    """
+
+    errors, result = run_query(query, 10000, variables={"first": 20})
+
+    assert not errors
+    assert result == {"read": 101}
+
+
+NESTED_VARIABLE_QUERY = """
+query read($first: Int!) {
+  users(first: $first) {
+    friends(first: $first) {
+      avatar
+    }
+  }
+}
+"""
+
+
+def test_rejects_multipliers_passed_as_unknown_variables():
+    errors, result = run_query(NESTED_VARIABLE_QUERY, 10000)
+
+    assert len(errors) == 1
+    assert errors[0].message == (
+        "The cost of 'read' can't be estimated because it passes list sizes "
+        "as variables"
+    )
+    assert [location.line for location in errors[0].locations] == [3, 4]
+
+
+def test_max_list_size_is_used_for_unknown_variables():
+    errors, result = run_query(NESTED_VARIABLE_QUERY, 10000, max_list_size=100)
+
+    assert len(errors) == 1
+    assert errors[0].message == (
+        "'read' exceeds maximum operation cost of 10000 with a cost of 50201"
+    )
+
+
+def test_rejects_large_multipliers_passed_as_variables():
+    errors, result = run_query(NESTED_VARIABLE_QUERY, 10000, variables={"first": 1000})
+
+    assert len(errors) == 1
+    assert result == {"read": 1 + 1000 * (2 + 1000 * 5)}
+
+
+def test_default_values_of_variables():
+    query = """
+    query read($first: Int = 20, $last: Int) {
+      users(first: $first, last: $last) {
+        avatar
+      }
+    }
+    """
+
+    errors, result = run_query(query, 10000, variables={})
+
+    assert not errors
+    assert result == {"read": 101}
+
+
+def test_default_list_size():
+    errors, result = run_query(
+        "{ users { avatar } tags { avatar } }", 10000, default_list_size=3
+    )
+
+    assert not errors
+    # the default values of `first` and `last` are 0
+    assert result == {"anonymous": 1 + 1 + 3 * 5}
+
+
+def test_counts_fragments():
+    query = """
+    query read {
+      users(first: 10) {
+        ...UserFields
+        friends(first: 2) {
+          ...UserFields
+        }
+      }
+      user {
+        ... on User {
+          ...UserFields
+        }
+      }
+    }
+
+    fragment UserFields on User {
+      avatar
+    }
+    """
+
+    errors, result = run_query(query, 10000)
+
+    assert not errors
+    # users costs 171 and user costs 6
+    assert result == {"read": 171 + 6}
+
+
+def test_fragment_cycles_dont_recurse_forever():
+    query = """
+    query read {
+      user {
+        ...A
+      }
+    }
+
+    fragment A on User {
+      avatar
+      ...B
+    }
+
+    fragment B on User {
+      ...A
+    }
+    """
+
+    result = None
+
+    def callback(query_costs):
+        nonlocal result
+        result = query_costs
+
+    # the default rules of graphql-core don't handle cycles in all the cases,
+    # so we only run the cost rule
+    errors = validate(
+        schema._schema,
+        parse(query),
+        rules=[query_cost_validator(10000, callback=callback)],
+    )
+
+    assert not errors
+    assert result == {"read": 6}
+
+
+def test_rejects_operations_over_the_budget():
+    query = """
+    query cheap {
+      version
+    }
+    query expensive {
+      users(first: 1000) {
+        friends(first: 1000) {
+          name
+        }
+      }
+    }
+    """
+
+    errors, result = run_query(query, 1000)
+
+    assert len(errors) == 1
+    assert errors[0].message == (
+        "'expensive' exceeds maximum operation cost of 1000 with a cost of 2001"
+    )
+    assert result == {"cheap": 0, "expensive": 2001}
+
+
+def test_get_query_cost():
+    document = parse(
+        """
+        query a { user { avatar } }
+        query b($first: Int) { users(first: $first) { avatar } }
+        """
+    )
+
+    assert get_query_cost(schema._schema, document, "a") == 6
+    assert get_query_cost(schema._schema, document, "b", {"first": 4}) == 21
+    assert get_query_cost(schema._schema, document, "missing") == 0
+
+
+def test_execute_with_the_validator():
+    result = schema.execute_sync(
+        "{ users(first: 100) { avatar } }",
+        validation_rules=default_validation_rules + [query_cost_validator(100)],
+    )
+
+    assert result.errors
+    assert result.data is None
+
+
+def test_the_cost_is_stored_on_the_execution_context():
+    costs = []
+
+    class ReadCost(Extension):
+        def on_validation_end(self):
+            costs.append(self.execution_context.query_cost)
+
+    schema = strawberry.Schema(Query, extensions=[ReadCost])
+    query = """
+    query read($first: Int!) { users(first: $first) { avatar } }
+    query other { user { avatar } }
+    """
+
+    result = schema.execute_sync(
+        query,
+        variable_values={"first": 4},
+        operation_name="read",
+        # the variables of the execution are used
+        validation_rules=default_validation_rules + [query_cost_validator(100)],
+    )
+
+    assert not result.errors
+    assert costs == [21]